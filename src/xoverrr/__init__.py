@@ -1,16 +1,27 @@
 from .constants import (CHECK_FAILED, CHECK_SKIPPED, CHECK_SUCCESS,
-                        CHECK_TYPE_COUNTS, CHECK_TYPE_CUSTOM_QUERIES,
-                        CHECK_TYPE_SAMPLES, CHECK_TYPE_SNIFF_QUERY,
+                        CHECK_TYPE_COUNTS, CHECK_TYPE_COUNTS_DRILLDOWN,
+                        CHECK_TYPE_CUSTOM_QUERIES,
+                        CHECK_TYPE_PROFILE, CHECK_TYPE_SAMPLES,
+                        CHECK_TYPE_SNIFF_QUERY,
                         FLAG_VALUE_NO, FLAG_VALUE_YES, XSNIFF_PASSED_COLUMN,
                         XSNIFF_PASSED_VALUE_NO, XSNIFF_PASSED_VALUE_YES,
-                        XRECENTLY_CHANGED_COLUMN)
+                        XRECENTLY_CHANGED_COLUMN, XTABLE_LABEL_COLUMN)
+from .cancellation import CancellationToken
 from .core import DataQualityChecker, DataReference
+from .models import CountsCheckSpec, SuiteCheck
+from .snapshots import SnapshotCache
+from .state import CheckStateStore
 from .reporting import CheckResult, generate_count_report, generate_sample_report, generate_check_sniff_query_report
 from .utils import CheckStats, CheckDetails
 
 __all__ = [
     'DataQualityChecker',
     'DataReference',
+    'CountsCheckSpec',
+    'SuiteCheck',
+    'CheckStateStore',
+    'CancellationToken',
+    'SnapshotCache',
     'CheckStats',
     'CheckDetails',
     'CheckResult',
@@ -24,9 +35,12 @@ __all__ = [
     'CHECK_TYPE_SAMPLES',
     'CHECK_TYPE_CUSTOM_QUERIES',
     'CHECK_TYPE_SNIFF_QUERY',
+    'CHECK_TYPE_PROFILE',
+    'CHECK_TYPE_COUNTS_DRILLDOWN',
     'FLAG_VALUE_YES',
     'FLAG_VALUE_NO',
     'XRECENTLY_CHANGED_COLUMN',
+    'XTABLE_LABEL_COLUMN',
     'XSNIFF_PASSED_COLUMN',
     'XSNIFF_PASSED_VALUE_YES',
     'XSNIFF_PASSED_VALUE_NO',
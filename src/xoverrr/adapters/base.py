@@ -1,12 +1,23 @@
 import re
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from decimal import Decimal
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Tuple,
+                    Union)
 
 import pandas as pd
 from sqlalchemy.engine import Engine
 
-from ..constants import RESERVED_WORDS
+from ..constants import (KEY_DATETIME_TYPE_PATTERN, KEY_INTEGER_TYPE_PATTERN,
+                         KEY_KIND_DATETIME, KEY_KIND_INTEGER, KEY_KIND_TEXT,
+                         KEY_NULL_TEXT, KEY_SAMPLE_BUCKETS,
+                         KEY_TEXT_TYPE_PATTERN, NULL_REPLACEMENT,
+                         PROFILE_KIND_NUMERIC, PROFILE_KIND_OTHER,
+                         PROFILE_KIND_STRING, PROFILE_NUMERIC_TYPE_PATTERN,
+                         PROFILE_STRING_TYPE_PATTERN, RESERVED_WORDS,
+                         XKEY_HASH_SUM_COLUMN, XTABLE_LABEL_COLUMN)
+from ..cancellation import CancellationToken
 from ..logger import app_logger
 from ..models import DataReference, ObjectType
 
@@ -14,13 +25,41 @@ from ..models import DataReference, ObjectType
 class BaseDatabaseAdapter(ABC):
     """Abstract base class with updated method signatures for parameterized queries"""
 
+    # build_count_query needs columns metadata (e.g. to detect tz-aware columns)
+    COUNT_QUERY_USES_COLUMNS_META = False
+    # max values per IN list of a key filter (Oracle allows 1000 expressions)
+    KEY_FILTER_IN_LIST_SIZE = 1000
+
     @abstractmethod
     def _execute_query(
-        self, query: Union[str, Tuple[str, Dict]], engine: Engine, timezone: str
+        self,
+        query: Union[str, Tuple[str, Dict]],
+        engine: Engine,
+        timezone: str,
+        timeout_seconds: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> pd.DataFrame:
-        """Execute query with DBMS-specific optimizations"""
+        """
+        Execute query with DBMS-specific optimizations.
+
+        ``timeout_seconds`` is enforced by the database, ``cancel_token``
+        aborts the running statement when cancelled.
+        """
         pass
 
+    @contextmanager
+    def _cancellable(
+        self, dbapi_connection, cancel_token: Optional[CancellationToken]
+    ) -> Iterator[None]:
+        """Abort the statement running on ``dbapi_connection`` on cancellation"""
+        if cancel_token is None:
+            yield
+            return
+        # drivers without a cancel call abort the fetch by closing the socket
+        abort = getattr(dbapi_connection, 'cancel', None) or dbapi_connection.close
+        with cancel_token.in_flight(abort):
+            yield
+
     @abstractmethod
     def get_object_type(self, data_ref: DataReference, engine: Engine) -> ObjectType:
         """Determine database object type"""
@@ -41,6 +80,10 @@ class BaseDatabaseAdapter(ABC):
     def build_primary_key_query(self, data_ref: DataReference) -> Tuple[str, Dict]:
         pass
 
+    @abstractmethod
+    def build_table_stats_query(self, data_ref: DataReference) -> Tuple[str, Dict]:
+        """Catalog statistics query returning num_rows and avg_row_bytes"""
+
     def build_count_query_common(
         self,
         data_ref: DataReference,
@@ -49,13 +92,51 @@ class BaseDatabaseAdapter(ABC):
         end_date: Optional[str],
         columns_meta: Optional[pd.DataFrame],
         timezone: Optional[str],
+        aggregates: Optional[List[Tuple[str, str]]] = None,
+        hourly: bool = False,
     ) -> Tuple[str, Dict]:
         """Returns tuple of (query, params) with recent data exclusion"""
         result = self.build_count_query(
-            data_ref, date_column, start_date, end_date, columns_meta, timezone
+            data_ref,
+            date_column,
+            start_date,
+            end_date,
+            columns_meta,
+            timezone,
+            aggregates=aggregates,
+            hourly=hourly,
         )
         return result
 
+    def build_count_union_query(
+        self, parts: List[Tuple[str, Dict]]
+    ) -> Tuple[str, Dict]:
+        """
+        Combine count queries into one UNION ALL query with a table label.
+
+        Binds of part ``i`` are renamed to ``<name>_<i>``; each row carries the
+        part index in ``XTABLE_LABEL_COLUMN``.
+        """
+        union_parts = []
+        union_params = {}
+        for i, (query, params) in enumerate(parts):
+            for name in sorted(params or {}, key=len, reverse=True):
+                query = re.sub(rf'(?<![:\w]):{name}\b', f':{name}_{i}', query)
+                union_params[f'{name}_{i}'] = params[name]
+            union_parts.append(
+                f"SELECT '{i}' AS {XTABLE_LABEL_COLUMN}, dt, cnt "
+                f'FROM ({query}) xoverrr_cnt_{i}'
+            )
+        return '\nUNION ALL\n'.join(union_parts), union_params
+
+    def build_query_row_count_query(
+        self, query: str, params: Optional[Dict]
+    ) -> Tuple[str, Dict]:
+        """Row count of a custom query, computed on the server"""
+        return f'SELECT count(*) AS cnt FROM ({query}) xoverrr_rows', dict(
+            params or {}
+        )
+
     @abstractmethod
     def build_count_query(
         self,
@@ -65,10 +146,90 @@ class BaseDatabaseAdapter(ABC):
         end_date: Optional[str],
         columns_meta: Optional[pd.DataFrame],
         timezone: Optional[str],
+        aggregates: Optional[List[Tuple[str, str]]] = None,
+        hourly: bool = False,
     ) -> Tuple[str, Dict]:
-        """Returns tuple of (query, params) with recent data exclusion"""
+        """
+        Returns tuple of (query, params) with recent data exclusion.
+
+        ``aggregates`` are extra ``(alias, expression)`` columns computed per
+        day next to ``cnt``. ``hourly`` groups by hour instead of day, ``dt``
+        is then a ``YYYY-MM-DD HH`` bucket.
+        """
         pass
 
+    @abstractmethod
+    def build_hour_bucket_expression(
+        self,
+        date_column: str,
+        columns_meta: Optional[pd.DataFrame],
+        timezone: Optional[str],
+    ) -> str:
+        """``YYYY-MM-DD HH`` text of the hour of ``date_column``"""
+        pass
+
+    def build_hours_condition(
+        self,
+        date_column: str,
+        hours: List[str],
+        columns_meta: Optional[pd.DataFrame],
+        timezone: Optional[str],
+    ) -> Tuple[str, Dict]:
+        """Condition selecting rows of the given ``YYYY-MM-DD HH`` hour buckets"""
+        params = {f'xhour{i}': hour for i, hour in enumerate(hours)}
+        hour_expr = self.build_hour_bucket_expression(
+            date_column, columns_meta, timezone
+        )
+        binds = ', '.join(f':{name}' for name in params)
+        return f'{hour_expr} IN ({binds})', params
+
+    @staticmethod
+    def _format_count_aggregates(aggregates: Optional[List[Tuple[str, str]]]) -> str:
+        return ''.join(
+            f',\n                {expression} as {alias}'
+            for alias, expression in aggregates or []
+        )
+
+    @staticmethod
+    def classify_profile_column(data_type: str) -> str:
+        """Profile kind of a column type: numeric, string or other"""
+        data_type = data_type.lower()
+        if re.search(PROFILE_NUMERIC_TYPE_PATTERN, data_type):
+            return PROFILE_KIND_NUMERIC
+        if re.search(PROFILE_STRING_TYPE_PATTERN, data_type):
+            return PROFILE_KIND_STRING
+        return PROFILE_KIND_OTHER
+
+    def build_profile_aggregates(
+        self, columns: List[Tuple[str, str]]
+    ) -> List[Tuple[str, str, str, str]]:
+        """
+        Per-day aggregates profiling ``(column, kind)`` pairs.
+
+        Returns ``(alias, expression, column, metric)`` tuples; aliases are
+        short positional names to stay within identifier length limits.
+        """
+        aggregates = []
+        for i, (column, kind) in enumerate(columns):
+            quoted = f'"{column}"' if column.lower() in RESERVED_WORDS else column
+            expressions = {'nulls': f'count(*) - count({quoted})'}
+            if kind == PROFILE_KIND_NUMERIC:
+                expressions.update(
+                    min=f'min({quoted})',
+                    max=f'max({quoted})',
+                    sum=f'sum({quoted})',
+                )
+            elif kind == PROFILE_KIND_STRING:
+                expressions['len_sum'] = (
+                    f'sum({self._build_string_length_expression(quoted)})'
+                )
+            for metric, expression in expressions.items():
+                aggregates.append((f'xp{i}_{metric}', expression, column, metric))
+        return aggregates
+
+    def _build_string_length_expression(self, column: str) -> str:
+        return f'length({column})'
+
     def build_data_query_common(
         self,
         data_ref: DataReference,
@@ -80,15 +241,21 @@ class BaseDatabaseAdapter(ABC):
         exclude_recent_hours: Optional[int] = None,
         columns_meta: pd.DataFrame = None,
         timezone: str = None,
+        extra_conditions: Optional[List[Tuple[str, Dict]]] = None,
     ) -> Tuple[str, Dict]:
-        """Build data query for the DBMS with recent data exclusion"""
+        """
+        Build data query for the DBMS with recent data exclusion.
+
+        ``extra_conditions`` are ``(condition, params)`` pairs appended to the
+        WHERE clause with AND.
+        """
         # Handle reserved words
         cols_select = [
             f'"{col}"' if col.lower() in RESERVED_WORDS else col
             for col in common_columns
         ]
 
-        result = self.build_data_query(
+        query, params = self.build_data_query(
             data_ref,
             cols_select,
             date_column,
@@ -99,7 +266,294 @@ class BaseDatabaseAdapter(ABC):
             columns_meta,
             timezone,
         )
-        return result
+        for condition, condition_params in extra_conditions or []:
+            query += f'            AND ({condition})\n'
+            params.update(condition_params)
+        return query, params
+
+    def build_chunk_fingerprint_query(
+        self,
+        data_ref: DataReference,
+        common_columns: List[str],
+        date_column: Optional[str],
+        update_column: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        columns_meta: Optional[pd.DataFrame] = None,
+        timezone: Optional[str] = None,
+    ) -> Tuple[str, Dict]:
+        """
+        Server-side fingerprint of a chunk: row count, sum of a row hash over
+        the compared columns and max of update_column.
+        """
+        columns = list(common_columns)
+        if update_column and update_column not in columns:
+            columns.append(update_column)
+        data_query, params = self.build_data_query_common(
+            data_ref,
+            columns,
+            date_column,
+            update_column,
+            start_date,
+            end_date,
+            None,
+            columns_meta,
+            timezone,
+        )
+        quoted = {
+            col: f'"{col}"' if col.lower() in RESERVED_WORDS else col for col in columns
+        }
+        max_updated = f'max({quoted[update_column]})' if update_column else 'NULL'
+        data_types = (
+            dict(zip(columns_meta['column_name'], columns_meta['data_type']))
+            if columns_meta is not None
+            else {}
+        )
+        row_hash = self._build_row_hash_expression(
+            [quoted[col] for col in common_columns],
+            [str(data_types.get(col, '')).lower() for col in common_columns],
+        )
+        query = f"""
+            SELECT
+                count(*) AS cnt,
+                sum({row_hash}) AS hash_sum,
+                {max_updated} AS max_updated
+            FROM ({data_query}) xoverrr_fp
+        """
+        return query, params
+
+    @abstractmethod
+    def _build_row_hash_expression(
+        self, columns: List[str], data_types: List[str]
+    ) -> str:
+        """Numeric per-row hash of the given (quoted) columns of ``data_types``"""
+        pass
+
+    def build_key_fingerprint_aggregates(
+        self, key_columns: List[str], columns_meta: pd.DataFrame
+    ) -> List[Tuple[str, str]]:
+        """
+        Daily count query aggregate fingerprinting the key set of a day: the
+        sum of a 60-bit hash of the key values (see ``build_key_hash_expression``).
+        Equal counts with different sums mean rows were lost and others added
+        (or duplicated).
+        """
+        return [
+            (
+                XKEY_HASH_SUM_COLUMN,
+                f'sum({self.build_key_hash_expression(key_columns, columns_meta)})',
+            )
+        ]
+
+    def build_key_bounds_aggregates(self, key_column: str) -> List[Tuple[str, str]]:
+        """Count query aggregates of the key bounds (``xkey_min``, ``xkey_max``)"""
+        quoted = (
+            f'"{key_column}"' if key_column.lower() in RESERVED_WORDS else key_column
+        )
+        return [('xkey_min', f'min({quoted})'), ('xkey_max', f'max({quoted})')]
+
+    def build_key_range_aggregates(
+        self, key_column: str, ranges: List[Tuple[int, int]]
+    ) -> List[Tuple[str, str]]:
+        """
+        Count query aggregates counting rows per half-open ``[lo, hi)`` range
+        of an integer key (``xrange0``, ``xrange1``, ...)
+        """
+        quoted = (
+            f'"{key_column}"' if key_column.lower() in RESERVED_WORDS else key_column
+        )
+        return [
+            (
+                f'xrange{i}',
+                (
+                    f'sum(CASE WHEN {quoted} >= {int(lo)} AND {quoted} < {int(hi)} '
+                    'THEN 1 ELSE 0 END)'
+                ),
+            )
+            for i, (lo, hi) in enumerate(ranges)
+        ]
+
+    def build_key_ranges_condition(
+        self, key_column: str, ranges: List[Tuple[int, int]]
+    ) -> Tuple[str, Dict]:
+        """Condition selecting rows in any of the half-open ``[lo, hi)`` key ranges"""
+        quoted = (
+            f'"{key_column}"' if key_column.lower() in RESERVED_WORDS else key_column
+        )
+        conditions, params = [], {}
+        for i, (lo, hi) in enumerate(ranges):
+            conditions.append(f'({quoted} >= :xlo{i} AND {quoted} < :xhi{i})')
+            params[f'xlo{i}'], params[f'xhi{i}'] = int(lo), int(hi)
+        return ' OR '.join(conditions), params
+
+    def build_key_sample_condition(
+        self,
+        key_columns: List[str],
+        columns_meta: pd.DataFrame,
+        sample_buckets: int,
+        first_bucket: int = 0,
+    ) -> Tuple[str, Dict]:
+        """
+        Condition keeping the keys whose hash falls in buckets
+        ``[first_bucket, sample_buckets)`` of ``KEY_SAMPLE_BUCKETS``. The key
+        hash is the same on all engines, so both sides select the same keys.
+        """
+        key_hash = self.build_key_hash_expression(key_columns, columns_meta)
+        bucket = self._build_modulo_expression(key_hash, KEY_SAMPLE_BUCKETS)
+        condition = f'{bucket} < :xsample_buckets'
+        params = {'xsample_buckets': sample_buckets}
+        if first_bucket:
+            condition = f'{bucket} >= :xsample_first_bucket AND {condition}'
+            params['xsample_first_bucket'] = first_bucket
+        return condition, params
+
+    def _build_modulo_expression(self, expression: str, divisor: int) -> str:
+        return f'mod({expression}, {divisor})'
+
+    @staticmethod
+    def classify_key_column(data_type: str) -> Optional[str]:
+        """Key hash kind of a column type: integer, text, datetime or None"""
+        data_type = data_type.lower()
+        if re.search(KEY_INTEGER_TYPE_PATTERN, data_type):
+            return KEY_KIND_INTEGER
+        if re.search(KEY_TEXT_TYPE_PATTERN, data_type):
+            return KEY_KIND_TEXT
+        if re.search(KEY_DATETIME_TYPE_PATTERN, data_type):
+            return KEY_KIND_DATETIME
+        return None
+
+    def build_key_hash_expression(
+        self, key_columns: List[str], columns_meta: pd.DataFrame
+    ) -> str:
+        """
+        Engine-independent 60-bit hash of the key columns: the first 15 hex
+        digits of the MD5 of the key values as text, joined by '|'.
+
+        Every engine renders a value as the same text: integers as plain
+        digits, datetimes as ``YYYY-MM-DD HH24:MI:SS``, text as is, and NULL
+        or empty text as ``KEY_NULL_TEXT``. Other key types (decimals, floats,
+        ...) have no common text form and raise ``ValueError``.
+        """
+        data_types = dict(
+            zip(columns_meta['column_name'].str.lower(), columns_meta['data_type'])
+        )
+        key_texts = []
+        for col in key_columns:
+            data_type = data_types.get(col.lower())
+            if data_type is None:
+                raise ValueError(f'Key column {col} not found in columns metadata')
+            kind = self.classify_key_column(data_type)
+            if kind is None:
+                raise ValueError(
+                    f'Key column {col} of type {data_type} cannot be hashed: '
+                    'only integer, text, date and timestamp keys are supported'
+                )
+            quoted = f'"{col}"' if col.lower() in RESERVED_WORDS else col
+            key_text = self._build_key_text_expression(quoted, kind)
+            key_texts.append(f"coalesce({key_text}, '{KEY_NULL_TEXT}')")
+        return self._build_key_hash_expression(key_texts)
+
+    @abstractmethod
+    def _build_key_text_expression(self, column: str, kind: str) -> str:
+        """
+        Text of a (quoted) key column of the given ``KEY_KIND_*``, NULL for
+        NULL and empty text values
+        """
+        pass
+
+    @abstractmethod
+    def _build_key_hash_expression(self, key_texts: List[str]) -> str:
+        """
+        60-bit hash of the non-NULL key text expressions: the first 15 hex
+        digits of their MD5, joined by '|'
+        """
+        pass
+
+    def build_key_filter_condition(
+        self,
+        key_columns: List[str],
+        keys: List[Tuple],
+        columns_meta: pd.DataFrame,
+        bind_prefix: str = 'xkey',
+    ) -> Tuple[str, Dict]:
+        """
+        Condition selecting rows by primary key values.
+
+        ``keys`` hold the text values of ``prepare_dataframe``, bound as the
+        key column types of ``columns_meta`` (see ``_key_bind_value``). Keys
+        are split into IN lists of at most ``KEY_FILTER_IN_LIST_SIZE`` values
+        (Oracle limit) combined with OR; keys with NULL values are matched
+        with IS NULL, one condition per key.
+        """
+        if not keys:
+            return '1=0', {}
+        data_types = dict(
+            zip(columns_meta['column_name'].str.lower(), columns_meta['data_type'])
+        )
+        key_types = [data_types.get(col.lower(), '') for col in key_columns]
+        columns = [
+            f'"{col}"' if col.lower() in RESERVED_WORDS else col for col in key_columns
+        ]
+        target = columns[0] if len(columns) == 1 else f'({", ".join(columns)})'
+        params = {}
+        values, null_conditions = [], []
+        for i, key in enumerate(keys):
+            binds = [f'{bind_prefix}_{i}_{j}' for j in range(len(key))]
+            key_values = [
+                self._key_bind_value(value, data_type)
+                for value, data_type in zip(key, key_types)
+            ]
+            if any(value is None for value in key_values):
+                parts = []
+                for column, bind, value in zip(columns, binds, key_values):
+                    if value is None:
+                        parts.append(f'{column} IS NULL')
+                    else:
+                        parts.append(f'{column} = :{bind}')
+                        params[bind] = value
+                null_conditions.append(f'({" AND ".join(parts)})')
+                continue
+            params.update(zip(binds, key_values))
+            values.append(
+                f':{binds[0]}'
+                if len(binds) == 1
+                else f'({", ".join(f":{bind}" for bind in binds)})'
+            )
+        in_lists = [
+            f'{target} IN '
+            f'({", ".join(values[offset : offset + self.KEY_FILTER_IN_LIST_SIZE])})'
+            for offset in range(0, len(values), self.KEY_FILTER_IN_LIST_SIZE)
+        ]
+        return ' OR '.join(in_lists + null_conditions), params
+
+    @staticmethod
+    def _key_bind_value(value: str, data_type: str) -> Any:
+        """
+        Bind value of a ``prepare_dataframe`` key text for a column of
+        ``data_type``: None for NULL, numbers for numeric columns, date or
+        datetime for date/time columns, the text otherwise
+        """
+        if value == NULL_REPLACEMENT:
+            return None
+        data_type = data_type.lower()
+        if re.search(PROFILE_NUMERIC_TYPE_PATTERN, data_type):
+            number = Decimal(value)
+            return int(number) if number == number.to_integral_value() else number
+        if re.search(KEY_DATETIME_TYPE_PATTERN, data_type):
+            timestamp = pd.Timestamp(value)
+            if re.search(r'^(nullable\()?date(32)?\b', data_type) and (
+                timestamp == timestamp.normalize()
+            ):
+                return timestamp.date()
+            return timestamp.to_pydatetime()
+        return value
+
+    @abstractmethod
+    def build_updated_after_condition(
+        self, update_column: str, watermark: str
+    ) -> Tuple[str, Dict]:
+        """Condition selecting rows with update_column >= watermark (DATETIME_FORMAT)"""
+        pass
 
     @abstractmethod
     def build_data_query(
@@ -1,10 +1,14 @@
+import math
 import time
 from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy import text
 
-from ..constants import DATE_FORMAT, DATETIME_FORMAT, FLAG_VALUE_YES, XRECENTLY_CHANGED_COLUMN
+from ..cancellation import CancellationToken
+from ..constants import (DATE_FORMAT, DATETIME_FORMAT, FLAG_VALUE_YES,
+                         KEY_KIND_DATETIME, KEY_KIND_INTEGER,
+                         XRECENTLY_CHANGED_COLUMN)
 from ..exceptions import QueryExecutionError
 from ..logger import app_logger
 from ..models import DataReference, ObjectType
@@ -37,28 +41,39 @@ class ClickHouseAdapter(BaseDatabaseAdapter):
     }
 
     def _execute_query(
-        self, query: Union[str, Tuple[str, Dict]], engine: Engine, timezone: str
+        self,
+        query: Union[str, Tuple[str, Dict]],
+        engine: Engine,
+        timezone: str,
+        timeout_seconds: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> pd.DataFrame:
         df = None
         tz_set = None
         start_time = time.time()
         app_logger.info('start')
 
+        settings = []
         if timezone:
-            tz_set = f"SETTINGS session_timezone = '{timezone}'"
+            settings.append(f"session_timezone = '{timezone}'")
+        if timeout_seconds:
+            max_execution_time = max(1, math.ceil(timeout_seconds))
+            settings.append(f'max_execution_time = {max_execution_time}')
+        if settings:
+            tz_set = f'SETTINGS {", ".join(settings)}'
         try:
+            params = None
             if isinstance(query, tuple):
                 query, params = query
-                if tz_set:
-                    query = f'{query} {tz_set}'
-                app_logger.info(f'query\n {query}')
+            if tz_set:
+                query = f'{query} {tz_set}'
+            app_logger.info(f'query\n {query}')
+            if params is not None:
                 app_logger.info(f'{params=}')
-                df = pd.read_sql(text(query), engine, params=params, coerce_float=False)
-            else:
-                if tz_set:
-                    query = f'{query} {tz_set}'
-                app_logger.info(f'query\n {query}')
-                df = pd.read_sql(text(query), engine, coerce_float=False)
+            with engine.connect() as conn, self._cancellable(
+                conn.connection.dbapi_connection, cancel_token
+            ):
+                df = pd.read_sql(text(query), conn, params=params, coerce_float=False)
 
             execution_time = time.time() - start_time
             app_logger.info(f'Query executed in {execution_time:.2f}s')
@@ -182,6 +197,18 @@ class ClickHouseAdapter(BaseDatabaseAdapter):
         params = {'schema': data_ref.schema, 'table': data_ref.name}
         return query, params
 
+    def build_table_stats_query(self, data_ref: DataReference) -> Tuple[str, Dict]:
+        query = """
+            SELECT
+                total_rows as num_rows,
+                if(total_rows > 0, total_bytes / total_rows, NULL) as avg_row_bytes
+            FROM system.tables
+            WHERE database = :schema
+            AND name = :table
+        """
+        params = {'schema': data_ref.schema, 'table': data_ref.name}
+        return query, params
+
     def build_count_query(
         self,
         data_ref: DataReference,
@@ -190,11 +217,18 @@ class ClickHouseAdapter(BaseDatabaseAdapter):
         end_date: Optional[str],
         columns_meta: Optional[pd.DataFrame],
         timezone: Optional[str],
+        aggregates: Optional[List[Tuple[str, str]]] = None,
+        hourly: bool = False,
     ) -> Tuple[str, Dict]:
+        dt_expr = (
+            self.build_hour_bucket_expression(date_column, columns_meta, timezone)
+            if hourly
+            else f"formatDateTime(toDate({date_column}), '%Y-%m-%d')"
+        )
         query = f"""
             SELECT
-                formatDateTime(toDate({date_column}), '%Y-%m-%d') as dt,
-                count(*) as cnt
+                {dt_expr} as dt,
+                count(*) as cnt{self._format_count_aggregates(aggregates)}
             FROM {data_ref.full_name}
             WHERE 1=1
         """
@@ -210,6 +244,14 @@ class ClickHouseAdapter(BaseDatabaseAdapter):
         query += ' GROUP BY dt ORDER BY dt DESC'
         return query, params
 
+    def build_hour_bucket_expression(
+        self,
+        date_column: str,
+        columns_meta: Optional[pd.DataFrame],
+        timezone: Optional[str],
+    ) -> str:
+        return f"formatDateTime(toStartOfHour({date_column}), '%Y-%m-%d %H')"
+
     def build_data_query(
         self,
         data_ref: DataReference,
@@ -248,6 +290,44 @@ class ClickHouseAdapter(BaseDatabaseAdapter):
 
         return query, params
 
+    def build_updated_after_condition(
+        self, update_column: str, watermark: str
+    ) -> Tuple[str, Dict]:
+        return (
+            f'{update_column} >= parseDateTimeBestEffort(:xwatermark)',
+            {'xwatermark': watermark},
+        )
+
+    def _build_row_hash_expression(
+        self, columns: List[str], data_types: List[str]
+    ) -> str:
+        return f"cityHash64(toString(tuple({', '.join(columns)})))"
+
+    def _build_string_length_expression(self, column: str) -> str:
+        return f'lengthUTF8({column})'
+
+    def _build_modulo_expression(self, expression: str, divisor: int) -> str:
+        return f'modulo({expression}, {divisor})'
+
+    def _build_key_text_expression(self, column: str, kind: str) -> str:
+        if kind == KEY_KIND_INTEGER:
+            return f'toString({column})'
+        if kind == KEY_KIND_DATETIME:
+            return f"formatDateTime({column}, '%Y-%m-%d %H:%i:%S')"
+        # empty strings hash as NULL, as on Oracle
+        return f"nullIf(toString({column}), '')"
+
+    def _build_key_hash_expression(self, key_texts: List[str]) -> str:
+        key_text = ", '|', ".join(key_texts)
+        if len(key_texts) > 1:
+            key_text = f'concat({key_text})'
+        # first 8 MD5 bytes read big-endian, shifted to 60 bits; UInt128 keeps
+        # the daily sum from wrapping around
+        return (
+            'toUInt128(bitShiftRight(reinterpretAsUInt64(reverse('
+            f'substring(MD5({key_text}), 1, 8))), 4))'
+        )
+
     def _build_exclusion_condition(
         self, update_column: str, exclude_recent_hours: int
     ) -> Tuple[str, Dict]:
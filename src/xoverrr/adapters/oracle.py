@@ -4,7 +4,9 @@ from typing import Callable, Dict, List, Optional, Tuple, Union
 import pandas as pd
 from sqlalchemy import text
 
-from ..constants import DATETIME_FORMAT, FLAG_VALUE_YES, XRECENTLY_CHANGED_COLUMN
+from ..cancellation import CancellationToken
+from ..constants import (DATETIME_FORMAT, FLAG_VALUE_YES, KEY_KIND_DATETIME,
+                         KEY_KIND_INTEGER, XRECENTLY_CHANGED_COLUMN)
 from ..exceptions import QueryExecutionError
 from ..logger import app_logger
 from ..models import DataReference, ObjectType
@@ -12,6 +14,11 @@ from .base import BaseDatabaseAdapter, Engine
 
 
 class OracleAdapter(BaseDatabaseAdapter):
+    COUNT_QUERY_USES_COLUMNS_META = True
+    # LOB part hashed by the chunk fingerprint (dbms_lob.substr in SQL returns
+    # at most 4000 bytes of CLOB text and 2000 bytes of BLOB RAW)
+    LOB_HASH_PREFIX_CHARS = 1000
+    LOB_HASH_PREFIX_BYTES = 2000
     PERSIST_TYPE_MAP = {
         'short_string': 'VARCHAR2(32)',
         'string': 'VARCHAR2(64)',
@@ -29,10 +36,13 @@ class OracleAdapter(BaseDatabaseAdapter):
         query: Union[str, Tuple[str, Dict]],
         engine: Engine,
         timezone: str,
+        timeout_seconds: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
         sqltype: str = 'sql',
     ) -> pd.DataFrame:
         tz_set = None
         raw_conn = None
+        driver_conn = None
         cursor = None
 
         start_time = time.time()
@@ -43,6 +53,11 @@ class OracleAdapter(BaseDatabaseAdapter):
 
         try:
             raw_conn = engine.raw_connection()
+            driver_conn = raw_conn.dbapi_connection
+            if timeout_seconds:
+                # oracledb round-trip timeout in ms, reset before the pooled
+                # connection is returned
+                driver_conn.call_timeout = max(1, int(timeout_seconds * 1000))
             cursor = raw_conn.cursor()
 
             if tz_set:
@@ -51,56 +66,8 @@ class OracleAdapter(BaseDatabaseAdapter):
 
             cursor.arraysize = 100000
 
-            if isinstance(query, tuple):
-                query_text, params = query
-
-                # Check if this is a PL/SQL block with OUT parameter
-                if sqltype == 'plsql':
-                    app_logger.info('executing PL/SQL block with OUT parameter')
-
-                    # Create output variable
-                    result_var = cursor.var(str)
-
-                    # Add the output variable to params if it's not already there
-                    if params is None:
-                        params = {}
-
-                    # Make sure :result is not in params as it's an OUT parameter
-                    if 'result' in params:
-                        del params['result']
-
-                    # Execute with output variable
-                    cursor.execute(query_text, {**params, 'result': result_var})
-
-                    # Get the result and convert to DataFrame
-                    result_value = result_var.getvalue()
-
-                    # Create a simple DataFrame with the result
-                    df = pd.DataFrame([[result_value]], columns=['result'])
-
-                else:
-                    # Regular query execution
-                    app_logger.info(f'query\n {query_text}')
-                    app_logger.info(f'{params=}')
-                    cursor.execute(query_text, params or {})
-
-                    if cursor.description:
-                        columns = [col[0].lower() for col in cursor.description]
-                        data = cursor.fetchall()
-                        df = pd.DataFrame(data, columns=columns)
-                    else:
-                        # For DML operations that don't return rows
-                        df = pd.DataFrame()
-            else:
-                app_logger.info(f'query\n {query}')
-                cursor.execute(query)
-
-                if cursor.description:
-                    columns = [col[0].lower() for col in cursor.description]
-                    data = cursor.fetchall()
-                    df = pd.DataFrame(data, columns=columns)
-                else:
-                    df = pd.DataFrame()
+            with self._cancellable(driver_conn, cancel_token):
+                df = self._fetch_dataframe(cursor, query, sqltype)
 
             execution_time = time.time() - start_time
             app_logger.info(f'Query executed in {execution_time:.2f}s')
@@ -122,12 +89,73 @@ class OracleAdapter(BaseDatabaseAdapter):
                     cursor.close()
                 except:
                     pass
+            if driver_conn is not None and timeout_seconds:
+                try:
+                    driver_conn.call_timeout = 0
+                except Exception:
+                    app_logger.debug('Failed to reset call_timeout', exc_info=True)
             if raw_conn:
                 try:
                     raw_conn.close()
                 except:
                     pass
 
+    def _fetch_dataframe(
+        self, cursor, query: Union[str, Tuple[str, Dict]], sqltype: str
+    ) -> pd.DataFrame:
+        if isinstance(query, tuple):
+            query_text, params = query
+
+            # Check if this is a PL/SQL block with OUT parameter
+            if sqltype == 'plsql':
+                app_logger.info('executing PL/SQL block with OUT parameter')
+
+                # Create output variable
+                result_var = cursor.var(str)
+
+                # Add the output variable to params if it's not already there
+                if params is None:
+                    params = {}
+
+                # Make sure :result is not in params as it's an OUT parameter
+                if 'result' in params:
+                    del params['result']
+
+                # Execute with output variable
+                cursor.execute(query_text, {**params, 'result': result_var})
+
+                # Get the result and convert to DataFrame
+                result_value = result_var.getvalue()
+
+                # Create a simple DataFrame with the result
+                df = pd.DataFrame([[result_value]], columns=['result'])
+
+            else:
+                # Regular query execution
+                app_logger.info(f'query\n {query_text}')
+                app_logger.info(f'{params=}')
+                cursor.execute(query_text, params or {})
+
+                if cursor.description:
+                    columns = [col[0].lower() for col in cursor.description]
+                    data = cursor.fetchall()
+                    df = pd.DataFrame(data, columns=columns)
+                else:
+                    # For DML operations that don't return rows
+                    df = pd.DataFrame()
+        else:
+            app_logger.info(f'query\n {query}')
+            cursor.execute(query)
+
+            if cursor.description:
+                columns = [col[0].lower() for col in cursor.description]
+                data = cursor.fetchall()
+                df = pd.DataFrame(data, columns=columns)
+            else:
+                df = pd.DataFrame()
+
+        return df
+
     def get_object_type(self, data_ref: DataReference, engine: Engine) -> ObjectType:
         """Determine if object is table or view in Oracle"""
         query = """
@@ -323,6 +351,18 @@ class OracleAdapter(BaseDatabaseAdapter):
         params['table_name'] = data_ref.name
         return query, params
 
+    def build_table_stats_query(self, data_ref: DataReference) -> Tuple[str, Dict]:
+        query = """
+            SELECT
+                num_rows,
+                avg_row_len as avg_row_bytes
+            FROM all_tables
+            WHERE owner = upper(:schema_name)
+            AND table_name = upper(:table_name)
+        """
+        params = {'schema_name': data_ref.schema, 'table_name': data_ref.name}
+        return query, params
+
     def build_count_query(
         self,
         data_ref: DataReference,
@@ -331,6 +371,8 @@ class OracleAdapter(BaseDatabaseAdapter):
         end_date: Optional[str],
         columns_meta: Optional[pd.DataFrame],
         timezone: Optional[str],
+        aggregates: Optional[List[Tuple[str, str]]] = None,
+        hourly: bool = False,
     ) -> Tuple[str, Dict]:
 
         tz_columns = []
@@ -343,29 +385,49 @@ class OracleAdapter(BaseDatabaseAdapter):
             target_timezone=timezone,
             as_alias=False,
         )
+        dt_expr = (
+            self.build_hour_bucket_expression(date_column, columns_meta, timezone)
+            if hourly
+            else f"to_char(trunc({date_expr}, 'dd'),'YYYY-MM-DD')"
+        )
 
         query = f"""
             SELECT
-                to_char(trunc({date_expr}, 'dd'),'YYYY-MM-DD') as dt,
-                count(*) as cnt
+                {dt_expr} as dt,
+                count(*) as cnt{self._format_count_aggregates(aggregates)}
             FROM {data_ref.full_name}
             WHERE 1=1\n"""
         params = {}
 
+        start_condition, end_condition = self._build_date_range_conditions(
+            column_name=date_column,
+            tz_columns=tz_columns,
+            target_timezone=timezone,
+        )
         if start_date:
-            query += (
-                f" AND {date_expr} >= trunc(to_date(:start_date, 'YYYY-MM-DD'), 'dd')\n"
-            )
+            query += f' AND {start_condition}\n'
             params['start_date'] = start_date
         if end_date:
-            query += f" AND {date_expr} < trunc(to_date(:end_date, 'YYYY-MM-DD'), 'dd') + 1\n"
+            query += f' AND {end_condition}\n'
             params['end_date'] = end_date
 
-        query += (
-            f" GROUP BY to_char(trunc({date_expr}, 'dd'),'YYYY-MM-DD') ORDER BY dt DESC"
-        )
+        query += f' GROUP BY {dt_expr} ORDER BY dt DESC'
         return query, params
 
+    def build_hour_bucket_expression(
+        self,
+        date_column: str,
+        columns_meta: Optional[pd.DataFrame],
+        timezone: Optional[str],
+    ) -> str:
+        date_expr = self._build_cast_tz_column_expression(
+            column_name=date_column,
+            tz_columns=self._identify_timestamp_tz_columns(columns_meta),
+            target_timezone=timezone,
+            as_alias=False,
+        )
+        return f"to_char(trunc({date_expr}, 'hh24'),'YYYY-MM-DD HH24')"
+
     def build_data_query(
         self,
         data_ref: DataReference,
@@ -405,25 +467,69 @@ class OracleAdapter(BaseDatabaseAdapter):
         FROM {data_ref.full_name}
         WHERE 1=1\n"""
 
-        date_expr = None
         if date_column:
-            date_expr = self._build_cast_tz_column_expression(
+            # raw column in WHERE (no cast) to keep index range scans and partition pruning
+            start_condition, end_condition = self._build_date_range_conditions(
                 column_name=date_column,
                 tz_columns=tz_columns,
                 target_timezone=timezone,
-                as_alias=False,  # No alias in WHERE
             )
 
-        if start_date and date_expr:
-            query += f"            AND {date_expr} >= trunc(to_date(:start_date, 'YYYY-MM-DD'), 'dd')\n"
-            params['start_date'] = start_date
+            if start_date:
+                query += f'            AND {start_condition}\n'
+                params['start_date'] = start_date
 
-        if end_date and date_expr:
-            query += f"            AND {date_expr} < trunc(to_date(:end_date, 'YYYY-MM-DD'), 'dd') + 1\n"
-            params['end_date'] = end_date
+            if end_date:
+                query += f'            AND {end_condition}\n'
+                params['end_date'] = end_date
 
         return query, params
 
+    def build_updated_after_condition(
+        self, update_column: str, watermark: str
+    ) -> Tuple[str, Dict]:
+        return (
+            f"{update_column} >= to_timestamp(:xwatermark, 'YYYY-MM-DD HH24:MI:SS')",
+            {'xwatermark': watermark},
+        )
+
+    def _build_row_hash_expression(
+        self, columns: List[str], data_types: List[str]
+    ) -> str:
+        column_hashes = []
+        for col, data_type in zip(columns, data_types):
+            if data_type in ('clob', 'nclob', 'blob'):
+                # ora_hash rejects LOBs: hash their length and first part
+                prefix = (
+                    self.LOB_HASH_PREFIX_BYTES
+                    if data_type == 'blob'
+                    else self.LOB_HASH_PREFIX_CHARS
+                )
+                column_hashes.append(
+                    f"ora_hash(dbms_lob.getlength({col})) || ':' || "
+                    f'ora_hash(dbms_lob.substr({col}, {prefix}, 1))'
+                )
+            else:
+                column_hashes.append(f'ora_hash({col})')
+        row_text = " || '|' || ".join(column_hashes)
+        return f'ora_hash({row_text})'
+
+    def _build_key_text_expression(self, column: str, kind: str) -> str:
+        # explicit formats: plain to_char follows the session NLS settings;
+        # empty strings already are NULL
+        if kind == KEY_KIND_INTEGER:
+            return f"to_char({column}, 'TM9')"
+        if kind == KEY_KIND_DATETIME:
+            return f"to_char({column}, 'YYYY-MM-DD HH24:MI:SS')"
+        return f'to_char({column})'
+
+    def _build_key_hash_expression(self, key_texts: List[str]) -> str:
+        key_text = " || '|' || ".join(key_texts)
+        return (
+            f"to_number(substr(rawtohex(standard_hash({key_text}, 'MD5')), 1, 15), "
+            "'XXXXXXXXXXXXXXX')"
+        )
+
     def _build_exclusion_condition(
         self, update_column: str, exclude_recent_hours: int
     ) -> Tuple[str, Dict]:
@@ -534,6 +640,42 @@ class OracleAdapter(BaseDatabaseAdapter):
 
         return cast_expr
 
+    def _build_date_range_conditions(
+        self,
+        column_name: str,
+        tz_columns: List[str],
+        target_timezone: str,
+    ) -> Tuple[str, str]:
+        """
+        Build sargable (start, end) range conditions for the date column.
+
+        For TIMESTAMP WITH TIME ZONE columns the day bounds are converted into
+        TIMESTAMP WITH TIME ZONE values of the target timezone and compared with
+        the raw column, so the expression is applied to the bind values only
+        and indexes / partition pruning on the column stay usable.
+
+        Parameters:
+            column_name: Name of the date column
+            tz_columns: List of columns that need timezone handling
+            target_timezone: Timezone the day bounds belong to
+
+        Returns:
+            Tuple of (start condition, end condition) using :start_date / :end_date binds
+        """
+        start_bound = "trunc(to_date(:start_date, 'YYYY-MM-DD'), 'dd')"
+        end_bound = "trunc(to_date(:end_date, 'YYYY-MM-DD'), 'dd') + 1"
+
+        if column_name in tz_columns:
+            start_bound = (
+                f"from_tz(cast({start_bound} as timestamp), '{target_timezone}')"
+            )
+            end_bound = f"from_tz(cast({end_bound} as timestamp), '{target_timezone}')"
+
+        return (
+            f'{column_name} >= {start_bound}',
+            f'{column_name} < {end_bound}',
+        )
+
     def _apply_timestamp_tz_casts(
         self,
         columns: List[str],
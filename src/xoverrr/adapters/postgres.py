@@ -5,7 +5,9 @@ from typing import Callable, Dict, List, Optional, Tuple, Union
 import pandas as pd
 from sqlalchemy import text
 
-from ..constants import DATETIME_FORMAT, FLAG_VALUE_YES, XRECENTLY_CHANGED_COLUMN
+from ..cancellation import CancellationToken
+from ..constants import (DATETIME_FORMAT, FLAG_VALUE_YES, KEY_KIND_DATETIME,
+                         KEY_KIND_INTEGER, XRECENTLY_CHANGED_COLUMN)
 from ..exceptions import MetadataError, QueryExecutionError
 from ..logger import app_logger
 from ..models import DataReference, ObjectType
@@ -26,7 +28,12 @@ class PostgresAdapter(BaseDatabaseAdapter):
     }
 
     def _execute_query(
-        self, query: Union[str, Tuple[str, Dict]], engine: Engine, timezone: str
+        self,
+        query: Union[str, Tuple[str, Dict]],
+        engine: Engine,
+        timezone: str,
+        timeout_seconds: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> pd.DataFrame:
 
         df = None
@@ -37,20 +44,27 @@ class PostgresAdapter(BaseDatabaseAdapter):
 
         if timezone:
             tz_set = f"set time zone '{timezone}';"
+        if timeout_seconds:
+            # local to the transaction of this query, the pooled session keeps
+            # its own setting
+            timeout_set = (
+                f'set local statement_timeout = {max(1, int(timeout_seconds * 1000))};'
+            )
+            tz_set = f'{tz_set}\n{timeout_set}' if tz_set else timeout_set
 
         try:
+            params = None
             if isinstance(query, tuple):
                 query, params = query
-                if tz_set:
-                    query = f'{tz_set}\n{query}'
-                app_logger.info(f'query\n {query}')
+            if tz_set:
+                query = f'{tz_set}\n{query}'
+            app_logger.info(f'query\n {query}')
+            if params is not None:
                 app_logger.info(f'{params=}')
-                df = pd.read_sql(text(query), engine, params=params, coerce_float=False)
-            else:
-                if tz_set:
-                    query = f'{tz_set}\n{query}'
-                app_logger.info(f'query\n {query}')
-                df = pd.read_sql(text(query), engine, coerce_float=False)
+            with engine.connect() as conn, self._cancellable(
+                conn.connection.dbapi_connection, cancel_token
+            ):
+                df = pd.read_sql(text(query), conn, params=params, coerce_float=False)
             execution_time = time.time() - start_time
             app_logger.info(f'Query executed in {execution_time:.2f}s')
             app_logger.info('complete')
@@ -233,6 +247,22 @@ class PostgresAdapter(BaseDatabaseAdapter):
         params = {'schema': data_ref.schema, 'table': data_ref.name}
         return query, params
 
+    def build_table_stats_query(self, data_ref: DataReference) -> Tuple[str, Dict]:
+        query = """
+            select
+                cast(c.reltuples as bigint) as num_rows,
+                case when c.reltuples > 0
+                     then pg_relation_size(c.oid) / c.reltuples
+                end as avg_row_bytes
+            from pg_class c
+            join pg_namespace n on n.oid = c.relnamespace
+            where n.nspname = :schema
+            and c.relname = :table
+            and c.reltuples >= 0
+        """
+        params = {'schema': data_ref.schema, 'table': data_ref.name}
+        return query, params
+
     def build_count_query(
         self,
         data_ref: DataReference,
@@ -241,11 +271,18 @@ class PostgresAdapter(BaseDatabaseAdapter):
         end_date: Optional[str],
         columns_meta: Optional[pd.DataFrame],
         timezone: Optional[str],
+        aggregates: Optional[List[Tuple[str, str]]] = None,
+        hourly: bool = False,
     ) -> Tuple[str, Dict]:
+        dt_expr = (
+            self.build_hour_bucket_expression(date_column, columns_meta, timezone)
+            if hourly
+            else f"to_char(date_trunc('day', {date_column}),'YYYY-MM-DD')"
+        )
         query = f"""
             SELECT
-                to_char(date_trunc('day', {date_column}),'YYYY-MM-DD') as dt,
-                count(*) as cnt
+                {dt_expr} as dt,
+                count(*) as cnt{self._format_count_aggregates(aggregates)}
             FROM {data_ref.full_name}
             WHERE 1=1\n"""
         params = {}
@@ -259,9 +296,17 @@ class PostgresAdapter(BaseDatabaseAdapter):
             query += f" AND {date_column} < date_trunc('day', cast(:end_date as date))  + interval '1 days'\n"
             params['end_date'] = end_date
 
-        query += f" GROUP BY to_char(date_trunc('day', {date_column}),'YYYY-MM-DD') ORDER BY dt DESC"
+        query += f' GROUP BY {dt_expr} ORDER BY dt DESC'
         return query, params
 
+    def build_hour_bucket_expression(
+        self,
+        date_column: str,
+        columns_meta: Optional[pd.DataFrame],
+        timezone: Optional[str],
+    ) -> str:
+        return f"to_char(date_trunc('hour', {date_column}),'YYYY-MM-DD HH24')"
+
     def build_data_query(
         self,
         data_ref: DataReference,
@@ -299,6 +344,31 @@ class PostgresAdapter(BaseDatabaseAdapter):
 
         return query, params
 
+    def build_updated_after_condition(
+        self, update_column: str, watermark: str
+    ) -> Tuple[str, Dict]:
+        return (
+            f'{update_column} >= cast(:xwatermark as timestamp)',
+            {'xwatermark': watermark},
+        )
+
+    def _build_row_hash_expression(
+        self, columns: List[str], data_types: List[str]
+    ) -> str:
+        return f"hashtext(ROW({', '.join(columns)})::text)::bigint"
+
+    def _build_key_text_expression(self, column: str, kind: str) -> str:
+        if kind == KEY_KIND_INTEGER:
+            return f'{column}::text'
+        if kind == KEY_KIND_DATETIME:
+            return f"to_char({column}, 'YYYY-MM-DD HH24:MI:SS')"
+        # empty strings hash as NULL, as on Oracle
+        return f"nullif({column}::text, '')"
+
+    def _build_key_hash_expression(self, key_texts: List[str]) -> str:
+        key_text = " || '|' || ".join(key_texts)
+        return f"('x' || substr(md5({key_text}), 1, 15))::bit(60)::bigint"
+
     def _build_exclusion_condition(
         self, update_column: str, exclude_recent_hours: int
     ) -> Tuple[str, Dict]:
@@ -0,0 +1,69 @@
+"""
+Cooperative cancellation of running checks.
+
+A ``CancellationToken`` is shared by a checker and the code driving it. Any
+thread may cancel it: queries running at that moment are aborted through
+their driver cancel call, and every later query of the checker raises
+``CheckCancelledError`` instead of reaching the database, so the remaining
+chunks of a check are never started.
+"""
+
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+from .exceptions import CheckCancelledError
+from .logger import app_logger
+
+
+class CancellationToken:
+    """Thread-safe cancellation flag with abort callbacks of in-flight queries"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._ids = itertools.count()
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = 'cancelled by caller') -> None:
+        """Cancel the checks using this token and abort their running queries"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+        app_logger.warning(f'Check cancelled: {reason}')
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                app_logger.warning(
+                    f'Could not abort running query: {e}', exc_info=True
+                )
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise CheckCancelledError(f'Check run was cancelled: {self.reason}')
+
+    @contextmanager
+    def in_flight(self, abort: Callable[[], None]) -> Iterator[None]:
+        """
+        Register ``abort`` for the query running in this block; it is called
+        if the token is cancelled before the block ends.
+        """
+        callback_id = next(self._ids)
+        with self._lock:
+            self.raise_if_cancelled()
+            self._callbacks[callback_id] = abort
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._callbacks.pop(callback_id, None)
@@ -0,0 +1,105 @@
+"""
+Process pool backend of the chunk comparison.
+
+``prepare_dataframe`` and ``compare_dataframes`` are pandas / Python CPU work
+holding the GIL, so threads do not speed them up. A ``ComparePool`` runs them
+in worker processes. Fetched frames are handed over in temp files rather than
+pickled through the pool pipe, and workers send back only the compact chunk
+stats and details. Workers are replaced after a few chunks, which returns
+their fragmented heap to the OS.
+"""
+
+import multiprocessing
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from .constants import COMPARE_WORKER_MAX_CHUNKS, DETAILS_EXAMPLES
+from .utils import (CheckDetails, CheckStats, clean_recently_changed_data,
+                    compare_dataframes, prepare_dataframe)
+
+
+def compare_frame_files(
+    source_path: str,
+    target_path: str,
+    key_columns: List[str],
+    max_examples: int,
+    details_level: str = DETAILS_EXAMPLES,
+    source_prepared: bool = False,
+    target_prepared: bool = False,
+    source_columns: Optional[List[str]] = None,
+    clean_recent: bool = False,
+) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
+    """
+    Prepare and compare the frames stored in two files (worker side).
+
+    ``source_columns`` selects the compared columns of a shared source
+    frame, ``clean_recent`` drops recently changed rows before comparing.
+    """
+    source_df = pd.read_pickle(source_path)
+    if source_columns is not None:
+        source_df = source_df[
+            [col for col in source_df.columns if col in source_columns]
+        ]
+    if not source_prepared:
+        source_df = prepare_dataframe(source_df)
+    target_df = pd.read_pickle(target_path)
+    if not target_prepared:
+        target_df = prepare_dataframe(target_df)
+    if clean_recent:
+        source_df, target_df = clean_recently_changed_data(
+            source_df, target_df, key_columns
+        )
+    if source_df.empty and target_df.empty:
+        return None, None
+    return compare_dataframes(
+        source_df, target_df, key_columns, max_examples, details_level
+    )
+
+
+class ComparePool:
+    """Worker processes comparing chunk frames handed over in temp files"""
+
+    def __init__(self, processes: int):
+        if processes < 1:
+            raise ValueError('compare_processes must be greater than 0')
+        options = {}
+        if sys.version_info >= (3, 11):
+            options['max_tasks_per_child'] = COMPARE_WORKER_MAX_CHUNKS
+        # spawned workers do not inherit open connections and threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            **options,
+        )
+        self._directory = tempfile.mkdtemp(prefix='xoverrr-compare-')
+
+    def write_frame(self, df: pd.DataFrame) -> str:
+        """Store a frame for the workers, returns its path"""
+        path = os.path.join(self._directory, f'{uuid.uuid4().hex}.pkl')
+        df.to_pickle(path, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+
+    def submit(self, source_path: str, target_path: str, *args, **kwargs) -> Future:
+        """Compare two stored frames, see ``compare_frame_files``"""
+        return self._executor.submit(
+            compare_frame_files, source_path, target_path, *args, **kwargs
+        )
+
+    def discard(self, *paths: str) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(self._directory, ignore_errors=True)
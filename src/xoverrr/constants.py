@@ -6,10 +6,94 @@ DATETIME_FORMAT = f'{DATE_FORMAT} %H:%M:%S'
 NULL_REPLACEMENT = 'N/A'
 DEFAULT_MAX_EXAMPLES = 3
 DEFAULT_MAX_SAMPLE_SIZE_GB = 3  # Max size of dataframe to compare
+# Memory budget (memory_budget_gb): copies of the fetched rows alive while a
+# chunk is compared - raw frames, prepared (text) frames, deduplicated frames
+# and the concat of both sides
+MEMORY_FOOTPRINT_FACTOR = 4
+# Frame size guard: rows whose text values are measured to estimate the size
+# of a fetched frame (the exact deep measurement runs only at DEBUG level)
+DATAFRAME_SIZE_SAMPLE_ROWS = 1000
+# Compare process pool (compare_processes): chunks compared by a worker before
+# it is replaced, returning its heap to the OS (Python 3.11+)
+COMPARE_WORKER_MAX_CHUNKS = 4
+# Counts check: max predicted (catalog) rows to scan the whole range in one query
+DEFAULT_COUNTS_SINGLE_SCAN_MAX_ROWS = 50_000_000
+# Counts check: cached (frozen) days re-queried per run to revalidate the cache
+DEFAULT_COUNTS_REVALIDATE_DAYS = 1
+# Counts key bisection: key ranges of at most N rows are fetched and diffed
+DEFAULT_KEY_BISECT_MAX_RANGE_ROWS = 1000
+# Counts key bisection: max key ranges counted (or fetched) by one query
+KEY_BISECT_MAX_RANGES = 256
+# Incremental samples check: max mismatched keys kept between runs
+DEFAULT_INCREMENTAL_MAX_TRACKED_KEYS = 100_000
+
+# Key sampling (check_samples sample_fraction): keys are spread over N hash
+# buckets, a fraction keeps the first round(fraction * N) buckets
+KEY_SAMPLE_BUCKETS = 10_000
+# Chunk recovery (check_samples max_retries / min_split_days): first retry
+# delay of a transient chunk query error, doubled on each retry
+CHUNK_RETRY_BACKOFF_SECONDS = 1.0
+CHUNK_ERROR_RETRY = 'retry'
+CHUNK_ERROR_SPLIT = 'split'
+# Lowercase fragments of driver errors: chunk too slow or too big (split it)
+SPLIT_QUERY_ERROR_PATTERNS = (
+    'statement timeout',  # PostgreSQL statement_timeout
+    'ora-01555',  # snapshot too old
+    'ora-01013',  # user requested cancel (call timeout)
+    'ora-04036',  # PGA memory limit
+    'memory limit',  # ClickHouse MEMORY_LIMIT_EXCEEDED
+    'timeout_exceeded',  # ClickHouse max_execution_time
+    'out of memory',
+)
+# ... and transient failures worth retrying as is
+RETRYABLE_QUERY_ERROR_PATTERNS = (
+    'server closed the connection',
+    'could not connect',
+    'connection refused',
+    'connection reset',
+    'deadlock detected',
+    'ora-03113',  # end-of-file on communication channel
+    'ora-03114',  # not connected
+    'ora-12170',  # connect timeout
+    'ora-12541',  # no listener
+    'network_error',
+    'socket',
+)
+# Confidence level of the intervals reported for sampled checks and its z-score
+SAMPLE_CONFIDENCE_PCT = 95
+SAMPLE_CONFIDENCE_Z = 1.96
 
 # SQL patterns
 RESERVED_WORDS = ['date', 'comment', 'file', 'number', 'mode', 'successful']
 
+# Profile check: column kinds and the type names mapped to them
+PROFILE_KIND_NUMERIC = 'numeric'
+PROFILE_KIND_STRING = 'string'
+PROFILE_KIND_OTHER = 'other'
+PROFILE_NUMERIC_TYPE_PATTERN = (
+    r'^(nullable\()?(u?int\d*|integer|smallint|bigint|tinyint|number|numeric'
+    r'|decimal|float\d*|double( precision)?|real|binary_(float|double))\b'
+)
+PROFILE_STRING_TYPE_PATTERN = (
+    r'^(nullable\()?(lowcardinality\()?(n?varchar2?|n?char|character'
+    r'( varying)?|text|string|fixedstring|n?clob)\b'
+)
+
+# Key hash: key column kinds hashed the same on all engines, the type names
+# mapped to them and the text hashed for NULL (and Oracle-style empty) values
+KEY_KIND_INTEGER = 'integer'
+KEY_KIND_TEXT = 'text'
+KEY_KIND_DATETIME = 'datetime'
+KEY_INTEGER_TYPE_PATTERN = (
+    r'^(nullable\()?(u?int\d*|integer|smallint|bigint|tinyint|number)\b'
+)
+KEY_TEXT_TYPE_PATTERN = (
+    r'^(nullable\()?(lowcardinality\()?(nullable\()?(n?varchar2?|n?char|bpchar'
+    r'|character( varying)?|text|string|fixedstring)\b'
+)
+KEY_DATETIME_TYPE_PATTERN = r'^(nullable\()?(date|datetime|timestamp)'
+KEY_NULL_TEXT = '<null>'
+
 DEFAULT_TZ = 'UTC'
 
 # Check result statuses
@@ -22,6 +106,8 @@ CHECK_TYPE_COUNTS = 'counts'
 CHECK_TYPE_SAMPLES = 'samples'
 CHECK_TYPE_CUSTOM_QUERIES = 'custom_queries'
 CHECK_TYPE_SNIFF_QUERY = 'sniff_query'
+CHECK_TYPE_PROFILE = 'profile'
+CHECK_TYPE_COUNTS_DRILLDOWN = 'counts_drilldown'
 
 # Shared y/n flag convention for x-prefixed check columns.
 FLAG_VALUE_YES = 'y'
@@ -36,6 +122,12 @@ XSNIFF_PASSED_COLUMN = 'xsniff_passed'
 XSNIFF_PASSED_VALUE_YES = FLAG_VALUE_YES
 XSNIFF_PASSED_VALUE_NO = FLAG_VALUE_NO
 
+# Table label column of multi-table count queries (check_counts_many).
+XTABLE_LABEL_COLUMN = 'xtable_label'
+
+# Daily key fingerprint column of count queries (check_counts key_fingerprint).
+XKEY_HASH_SUM_COLUMN = 'xkey_hash_sum'
+
 # Report output formats
 REPORT_OUTPUT_FORMAT_JSON = 'json'
 REPORT_OUTPUT_FORMAT_TEXT = 'text'
@@ -44,5 +136,16 @@ REPORT_OUTPUT_FORMATS = frozenset({
     REPORT_OUTPUT_FORMAT_TEXT,
 })
 
+# Details collected by samples and custom query checks: counters only, key and
+# value examples (default), or examples plus issue row dumps in the report
+DETAILS_NONE = 'none'
+DETAILS_EXAMPLES = 'examples'
+DETAILS_FULL = 'full'
+DETAILS_LEVELS = frozenset({
+    DETAILS_NONE,
+    DETAILS_EXAMPLES,
+    DETAILS_FULL,
+})
+
 # Float precision used in text reports and persisted stats columns.
 STATS_REPORT_FLOAT_DECIMALS = 5
@@ -1,5 +1,8 @@
+import time
 from collections import defaultdict
-from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.engine import Engine
@@ -9,9 +12,14 @@ from .adapters.base import BaseDatabaseAdapter
 from .adapters.clickhouse import ClickHouseAdapter
 from .adapters.oracle import OracleAdapter
 from .adapters.postgres import PostgresAdapter
-from .exceptions import DQCheckException, MetadataError
+from .cancellation import CancellationToken
+from .compare_pool import ComparePool
+from .exceptions import (CheckCancelledError, DataFrameSizeError,
+                         MetadataError, QueryExecutionError)
+from .incremental import INCREMENTAL_MODE_FULL, IncrementalSampleTracker
 from .logger import app_logger
-from .models import DataReference, DBMSType, ObjectType
+from .models import (CountsCheckSpec, DataReference, DBMSType, ObjectType,
+                     SuiteCheck)
 from .persistence import (
     CheckResultPersister,
     CheckRunTimings,
@@ -19,13 +27,33 @@ from .persistence import (
     build_run_id,
     parse_persist_result_option,
 )
-from .utils import (CheckDetails, CheckStats,
-                    build_check_stats, build_sniff_issue_stats,
-                    clean_recently_changed_data,
+from .planning import (
+    CountCachePlan,
+    CountsExecutionPlan,
+    TableStats,
+    bisect_key_ranges,
+    days_to_windows,
+    plan_count_cache,
+    plan_counts_execution,
+    plan_memory_window,
+    sample_fraction_buckets,
+    split_date_window,
+)
+from .snapshots import SnapshotCache, engine_label
+from .state import CheckStateStore, CountCacheScope, build_check_key
+from .suite import SharedRead, plan_suite
+from .utils import (CheckDetails, CheckResultAccumulator, CheckStats,
+                    build_sampling_estimates, build_sniff_issue_stats,
+                    check_details_from_dict, check_details_to_dict,
+                    check_stats_from_dict, check_stats_to_dict,
+                    classify_chunk_error, clean_recently_changed_data,
                     compare_dataframes, cross_fill_missing_dates,
                     evaluate_check_sniff_query_data,
-                    normalize_column_names,
-                    prepare_dataframe, sniff_issue_row_count,
+                    final_diff_score_lower_bound,
+                    find_count_discrepancies, get_dataframe_size_gb,
+                    merge_partition_results,
+                    normalize_column_names, normalize_profile_value,
+                    prepare_dataframe, sniff_issue_row_count, split_partitions,
                     validate_dataframe_size)
 from .reporting import (
     build_check_result,
@@ -50,7 +78,37 @@ class DataQualityChecker:
         default_exclude_recent_hours: Optional[int] = 24,
         timezone: str = ct.DEFAULT_TZ,
         results_engine: Optional[Engine] = None,
+        state_store: Optional[CheckStateStore] = None,
+        snapshot_cache: Optional[SnapshotCache] = None,
+        query_timeout_seconds: Optional[float] = None,
+        check_timeout_seconds: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        memory_budget_gb: Optional[float] = None,
+        compare_processes: Optional[int] = None,
+        compare_partitions: Optional[int] = None,
     ):
+        """
+        ``query_timeout_seconds`` is enforced by the databases on every query
+        (statement_timeout, call_timeout, max_execution_time);
+        ``check_timeout_seconds`` bounds a whole check run. A ``cancel_token``
+        can be cancelled from another thread to abort running queries and
+        stop the remaining chunks; queries then raise ``CheckCancelledError``.
+
+        ``memory_budget_gb`` bounds the memory of one chunk comparison: the
+        date windows of samples checks are sized from daily row counts to
+        fit it, and a fetched frame may use a ``MEMORY_FOOTPRINT_FACTOR``
+        share of it (instead of the fixed ``DEFAULT_MAX_SAMPLE_SIZE_GB``).
+
+        With ``compare_processes`` chunks of samples checks are prepared and
+        compared in that many worker processes (see ``ComparePool``), started
+        on the first chunk of a check run and stopped when it finishes.
+        ``compare_partitions`` > 1 hash-partitions every compared chunk on
+        its key columns; the partitions are compared in parallel (in the
+        worker processes, or in threads without them) and merged. It defaults
+        to ``compare_processes``, so every worker gets a share of each chunk
+        (chunks are fetched and compared one after another). The threads
+        share the GIL, so real parallelism needs ``compare_processes``.
+        """
         self.source_engine = source_engine
         self.target_engine = target_engine
         self.source_db_type = DBMSType.from_engine(source_engine)
@@ -63,6 +121,27 @@ class DataQualityChecker:
         self.result_persister = CheckResultPersister(
             results_engine=results_engine,
         )
+        self.state_store = state_store
+        self.snapshot_cache = snapshot_cache
+        self.query_timeout_seconds = query_timeout_seconds
+        self.check_timeout_seconds = check_timeout_seconds
+        self.cancel_token = cancel_token
+        if memory_budget_gb is not None and memory_budget_gb <= 0:
+            raise ValueError('memory_budget_gb must be greater than 0')
+        self.memory_budget_gb = memory_budget_gb
+        if compare_processes is not None and compare_processes < 1:
+            raise ValueError('compare_processes must be greater than 0')
+        self.compare_processes = compare_processes
+        if compare_partitions is None:
+            compare_partitions = compare_processes or 1
+        if compare_partitions < 1:
+            raise ValueError('compare_partitions must be greater than 0')
+        self.compare_partitions = compare_partitions
+        self._compare_pool: Optional[ComparePool] = None
+        self._compare_executor: Optional[ThreadPoolExecutor] = None
+        self._check_deadline: Optional[float] = None
+        self._details_level = ct.DETAILS_EXAMPLES
+        self._suite_reads: Optional[Dict[Tuple, SharedRead]] = None
 
         self.adapters = {
             DBMSType.ORACLE: OracleAdapter(),
@@ -127,9 +206,47 @@ class DataQualityChecker:
         persist_result: Union[bool, DataReference] = False,
         check_tags: Optional[Dict] = None,
         report_output_format: str = ct.REPORT_OUTPUT_FORMAT_TEXT,
+        max_parallel_chunks: int = 1,
+        single_scan_max_rows: Optional[int] = ct.DEFAULT_COUNTS_SINGLE_SCAN_MAX_ROWS,
+        freeze_after_days: Optional[int] = None,
+        revalidate_days: int = ct.DEFAULT_COUNTS_REVALIDATE_DAYS,
+        key_fingerprint: bool = False,
+        custom_primary_key: Optional[List[str]] = None,
+        bisect_key_column: Optional[str] = None,
+        bisect_max_range_rows: int = ct.DEFAULT_KEY_BISECT_MAX_RANGE_ROWS,
     ) -> Tuple[str, Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Compare daily row counts between source and target tables.
 
+        Parameters:
+            chunk_size_days : `Optional[int] = None`
+                Split the date range into N-day chunks.
+            max_parallel_chunks : `int = 1`
+                Concurrent chunk queries per engine when the range is chunked.
+            single_scan_max_rows : `Optional[int]`
+                Run one grouped query for the whole range when catalog row
+                estimates of both tables are below this limit (None disables).
+            freeze_after_days : `Optional[int] = None`
+                Days older than N days are immutable: their counts are served
+                from the checker ``state_store`` once cached (None disables).
+            revalidate_days : `int`
+                Random cached days re-queried per run to revalidate the cache.
+            key_fingerprint : `bool = False`
+                Also sum a hash of the primary key per day: days with equal
+                counts but different key sets fail the check (reported in
+                ``details.execution_info['key_fingerprint']``).
+            custom_primary_key : `Optional[List[str]] = None`
+                Key columns of the fingerprint, default the table primary key.
+            bisect_key_column : `Optional[str] = None`
+                Integer key column used to locate the rows of days with
+                different counts: key ranges are bisected with count queries
+                until they hold at most ``bisect_max_range_rows`` rows, then
+                only the keys of those ranges are fetched and compared.
+                Results are in ``details.execution_info['key_bisection']``.
+        """
         self._validate_inputs(source_table, target_table)
+        if key_fingerprint and freeze_after_days is not None:
+            raise ValueError('key_fingerprint cannot be used with freeze_after_days')
         self._require_target_engine()
         validate_report_output_format(report_output_format)
         persist_options = parse_persist_result_option(persist_result)
@@ -153,6 +270,17 @@ class DataQualityChecker:
                 max_examples,
                 run_id=run_id,
                 run_started_at=run_started_at,
+                max_parallel_chunks=max_parallel_chunks,
+                single_scan_max_rows=single_scan_max_rows,
+                freeze_after_days=freeze_after_days,
+                revalidate_days=revalidate_days,
+                key_fingerprint_columns=(
+                    normalize_column_names(custom_primary_key or [])
+                    if key_fingerprint
+                    else None
+                ),
+                bisect_key_column=bisect_key_column,
+                bisect_max_range_rows=bisect_max_range_rows,
             )
 
             report = self._finalize_check(
@@ -190,6 +318,129 @@ class DataQualityChecker:
             self._update_stats(status, source_table)
             return status, report, None, None
 
+    def check_counts_many(
+        self,
+        specs: List[Union[CountsCheckSpec, Tuple]],
+        date_range: Optional[Tuple[str, str]] = None,
+        tolerance_pct: float = 0.0,
+        max_examples: Optional[int] = ct.DEFAULT_MAX_EXAMPLES,
+        persist_result: Union[bool, DataReference] = False,
+        check_tags: Optional[Dict] = None,
+        report_output_format: str = ct.REPORT_OUTPUT_FORMAT_TEXT,
+        max_tables_per_query: Optional[int] = None,
+        max_parallel_queries: int = 1,
+    ) -> List[Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]]:
+        """
+        Compare daily row counts of many table pairs in few round trips.
+
+        Count queries of the tables are combined into UNION ALL queries (one
+        per engine and batch) labelled per table; each table pair still gets
+        its own run_id, report and persisted result. When a union query
+        fails, its tables are re-counted one by one so that a single broken
+        table does not fail the whole batch.
+
+        Parameters:
+            specs : `List[CountsCheckSpec]`
+                Table pairs to check; tuples
+                ``(source_table, target_table, date_column[, check_name])``
+                are accepted too.
+            max_tables_per_query : `Optional[int] = None`
+                Max tables per UNION ALL query (None puts all in one query).
+            max_parallel_queries : `int = 1`
+                Concurrent union queries per engine.
+
+        Returns:
+            One ``(status, report, stats, details)`` tuple per spec, in order.
+        """
+        specs = [
+            spec if isinstance(spec, CountsCheckSpec) else CountsCheckSpec(*spec)
+            for spec in specs
+        ]
+        for spec in specs:
+            self._validate_inputs(spec.source_table, spec.target_table)
+        self._require_target_engine()
+        validate_report_output_format(report_output_format)
+        persist_options = parse_persist_result_option(persist_result)
+        if max_tables_per_query is not None and max_tables_per_query < 1:
+            raise ValueError('max_tables_per_query must be greater than 0')
+        if max_parallel_queries < 1:
+            raise ValueError('max_parallel_queries must be greater than 0')
+
+        start_date, end_date = date_range or (None, None)
+
+        fetch_timings = CheckRunTimings(run_started_at=CheckRunTimings.now())
+        self._run_timings = fetch_timings
+        self._reset_run_context()
+        fetched = self._fetch_counts_many(
+            specs, start_date, end_date, max_tables_per_query, max_parallel_queries
+        )
+
+        results = []
+        for spec, spec_counts in zip(specs, fetched):
+            run_id, run_started_at = self._start_check_run(
+                ct.CHECK_TYPE_COUNTS, spec.check_name, timings=fetch_timings
+            )
+            self.check_stats['checked'] += 1
+            try:
+                if isinstance(spec_counts, Exception):
+                    raise spec_counts
+                (
+                    source_counts,
+                    target_counts,
+                    source_query,
+                    target_query,
+                    execution_info,
+                ) = spec_counts
+
+                status, draft_report, stats, details = self._evaluate_counts(
+                    spec.source_table,
+                    spec.target_table,
+                    source_counts,
+                    target_counts,
+                    tolerance_pct,
+                    max_examples,
+                    run_id,
+                    run_started_at,
+                    source_query,
+                    target_query,
+                    execution_info=execution_info,
+                )
+                report = self._finalize_check(
+                    status=status,
+                    report=draft_report,
+                    stats=stats,
+                    details=details,
+                    check_type=ct.CHECK_TYPE_COUNTS,
+                    check_name=spec.check_name,
+                    check_tags=check_tags,
+                    source_table=spec.source_table.full_name,
+                    target_table=spec.target_table.full_name,
+                    persist_options=persist_options,
+                    report_output_format=report_output_format,
+                )
+            except Exception:
+                app_logger.exception(
+                    f'Counts check failed for {spec.source_table.full_name}'
+                )
+                status, stats, details = ct.CHECK_FAILED, None, None
+                report = self._finalize_check(
+                    status=status,
+                    report=None,
+                    stats=None,
+                    details=None,
+                    check_type=ct.CHECK_TYPE_COUNTS,
+                    check_name=spec.check_name,
+                    check_tags=check_tags,
+                    source_table=spec.source_table.full_name,
+                    target_table=spec.target_table.full_name,
+                    persist_options=persist_options,
+                    report_output_format=report_output_format,
+                )
+            self._update_stats(status, spec.source_table)
+            results.append((status, report, stats, details))
+
+        return results
+
     def check_samples(
         self,
         source_table: DataReference,
@@ -208,6 +459,16 @@ class DataQualityChecker:
         persist_result: Union[bool, DataReference] = False,
         check_tags: Optional[Dict] = None,
         report_output_format: str = ct.REPORT_OUTPUT_FORMAT_TEXT,
+        incremental: bool = False,
+        max_tracked_keys: int = ct.DEFAULT_INCREMENTAL_MAX_TRACKED_KEYS,
+        freeze_after_days: Optional[int] = None,
+        sample_fraction: Optional[float] = None,
+        sequential_slice_fraction: Optional[float] = None,
+        fail_fast: bool = False,
+        resume_run_id: Optional[str] = None,
+        max_retries: int = 0,
+        min_split_days: Optional[int] = None,
+        details_level: str = ct.DETAILS_EXAMPLES,
     ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
         """
         Compare data from custom queries with specified key columns
@@ -227,13 +488,91 @@ class DataQualityChecker:
                 Tolerance pct for discrepancies (0–100).
             max_examples
                 Maximum number of discrepancy examples per column
+            incremental : `bool = False`
+                Compare only rows whose update_column reached the watermark of
+                the previous run plus keys that mismatched last time. Needs
+                check_name, update_column and a checker state_store.
+            max_tracked_keys : `int`
+                Max mismatched keys kept between incremental runs; above it
+                the next run is a full check.
+            freeze_after_days : `Optional[int] = None`
+                Chunks ending more than N days ago are closed: their server-side
+                fingerprints are stored with the chunk result, and reruns reuse
+                the result while both fingerprints are unchanged. Needs
+                check_name and a checker state_store.
+            sample_fraction : `Optional[float] = None`
+                Compare only the keys whose hash falls in this fraction of
+                hash buckets (e.g. 0.01). The hash is the same on all engines,
+                so both sides read the same key subset; full-range estimates
+                with confidence intervals are in
+                ``details.execution_info['sampling']``.
+            sequential_slice_fraction : `Optional[float] = None`
+                Compare key-hash slices of this fraction one at a time and stop
+                as soon as the confidence interval of final_diff_score lies
+                entirely above or below tolerance_pct (needs tolerance_pct > 0
+                to stop on clean tables). Reported in
+                ``details.execution_info['sequential_sampling']``.
+            fail_fast : `bool = False`
+                With several chunks, count the rows of the whole range first
+                and skip the remaining chunks as soon as the check fails even
+                if all of them match. The stats then cover the compared
+                chunks only, ``details.execution_info['fail_fast']`` marks
+                the result partial.
+            resume_run_id : `Optional[str] = None`
+                With a checker state_store, every chunk result of a chunked
+                run is checkpointed under its run_id until the run completes.
+                Pass the run_id of an interrupted run with the same settings
+                to skip its completed chunks and merge their stored results.
+            max_retries : `int = 0`
+                Retries of a chunk whose query fails with a transient error
+                (lost connection, deadlock), with exponential backoff.
+            min_split_days : `Optional[int] = None`
+                Split a chunk whose query times out or whose result is too
+                big into halves, recursively down to windows of this many
+                days. Splits are reported in
+                ``details.execution_info['chunk_recovery']`` with a suggested
+                chunk_size_days for the next runs.
+            details_level : `str = 'examples'`
+                ``'none'`` computes the stats only: no key and value examples
+                and no text report. ``'full'`` adds the issue rows of both
+                sides to the report.
         """
         self._validate_inputs(source_table, target_table)
         self._require_target_engine()
         validate_report_output_format(report_output_format)
+        self._validate_details_level(details_level)
+        if incremental:
+            self._validate_incremental_options(check_name, update_column)
+        if freeze_after_days is not None:
+            self._validate_chunk_reuse_options(
+                check_name, freeze_after_days, incremental
+            )
+        for name, fraction in (
+            ('sample_fraction', sample_fraction),
+            ('sequential_slice_fraction', sequential_slice_fraction),
+        ):
+            if fraction is not None:
+                self._validate_sample_fraction(
+                    name, fraction, incremental, freeze_after_days
+                )
+        if sample_fraction is not None and sequential_slice_fraction is not None:
+            raise ValueError(
+                'sample_fraction cannot be combined with sequential_slice_fraction'
+            )
+        if fail_fast and (incremental or sequential_slice_fraction is not None):
+            raise ValueError(
+                'fail_fast cannot be combined with incremental or '
+                'sequential_slice_fraction'
+            )
+        if resume_run_id is not None:
+            self._validate_resume_options(incremental, sequential_slice_fraction)
+        if max_retries < 0:
+            raise ValueError('max_retries must not be negative')
+        if min_split_days is not None and min_split_days < 1:
+            raise ValueError('min_split_days must be greater than 0')
         persist_options = parse_persist_result_option(persist_result)
         run_id, run_started_at = self._start_check_run(
-            ct.CHECK_TYPE_SAMPLES, check_name
+            ct.CHECK_TYPE_SAMPLES, check_name, details_level=details_level
         )
 
         exclude_hours = exclude_recent_hours or self.default_exclude_recent_hours
@@ -266,6 +605,18 @@ class DataQualityChecker:
                 max_examples,
                 run_id=run_id,
                 run_started_at=run_started_at,
+                incremental_check_name=check_name if incremental else None,
+                max_tracked_keys=max_tracked_keys,
+                reuse_check_name=(
+                    check_name if freeze_after_days is not None else None
+                ),
+                freeze_after_days=freeze_after_days,
+                sample_fraction=sample_fraction,
+                sequential_slice_fraction=sequential_slice_fraction,
+                fail_fast=fail_fast,
+                resume_run_id=resume_run_id,
+                max_retries=max_retries,
+                min_split_days=min_split_days,
             )
 
             report = self._finalize_check(
@@ -303,326 +654,281 @@ class DataQualityChecker:
             self._update_stats(status, source_table)
             return status, report, None, None
 
-    def _start_check_run(
-        self, check_type: str, check_name: Optional[str]
-    ) -> Tuple[str, str]:
-        run_started_at = pd.Timestamp.now().strftime(ct.DATETIME_FORMAT)
-        run_id = build_run_id()
-        app_logger.info(
-            f'Check run started: run_id={run_id} '
-            f'check_name={check_name} check_type={check_type}'
-        )
-        self._active_run_id = run_id
-        self._active_run_started_at = run_started_at
-        self._active_check_name = check_name
-        self._run_timings = CheckRunTimings(run_started_at=run_started_at)
-        return run_id, run_started_at
-
-    def _check_counts(
+    def check_samples_multi(
         self,
         source_table: DataReference,
-        target_table: DataReference,
-        date_column: str,
-        start_date: Optional[str],
-        end_date: Optional[str],
-        chunk_size_days: Optional[int],
-        tolerance_pct: float,
-        max_examples: int,
-        run_id: str,
-        run_started_at: str,
-    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
-
-        try:
-            source_adapter = self._get_adapter(self.source_db_type)
-            target_adapter = self._get_adapter(self.target_db_type)
-
-            source_columns_meta = self._get_metadata_cols(
-                source_table, self.source_engine
-            )
-            app_logger.info('source_columns meta:\n')
-            app_logger.info(source_columns_meta.to_string(index=False))
+        targets: List[Tuple[Engine, DataReference]],
+        check_name: Optional[str] = None,
+        date_column: Optional[str] = None,
+        update_column: Optional[str] = None,
+        date_range: Optional[Tuple[str, str]] = None,
+        chunk_size_days: Optional[int] = None,
+        exclude_columns: Optional[List[str]] = None,
+        include_columns: Optional[List[str]] = None,
+        custom_primary_key: Optional[List[str]] = None,
+        tolerance_pct: float = 0.0,
+        exclude_recent_hours: Optional[int] = None,
+        max_examples: Optional[int] = ct.DEFAULT_MAX_EXAMPLES,
+        persist_result: Union[bool, DataReference] = False,
+        check_tags: Optional[Dict] = None,
+        report_output_format: str = ct.REPORT_OUTPUT_FORMAT_TEXT,
+        details_level: str = ct.DETAILS_EXAMPLES,
+    ) -> List[Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]]:
+        """
+        Compare one source table against several replicas of it.
 
-            target_columns_meta = self._get_metadata_cols(
-                target_table, self.target_engine
-            )
-            app_logger.info('target_columns meta:\n')
-            app_logger.info(target_columns_meta.to_string(index=False))
+        Each source chunk is fetched and prepared once, the target chunks are
+        fetched concurrently (one query at a time per engine) and the source
+        frame is compared against each of them. Every target gets its own
+        run_id, report and persisted result; a target that fails does not
+        stop the others.
 
-            source_chunks = []
-            target_chunks = []
-            source_query, source_params = None, None
-            target_query, target_params = None, None
-            
-            date_chunks = self._iter_date_chunks(
-                date_column, start_date, end_date, chunk_size_days
-            )
+        Parameters:
+            targets : `List[Tuple[Engine, DataReference]]`
+                Target engines and tables; the checker target_engine is not used.
 
-            for chunk_start, chunk_end in date_chunks:
-                source_query, source_params = source_adapter.build_count_query_common(
-                    source_table,
-                    date_column,
-                    chunk_start,
-                    chunk_end,
-                    source_columns_meta,
-                    self.timezone,
-                )
-                chunk_source = self._execute_query(
-                    (source_query, source_params),
-                    self.source_engine,
-                    self.timezone,
-                    query_side='source',
-                )
-                source_chunks.append(chunk_source)
+        The other parameters are the same as in ``check_samples``.
 
-                target_query, target_params = target_adapter.build_count_query_common(
-                    target_table,
-                    date_column,
-                    chunk_start,
-                    chunk_end,
-                    target_columns_meta,
-                    self.timezone,
-                )
-                chunk_target = self._execute_query(
-                    (target_query, target_params),
-                    self.target_engine,
-                    self.timezone,
-                    query_side='target',
-                )
-                target_chunks.append(chunk_target)
+        Returns:
+            One ``(status, report, stats, details)`` tuple per target, in order.
+        """
+        if not targets:
+            raise ValueError('targets must not be empty')
+        for _, target_table in targets:
+            self._validate_inputs(source_table, target_table)
+        validate_report_output_format(report_output_format)
+        self._validate_details_level(details_level)
+        persist_options = parse_persist_result_option(persist_result)
 
-            source_counts = pd.concat(source_chunks, ignore_index=True)
-            target_counts = pd.concat(target_chunks, ignore_index=True)
-            source_counts = source_counts.groupby('dt', as_index=False)['cnt'].sum()
-            target_counts = target_counts.groupby('dt', as_index=False)['cnt'].sum()
+        exclude_hours = exclude_recent_hours or self.default_exclude_recent_hours
+        start_date, end_date = date_range or (None, None)
+        custom_keys = (
+            normalize_column_names(custom_primary_key or [])
+            if custom_primary_key
+            else None
+        )
 
-            source_counts_filled, target_counts_filled = cross_fill_missing_dates(
-                source_counts, target_counts
+        fetch_timings = CheckRunTimings(run_started_at=CheckRunTimings.now())
+        self._run_timings = fetch_timings
+        self._reset_run_context(details_level)
+        try:
+            outcomes = self._check_samples_multi_iterative(
+                source_table,
+                targets,
+                date_column,
+                update_column,
+                start_date,
+                end_date,
+                chunk_size_days,
+                normalize_column_names(exclude_columns or []),
+                normalize_column_names(include_columns or []),
+                custom_keys,
+                exclude_hours,
+                max_examples or ct.DEFAULT_MAX_EXAMPLES,
             )
-
-            merged = source_counts_filled.merge(target_counts_filled, on='dt')
-            total_count_source = source_counts_filled['cnt'].sum()
-            total_count_taget = target_counts_filled['cnt'].sum()
-
-            if (total_count_source, total_count_taget) == (0, 0):
-                app_logger.warning('nothing to compare to you')
-                status = ct.CHECK_SKIPPED
-                return status, None, None, None
-
-            else:
-                result_diff_in_counters = abs(merged['cnt_x'] - merged['cnt_y']).sum()
-                result_equal_in_counters = merged[['cnt_x', 'cnt_y']].min(axis=1).sum()
-
-                discrepancies_counters_pct = (
-                    100
-                    * result_diff_in_counters
-                    / (result_diff_in_counters + result_equal_in_counters)
-                )
-                stats, details = self._check_dataframes_timed(
-                    source_df=source_counts_filled,
-                    target_df=target_counts_filled,
-                    key_columns=['dt'],
-                    max_examples=max_examples,
+        except Exception as e:  # noqa: BLE001
+            # e.g. the source fetch failed: every target fails with it
+            outcomes = [e] * len(targets)
+
+        results = []
+        for (_, target_table), outcome in zip(targets, outcomes):
+            run_id, run_started_at = self._start_check_run(
+                ct.CHECK_TYPE_SAMPLES,
+                check_name,
+                timings=fetch_timings,
+                details_level=details_level,
+            )
+            self.check_stats['checked'] += 1
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                stats, details, queries, date_chunks, report_context = outcome
+                if stats is None:
+                    status, draft_report = ct.CHECK_SKIPPED, None
+                else:
+                    status, draft_report, stats, details = (
+                        self._finish_samples_check(
+                            source_table,
+                            target_table,
+                            stats,
+                            details,
+                            tolerance_pct,
+                            queries,
+                            run_id,
+                            run_started_at,
+                            date_chunks,
+                            report_context=report_context,
+                        )
+                    )
+                report = self._finalize_check(
+                    status=status,
+                    report=draft_report,
+                    stats=stats,
+                    details=details,
+                    check_type=ct.CHECK_TYPE_SAMPLES,
+                    check_name=check_name,
+                    check_tags=check_tags,
+                    source_table=source_table.full_name,
+                    target_table=target_table.full_name,
+                    persist_options=persist_options,
+                    report_output_format=report_output_format,
                 )
-
-                status = (
-                    ct.CHECK_FAILED
-                    if discrepancies_counters_pct > tolerance_pct
-                    else ct.CHECK_SUCCESS
+            except Exception:
+                app_logger.exception(
+                    f'Samples check failed for {target_table.full_name}'
                 )
-
-                report = generate_count_report(
-                    source_table.full_name,
-                    target_table.full_name,
-                    stats,
-                    details,
-                    total_count_source,
-                    total_count_taget,
-                    discrepancies_counters_pct,
-                    result_diff_in_counters,
-                    result_equal_in_counters,
-                    self.timezone,
-                    run_id,
-                    run_started_at,
-                    source_query,
-                    source_params,
-                    target_query,
-                    target_params,
-                    **self._report_context,
+                status, stats, details = ct.CHECK_FAILED, None, None
+                report = self._finalize_check(
+                    status=status,
+                    report=None,
+                    stats=None,
+                    details=None,
+                    check_type=ct.CHECK_TYPE_SAMPLES,
+                    check_name=check_name,
+                    check_tags=check_tags,
+                    source_table=source_table.full_name,
+                    target_table=target_table.full_name,
+                    persist_options=persist_options,
+                    report_output_format=report_output_format,
                 )
+            self._update_stats(status, source_table)
+            results.append((status, report, stats, details))
 
-                return status, report, stats, details
-
-        except Exception as e:
-            app_logger.error(f'Counts check failed: {str(e)}')
-            raise
+        return results
 
-    def _check_samples(
+    def check_samples_sharded(
         self,
-        source_table: DataReference,
+        sources: List[Tuple[Engine, DataReference]],
         target_table: DataReference,
-        date_column: str,
-        update_column: str,
-        start_date: Optional[str],
-        end_date: Optional[str],
-        chunk_size_days: Optional[int],
-        exclude_columns: List[str],
-        include_columns: List[str],
-        custom_key_columns: Optional[List[str]],
-        tolerance_pct: float,
-        exclude_recent_hours: Optional[int],
-        max_examples: Optional[int],
-        run_id: str,
-        run_started_at: str,
+        check_name: Optional[str] = None,
+        date_column: Optional[str] = None,
+        update_column: Optional[str] = None,
+        date_range: Optional[Tuple[str, str]] = None,
+        chunk_size_days: Optional[int] = None,
+        exclude_columns: Optional[List[str]] = None,
+        include_columns: Optional[List[str]] = None,
+        custom_primary_key: Optional[List[str]] = None,
+        tolerance_pct: float = 0.0,
+        exclude_recent_hours: Optional[int] = None,
+        max_examples: Optional[int] = ct.DEFAULT_MAX_EXAMPLES,
+        persist_result: Union[bool, DataReference] = False,
+        check_tags: Optional[Dict] = None,
+        report_output_format: str = ct.REPORT_OUTPUT_FORMAT_TEXT,
+        shard_column: Optional[str] = None,
+        shard_labels: Optional[List[str]] = None,
+        details_level: str = ct.DETAILS_EXAMPLES,
     ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Compare the union of several source shards with one target table.
 
-        try:
-            source_object_type = self._get_object_type(source_table, self.source_engine)
-            target_object_type = self._get_object_type(target_table, self.target_engine)
-            app_logger.info(
-                f'object type source: {source_object_type} vs target {target_object_type}'
-            )
-
-            source_columns_meta = self._get_metadata_cols(
-                source_table, self.source_engine
-            )
-            app_logger.info('source_columns meta:\n')
-            app_logger.info(source_columns_meta.to_string(index=False))
-
-            target_columns_meta = self._get_metadata_cols(
-                target_table, self.target_engine
-            )
-            app_logger.info('target_columns meta:\n')
-            app_logger.info(target_columns_meta.to_string(index=False))
-
-            intersect = list(set(include_columns) & set(exclude_columns))
-            if intersect:
-                app_logger.warning(
-                    f'Intersection columns between Include and exclude: {",".join(intersect)}'
-                )
-
-            key_columns = None
+        Each date chunk is queried on all shards concurrently (one query at
+        a time per engine), the shard frames are concatenated and compared
+        with the target chunk. Row counts per shard are reported in
+        ``details.execution_info['shards']``.
 
-            if custom_key_columns:
-                key_columns = custom_key_columns
-                source_cols = source_columns_meta['column_name'].tolist()
-                target_cols = target_columns_meta['column_name'].tolist()
+        Parameters:
+            sources : `List[Tuple[Engine, DataReference]]`
+                Shard engines and tables; the checker source_engine is not used.
+            shard_column : `Optional[str] = None`
+                Target column holding the shard label of each row; source rows
+                are tagged with their shard label and the column is compared.
+            shard_labels : `Optional[List[str]] = None`
+                Labels of the shards, default their position ("0", "1", ...).
+
+        The other parameters are the same as in ``check_samples``.
+        """
+        if not sources:
+            raise ValueError('sources must not be empty')
+        for _, source_table in sources:
+            self._validate_inputs(source_table, target_table)
+        if shard_labels is not None and len(shard_labels) != len(sources):
+            raise ValueError('shard_labels must have one label per source')
+        self._require_target_engine()
+        validate_report_output_format(report_output_format)
+        self._validate_details_level(details_level)
+        persist_options = parse_persist_result_option(persist_result)
+        run_id, run_started_at = self._start_check_run(
+            ct.CHECK_TYPE_SAMPLES, check_name, details_level=details_level
+        )
 
-                missing_in_source = [
-                    col for col in custom_key_columns if col not in source_cols
-                ]
-                missing_in_target = [
-                    col for col in custom_key_columns if col not in target_cols
-                ]
+        exclude_hours = exclude_recent_hours or self.default_exclude_recent_hours
+        start_date, end_date = date_range or (None, None)
+        custom_keys = (
+            normalize_column_names(custom_primary_key or [])
+            if custom_primary_key
+            else None
+        )
+        labels = [str(label) for label in shard_labels or range(len(sources))]
+        source_table = sources[0][1]
 
-                if missing_in_source:
-                    raise MetadataError(
-                        f'Custom key columns missing in source: {missing_in_source}'
-                    )
-                if missing_in_target:
-                    raise MetadataError(
-                        f'Custom key columns missing in target: {missing_in_target}'
-                    )
-            else:
-                source_pk = (
-                    self._get_metadata_pk(source_table, self.source_engine)
-                    if source_object_type == ObjectType.TABLE
-                    else pd.DataFrame({'pk_column_name': []})
-                )
-                target_pk = (
-                    self._get_metadata_pk(target_table, self.target_engine)
-                    if target_object_type == ObjectType.TABLE
-                    else pd.DataFrame({'pk_column_name': []})
-                )
+        try:
+            self.check_stats['checked'] += 1
 
-                if (
-                    source_pk['pk_column_name'].tolist()
-                    != target_pk['pk_column_name'].tolist()
-                ):
-                    app_logger.warning(
-                        f'Primary keys differ: source={source_pk["pk_column_name"].tolist()}, target={target_pk["pk_column_name"].tolist()}'
-                    )
-                key_columns = (
-                    source_pk['pk_column_name'].tolist()
-                    or target_pk['pk_column_name'].tolist()
-                )
-                if not key_columns:
-                    raise MetadataError(
-                        f'Primary key not found in the source neither in the target and not provided'
-                    )
-
-            if include_columns:
-                if not set(include_columns) & set(key_columns):
-                    app_logger.warning(
-                        f'The primary key was not included in the column list.\
-                                       The key column was included in the resulting query automatically. PK:{key_columns}'
-                    )
-
-                include_columns = list(set(include_columns + key_columns))
-
-                source_columns_meta = source_columns_meta[
-                    source_columns_meta['column_name'].isin(include_columns)
-                ]
-                target_columns_meta = target_columns_meta[
-                    target_columns_meta['column_name'].isin(include_columns)
-                ]
-
-            if exclude_columns:
-                if set(exclude_columns) & set(key_columns):
-                    app_logger.warning(
-                        f'The primary key has been excluded from the column list.\
-                                       However, the key column must be present in the resulting query.s PK:{key_columns}'
-                    )
-
-                exclude_columns = list(set(exclude_columns) - set(key_columns))
-
-                source_columns_meta = source_columns_meta[
-                    ~source_columns_meta['column_name'].isin(exclude_columns)
-                ]
-                target_columns_meta = target_columns_meta[
-                    ~target_columns_meta['column_name'].isin(exclude_columns)
-                ]
-
-            common_cols_df, source_only_cols, target_only_cols = (
-                self._analyze_columns_meta(source_columns_meta, target_columns_meta)
-            )
-            common_cols = common_cols_df['column_name'].tolist()
-
-            if not common_cols:
-                raise MetadataError(
-                    f'No one column to compare, need to check tables or reduce the exclude_columns list: {",".join(exclude_columns)}'
-                )
-
-            return self._check_samples_iterative(
-                source_table=source_table,
-                target_table=target_table,
-                source_columns_meta=source_columns_meta,
-                target_columns_meta=target_columns_meta,
-                common_cols=common_cols,
-                key_columns=key_columns,
-                source_only_cols=source_only_cols,
-                target_only_cols=target_only_cols,
-                date_column=date_column,
-                update_column=update_column,
-                start_date=start_date,
-                end_date=end_date,
-                chunk_size_days=chunk_size_days,
-                exclude_recent_hours=exclude_recent_hours,
-                tolerance_pct=tolerance_pct,
-                max_examples=max_examples,
+            status, draft_report, stats, details = self._check_samples_sharded(
+                sources,
+                labels,
+                target_table,
+                date_column,
+                update_column,
+                start_date,
+                end_date,
+                chunk_size_days,
+                normalize_column_names(exclude_columns or []),
+                normalize_column_names(include_columns or []),
+                custom_keys,
+                tolerance_pct,
+                exclude_hours,
+                max_examples,
+                shard_column.lower() if shard_column else None,
                 run_id=run_id,
                 run_started_at=run_started_at,
             )
 
-        except Exception as e:
-            app_logger.error(f'Samples check failed: {str(e)}')
-            raise
+            report = self._finalize_check(
+                status=status,
+                report=draft_report,
+                stats=stats,
+                details=details,
+                check_type=ct.CHECK_TYPE_SAMPLES,
+                check_name=check_name,
+                check_tags=check_tags,
+                source_table=source_table.full_name,
+                target_table=target_table.full_name,
+                persist_options=persist_options,
+                report_output_format=report_output_format,
+            )
+            self._update_stats(status, source_table)
+            return status, report, stats, details
 
-    def check_sniff_query(
+        except Exception:
+            app_logger.exception('Samples check failed')
+            status = ct.CHECK_FAILED
+            report = self._finalize_check(
+                status=status,
+                report=None,
+                stats=None,
+                details=None,
+                check_type=ct.CHECK_TYPE_SAMPLES,
+                check_name=check_name,
+                check_tags=check_tags,
+                source_table=source_table.full_name,
+                target_table=target_table.full_name,
+                persist_options=persist_options,
+                report_output_format=report_output_format,
+            )
+            self._update_stats(status, source_table)
+            return status, report, None, None
+
+    def check_profile(
         self,
-        source_query: str,
-        source_params: Optional[Dict] = None,
+        source_table: DataReference,
+        target_table: DataReference,
+        date_column: str,
         check_name: Optional[str] = None,
+        date_range: Optional[Tuple[str, str]] = None,
         chunk_size_days: Optional[int] = None,
+        exclude_columns: Optional[List[str]] = None,
+        include_columns: Optional[List[str]] = None,
         tolerance_pct: float = 0.0,
         max_examples: Optional[int] = ct.DEFAULT_MAX_EXAMPLES,
         persist_result: Union[bool, DataReference] = False,
@@ -630,385 +936,2234 @@ class DataQualityChecker:
         report_output_format: str = ct.REPORT_OUTPUT_FORMAT_TEXT,
     ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
         """
-        Sniff out data issues with a source-only SQL check.
+        Compare per-day, per-column aggregates computed by the databases.
 
-        Row-level and scalar pass/fail checks both use ``xsniff_passed``
-        (``y`` = passed, ``n`` = failed).
-        """
-        source_engine = self.source_engine
-        timezone = self.timezone
-        source_params = source_params or {}
+        The daily count query of each side gets aggregate columns for every
+        compared column: null count for all columns, min, max and sum for
+        numeric columns and the sum of lengths for string columns. Only the
+        aggregate frames (one row per day) are fetched and compared, each
+        ``column__metric`` is a compared value of the day.
+
+        A column of different kinds on both sides (e.g. number vs text) is
+        profiled by its null count only. No primary key is needed.
+
+        Parameters:
+            chunk_size_days : `Optional[int] = None`
+                Split the date range into N-day chunks.
 
+        The other parameters are the same as in ``check_samples``.
+        """
+        self._validate_inputs(source_table, target_table)
+        self._require_target_engine()
         validate_report_output_format(report_output_format)
         persist_options = parse_persist_result_option(persist_result)
         run_id, run_started_at = self._start_check_run(
-            ct.CHECK_TYPE_SNIFF_QUERY, check_name
+            ct.CHECK_TYPE_PROFILE, check_name
         )
 
+        start_date, end_date = date_range or (None, None)
+
         try:
             self.check_stats['checked'] += 1
 
-            app_logger.info('Getting metadata for sniff query')
-            source_metadata = self._get_metadata_cols_for_custom_query(
-                (source_query, source_params), source_engine
-            )
-            source_adapter = self._get_adapter(self.source_db_type)
-            source_chunks = self._resolve_source_query_chunks(
-                source_params, chunk_size_days
+            status, draft_report, stats, details = self._check_profile(
+                source_table,
+                target_table,
+                date_column,
+                start_date,
+                end_date,
+                chunk_size_days,
+                normalize_column_names(exclude_columns or []),
+                normalize_column_names(include_columns or []),
+                tolerance_pct,
+                max_examples,
+                run_id=run_id,
+                run_started_at=run_started_at,
             )
 
-            if len(source_chunks) == 1:
-                stats, details = self._execute_source_query_chunk(
-                    source_query=source_query,
-                    source_params=source_chunks[0],
-                    source_engine=source_engine,
-                    source_adapter=source_adapter,
-                    source_metadata=source_metadata,
-                    max_examples=max_examples,
-                    timezone=timezone,
-                )
-            else:
-                stats, details = self._check_sniff_query_iterative(
-                    source_query=source_query,
-                    source_chunks=source_chunks,
-                    source_engine=source_engine,
-                    source_adapter=source_adapter,
-                    source_metadata=source_metadata,
-                    max_examples=max_examples,
-                    timezone=timezone,
-                )
-
-            date_chunks = [
-                (chunk.get('start_date'), chunk.get('end_date'))
-                for chunk in source_chunks
-                if chunk.get('start_date') is not None
-                and chunk.get('end_date') is not None
-            ] or None
-
-            if not stats:
-                status = ct.CHECK_SKIPPED
-                draft_report = None
-            else:
-                status = (
-                    ct.CHECK_FAILED
-                    if stats.final_diff_score > tolerance_pct
-                    else ct.CHECK_SUCCESS
-                )
-                draft_report = generate_check_sniff_query_report(
-                    stats,
-                    details,
-                    self.timezone,
-                    run_id,
-                    run_started_at,
-                    source_query,
-                    source_params,
-                    date_chunks=date_chunks,
-                    library_version=self._report_context['library_version'],
-                    source_db_type=self._report_context['source_db_type'],
-                )
-
             report = self._finalize_check(
                 status=status,
                 report=draft_report,
                 stats=stats,
                 details=details,
-                check_type=ct.CHECK_TYPE_SNIFF_QUERY,
+                check_type=ct.CHECK_TYPE_PROFILE,
                 check_name=check_name,
                 check_tags=check_tags,
-                source_table=None,
-                target_table=None,
-                source_query=source_query,
-                source_params=source_params,
+                source_table=source_table.full_name,
+                target_table=target_table.full_name,
                 persist_options=persist_options,
                 report_output_format=report_output_format,
             )
-            self._update_stats(status, None)
+            self._update_stats(status, source_table)
             return status, report, stats, details
 
         except Exception:
-            app_logger.exception('Sniff query failed')
+            app_logger.exception('Profile check failed')
             status = ct.CHECK_FAILED
             report = self._finalize_check(
                 status=status,
                 report=None,
                 stats=None,
                 details=None,
-                check_type=ct.CHECK_TYPE_SNIFF_QUERY,
+                check_type=ct.CHECK_TYPE_PROFILE,
                 check_name=check_name,
                 check_tags=check_tags,
-                source_table=None,
-                target_table=None,
-                source_query=source_query,
-                source_params=source_params,
+                source_table=source_table.full_name,
+                target_table=target_table.full_name,
                 persist_options=persist_options,
                 report_output_format=report_output_format,
             )
-            self._update_stats(status, None)
+            self._update_stats(status, source_table)
             return status, report, None, None
 
-    def check_custom_queries(
+    def check_counts_drilldown(
         self,
-        source_query: str,
-        source_params: Dict,
-        target_query: str,
-        target_params: Dict,
-        custom_primary_key: List[str],
+        source_table: DataReference,
+        target_table: DataReference,
+        date_column: str,
+        date_range: Tuple[str, str],
         check_name: Optional[str] = None,
+        update_column: Optional[str] = None,
         chunk_size_days: Optional[int] = None,
         exclude_columns: Optional[List[str]] = None,
+        include_columns: Optional[List[str]] = None,
+        custom_primary_key: Optional[List[str]] = None,
         tolerance_pct: float = 0.0,
+        exclude_recent_hours: Optional[int] = None,
         max_examples: Optional[int] = ct.DEFAULT_MAX_EXAMPLES,
         persist_result: Union[bool, DataReference] = False,
         check_tags: Optional[Dict] = None,
         report_output_format: str = ct.REPORT_OUTPUT_FORMAT_TEXT,
     ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
         """
-        Compare data from custom queries with specified key columns.
+        Daily counts over the range, drilled down to rows where they differ.
 
-        For source-only issue checks, use :meth:`check_sniff_query`.
+        Days with different counts are counted again by hour, and only rows
+        of the hours with different counts are fetched and compared like in
+        ``check_samples``. The report holds the counts report followed by
+        the row-level report; stats and details are the row-level ones (the
+        counts ones when no rows were compared). Drilled days and hours are
+        listed in ``details.execution_info['drilldown']``.
+
+        The check fails when the counts differ by more than ``tolerance_pct``
+        or the compared rows do.
+
+        Parameters are the same as in ``check_counts`` and ``check_samples``.
         """
+        self._validate_inputs(source_table, target_table)
         self._require_target_engine()
-        source_engine = self.source_engine
-        target_engine = self.target_engine
-        timezone = self.timezone
-        source_params = source_params or {}
-        target_params = target_params or {}
-        exclude_cols = normalize_column_names(exclude_columns or [])
-        custom_keys = normalize_column_names(custom_primary_key)
-        if not custom_keys:
-            raise ValueError('custom_primary_key is mandatory')
-
         validate_report_output_format(report_output_format)
         persist_options = parse_persist_result_option(persist_result)
         run_id, run_started_at = self._start_check_run(
-            ct.CHECK_TYPE_CUSTOM_QUERIES, check_name
+            ct.CHECK_TYPE_COUNTS_DRILLDOWN, check_name
+        )
+
+        exclude_hours = exclude_recent_hours or self.default_exclude_recent_hours
+        start_date, end_date = date_range
+        custom_keys = (
+            normalize_column_names(custom_primary_key or [])
+            if custom_primary_key
+            else None
         )
 
         try:
             self.check_stats['checked'] += 1
 
-            app_logger.info('Getting metadata for source query')
-            source_metadata = self._get_metadata_cols_for_custom_query(
-                (source_query, source_params), source_engine
-            )
-
-            app_logger.info('Getting metadata for target query')
-            target_metadata = self._get_metadata_cols_for_custom_query(
-                (target_query, target_params), target_engine
+            status, draft_report, stats, details = self._check_counts_drilldown(
+                source_table,
+                target_table,
+                date_column,
+                update_column,
+                start_date,
+                end_date,
+                chunk_size_days,
+                normalize_column_names(exclude_columns or []),
+                normalize_column_names(include_columns or []),
+                custom_keys,
+                tolerance_pct,
+                exclude_hours,
+                max_examples,
+                run_id=run_id,
+                run_started_at=run_started_at,
             )
 
-            source_adapter = self._get_adapter(self.source_db_type)
-            target_adapter = self._get_adapter(self.target_db_type)
-            date_chunks = self._resolve_custom_query_chunks(
-                source_params, target_params, chunk_size_days
-            )
-
-            if len(date_chunks) == 1:
-                stats, details = self._execute_custom_query_chunk(
-                    source_query=source_query,
-                    source_params=date_chunks[0][0],
-                    target_query=target_query,
-                    target_params=date_chunks[0][1],
-                    source_engine=source_engine,
-                    target_engine=target_engine,
-                    source_adapter=source_adapter,
-                    target_adapter=target_adapter,
-                    source_metadata=source_metadata,
-                    target_metadata=target_metadata,
-                    custom_primary_key=custom_keys,
-                    exclude_columns=exclude_cols,
-                    max_examples=max_examples,
-                    timezone=timezone,
-                )
-            else:
-                stats, details = self._check_custom_queries_iterative(
-                    source_query=source_query,
-                    target_query=target_query,
-                    chunk_ranges=date_chunks,
-                    source_engine=source_engine,
-                    target_engine=target_engine,
-                    source_adapter=source_adapter,
-                    target_adapter=target_adapter,
-                    source_metadata=source_metadata,
-                    target_metadata=target_metadata,
-                    custom_primary_key=custom_keys,
-                    exclude_columns=exclude_cols,
-                    max_examples=max_examples,
-                    timezone=timezone,
-                )
-
-            if not stats:
-                status = ct.CHECK_SKIPPED
-                draft_report = None
-            else:
-                status = (
-                    ct.CHECK_FAILED
-                    if stats.final_diff_score > tolerance_pct
-                    else ct.CHECK_SUCCESS
-                )
-                draft_report = generate_sample_report(
-                    None,
-                    None,
-                    stats,
-                    details,
-                    self.timezone,
-                    run_id,
-                    run_started_at,
-                    source_query,
-                    source_params,
-                    target_query,
-                    target_params,
-                    date_chunks=date_chunks,
-                    **self._report_context,
-                )
-
             report = self._finalize_check(
                 status=status,
                 report=draft_report,
                 stats=stats,
                 details=details,
-                check_type=ct.CHECK_TYPE_CUSTOM_QUERIES,
+                check_type=ct.CHECK_TYPE_COUNTS_DRILLDOWN,
                 check_name=check_name,
                 check_tags=check_tags,
-                source_table=None,
-                target_table=None,
-                source_query=source_query,
-                source_params=source_params,
-                target_query=target_query,
-                target_params=target_params,
+                source_table=source_table.full_name,
+                target_table=target_table.full_name,
                 persist_options=persist_options,
                 report_output_format=report_output_format,
             )
-            self._update_stats(status, None)
+            self._update_stats(status, source_table)
             return status, report, stats, details
 
         except Exception:
-            app_logger.exception('Custom queries check failed')
+            app_logger.exception('Counts drill-down check failed')
             status = ct.CHECK_FAILED
             report = self._finalize_check(
                 status=status,
                 report=None,
                 stats=None,
                 details=None,
-                check_type=ct.CHECK_TYPE_CUSTOM_QUERIES,
+                check_type=ct.CHECK_TYPE_COUNTS_DRILLDOWN,
                 check_name=check_name,
                 check_tags=check_tags,
-                source_table=None,
-                target_table=None,
-                source_query=source_query,
-                source_params=source_params,
-                target_query=target_query,
-                target_params=target_params,
+                source_table=source_table.full_name,
+                target_table=target_table.full_name,
                 persist_options=persist_options,
                 report_output_format=report_output_format,
             )
-            self._update_stats(status, None)
+            self._update_stats(status, source_table)
             return status, report, None, None
 
-    def _finalize_check(
-        self,
-        *,
-        status: str,
-        report: Optional[str],
-        stats: Optional[CheckStats],
-        details: Optional[CheckDetails],
-        check_type: str,
-        persist_options: PersistResultOptions,
-        report_output_format: str,
-        check_name: Optional[str] = None,
-        check_tags: Optional[Dict] = None,
-        source_table: Optional[str] = None,
-        target_table: Optional[str] = None,
-        source_query: Optional[str] = None,
-        source_params: Optional[Dict] = None,
-        target_query: Optional[str] = None,
-        target_params: Optional[Dict] = None,
-    ) -> Optional[str]:
-        if not getattr(self, '_active_run_id', None):
-            raise RuntimeError('check run was not started; run_id is missing')
-        self._run_timings.finish_run()
-        result = build_check_result(
-            run_id=self._active_run_id,
-            timestamp=self._active_run_started_at,
-            timezone=self.timezone,
-            status=status,
-            report=report,
-            stats=stats,
-            details=details,
-            check_type=check_type,
-            check_name=self._active_check_name,
-            check_tags=check_tags,
-            source_table=source_table,
-            target_table=target_table,
-            source_query=source_query,
-            source_params=source_params,
-            target_query=target_query,
-            target_params=target_params,
-            timings=self._run_timings,
-        )
-        self.result_persister.persist(
-            result,
-            persist_result=persist_options.enabled,
-            persist_result_ref=persist_options.table_ref,
-        )
+    def run_suite(
+        self, checks: List[SuiteCheck]
+    ) -> List[Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]]:
+        """
+        Run several checks sharing table reads where possible.
+
+        ``check_samples`` over the same table, date range, chunking and
+        recent-rows settings read each chunk once per side: one query for the
+        union of their columns, projected per check. ``check_counts`` over a
+        table and range read that way derive their daily counts from the
+        shared frames. Other checks run as usual.
+
+        Parameters:
+            checks : `List[SuiteCheck]`
+                Checker method names and keyword arguments.
+
+        Returns:
+            The result of every check, in order.
+        """
+        for check in checks:
+            if not check.method.startswith('check_') or not hasattr(
+                self, check.method
+            ):
+                raise ValueError(f'Unknown check method: {check.method}')
+
+        shared, order = plan_suite(checks, self.default_exclude_recent_hours)
+        self._suite_reads = self._prepare_suite_reads(shared, checks)
         app_logger.info(
-            f'Check run finished: run_id={self._active_run_id} status={status}'
+            f'suite plan: {[read.to_dict() for read in shared]}, order: {order}'
         )
-        return format_check_result(result, report_output_format)
+        results = [None] * len(checks)
+        try:
+            for i in order:
+                results[i] = getattr(self, checks[i].method)(**checks[i].kwargs)
+        finally:
+            self._suite_reads = None
+        return results
+
+    def _prepare_suite_reads(
+        self, shared: List[SharedRead], checks: List[SuiteCheck]
+    ) -> Dict[Tuple, SharedRead]:
+        """Resolve the superset columns of shared reads and index them by chunk"""
+        index = {}
+        for read in shared:
+            engine = (
+                self.source_engine if read.key.side == 'source' else self.target_engine
+            )
+            metas = []
+            for i in list(read.sample_checks):
+                kwargs = checks[i].kwargs
+                custom_keys = kwargs.get('custom_primary_key')
+                try:
+                    columns = self._resolve_samples_columns(
+                        kwargs['source_table'],
+                        kwargs['target_table'],
+                        self.target_engine,
+                        normalize_column_names(kwargs.get('exclude_columns') or []),
+                        normalize_column_names(kwargs.get('include_columns') or []),
+                        normalize_column_names(custom_keys) if custom_keys else None,
+                    )
+                except Exception as e:
+                    app_logger.warning(
+                        f'Suite check {i} reads on its own: {e}', exc_info=True
+                    )
+                    read.sample_checks.remove(i)
+                    continue
+                metas.append(columns[f'{read.key.side}_columns_meta'])
+                read.columns += [
+                    col for col in columns['common_cols'] if col not in read.columns
+                ]
+            if not metas or read.consumers < 2:
+                continue
+            date_column = (read.key.date_column or '').lower()
+            if read.count_checks and date_column not in read.columns:
+                # counts are derived from the date column: read it too
+                table_meta = self._get_metadata_cols(read.table, engine)
+                date_meta = table_meta[table_meta['column_name'] == date_column]
+                if not date_meta.empty:
+                    metas.append(date_meta)
+                    read.columns.append(date_column)
+            if date_column not in read.columns:
+                read.count_checks.clear()
+            read.columns_meta = pd.concat(metas).drop_duplicates('column_name')
+            read.windows = self._iter_date_chunks(
+                read.key.date_column,
+                *(read.key.date_range or (None, None)),
+                read.key.chunk_size_days,
+            )
+            for window in read.windows:
+                index.setdefault(self._suite_read_index(engine, read, *window), read)
+        return index
 
-    def _resolve_custom_query_chunks(
+    @staticmethod
+    def _suite_read_index(
+        engine: Engine,
+        read: SharedRead,
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> Tuple:
+        return (
+            id(engine),
+            read.key.table_name,
+            read.key.date_column,
+            read.key.update_column,
+            read.key.exclude_recent_hours,
+            start_date,
+            end_date,
+        )
+
+    def _read_shared_frame(
         self,
-        source_params: Dict,
-        target_params: Dict,
-        chunk_size_days: Optional[int],
-    ) -> List[Tuple[Dict, Dict]]:
-        source_params = source_params or {}
-        target_params = target_params or {}
-        source_start = source_params.get('start_date')
-        source_end = source_params.get('end_date')
-        target_start = target_params.get('start_date')
-        target_end = target_params.get('end_date')
+        engine: Engine,
+        data_ref: DataReference,
+        common_columns: List[str],
+        date_column: Optional[str],
+        update_column: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        exclude_recent_hours: Optional[int],
+        query_side: str,
+    ) -> Optional[Tuple[pd.DataFrame, str, Dict]]:
+        """Projection of a suite's shared chunk read, None when not shared"""
+        read = self._suite_reads.get(
+            (
+                id(engine),
+                data_ref.full_name.lower(),
+                date_column,
+                update_column,
+                exclude_recent_hours,
+                start_date,
+                end_date,
+            )
+        )
+        if read is None or not set(common_columns) <= set(read.columns):
+            return None
+
+        window = (start_date, end_date)
+        if window not in read.frames:
+            df, query, params = self._get_table_data(
+                engine,
+                data_ref,
+                read.columns_meta,
+                list(read.columns),
+                date_column,
+                update_column,
+                start_date,
+                end_date,
+                exclude_recent_hours,
+                query_side=query_side,
+                shared=False,
+            )
+            read.frames[window] = [df, query, params, len(read.sample_checks)]
+            if window not in read.fetched_windows and read.count_checks:
+                days = df[date_column.lower()].dropna().astype(str).str[:10]
+                for day, cnt in days.value_counts().items():
+                    read.day_counts[day] = read.day_counts.get(day, 0) + int(cnt)
+            read.fetched_windows.add(window)
+
+        entry = read.frames[window]
+        df, query, params = entry[0], entry[1], entry[2]
+        entry[3] -= 1
+        if entry[3] <= 0:
+            del read.frames[window]
+        projected = list(common_columns) + [
+            col
+            for col in df.columns
+            if col == ct.XRECENTLY_CHANGED_COLUMN and col not in common_columns
+        ]
+        return df[projected].copy(), query, params
 
-        if not (
-            chunk_size_days
-            and source_start is not None
-            and source_end is not None
-            and target_start is not None
-            and target_end is not None
-        ):
-            return [(dict(source_params), dict(target_params))]
+    def _derived_suite_counts(
+        self,
+        side: str,
+        data_ref: DataReference,
+        date_column: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> Optional[pd.DataFrame]:
+        """Daily counts taken from a complete shared read of the running suite"""
+        if not getattr(self, '_suite_reads', None) or date_column is None:
+            return None
+        for read in self._suite_reads.values():
+            if (
+                read.key.side == side
+                and read.key.table_name == data_ref.full_name.lower()
+                and read.key.date_column == date_column
+                and read.key.date_range == (start_date, end_date)
+                and read.count_checks
+                and read.complete
+            ):
+                return pd.DataFrame(
+                    sorted(read.day_counts.items(), reverse=True),
+                    columns=['dt', 'cnt'],
+                )
+        return None
 
-        source_chunks = self._iter_date_chunks(
-            'date', source_start, source_end, chunk_size_days
+    def _start_check_run(
+        self,
+        check_type: str,
+        check_name: Optional[str],
+        timings: Optional[CheckRunTimings] = None,
+        details_level: str = ct.DETAILS_EXAMPLES,
+    ) -> Tuple[str, str]:
+        """
+        Start a check run; ``timings`` carries over queries run before it,
+        ``details_level`` is the details level of its comparisons and report.
+        """
+        run_started_at = (
+            timings.run_started_at
+            if timings is not None
+            else pd.Timestamp.now().strftime(ct.DATETIME_FORMAT)
         )
-        target_chunks = self._iter_date_chunks(
-            'date', target_start, target_end, chunk_size_days
+        run_id = build_run_id()
+        app_logger.info(
+            f'Check run started: run_id={run_id} '
+            f'check_name={check_name} check_type={check_type}'
         )
-        if len(source_chunks) != len(target_chunks):
-            raise ValueError(
-                'source and target custom query date ranges produce different chunk counts'
-            )
+        self._active_run_id = run_id
+        self._active_run_started_at = run_started_at
+        self._active_check_name = check_name
+        self._reset_run_context(details_level)
+        self._run_timings = (
+            replace(timings)
+            if timings is not None
+            else CheckRunTimings(run_started_at=run_started_at)
+        )
+        return run_id, run_started_at
 
-        chunk_ranges: List[Tuple[Dict, Dict]] = []
-        for (s_start, s_end), (t_start, t_end) in zip(source_chunks, target_chunks):
-            source_chunk_params = dict(source_params)
-            target_chunk_params = dict(target_params)
-            source_chunk_params['start_date'] = s_start
-            source_chunk_params['end_date'] = s_end
-            target_chunk_params['start_date'] = t_start
-            target_chunk_params['end_date'] = t_end
-            chunk_ranges.append((source_chunk_params, target_chunk_params))
-        return chunk_ranges
+    def _reset_run_context(self, details_level: str = ct.DETAILS_EXAMPLES) -> None:
+        """
+        Start the check deadline and set the details level of the queries and
+        comparisons that follow; also run before the fetch shared by several
+        check runs, so it does not inherit them from the previous check.
+        """
+        self._check_deadline = (
+            time.monotonic() + self.check_timeout_seconds
+            if self.check_timeout_seconds is not None
+            else None
+        )
+        self._details_level = details_level
 
-    def _resolve_source_query_chunks(
+    def _check_counts(
         self,
-        source_params: Dict,
+        source_table: DataReference,
+        target_table: DataReference,
+        date_column: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
         chunk_size_days: Optional[int],
-    ) -> List[Dict]:
-        source_params = dict(source_params or {})
-        source_start = source_params.get('start_date')
-        source_end = source_params.get('end_date')
-
+        tolerance_pct: float,
+        max_examples: int,
+        run_id: str,
+        run_started_at: str,
+        max_parallel_chunks: int = 1,
+        single_scan_max_rows: Optional[int] = None,
+        freeze_after_days: Optional[int] = None,
+        revalidate_days: int = 0,
+        key_fingerprint_columns: Optional[List[str]] = None,
+        bisect_key_column: Optional[str] = None,
+        bisect_max_range_rows: int = ct.DEFAULT_KEY_BISECT_MAX_RANGE_ROWS,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+        """``key_fingerprint_columns`` enables the key fingerprint ([] = table PK)"""
+
+        try:
+            source_adapter = self._get_adapter(self.source_db_type)
+            target_adapter = self._get_adapter(self.target_db_type)
+
+            source_columns_meta = self._get_metadata_cols(
+                source_table, self.source_engine
+            )
+            app_logger.info('source_columns meta:\n')
+            app_logger.info(source_columns_meta.to_string(index=False))
+
+            target_columns_meta = self._get_metadata_cols(
+                target_table, self.target_engine
+            )
+            app_logger.info('target_columns meta:\n')
+            app_logger.info(target_columns_meta.to_string(index=False))
+
+            key_columns = None
+            if key_fingerprint_columns is not None:
+                key_columns = key_fingerprint_columns or self._resolve_key_columns(
+                    source_table, target_table
+                )
+                # fail before any count query on keys without a common text form
+                source_adapter.build_key_hash_expression(
+                    key_columns, source_columns_meta
+                )
+                target_adapter.build_key_hash_expression(
+                    key_columns, target_columns_meta
+                )
+
+            count_cache = None
+            if freeze_after_days is not None:
+                count_cache = self._plan_count_cache(
+                    source_table,
+                    target_table,
+                    date_column,
+                    start_date,
+                    end_date,
+                    freeze_after_days,
+                    revalidate_days,
+                )
+
+            if count_cache is None:
+                date_chunks = self._iter_date_chunks(
+                    date_column, start_date, end_date, chunk_size_days
+                )
+            else:
+                date_chunks = [
+                    chunk
+                    for window in days_to_windows(count_cache[0].query_days)
+                    for chunk in self._iter_date_chunks(
+                        date_column, *window, chunk_size_days
+                    )
+                ]
+            derived = [
+                self._derived_suite_counts(
+                    side, data_ref, date_column, start_date, end_date
+                )
+                for side, data_ref in (
+                    ('source', source_table),
+                    ('target', target_table),
+                )
+            ]
+            if (
+                count_cache is None
+                and key_columns is None
+                and all(counts is not None for counts in derived)
+            ):
+                source_counts, target_counts = derived
+                source_query, source_params = None, None
+                target_query, target_params = None, None
+                execution_info = {'counts_source': 'suite shared reads'}
+            else:
+                plan = self._plan_counts_execution(
+                    source_table,
+                    target_table,
+                    date_chunks,
+                    max_parallel_chunks,
+                    single_scan_max_rows,
+                )
+                app_logger.info(f'counts execution plan: {plan.to_dict()}')
+
+                (
+                    source_counts,
+                    target_counts,
+                    (source_query, source_params),
+                    (target_query, target_params),
+                ) = self._fetch_counts(
+                    plan,
+                    source_adapter,
+                    target_adapter,
+                    source_table,
+                    target_table,
+                    date_column,
+                    source_columns_meta,
+                    target_columns_meta,
+                    key_columns=key_columns,
+                )
+
+                execution_info = {'counts_plan': plan.to_dict()}
+                if count_cache is not None:
+                    source_counts, target_counts, execution_info['count_cache'] = (
+                        self._apply_count_cache(
+                            *count_cache, source_counts, target_counts
+                        )
+                    )
+
+            status, report, stats, details = self._evaluate_counts(
+                source_table,
+                target_table,
+                source_counts,
+                target_counts,
+                tolerance_pct,
+                max_examples,
+                run_id,
+                run_started_at,
+                (source_query, source_params),
+                (target_query, target_params),
+                execution_info=execution_info,
+            )
+            if bisect_key_column and status != ct.CHECK_SKIPPED:
+                days = sorted(
+                    set(
+                        find_count_discrepancies(
+                            source_counts.copy(), target_counts.copy()
+                        )['dt']
+                    )
+                )
+                details.execution_info['key_bisection'] = {
+                    day: self._bisect_day_keys(
+                        {'source': source_adapter, 'target': target_adapter},
+                        {'source': source_columns_meta, 'target': target_columns_meta},
+                        {'source': source_table, 'target': target_table},
+                        bisect_key_column.lower(),
+                        date_column,
+                        day,
+                        bisect_max_range_rows,
+                        max_examples or ct.DEFAULT_MAX_EXAMPLES,
+                    )
+                    for day in days
+                }
+            return status, report, stats, details
+
+        except Exception as e:
+            app_logger.error(f'Counts check failed: {e}')
+            raise
+
+    def _bisect_day_keys(
+        self,
+        adapters: Dict[str, BaseDatabaseAdapter],
+        columns_meta: Dict[str, pd.DataFrame],
+        tables: Dict[str, DataReference],
+        key_column: str,
+        date_column: str,
+        day: str,
+        max_range_rows: int,
+        max_examples: int,
+    ) -> Dict:
+        """
+        Locate the keys missing on either side of one day by bisecting ranges
+        of an integer key with count queries, then diffing the keys of the
+        small ranges still differing.
+
+        Ranges with equal counts are assumed equal, so a lost row replaced by
+        another one in the same range is not found.
+        """
+        engines = {'source': self.source_engine, 'target': self.target_engine}
+        queries = 0
+
+        def _count(
+            build_aggregates: Callable[[BaseDatabaseAdapter], List[Tuple[str, str]]],
+        ) -> Dict[str, Optional[pd.Series]]:
+            nonlocal queries
+            rows = {}
+            for side in ('source', 'target'):
+                query = adapters[side].build_count_query_common(
+                    tables[side],
+                    date_column,
+                    day,
+                    day,
+                    columns_meta[side],
+                    self.timezone,
+                    aggregates=build_aggregates(adapters[side]),
+                )
+                frame = self._execute_query(
+                    query, engines[side], self.timezone, query_side=side
+                )
+                frame.columns = normalize_column_names(list(frame.columns))
+                queries += 1
+                rows[side] = frame.iloc[0] if not frame.empty else None
+            return rows
+
+        bounds = _count(
+            lambda adapter: adapter.build_key_bounds_aggregates(key_column)
+        )
+        key_bounds = []
+        for row in bounds.values():
+            if row is None or pd.isna(row['xkey_min']):
+                continue
+            for value in (row['xkey_min'], row['xkey_max']):
+                if isinstance(value, str) or int(value) != value:
+                    raise ValueError(
+                        f'Key bisection needs an integer key column: '
+                        f'{key_column}={value!r}'
+                    )
+                key_bounds.append(int(value))
+
+        ranges = [(min(key_bounds), max(key_bounds) + 1)] if key_bounds else []
+        leaves, unresolved = [], []
+        while ranges:
+            if len(ranges) > ct.KEY_BISECT_MAX_RANGES:
+                unresolved = ranges
+                break
+            rows = _count(
+                lambda adapter, ranges=ranges: adapter.build_key_range_aggregates(
+                    key_column, ranges
+                )
+            )
+            counts = {
+                side: [
+                    0 if row is None else int(row[f'xrange{i}'] or 0)
+                    for i in range(len(ranges))
+                ]
+                for side, row in rows.items()
+            }
+            ranges, new_leaves = bisect_key_ranges(
+                ranges, counts['source'], counts['target'], max_range_rows
+            )
+            leaves.extend(new_leaves)
+
+        keys = {'source': set(), 'target': set()}
+        for batch_start in range(0, len(leaves), ct.KEY_BISECT_MAX_RANGES):
+            batch = leaves[batch_start : batch_start + ct.KEY_BISECT_MAX_RANGES]
+            for side in ('source', 'target'):
+                query = adapters[side].build_data_query_common(
+                    tables[side],
+                    [key_column],
+                    date_column,
+                    None,
+                    day,
+                    day,
+                    None,
+                    columns_meta[side],
+                    self.timezone,
+                    extra_conditions=[
+                        adapters[side].build_key_ranges_condition(key_column, batch)
+                    ],
+                )
+                frame = self._execute_query(
+                    query, engines[side], self.timezone, query_side=side
+                )
+                queries += 1
+                keys[side].update(int(key) for key in frame.iloc[:, 0])
+
+        source_only = sorted(keys['source'] - keys['target'])
+        target_only = sorted(keys['target'] - keys['source'])
+        return {
+            'queries': queries,
+            'fetched_ranges': len(leaves),
+            'unresolved_ranges': len(unresolved),
+            'source_only_keys': len(source_only),
+            'target_only_keys': len(target_only),
+            'source_only_keys_examples': source_only[:max_examples],
+            'target_only_keys_examples': target_only[:max_examples],
+        }
+
+    def _evaluate_counts(
+        self,
+        source_table: DataReference,
+        target_table: DataReference,
+        source_counts: pd.DataFrame,
+        target_counts: pd.DataFrame,
+        tolerance_pct: float,
+        max_examples: int,
+        run_id: str,
+        run_started_at: str,
+        source_query: Tuple[Optional[str], Optional[Dict]],
+        target_query: Tuple[Optional[str], Optional[Dict]],
+        execution_info: Optional[Dict] = None,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+        """Compare merged daily counts (dt, cnt) and build the counts report"""
+        source_counts_filled, target_counts_filled = cross_fill_missing_dates(
+            source_counts, target_counts
+        )
+
+        merged = source_counts_filled.merge(target_counts_filled, on='dt')
+        total_count_source = source_counts_filled['cnt'].sum()
+        total_count_taget = target_counts_filled['cnt'].sum()
+
+        if (total_count_source, total_count_taget) == (0, 0):
+            app_logger.warning('nothing to compare to you')
+            status = ct.CHECK_SKIPPED
+            return status, None, None, None
+
+        key_fingerprint = ct.XKEY_HASH_SUM_COLUMN in source_counts_filled
+        different_key_days = []
+        if key_fingerprint:
+            different_key_days = merged.loc[
+                (merged['cnt_x'] == merged['cnt_y'])
+                & (
+                    merged[f'{ct.XKEY_HASH_SUM_COLUMN}_x']
+                    != merged[f'{ct.XKEY_HASH_SUM_COLUMN}_y']
+                ),
+                'dt',
+            ].tolist()
+
+        result_diff_in_counters = abs(merged['cnt_x'] - merged['cnt_y']).sum()
+        result_equal_in_counters = merged[['cnt_x', 'cnt_y']].min(axis=1).sum()
+
+        discrepancies_counters_pct = (
+            100
+            * result_diff_in_counters
+            / (result_diff_in_counters + result_equal_in_counters)
+        )
+        stats, details = self._check_dataframes_timed(
+            source_df=source_counts_filled,
+            target_df=target_counts_filled,
+            key_columns=['dt'],
+            max_examples=max_examples,
+        )
+        details.execution_info.update(execution_info or {})
+        if key_fingerprint:
+            details.execution_info['key_fingerprint'] = {
+                'same_count_different_keys_days': different_key_days
+            }
+
+        status = (
+            ct.CHECK_FAILED
+            if discrepancies_counters_pct > tolerance_pct or different_key_days
+            else ct.CHECK_SUCCESS
+        )
+
+        report = generate_count_report(
+            source_table.full_name,
+            target_table.full_name,
+            stats,
+            details,
+            total_count_source,
+            total_count_taget,
+            discrepancies_counters_pct,
+            result_diff_in_counters,
+            result_equal_in_counters,
+            self.timezone,
+            run_id,
+            run_started_at,
+            source_query[0],
+            source_query[1],
+            target_query[0],
+            target_query[1],
+            **self._report_context,
+        )
+
+        return status, report, stats, details
+
+    def _plan_count_cache(
+        self,
+        source_table: DataReference,
+        target_table: DataReference,
+        date_column: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        freeze_after_days: int,
+        revalidate_days: int,
+    ) -> Optional[Tuple[CountCachePlan, Dict[str, CountCacheScope], Dict[str, Dict]]]:
+        """Look up cached counts of frozen days; None when the cache does not apply"""
+        if freeze_after_days < 0:
+            raise ValueError('freeze_after_days must not be negative')
+        if self.state_store is None:
+            raise ValueError('freeze_after_days requires a checker state_store')
+        if not (date_column and start_date and end_date):
+            app_logger.info(
+                'count cache skipped: it needs date_column and a bounded date_range'
+            )
+            return None
+
+        scopes = {
+            'source': CountCacheScope.for_table(
+                self.source_engine, source_table, date_column, self.timezone
+            ),
+            'target': CountCacheScope.for_table(
+                self.target_engine, target_table, date_column, self.timezone
+            ),
+        }
+        freeze_before = self._freeze_before(freeze_after_days)
+        frozen_end = min(
+            pd.Timestamp(end_date).normalize(),
+            pd.Timestamp(freeze_before) - pd.Timedelta(days=1),
+        )
+        frozen_days = [
+            day.strftime(ct.DATE_FORMAT)
+            for day in pd.date_range(pd.Timestamp(start_date).normalize(), frozen_end)
+        ]
+        cached = {
+            side: self.state_store.get_day_counts(scope, frozen_days)
+            for side, scope in scopes.items()
+        }
+        cache_plan = plan_count_cache(
+            start_date,
+            end_date,
+            freeze_before,
+            cached['source'],
+            cached['target'],
+            revalidate_days=revalidate_days,
+        )
+        app_logger.info(f'count cache plan: {cache_plan.to_dict()}')
+        return cache_plan, scopes, cached
+
+    def _apply_count_cache(
+        self,
+        cache_plan: CountCachePlan,
+        scopes: Dict[str, CountCacheScope],
+        cached: Dict[str, Dict[str, int]],
+        source_counts: pd.DataFrame,
+        target_counts: pd.DataFrame,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, Dict]:
+        """
+        Store queried frozen days and add cached days to the queried counts.
+
+        Frozen days without rows are cached as 0 so they are not queried again;
+        zero days are dropped from the result to match an uncached run.
+        """
+        mismatches = []
+        frames = []
+        for side, queried in (('source', source_counts), ('target', target_counts)):
+            queried_by_day = {
+                dt: int(cnt) for dt, cnt in zip(queried['dt'], queried['cnt'])
+            }
+            for day in cache_plan.revalidate_days:
+                if queried_by_day.get(day, 0) != cached[side][day]:
+                    mismatches.append(f'{side}:{day}')
+            self.state_store.put_day_counts(
+                scopes[side],
+                {
+                    day: queried_by_day.get(day, 0)
+                    for day in cache_plan.frozen_query_days
+                },
+            )
+            day_counts = {day: cached[side][day] for day in cache_plan.cached_days}
+            day_counts.update(queried_by_day)
+            frames.append(
+                pd.DataFrame(
+                    sorted((dt, cnt) for dt, cnt in day_counts.items() if cnt),
+                    columns=['dt', 'cnt'],
+                ).astype({'cnt': 'int64'})
+            )
+
+        if mismatches:
+            app_logger.warning(
+                f'count cache revalidation found changed frozen days: {mismatches}'
+            )
+        cache_info = cache_plan.to_dict()
+        cache_info['revalidation_mismatches'] = mismatches
+        return frames[0], frames[1], cache_info
+
+    def _plan_counts_execution(
+        self,
+        source_table: DataReference,
+        target_table: DataReference,
+        date_chunks: List[Tuple[Optional[str], Optional[str]]],
+        max_parallel_chunks: int,
+        single_scan_max_rows: Optional[int],
+    ) -> CountsExecutionPlan:
+        source_stats, target_stats = None, None
+        if len(date_chunks) > 1 and single_scan_max_rows is not None:
+            source_stats = self._get_table_stats(source_table, self.source_engine)
+            target_stats = self._get_table_stats(target_table, self.target_engine)
+        return plan_counts_execution(
+            date_chunks,
+            source_stats,
+            target_stats,
+            max_workers_per_engine=max_parallel_chunks,
+            single_scan_max_rows=single_scan_max_rows,
+        )
+
+    def _fetch_counts(
+        self,
+        plan: CountsExecutionPlan,
+        source_adapter: BaseDatabaseAdapter,
+        target_adapter: BaseDatabaseAdapter,
+        source_table: DataReference,
+        target_table: DataReference,
+        date_column: str,
+        source_columns_meta: pd.DataFrame,
+        target_columns_meta: pd.DataFrame,
+        key_columns: Optional[List[str]] = None,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, Tuple[str, Dict], Tuple[str, Dict]]:
+        """
+        Run the planned count queries on both engines and merge daily counts.
+
+        Chunk results are merged into per-day counters as they arrive, so
+        parallel chunks never need a concat + re-group of all results. With
+        ``key_columns`` the daily key hash sums are merged the same way.
+        """
+        sides = {
+            'source': (
+                source_adapter,
+                source_table,
+                source_columns_meta,
+                self.source_engine,
+            ),
+            'target': (
+                target_adapter,
+                target_table,
+                target_columns_meta,
+                self.target_engine,
+            ),
+        }
+        jobs = []
+        last_queries = {}
+        for chunk_start, chunk_end in plan.chunks:
+            for side, (adapter, table, columns_meta, engine) in sides.items():
+                query, params = adapter.build_count_query_common(
+                    table,
+                    date_column,
+                    chunk_start,
+                    chunk_end,
+                    columns_meta,
+                    self.timezone,
+                    aggregates=(
+                        adapter.build_key_fingerprint_aggregates(
+                            key_columns, columns_meta
+                        )
+                        if key_columns
+                        else None
+                    ),
+                )
+                jobs.append((side, engine, (query, params)))
+                last_queries[side] = (query, params)
+
+        daily_counts = {'source': defaultdict(int), 'target': defaultdict(int)}
+        daily_key_hashes = {'source': defaultdict(int), 'target': defaultdict(int)}
+
+        def _merge(side: str, chunk_counts: pd.DataFrame) -> None:
+            for dt, cnt in zip(chunk_counts['dt'], chunk_counts['cnt']):
+                daily_counts[side][dt] += int(cnt)
+            if key_columns:
+                key_hashes = chunk_counts[ct.XKEY_HASH_SUM_COLUMN]
+                for dt, key_hash in zip(chunk_counts['dt'], key_hashes):
+                    daily_key_hashes[side][dt] += int(key_hash)
+
+        if not plan.is_parallel:
+            for side, engine, query in jobs:
+                _merge(
+                    side,
+                    self._execute_query(query, engine, self.timezone, query_side=side),
+                )
+        else:
+            for side, chunk_counts in self._run_per_engine(
+                [
+                    (
+                        side,
+                        engine,
+                        self._execute_query,
+                        (query, engine, self.timezone),
+                        {'query_side': side},
+                    )
+                    for side, engine, query in jobs
+                ],
+                plan.max_workers_per_engine,
+                thread_name_prefix='xoverrr-counts',
+            ):
+                _merge(side, chunk_counts)
+
+        def _to_frame(side: str) -> pd.DataFrame:
+            counts = pd.DataFrame(
+                sorted(daily_counts[side].items()), columns=['dt', 'cnt']
+            ).astype({'cnt': 'int64'})
+            if key_columns:
+                # hash sums exceed int64, keep them as exact text
+                counts[ct.XKEY_HASH_SUM_COLUMN] = [
+                    str(daily_key_hashes[side][dt]) for dt in counts['dt']
+                ]
+            return counts
+
+        return (
+            _to_frame('source'),
+            _to_frame('target'),
+            last_queries.get('source', (None, None)),
+            last_queries.get('target', (None, None)),
+        )
+
+    def _fetch_counts_many(
+        self,
+        specs: List[CountsCheckSpec],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        max_tables_per_query: Optional[int],
+        max_parallel_queries: int,
+    ) -> List[Union[Tuple, Exception]]:
+        """
+        Fetch daily counts of all specs with batched UNION ALL queries.
+
+        Returns per spec either ``(source_counts, target_counts, source_query,
+        target_query, execution_info)`` or the exception that prevented it.
+        """
+        sides = {
+            'source': (self._get_adapter(self.source_db_type), self.source_engine),
+            'target': (self._get_adapter(self.target_db_type), self.target_engine),
+        }
+
+        spec_queries: List[Union[Dict[str, Tuple[str, Dict]], Exception]] = []
+        for spec in specs:
+            try:
+                queries = {}
+                for side, (adapter, engine) in sides.items():
+                    table = spec.source_table if side == 'source' else spec.target_table
+                    columns_meta = (
+                        self._get_metadata_cols(table, engine)
+                        if adapter.COUNT_QUERY_USES_COLUMNS_META
+                        else None
+                    )
+                    queries[side] = adapter.build_count_query_common(
+                        table,
+                        spec.date_column,
+                        start_date,
+                        end_date,
+                        columns_meta,
+                        self.timezone,
+                    )
+                spec_queries.append(queries)
+            # raised again by the check of the spec
+            except Exception as e:  # noqa: BLE001
+                app_logger.error(
+                    'Could not build count query for '
+                    f'{spec.source_table.full_name}: {e}'
+                )
+                spec_queries.append(e)
+
+        valid = [
+            i for i, queries in enumerate(spec_queries) if isinstance(queries, dict)
+        ]
+        batch_size = max_tables_per_query or max(len(valid), 1)
+        batches = [valid[i : i + batch_size] for i in range(0, len(valid), batch_size)]
+
+        def _run_batch(side: str, batch: List[int]) -> Tuple[Dict[int, Any], bool]:
+            adapter, engine = sides[side]
+            parts = [spec_queries[i][side] for i in batch]
+            try:
+                union_counts = self._execute_query(
+                    adapter.build_count_union_query(parts),
+                    engine,
+                    self.timezone,
+                    query_side=side,
+                )
+                return self._split_union_counts(union_counts, batch), False
+            except Exception as e:
+                if len(batch) == 1:
+                    return {batch[0]: e}, False
+                app_logger.warning(
+                    f'{side} union count query failed, '
+                    f'falling back to per-table queries: {e}',
+                    exc_info=True,
+                )
+            batch_counts = {}
+            for i in batch:
+                try:
+                    batch_counts[i] = self._execute_query(
+                        spec_queries[i][side], engine, self.timezone, query_side=side
+                    )
+                # raised again by the check of the table
+                except Exception as table_error:  # noqa: BLE001
+                    batch_counts[i] = table_error
+            return batch_counts, True
+
+        counts = {'source': {}, 'target': {}}
+        fallback_batches = set()
+        jobs = [
+            ((side, batch_no), sides[side][1], _run_batch, (side, batch), {})
+            for batch_no, batch in enumerate(batches)
+            for side in sides
+        ]
+        for (side, batch_no), (batch_counts, fallback) in self._run_per_engine(
+            jobs, max_parallel_queries, thread_name_prefix='xoverrr-counts-many'
+        ):
+            counts[side].update(batch_counts)
+            if fallback:
+                fallback_batches.add(batch_no)
+
+        batch_of = {
+            i: batch_no for batch_no, batch in enumerate(batches) for i in batch
+        }
+        results = []
+        for i, queries in enumerate(spec_queries):
+            if isinstance(queries, Exception):
+                results.append(queries)
+                continue
+            side_counts = [counts[side][i] for side in sides]
+            error = next((c for c in side_counts if isinstance(c, Exception)), None)
+            if error is not None:
+                results.append(error)
+                continue
+            batch_no = batch_of[i]
+            execution_info = {
+                'counts_many': {
+                    'tables': len(specs),
+                    'union_queries_per_engine': len(batches),
+                    'tables_in_query': len(batches[batch_no]),
+                    'per_table_fallback': batch_no in fallback_batches,
+                }
+            }
+            results.append(
+                (
+                    *(
+                        c[['dt', 'cnt']].astype({'cnt': 'int64'}).reset_index(drop=True)
+                        for c in side_counts
+                    ),
+                    queries['source'],
+                    queries['target'],
+                    execution_info,
+                )
+            )
+        return results
+
+    @staticmethod
+    def _split_union_counts(
+        union_counts: pd.DataFrame, batch: List[int]
+    ) -> Dict[int, pd.DataFrame]:
+        """Split a labelled UNION ALL count result into per-spec (dt, cnt) frames"""
+        labels = union_counts[ct.XTABLE_LABEL_COLUMN].astype(str).str.strip()
+        return {
+            i: union_counts.loc[labels == str(part), ['dt', 'cnt']].reset_index(
+                drop=True
+            )
+            for part, i in enumerate(batch)
+        }
+
+    def _check_profile(
+        self,
+        source_table: DataReference,
+        target_table: DataReference,
+        date_column: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        chunk_size_days: Optional[int],
+        exclude_columns: List[str],
+        include_columns: List[str],
+        tolerance_pct: float,
+        max_examples: Optional[int],
+        run_id: str,
+        run_started_at: str,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+
+        try:
+            source_adapter = self._get_adapter(self.source_db_type)
+            target_adapter = self._get_adapter(self.target_db_type)
+
+            source_columns_meta = self._get_metadata_cols(
+                source_table, self.source_engine
+            )
+            target_columns_meta = self._get_metadata_cols(
+                target_table, self.target_engine
+            )
+            common_cols_df, source_only_cols, target_only_cols = (
+                self._analyze_columns_meta(source_columns_meta, target_columns_meta)
+            )
+            if include_columns:
+                common_cols_df = common_cols_df[
+                    common_cols_df['column_name'].isin(include_columns)
+                ]
+            skipped_columns = exclude_columns + [date_column.lower()]
+            common_cols_df = common_cols_df[
+                ~common_cols_df['column_name'].isin(skipped_columns)
+            ]
+            if common_cols_df.empty:
+                raise MetadataError(
+                    f'No one column to profile, need to check tables or reduce '
+                    f'the exclude_columns list: {",".join(exclude_columns)}'
+                )
+
+            profiled_columns = []
+            for column, source_type, target_type in zip(
+                common_cols_df['column_name'],
+                common_cols_df['data_type_source'],
+                common_cols_df['data_type_target'],
+            ):
+                source_kind = source_adapter.classify_profile_column(source_type)
+                target_kind = target_adapter.classify_profile_column(target_type)
+                profiled_columns.append(
+                    (
+                        column,
+                        source_kind
+                        if source_kind == target_kind
+                        else ct.PROFILE_KIND_OTHER,
+                    )
+                )
+            app_logger.info(f'profiled columns: {profiled_columns}')
+
+            date_chunks = self._iter_date_chunks(
+                date_column, start_date, end_date, chunk_size_days
+            )
+            frames, queries = {}, {}
+            for side, adapter, table, columns_meta, engine in (
+                (
+                    'source',
+                    source_adapter,
+                    source_table,
+                    source_columns_meta,
+                    self.source_engine,
+                ),
+                (
+                    'target',
+                    target_adapter,
+                    target_table,
+                    target_columns_meta,
+                    self.target_engine,
+                ),
+            ):
+                frames[side], queries[side] = self._fetch_profile(
+                    side,
+                    adapter,
+                    table,
+                    date_column,
+                    date_chunks,
+                    columns_meta,
+                    engine,
+                    adapter.build_profile_aggregates(profiled_columns),
+                )
+
+            if frames['source'].empty and frames['target'].empty:
+                app_logger.warning('nothing to compare to you')
+                return ct.CHECK_SKIPPED, None, None, None
+
+            stats, details = self._check_dataframes_timed(
+                source_df=frames['source'],
+                target_df=frames['target'],
+                key_columns=['dt'],
+                max_examples=max_examples,
+            )
+            details.execution_info['profile'] = {
+                'columns': {column: kind for column, kind in profiled_columns},
+                'source_only_columns': sorted(source_only_cols),
+                'target_only_columns': sorted(target_only_cols),
+            }
+            return self._finish_samples_check(
+                source_table,
+                target_table,
+                stats,
+                details,
+                tolerance_pct,
+                queries,
+                run_id,
+                run_started_at,
+                date_chunks,
+            )
+
+        except Exception as e:
+            app_logger.error(f'Profile check failed: {e}')
+            raise
+
+    def _fetch_profile(
+        self,
+        side: str,
+        adapter: BaseDatabaseAdapter,
+        data_ref: DataReference,
+        date_column: str,
+        date_chunks: List[Tuple[Optional[str], Optional[str]]],
+        columns_meta: pd.DataFrame,
+        engine: Engine,
+        aggregates: List[Tuple[str, str, str, str]],
+    ) -> Tuple[pd.DataFrame, Tuple[str, Dict]]:
+        """Daily aggregates of one side as a (dt, column__metric...) string frame"""
+        chunk_frames = []
+        query = (None, None)
+        for chunk_start, chunk_end in date_chunks:
+            query = adapter.build_count_query_common(
+                data_ref,
+                date_column,
+                chunk_start,
+                chunk_end,
+                columns_meta,
+                self.timezone,
+                aggregates=[aggregate[:2] for aggregate in aggregates],
+            )
+            chunk_frames.append(
+                self._execute_query(query, engine, self.timezone, query_side=side)
+            )
+
+        profile = pd.concat(chunk_frames, ignore_index=True)
+        profile.columns = normalize_column_names(list(profile.columns))
+        profile = profile.rename(
+            columns={
+                alias: f'{column}__{metric}' for alias, _, column, metric in aggregates
+            }
+        )
+        value_columns = [column for column in profile.columns if column != 'dt']
+        profile[value_columns] = profile[value_columns].map(normalize_profile_value)
+        profile['dt'] = profile['dt'].astype(str)
+        return profile.sort_values('dt', ignore_index=True), query
+
+    def _check_counts_drilldown(
+        self,
+        source_table: DataReference,
+        target_table: DataReference,
+        date_column: str,
+        update_column: Optional[str],
+        start_date: str,
+        end_date: str,
+        chunk_size_days: Optional[int],
+        exclude_columns: List[str],
+        include_columns: List[str],
+        custom_key_columns: Optional[List[str]],
+        tolerance_pct: float,
+        exclude_recent_hours: Optional[int],
+        max_examples: Optional[int],
+        run_id: str,
+        run_started_at: str,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+
+        try:
+            adapters = {
+                'source': self._get_adapter(self.source_db_type),
+                'target': self._get_adapter(self.target_db_type),
+            }
+            columns_meta = {
+                'source': self._get_metadata_cols(source_table, self.source_engine),
+                'target': self._get_metadata_cols(target_table, self.target_engine),
+            }
+
+            plan = self._plan_counts_execution(
+                source_table,
+                target_table,
+                self._iter_date_chunks(
+                    date_column, start_date, end_date, chunk_size_days
+                ),
+                1,
+                ct.DEFAULT_COUNTS_SINGLE_SCAN_MAX_ROWS,
+            )
+            source_counts, target_counts, source_query, target_query = (
+                self._fetch_counts(
+                    plan,
+                    adapters['source'],
+                    adapters['target'],
+                    source_table,
+                    target_table,
+                    date_column,
+                    columns_meta['source'],
+                    columns_meta['target'],
+                )
+            )
+            counts_status, counts_report, counts_stats, counts_details = (
+                self._evaluate_counts(
+                    source_table,
+                    target_table,
+                    source_counts,
+                    target_counts,
+                    tolerance_pct,
+                    max_examples,
+                    run_id,
+                    run_started_at,
+                    source_query,
+                    target_query,
+                    execution_info={'counts_plan': plan.to_dict()},
+                )
+            )
+            if counts_status == ct.CHECK_SKIPPED:
+                return counts_status, None, None, None
+
+            days = sorted(
+                set(
+                    find_count_discrepancies(
+                        source_counts.copy(), target_counts.copy()
+                    )['dt']
+                )
+            )
+            hours = self._drilldown_hours(
+                adapters,
+                columns_meta,
+                source_table,
+                target_table,
+                date_column,
+                days,
+            )
+            drilldown_info = {'days': days, 'hours': hours}
+            app_logger.info(f'counts drill-down: {drilldown_info}')
+
+            stats, details, queries = None, None, {}
+            if hours:
+                samples_kwargs = self._resolve_samples_columns(
+                    source_table,
+                    target_table,
+                    self.target_engine,
+                    exclude_columns,
+                    include_columns,
+                    custom_key_columns,
+                )
+                examples_limit = max_examples or ct.DEFAULT_MAX_EXAMPLES
+                accumulator = CheckResultAccumulator(examples_limit)
+                for day in sorted({hour[:10] for hour in hours}):
+                    day_hours = [hour for hour in hours if hour.startswith(day)]
+                    chunk_stats, chunk_details = self._compare_table_chunk(
+                        queries,
+                        source_table,
+                        target_table,
+                        samples_kwargs['source_columns_meta'],
+                        samples_kwargs['target_columns_meta'],
+                        samples_kwargs['common_cols'],
+                        samples_kwargs['key_columns'],
+                        date_column,
+                        update_column,
+                        day,
+                        day,
+                        exclude_recent_hours,
+                        examples_limit,
+                        extra_conditions={
+                            side: [
+                                adapters[side].build_hours_condition(
+                                    date_column,
+                                    day_hours,
+                                    columns_meta[side],
+                                    self.timezone,
+                                )
+                            ]
+                            for side in ('source', 'target')
+                        },
+                    )
+                    if chunk_stats is not None:
+                        accumulator.add(chunk_stats, chunk_details)
+                if accumulator.has_data:
+                    stats, details = accumulator.build(
+                        evaluated_columns=samples_kwargs['common_cols'],
+                        skipped_source_columns=samples_kwargs['source_only_cols'],
+                        skipped_target_columns=samples_kwargs['target_only_cols'],
+                    )
+
+            if stats is None:
+                counts_details.execution_info['drilldown'] = drilldown_info
+                return counts_status, counts_report, counts_stats, counts_details
+
+            details.execution_info['drilldown'] = {
+                **drilldown_info,
+                'counts_diff_pct': counts_stats.final_diff_score,
+            }
+            status, samples_report, stats, details = self._finish_samples_check(
+                source_table,
+                target_table,
+                stats,
+                details,
+                tolerance_pct,
+                queries,
+                run_id,
+                run_started_at,
+                [(hour, hour) for hour in hours],
+            )
+            if counts_status == ct.CHECK_FAILED:
+                status = ct.CHECK_FAILED
+            return status, f'{counts_report}\n{samples_report}', stats, details
+
+        except Exception as e:
+            app_logger.error(f'Counts drill-down check failed: {e}')
+            raise
+
+    def _drilldown_hours(
+        self,
+        adapters: Dict[str, BaseDatabaseAdapter],
+        columns_meta: Dict[str, pd.DataFrame],
+        source_table: DataReference,
+        target_table: DataReference,
+        date_column: str,
+        days: List[str],
+    ) -> List[str]:
+        """``YYYY-MM-DD HH`` hours of the given days with different counts"""
+        if not days:
+            return []
+        hourly_counts = {}
+        for side, data_ref, engine in (
+            ('source', source_table, self.source_engine),
+            ('target', target_table, self.target_engine),
+        ):
+            frames = [
+                self._execute_query(
+                    adapters[side].build_count_query_common(
+                        data_ref,
+                        date_column,
+                        window_start,
+                        window_end,
+                        columns_meta[side],
+                        self.timezone,
+                        hourly=True,
+                    ),
+                    engine,
+                    self.timezone,
+                    query_side=side,
+                )[['dt', 'cnt']]
+                for window_start, window_end in days_to_windows(days)
+            ]
+            hourly_counts[side] = pd.concat(frames, ignore_index=True).astype(
+                {'dt': str, 'cnt': 'int64'}
+            )
+        discrepancies = find_count_discrepancies(
+            hourly_counts['source'], hourly_counts['target']
+        )
+        return sorted(set(discrepancies['dt']))
+
+    def _run_per_engine(
+        self,
+        jobs: List[Tuple[Any, Engine, Callable, Tuple, Dict]],
+        max_workers_per_engine: int,
+        thread_name_prefix: str,
+    ) -> Iterator[Tuple[Any, Any]]:
+        """
+        Run ``(key, engine, fn, args, kwargs)`` jobs with at most N concurrent
+        calls per engine; yields ``(key, result)`` as jobs complete.
+        """
+        # one pool per distinct engine: the limit holds even when
+        # source and target share the same engine
+        executors = {}
+        try:
+            futures = {}
+            for key, engine, fn, args, kwargs in jobs:
+                executor = executors.get(id(engine))
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=max_workers_per_engine,
+                        thread_name_prefix=thread_name_prefix,
+                    )
+                    executors[id(engine)] = executor
+                futures[executor.submit(fn, *args, **kwargs)] = key
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _check_samples(
+        self,
+        source_table: DataReference,
+        target_table: DataReference,
+        date_column: str,
+        update_column: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        chunk_size_days: Optional[int],
+        exclude_columns: List[str],
+        include_columns: List[str],
+        custom_key_columns: Optional[List[str]],
+        tolerance_pct: float,
+        exclude_recent_hours: Optional[int],
+        max_examples: Optional[int],
+        run_id: str,
+        run_started_at: str,
+        incremental_check_name: Optional[str] = None,
+        max_tracked_keys: int = ct.DEFAULT_INCREMENTAL_MAX_TRACKED_KEYS,
+        reuse_check_name: Optional[str] = None,
+        freeze_after_days: Optional[int] = None,
+        sample_fraction: Optional[float] = None,
+        sequential_slice_fraction: Optional[float] = None,
+        fail_fast: bool = False,
+        resume_run_id: Optional[str] = None,
+        max_retries: int = 0,
+        min_split_days: Optional[int] = None,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+
+        try:
+            samples_kwargs = self._resolve_samples_columns(
+                source_table,
+                target_table,
+                self.target_engine,
+                exclude_columns,
+                include_columns,
+                custom_key_columns,
+            )
+            samples_kwargs.update(
+                source_table=source_table,
+                target_table=target_table,
+                date_column=date_column,
+                update_column=update_column,
+                start_date=start_date,
+                end_date=end_date,
+                chunk_size_days=chunk_size_days,
+                exclude_recent_hours=exclude_recent_hours,
+                tolerance_pct=tolerance_pct,
+                max_examples=max_examples,
+                run_id=run_id,
+                run_started_at=run_started_at,
+            )
+            if incremental_check_name:
+                return self._check_samples_incremental(
+                    incremental_check_name, max_tracked_keys, **samples_kwargs
+                )
+            if reuse_check_name:
+                samples_kwargs['chunk_reuse'] = (
+                    build_check_key(
+                        reuse_check_name,
+                        source_table.full_name,
+                        target_table.full_name,
+                        sorted(samples_kwargs['common_cols']),
+                        samples_kwargs['key_columns'],
+                        date_column,
+                        update_column,
+                        self.timezone,
+                    ),
+                    self._freeze_before(freeze_after_days),
+                )
+            if sequential_slice_fraction is not None:
+                return self._check_samples_sequential(
+                    sequential_slice_fraction, **samples_kwargs
+                )
+            if sample_fraction is not None:
+                samples_kwargs['sample_fraction'] = sample_fraction
+            if self.state_store is not None:
+                samples_kwargs['checkpoint_key'] = build_check_key(
+                    'checkpoint',
+                    source_table.full_name,
+                    target_table.full_name,
+                    sorted(samples_kwargs['common_cols']),
+                    samples_kwargs['key_columns'],
+                    date_column,
+                    update_column,
+                    start_date,
+                    end_date,
+                    chunk_size_days,
+                    exclude_recent_hours,
+                    sample_fraction,
+                    self.timezone,
+                )
+                samples_kwargs['resume_run_id'] = resume_run_id
+            return self._check_samples_iterative(
+                fail_fast=fail_fast,
+                max_retries=max_retries,
+                min_split_days=min_split_days,
+                **samples_kwargs,
+            )
+
+        except Exception as e:
+            app_logger.error(f'Samples check failed: {str(e)}')
+            raise
+
+    def _resolve_samples_columns(
+        self,
+        source_table: DataReference,
+        target_table: DataReference,
+        target_engine: Engine,
+        exclude_columns: List[str],
+        include_columns: List[str],
+        custom_key_columns: Optional[List[str]],
+        source_engine: Optional[Engine] = None,
+    ) -> Dict[str, Any]:
+        """Columns metadata, compared columns and key columns of a table pair"""
+        source_engine = source_engine or self.source_engine
+        source_object_type = self._get_object_type(source_table, source_engine)
+        target_object_type = self._get_object_type(target_table, target_engine)
+        app_logger.info(
+            f'object type source: {source_object_type} vs target {target_object_type}'
+        )
+
+        source_columns_meta = self._get_metadata_cols(
+            source_table, source_engine
+        )
+        app_logger.info('source_columns meta:\n')
+        app_logger.info(source_columns_meta.to_string(index=False))
+
+        target_columns_meta = self._get_metadata_cols(target_table, target_engine)
+        app_logger.info('target_columns meta:\n')
+        app_logger.info(target_columns_meta.to_string(index=False))
+
+        intersect = list(set(include_columns) & set(exclude_columns))
+        if intersect:
+            app_logger.warning(
+                f'Intersection columns between Include and exclude: {",".join(intersect)}'
+            )
+
+        key_columns = None
+
+        if custom_key_columns:
+            key_columns = custom_key_columns
+            source_cols = source_columns_meta['column_name'].tolist()
+            target_cols = target_columns_meta['column_name'].tolist()
+
+            missing_in_source = [
+                col for col in custom_key_columns if col not in source_cols
+            ]
+            missing_in_target = [
+                col for col in custom_key_columns if col not in target_cols
+            ]
+
+            if missing_in_source:
+                raise MetadataError(
+                    f'Custom key columns missing in source: {missing_in_source}'
+                )
+            if missing_in_target:
+                raise MetadataError(
+                    f'Custom key columns missing in target: {missing_in_target}'
+                )
+        else:
+            source_pk = (
+                self._get_metadata_pk(source_table, source_engine)
+                if source_object_type == ObjectType.TABLE
+                else pd.DataFrame({'pk_column_name': []})
+            )
+            target_pk = (
+                self._get_metadata_pk(target_table, target_engine)
+                if target_object_type == ObjectType.TABLE
+                else pd.DataFrame({'pk_column_name': []})
+            )
+
+            if (
+                source_pk['pk_column_name'].tolist()
+                != target_pk['pk_column_name'].tolist()
+            ):
+                app_logger.warning(
+                    f'Primary keys differ: source={source_pk["pk_column_name"].tolist()}, target={target_pk["pk_column_name"].tolist()}'
+                )
+            key_columns = (
+                source_pk['pk_column_name'].tolist()
+                or target_pk['pk_column_name'].tolist()
+            )
+            if not key_columns:
+                raise MetadataError(
+                    'Primary key not found in the source neither in the target and not provided'
+                )
+
+        if include_columns:
+            if not set(include_columns) & set(key_columns):
+                app_logger.warning(
+                    f'The primary key was not included in the column list.\
+                                   The key column was included in the resulting query automatically. PK:{key_columns}'
+                )
+
+            include_columns = list(set(include_columns + key_columns))
+
+            source_columns_meta = source_columns_meta[
+                source_columns_meta['column_name'].isin(include_columns)
+            ]
+            target_columns_meta = target_columns_meta[
+                target_columns_meta['column_name'].isin(include_columns)
+            ]
+
+        if exclude_columns:
+            if set(exclude_columns) & set(key_columns):
+                app_logger.warning(
+                    f'The primary key has been excluded from the column list.\
+                                   However, the key column must be present in the resulting query.s PK:{key_columns}'
+                )
+
+            exclude_columns = list(set(exclude_columns) - set(key_columns))
+
+            source_columns_meta = source_columns_meta[
+                ~source_columns_meta['column_name'].isin(exclude_columns)
+            ]
+            target_columns_meta = target_columns_meta[
+                ~target_columns_meta['column_name'].isin(exclude_columns)
+            ]
+
+        common_cols_df, source_only_cols, target_only_cols = (
+            self._analyze_columns_meta(source_columns_meta, target_columns_meta)
+        )
+        common_cols = common_cols_df['column_name'].tolist()
+
+        if not common_cols:
+            raise MetadataError(
+                f'No one column to compare, need to check tables or reduce the exclude_columns list: {",".join(exclude_columns)}'
+            )
+
+        return {
+            'source_columns_meta': source_columns_meta,
+            'target_columns_meta': target_columns_meta,
+            'common_cols': common_cols,
+            'key_columns': key_columns,
+            'source_only_cols': source_only_cols,
+            'target_only_cols': target_only_cols,
+        }
+
+    def check_sniff_query(
+        self,
+        source_query: str,
+        source_params: Optional[Dict] = None,
+        check_name: Optional[str] = None,
+        chunk_size_days: Optional[int] = None,
+        tolerance_pct: float = 0.0,
+        max_examples: Optional[int] = ct.DEFAULT_MAX_EXAMPLES,
+        persist_result: Union[bool, DataReference] = False,
+        check_tags: Optional[Dict] = None,
+        report_output_format: str = ct.REPORT_OUTPUT_FORMAT_TEXT,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Sniff out data issues with a source-only SQL check.
+
+        Row-level and scalar pass/fail checks both use ``xsniff_passed``
+        (``y`` = passed, ``n`` = failed).
+        """
+        source_engine = self.source_engine
+        timezone = self.timezone
+        source_params = source_params or {}
+
+        validate_report_output_format(report_output_format)
+        persist_options = parse_persist_result_option(persist_result)
+        run_id, run_started_at = self._start_check_run(
+            ct.CHECK_TYPE_SNIFF_QUERY, check_name
+        )
+
+        try:
+            self.check_stats['checked'] += 1
+
+            app_logger.info('Getting metadata for sniff query')
+            source_metadata = self._get_metadata_cols_for_custom_query(
+                (source_query, source_params), source_engine
+            )
+            source_adapter = self._get_adapter(self.source_db_type)
+            source_chunks = self._resolve_source_query_chunks(
+                source_params, chunk_size_days
+            )
+
+            if len(source_chunks) == 1:
+                stats, details = self._execute_source_query_chunk(
+                    source_query=source_query,
+                    source_params=source_chunks[0],
+                    source_engine=source_engine,
+                    source_adapter=source_adapter,
+                    source_metadata=source_metadata,
+                    max_examples=max_examples,
+                    timezone=timezone,
+                )
+            else:
+                stats, details = self._check_sniff_query_iterative(
+                    source_query=source_query,
+                    source_chunks=source_chunks,
+                    source_engine=source_engine,
+                    source_adapter=source_adapter,
+                    source_metadata=source_metadata,
+                    max_examples=max_examples,
+                    timezone=timezone,
+                )
+
+            date_chunks = [
+                (chunk.get('start_date'), chunk.get('end_date'))
+                for chunk in source_chunks
+                if chunk.get('start_date') is not None
+                and chunk.get('end_date') is not None
+            ] or None
+
+            if not stats:
+                status = ct.CHECK_SKIPPED
+                draft_report = None
+            else:
+                status = (
+                    ct.CHECK_FAILED
+                    if stats.final_diff_score > tolerance_pct
+                    else ct.CHECK_SUCCESS
+                )
+                draft_report = generate_check_sniff_query_report(
+                    stats,
+                    details,
+                    self.timezone,
+                    run_id,
+                    run_started_at,
+                    source_query,
+                    source_params,
+                    date_chunks=date_chunks,
+                    library_version=self._report_context['library_version'],
+                    source_db_type=self._report_context['source_db_type'],
+                )
+
+            report = self._finalize_check(
+                status=status,
+                report=draft_report,
+                stats=stats,
+                details=details,
+                check_type=ct.CHECK_TYPE_SNIFF_QUERY,
+                check_name=check_name,
+                check_tags=check_tags,
+                source_table=None,
+                target_table=None,
+                source_query=source_query,
+                source_params=source_params,
+                persist_options=persist_options,
+                report_output_format=report_output_format,
+            )
+            self._update_stats(status, None)
+            return status, report, stats, details
+
+        except Exception:
+            app_logger.exception('Sniff query failed')
+            status = ct.CHECK_FAILED
+            report = self._finalize_check(
+                status=status,
+                report=None,
+                stats=None,
+                details=None,
+                check_type=ct.CHECK_TYPE_SNIFF_QUERY,
+                check_name=check_name,
+                check_tags=check_tags,
+                source_table=None,
+                target_table=None,
+                source_query=source_query,
+                source_params=source_params,
+                persist_options=persist_options,
+                report_output_format=report_output_format,
+            )
+            self._update_stats(status, None)
+            return status, report, None, None
+
+    def check_custom_queries(
+        self,
+        source_query: str,
+        source_params: Dict,
+        target_query: str,
+        target_params: Dict,
+        custom_primary_key: List[str],
+        check_name: Optional[str] = None,
+        chunk_size_days: Optional[int] = None,
+        exclude_columns: Optional[List[str]] = None,
+        tolerance_pct: float = 0.0,
+        max_examples: Optional[int] = ct.DEFAULT_MAX_EXAMPLES,
+        persist_result: Union[bool, DataReference] = False,
+        check_tags: Optional[Dict] = None,
+        report_output_format: str = ct.REPORT_OUTPUT_FORMAT_TEXT,
+        fail_fast: bool = False,
+        details_level: str = ct.DETAILS_EXAMPLES,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Compare data from custom queries with specified key columns.
+
+        With ``fail_fast`` and several chunks, the rows of both queries over
+        the whole range are counted first and the remaining chunks are
+        skipped once the check fails even if all of them match; the result
+        is then marked partial in ``details.execution_info['fail_fast']``.
+        ``details_level`` is the details level, as in :meth:`check_samples`.
+
+        For source-only issue checks, use :meth:`check_sniff_query`.
+        """
+        self._require_target_engine()
+        source_engine = self.source_engine
+        target_engine = self.target_engine
+        timezone = self.timezone
+        source_params = source_params or {}
+        target_params = target_params or {}
+        exclude_cols = normalize_column_names(exclude_columns or [])
+        custom_keys = normalize_column_names(custom_primary_key)
+        if not custom_keys:
+            raise ValueError('custom_primary_key is mandatory')
+
+        validate_report_output_format(report_output_format)
+        self._validate_details_level(details_level)
+        persist_options = parse_persist_result_option(persist_result)
+        run_id, run_started_at = self._start_check_run(
+            ct.CHECK_TYPE_CUSTOM_QUERIES, check_name, details_level=details_level
+        )
+
+        try:
+            self.check_stats['checked'] += 1
+
+            app_logger.info('Getting metadata for source query')
+            source_metadata = self._get_metadata_cols_for_custom_query(
+                (source_query, source_params), source_engine
+            )
+
+            app_logger.info('Getting metadata for target query')
+            target_metadata = self._get_metadata_cols_for_custom_query(
+                (target_query, target_params), target_engine
+            )
+
+            source_adapter = self._get_adapter(self.source_db_type)
+            target_adapter = self._get_adapter(self.target_db_type)
+            date_chunks = self._resolve_custom_query_chunks(
+                source_params, target_params, chunk_size_days
+            )
+
+            if len(date_chunks) == 1:
+                stats, details = self._execute_custom_query_chunk(
+                    source_query=source_query,
+                    source_params=date_chunks[0][0],
+                    target_query=target_query,
+                    target_params=date_chunks[0][1],
+                    source_engine=source_engine,
+                    target_engine=target_engine,
+                    source_adapter=source_adapter,
+                    target_adapter=target_adapter,
+                    source_metadata=source_metadata,
+                    target_metadata=target_metadata,
+                    custom_primary_key=custom_keys,
+                    exclude_columns=exclude_cols,
+                    max_examples=max_examples,
+                    timezone=timezone,
+                )
+            else:
+                row_totals = None
+                if fail_fast:
+                    row_totals = self._count_custom_query_rows(
+                        (source_query, source_params),
+                        (target_query, target_params),
+                        source_adapter,
+                        target_adapter,
+                    )
+                stats, details = self._check_custom_queries_iterative(
+                    source_query=source_query,
+                    target_query=target_query,
+                    chunk_ranges=date_chunks,
+                    source_engine=source_engine,
+                    target_engine=target_engine,
+                    source_adapter=source_adapter,
+                    target_adapter=target_adapter,
+                    source_metadata=source_metadata,
+                    target_metadata=target_metadata,
+                    custom_primary_key=custom_keys,
+                    exclude_columns=exclude_cols,
+                    max_examples=max_examples,
+                    timezone=timezone,
+                    tolerance_pct=tolerance_pct,
+                    row_totals=row_totals,
+                )
+
+            if not stats:
+                status = ct.CHECK_SKIPPED
+                draft_report = None
+            else:
+                status = (
+                    ct.CHECK_FAILED
+                    if stats.final_diff_score > tolerance_pct
+                    else ct.CHECK_SUCCESS
+                )
+                draft_report = self._sample_report(
+                    None,
+                    None,
+                    stats,
+                    details,
+                    self.timezone,
+                    run_id,
+                    run_started_at,
+                    source_query,
+                    source_params,
+                    target_query,
+                    target_params,
+                    date_chunks=date_chunks,
+                    **self._report_context,
+                )
+
+            report = self._finalize_check(
+                status=status,
+                report=draft_report,
+                stats=stats,
+                details=details,
+                check_type=ct.CHECK_TYPE_CUSTOM_QUERIES,
+                check_name=check_name,
+                check_tags=check_tags,
+                source_table=None,
+                target_table=None,
+                source_query=source_query,
+                source_params=source_params,
+                target_query=target_query,
+                target_params=target_params,
+                persist_options=persist_options,
+                report_output_format=report_output_format,
+            )
+            self._update_stats(status, None)
+            return status, report, stats, details
+
+        except Exception:
+            app_logger.exception('Custom queries check failed')
+            status = ct.CHECK_FAILED
+            report = self._finalize_check(
+                status=status,
+                report=None,
+                stats=None,
+                details=None,
+                check_type=ct.CHECK_TYPE_CUSTOM_QUERIES,
+                check_name=check_name,
+                check_tags=check_tags,
+                source_table=None,
+                target_table=None,
+                source_query=source_query,
+                source_params=source_params,
+                target_query=target_query,
+                target_params=target_params,
+                persist_options=persist_options,
+                report_output_format=report_output_format,
+            )
+            self._update_stats(status, None)
+            return status, report, None, None
+
+    def _finalize_check(
+        self,
+        *,
+        status: str,
+        report: Optional[str],
+        stats: Optional[CheckStats],
+        details: Optional[CheckDetails],
+        check_type: str,
+        persist_options: PersistResultOptions,
+        report_output_format: str,
+        check_name: Optional[str] = None,
+        check_tags: Optional[Dict] = None,
+        source_table: Optional[str] = None,
+        target_table: Optional[str] = None,
+        source_query: Optional[str] = None,
+        source_params: Optional[Dict] = None,
+        target_query: Optional[str] = None,
+        target_params: Optional[Dict] = None,
+    ) -> Optional[str]:
+        if not getattr(self, '_active_run_id', None):
+            raise RuntimeError('check run was not started; run_id is missing')
+        if self._compare_pool is not None:
+            self._compare_pool.shutdown()
+            self._compare_pool = None
+        if self._compare_executor is not None:
+            self._compare_executor.shutdown(wait=True)
+            self._compare_executor = None
+        self._check_deadline = None
+        self._run_timings.finish_run()
+        result = build_check_result(
+            run_id=self._active_run_id,
+            timestamp=self._active_run_started_at,
+            timezone=self.timezone,
+            status=status,
+            report=report,
+            stats=stats,
+            details=details,
+            check_type=check_type,
+            check_name=self._active_check_name,
+            check_tags=check_tags,
+            source_table=source_table,
+            target_table=target_table,
+            source_query=source_query,
+            source_params=source_params,
+            target_query=target_query,
+            target_params=target_params,
+            timings=self._run_timings,
+        )
+        self.result_persister.persist(
+            result,
+            persist_result=persist_options.enabled,
+            persist_result_ref=persist_options.table_ref,
+        )
+        app_logger.info(
+            f'Check run finished: run_id={self._active_run_id} status={status}'
+        )
+        return format_check_result(result, report_output_format)
+
+    def _resolve_custom_query_chunks(
+        self,
+        source_params: Dict,
+        target_params: Dict,
+        chunk_size_days: Optional[int],
+    ) -> List[Tuple[Dict, Dict]]:
+        source_params = source_params or {}
+        target_params = target_params or {}
+        source_start = source_params.get('start_date')
+        source_end = source_params.get('end_date')
+        target_start = target_params.get('start_date')
+        target_end = target_params.get('end_date')
+
+        if not (
+            chunk_size_days
+            and source_start is not None
+            and source_end is not None
+            and target_start is not None
+            and target_end is not None
+        ):
+            return [(dict(source_params), dict(target_params))]
+
+        source_chunks = self._iter_date_chunks(
+            'date', source_start, source_end, chunk_size_days
+        )
+        target_chunks = self._iter_date_chunks(
+            'date', target_start, target_end, chunk_size_days
+        )
+        if len(source_chunks) != len(target_chunks):
+            raise ValueError(
+                'source and target custom query date ranges produce different chunk counts'
+            )
+
+        chunk_ranges: List[Tuple[Dict, Dict]] = []
+        for (s_start, s_end), (t_start, t_end) in zip(source_chunks, target_chunks):
+            source_chunk_params = dict(source_params)
+            target_chunk_params = dict(target_params)
+            source_chunk_params['start_date'] = s_start
+            source_chunk_params['end_date'] = s_end
+            target_chunk_params['start_date'] = t_start
+            target_chunk_params['end_date'] = t_end
+            chunk_ranges.append((source_chunk_params, target_chunk_params))
+        return chunk_ranges
+
+    def _resolve_source_query_chunks(
+        self,
+        source_params: Dict,
+        chunk_size_days: Optional[int],
+    ) -> List[Dict]:
+        source_params = dict(source_params or {})
+        source_start = source_params.get('start_date')
+        source_end = source_params.get('end_date')
+
         if not (
             chunk_size_days
             and source_start is not None
@@ -1027,528 +3182,1753 @@ class DataQualityChecker:
             chunk_params.append(params)
         return chunk_params
 
-    def _execute_source_query_chunk(
+    def _execute_source_query_chunk(
+        self,
+        source_query: str,
+        source_params: Dict,
+        source_engine: Engine,
+        source_adapter,
+        source_metadata: pd.DataFrame,
+        max_examples: Optional[int],
+        timezone: str,
+    ) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
+        source_data = self._execute_query(
+            (source_query, source_params), source_engine, timezone, query_side='source'
+        )
+        source_data = source_adapter.convert_types(
+            source_data, source_metadata, timezone
+        )
+        if source_data.empty:
+            return build_sniff_issue_stats(0, 0, 0), CheckDetails(
+                issue_breakdown=pd.DataFrame(),
+                issue_examples=pd.DataFrame(),
+                dup_source_keys_examples=tuple(),
+                dup_target_keys_examples=tuple(),
+                source_only_keys_examples=tuple(),
+                target_only_keys_examples=tuple(),
+                issue_row_examples=pd.DataFrame(),
+                evaluated_columns=[],
+            )
+
+        self._run_timings.mark_dataset_check_start()
+        try:
+            return evaluate_check_sniff_query_data(
+                source_data,
+                max_examples=max_examples or ct.DEFAULT_MAX_EXAMPLES,
+            )
+        finally:
+            self._run_timings.mark_dataset_check_end()
+
+    def _check_sniff_query_iterative(
+        self,
+        source_query: str,
+        source_chunks: List[Dict],
+        source_engine: Engine,
+        source_adapter,
+        source_metadata: pd.DataFrame,
+        max_examples: Optional[int],
+        timezone: str,
+    ) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
+        examples_limit = max_examples or ct.DEFAULT_MAX_EXAMPLES
+        total_rows = 0
+        passed_rows = 0
+        issue_rows = 0
+        status_counter = defaultdict(int)
+        issue_example_frames: List[pd.DataFrame] = []
+        example_columns: List[str] = []
+        has_data = False
+
+        for source_chunk_params in source_chunks:
+            chunk_stats, chunk_details = self._execute_source_query_chunk(
+                source_query=source_query,
+                source_params=source_chunk_params,
+                source_engine=source_engine,
+                source_adapter=source_adapter,
+                source_metadata=source_metadata,
+                max_examples=examples_limit,
+                timezone=timezone,
+            )
+            if not chunk_stats:
+                continue
+            has_data = True
+            total_rows += chunk_stats.total_source_rows
+            passed_rows += chunk_stats.passed_rows
+            issue_rows += sniff_issue_row_count(chunk_stats)
+
+            if not chunk_details.issue_breakdown.empty:
+                for row in chunk_details.issue_breakdown.itertuples(index=False):
+                    status_counter[row.status_value] += int(row.count)
+
+            if chunk_details.evaluated_columns:
+                example_columns = chunk_details.evaluated_columns
+
+            if (
+                chunk_details.issue_row_examples is not None
+                and not chunk_details.issue_row_examples.empty
+                and sum(len(frame) for frame in issue_example_frames) < examples_limit
+            ):
+                issue_example_frames.append(chunk_details.issue_row_examples)
+
+        if not has_data:
+            return None, None
+
+        stats = build_sniff_issue_stats(total_rows, passed_rows, issue_rows)
+        status_value_counts = (
+            pd.DataFrame(
+                [
+                    {'status_value': value, 'count': count}
+                    for value, count in sorted(status_counter.items(), key=str)
+                ]
+            )
+            if status_counter
+            else pd.DataFrame(columns=['status_value', 'count'])
+        )
+        merged_issue_row_examples = (
+            pd.concat(issue_example_frames, ignore_index=True).head(examples_limit)
+            if issue_example_frames
+            else pd.DataFrame()
+        )
+        details = CheckDetails(
+            issue_breakdown=status_value_counts,
+            issue_examples=pd.DataFrame(),
+            dup_source_keys_examples=tuple(),
+            dup_target_keys_examples=tuple(),
+            source_only_keys_examples=tuple(),
+            target_only_keys_examples=tuple(),
+            issue_row_examples=merged_issue_row_examples,
+            evaluated_columns=example_columns,
+        )
+        return stats, details
+
+    def _execute_custom_query_chunk(
         self,
         source_query: str,
         source_params: Dict,
+        target_query: str,
+        target_params: Dict,
         source_engine: Engine,
+        target_engine: Engine,
         source_adapter,
+        target_adapter,
         source_metadata: pd.DataFrame,
+        target_metadata: pd.DataFrame,
+        custom_primary_key: List[str],
+        exclude_columns: Optional[List[str]],
         max_examples: Optional[int],
         timezone: str,
     ) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
         source_data = self._execute_query(
             (source_query, source_params), source_engine, timezone, query_side='source'
         )
+        target_data = self._execute_query(
+            (target_query, target_params), target_engine, timezone, query_side='target'
+        )
+
         source_data = source_adapter.convert_types(
             source_data, source_metadata, timezone
         )
-        if source_data.empty:
-            return build_sniff_issue_stats(0, 0, 0), CheckDetails(
-                issue_breakdown=pd.DataFrame(),
-                issue_examples=pd.DataFrame(),
-                dup_source_keys_examples=tuple(),
-                dup_target_keys_examples=tuple(),
-                source_only_keys_examples=tuple(),
-                target_only_keys_examples=tuple(),
-                issue_row_examples=pd.DataFrame(),
-                evaluated_columns=[],
+        target_data = target_adapter.convert_types(
+            target_data, target_metadata, timezone
+        )
+        source_data_prepared = prepare_dataframe(source_data)
+        target_data_prepared = prepare_dataframe(target_data)
+
+        exclude_cols = exclude_columns or []
+        common_cols = [
+            col
+            for col in source_data_prepared.columns
+            if col in target_data_prepared.columns and col not in exclude_cols
+        ]
+        source_data_filtered = source_data_prepared[common_cols]
+        target_data_filtered = target_data_prepared[common_cols]
+        if ct.XRECENTLY_CHANGED_COLUMN in common_cols:
+            source_data_filtered, target_data_filtered = clean_recently_changed_data(
+                source_data_filtered, target_data_filtered, custom_primary_key
+            )
+        return self._check_dataframes_timed(
+            source_data_filtered,
+            target_data_filtered,
+            custom_primary_key,
+            max_examples,
+        )
+
+    def _check_custom_queries_iterative(
+        self,
+        source_query: str,
+        target_query: str,
+        chunk_ranges: List[Tuple[Dict, Dict]],
+        source_engine: Engine,
+        target_engine: Engine,
+        source_adapter,
+        target_adapter,
+        source_metadata: pd.DataFrame,
+        target_metadata: pd.DataFrame,
+        custom_primary_key: List[str],
+        exclude_columns: Optional[List[str]],
+        max_examples: Optional[int],
+        timezone: str,
+        tolerance_pct: float = 0.0,
+        row_totals: Optional[Dict[str, int]] = None,
+    ) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Compare custom query results chunk by chunk. With ``row_totals`` (rows
+        of the whole range per side) the remaining chunks are skipped once
+        the check cannot end within ``tolerance_pct``.
+        """
+        examples_limit = max_examples or ct.DEFAULT_MAX_EXAMPLES
+        accumulator = CheckResultAccumulator(examples_limit)
+        lower_bound = None
+        chunks_compared = len(chunk_ranges)
+
+        for chunk_index, (source_chunk_params, target_chunk_params) in enumerate(
+            chunk_ranges
+        ):
+            if row_totals is not None:
+                lower_bound = self._fail_fast_lower_bound(
+                    accumulator, row_totals, tolerance_pct
+                )
+                if lower_bound is not None:
+                    app_logger.info(
+                        f'fail fast: final_diff_score >= {lower_bound:.2f} '
+                        f'after {chunk_index} of {len(chunk_ranges)} chunks'
+                    )
+                    chunks_compared = chunk_index
+                    break
+            chunk_stats, chunk_details = self._execute_custom_query_chunk(
+                source_query=source_query,
+                source_params=source_chunk_params,
+                target_query=target_query,
+                target_params=target_chunk_params,
+                source_engine=source_engine,
+                target_engine=target_engine,
+                source_adapter=source_adapter,
+                target_adapter=target_adapter,
+                source_metadata=source_metadata,
+                target_metadata=target_metadata,
+                custom_primary_key=custom_primary_key,
+                exclude_columns=exclude_columns,
+                max_examples=examples_limit,
+                timezone=timezone,
+            )
+            if not chunk_stats:
+                continue
+            accumulator.add(chunk_stats, chunk_details)
+
+        if not accumulator.has_data:
+            return None, None
+
+        stats, details = accumulator.build(evaluated_columns=[])
+        if row_totals is not None:
+            details.execution_info['fail_fast'] = self._fail_fast_info(
+                lower_bound, chunks_compared, len(chunk_ranges), row_totals
+            )
+        return stats, details
+
+    def _count_custom_query_rows(
+        self,
+        source_query: Tuple[str, Dict],
+        target_query: Tuple[str, Dict],
+        source_adapter: BaseDatabaseAdapter,
+        target_adapter: BaseDatabaseAdapter,
+    ) -> Dict[str, int]:
+        """Rows of both custom queries over their whole range"""
+        row_totals = {}
+        for side, (query, params), adapter, engine in (
+            ('source', source_query, source_adapter, self.source_engine),
+            ('target', target_query, target_adapter, self.target_engine),
+        ):
+            counts = self._execute_query(
+                adapter.build_query_row_count_query(query, params),
+                engine,
+                self.timezone,
+                query_side=side,
+            )
+            row_totals[side] = int(counts['cnt'].iloc[0])
+        return row_totals
+
+    def _get_metadata_cols_for_custom_query(
+        self, query, engine: Engine
+    ) -> pd.DataFrame:
+        """Get metadata with proper source handling"""
+        adapter = self._get_adapter(DBMSType.from_engine(engine))
+
+        columns_meta = self._from_snapshot(
+            'custom_query_metadata',
+            query,
+            engine,
+            None,
+            lambda: adapter.get_metadata_for_custom_query(query, engine),
+        )
+
+        if columns_meta.empty:
+            raise ValueError(f'Failed to get metadata for custom query: {query}')
+
+        return columns_meta
+
+    def _get_metadata_cols(
+        self, data_ref: DataReference, engine: Engine
+    ) -> pd.DataFrame:
+        """Get metadata with proper source handling"""
+        adapter = self._get_adapter(DBMSType.from_engine(engine))
+
+        query, params = adapter.build_metadata_columns_query(data_ref)
+        columns_meta = self._execute_query((query, params), engine)
+
+        if columns_meta.empty:
+            raise ValueError(f'Failed to get metadata for: {data_ref.full_name}')
+
+        return columns_meta
+
+    def _get_metadata_pk(self, data_ref: DataReference, engine: Engine) -> pd.DataFrame:
+        """Get metadata with proper source handling"""
+        adapter = self._get_adapter(DBMSType.from_engine(engine))
+
+        query, params = adapter.build_primary_key_query(data_ref)
+        primary_key = self._execute_query((query, params), engine)
+
+        return primary_key
+
+    def _resolve_key_columns(
+        self, source_table: DataReference, target_table: DataReference
+    ) -> List[str]:
+        """Primary key of the source table, else of the target table"""
+        for data_ref, engine in (
+            (source_table, self.source_engine),
+            (target_table, self.target_engine),
+        ):
+            if self._get_object_type(data_ref, engine) != ObjectType.TABLE:
+                continue
+            key_columns = self._get_metadata_pk(data_ref, engine)[
+                'pk_column_name'
+            ].tolist()
+            if key_columns:
+                return key_columns
+        raise MetadataError(
+            'Primary key not found in the source neither in the target and not provided'
+        )
+
+    def _get_table_stats(
+        self, data_ref: DataReference, engine: Engine
+    ) -> Optional[TableStats]:
+        """Get catalog statistics, None when unavailable (views, no stats)"""
+        adapter = self._get_adapter(DBMSType.from_engine(engine))
+
+        try:
+            query, params = adapter.build_table_stats_query(data_ref)
+            table_stats = self._execute_query((query, params), engine)
+        except Exception as e:
+            app_logger.warning(
+                f'Could not get table statistics for {data_ref.full_name}: {e}',
+                exc_info=True,
+            )
+            return None
+
+        if table_stats.empty:
+            return None
+
+        row = table_stats.iloc[0]
+        num_rows = row.get('num_rows')
+        avg_row_bytes = row.get('avg_row_bytes')
+        return TableStats(
+            num_rows=None if pd.isna(num_rows) else int(num_rows),
+            avg_row_bytes=None if pd.isna(avg_row_bytes) else float(avg_row_bytes),
+        )
+
+    def _get_object_type(self, data_ref: DataReference, engine: Engine) -> pd.DataFrame:
+
+        adapter = self._get_adapter(DBMSType.from_engine(engine))
+        object_type = self._from_snapshot(
+            'object_type',
+            data_ref.full_name,
+            engine,
+            None,
+            lambda: adapter.get_object_type(data_ref, engine),
+        )
+        return object_type
+
+    def _get_table_data(
+        self,
+        engine,
+        data_ref: DataReference,
+        columns_meta: pd.DataFrame,
+        common_columns: List[str],
+        date_column: str,
+        update_column: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        exclude_recent_hours: Optional[int],
+        query_side: str,
+        extra_conditions: Optional[List[Tuple[str, Dict]]] = None,
+        shared: bool = True,
+    ) -> Tuple[pd.DataFrame, str, Dict]:
+        """Retrieve and prepare table data"""
+        if shared and not extra_conditions and getattr(self, '_suite_reads', None):
+            shared_frame = self._read_shared_frame(
+                engine,
+                data_ref,
+                common_columns,
+                date_column,
+                update_column,
+                start_date,
+                end_date,
+                exclude_recent_hours,
+                query_side,
+            )
+            if shared_frame is not None:
+                return shared_frame
+
+        db_type = DBMSType.from_engine(engine)
+        adapter = self._get_adapter(db_type)
+        app_logger.info(db_type)
+
+        query, params = adapter.build_data_query_common(
+            data_ref,
+            common_columns,
+            date_column,
+            update_column,
+            start_date,
+            end_date,
+            exclude_recent_hours,
+            columns_meta,
+            self.timezone,
+            extra_conditions=extra_conditions,
+        )
+
+        df = self._execute_query(
+            (query, params), engine, self.timezone, query_side=query_side
+        )
+
+        # Apply type conversions
+        df = adapter.convert_types(df, columns_meta, self.timezone)
+
+        return df, query, params
+
+    def _get_adapter(self, db_type: DBMSType) -> BaseDatabaseAdapter:
+        """Get adapter for specific DBMS"""
+        try:
+            return self.adapters[db_type]
+        except KeyError:
+            raise ValueError(f'No adapter available for {db_type}')
+
+    def _iter_date_chunks(
+        self,
+        date_column: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        chunk_size_days: Optional[int],
+    ) -> List[Tuple[Optional[str], Optional[str]]]:
+        if chunk_size_days is not None and chunk_size_days <= 0:
+            raise ValueError('chunk_size_days must be greater than 0')
+
+        if not (
+            chunk_size_days
+            and date_column
+            and start_date is not None
+            and end_date is not None
+        ):
+            return [(start_date, end_date)]
+
+        start_ts = pd.Timestamp(start_date).normalize()
+        end_ts = pd.Timestamp(end_date).normalize()
+        if start_ts > end_ts:
+            raise ValueError(
+                f'date_range start {start_date} is greater than end {end_date}'
+            )
+
+        chunks: List[Tuple[str, str]] = []
+        current = start_ts
+        while current <= end_ts:
+            chunk_end = min(current + pd.Timedelta(days=chunk_size_days - 1), end_ts)
+            chunks.append(
+                (
+                    current.strftime(ct.DATE_FORMAT),
+                    chunk_end.strftime(ct.DATE_FORMAT),
+                )
+            )
+            current = chunk_end + pd.Timedelta(days=1)
+        return chunks
+
+    def _validate_incremental_options(
+        self, check_name: Optional[str], update_column: Optional[str]
+    ) -> None:
+        if not check_name:
+            raise ValueError('incremental samples check requires check_name')
+        if not update_column:
+            raise ValueError('incremental samples check requires update_column')
+        if self.state_store is None:
+            raise ValueError('incremental samples check requires a checker state_store')
+
+    def _validate_chunk_reuse_options(
+        self, check_name: Optional[str], freeze_after_days: int, incremental: bool
+    ) -> None:
+        if freeze_after_days < 0:
+            raise ValueError('freeze_after_days must not be negative')
+        if not check_name:
+            raise ValueError('freeze_after_days requires check_name')
+        if self.state_store is None:
+            raise ValueError('freeze_after_days requires a checker state_store')
+        if incremental:
+            raise ValueError('freeze_after_days cannot be combined with incremental')
+
+    def _validate_sample_fraction(
+        self,
+        name: str,
+        sample_fraction: float,
+        incremental: bool,
+        freeze_after_days: Optional[int],
+    ) -> None:
+        if not 0 < sample_fraction <= 1:
+            raise ValueError(f'{name} must be in (0, 1]')
+        if incremental or freeze_after_days is not None:
+            raise ValueError(
+                f'{name} cannot be combined with incremental or freeze_after_days'
+            )
+
+    def _validate_details_level(self, details_level: str) -> None:
+        if details_level not in ct.DETAILS_LEVELS:
+            raise ValueError(
+                'details_level must be one of '
+                f'{sorted(ct.DETAILS_LEVELS)}, got {details_level!r}'
             )
 
-        self._run_timings.mark_dataset_check_start()
-        try:
-            return evaluate_check_sniff_query_data(
-                source_data,
-                max_examples=max_examples or ct.DEFAULT_MAX_EXAMPLES,
+    def _validate_resume_options(
+        self, incremental: bool, sequential_slice_fraction: Optional[float]
+    ) -> None:
+        if self.state_store is None:
+            raise ValueError('resume_run_id requires a checker state_store')
+        if incremental or sequential_slice_fraction is not None:
+            raise ValueError(
+                'resume_run_id cannot be combined with incremental or '
+                'sequential_slice_fraction'
             )
-        finally:
-            self._run_timings.mark_dataset_check_end()
 
-    def _check_sniff_query_iterative(
+    def _key_sample_conditions(
         self,
-        source_query: str,
-        source_chunks: List[Dict],
-        source_engine: Engine,
-        source_adapter,
-        source_metadata: pd.DataFrame,
-        max_examples: Optional[int],
-        timezone: str,
-    ) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
-        examples_limit = max_examples or ct.DEFAULT_MAX_EXAMPLES
-        total_rows = 0
-        passed_rows = 0
-        issue_rows = 0
-        status_counter = defaultdict(int)
-        issue_example_frames: List[pd.DataFrame] = []
-        example_columns: List[str] = []
-        has_data = False
-
-        for source_chunk_params in source_chunks:
-            chunk_stats, chunk_details = self._execute_source_query_chunk(
-                source_query=source_query,
-                source_params=source_chunk_params,
-                source_engine=source_engine,
-                source_adapter=source_adapter,
-                source_metadata=source_metadata,
-                max_examples=examples_limit,
-                timezone=timezone,
+        key_columns: List[str],
+        source_columns_meta: pd.DataFrame,
+        target_columns_meta: pd.DataFrame,
+        sample_buckets: int,
+        first_bucket: int = 0,
+    ) -> Dict[str, List[Tuple[str, Dict]]]:
+        """Data query condition per side keeping keys of the given hash buckets"""
+        return {
+            side: [
+                self._get_adapter(
+                    DBMSType.from_engine(engine)
+                ).build_key_sample_condition(
+                    key_columns, columns_meta, sample_buckets, first_bucket
+                )
+            ]
+            for side, engine, columns_meta in (
+                ('source', self.source_engine, source_columns_meta),
+                ('target', self.target_engine, target_columns_meta),
             )
-            if not chunk_stats:
-                continue
-            has_data = True
-            total_rows += chunk_stats.total_source_rows
-            passed_rows += chunk_stats.passed_rows
-            issue_rows += sniff_issue_row_count(chunk_stats)
-
-            if not chunk_details.issue_breakdown.empty:
-                for row in chunk_details.issue_breakdown.itertuples(index=False):
-                    status_counter[row.status_value] += int(row.count)
+        }
 
-            if chunk_details.evaluated_columns:
-                example_columns = chunk_details.evaluated_columns
+    def _compare_chunk_with_recovery(
+        self,
+        compare: Callable[
+            [Optional[str], Optional[str]],
+            Tuple[Optional[CheckStats], Optional[CheckDetails]],
+        ],
+        chunk_start: Optional[str],
+        chunk_end: Optional[str],
+        max_retries: int,
+        min_split_days: Optional[int],
+        examples_limit: int,
+        evaluated_columns: List[str],
+        recovery: Dict,
+    ) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Compare one chunk window with ``compare``, recovering from failed
+        chunk queries.
+
+        Transient errors are retried up to ``max_retries`` times with an
+        exponential backoff. Windows whose query times out or whose result
+        is too big are split in halves, recursively down to
+        ``min_split_days``, and the halves are merged into one chunk result.
+        Retries and splits are recorded in ``recovery``.
+        """
+        attempt = 0
+        while True:
+            try:
+                return compare(chunk_start, chunk_end)
+            except (QueryExecutionError, DataFrameSizeError) as e:
+                action = classify_chunk_error(e)
+                if action == ct.CHUNK_ERROR_RETRY and attempt < max_retries:
+                    delay = ct.CHUNK_RETRY_BACKOFF_SECONDS * 2**attempt
+                    attempt += 1
+                    recovery['retries'] += 1
+                    app_logger.warning(
+                        f'Chunk {chunk_start}..{chunk_end} failed, retry '
+                        f'{attempt}/{max_retries} in {delay:.0f}s: {e}'
+                    )
+                    time.sleep(delay)
+                    continue
+                windows = None
+                if (
+                    action == ct.CHUNK_ERROR_SPLIT
+                    and min_split_days is not None
+                    and chunk_start is not None
+                    and chunk_end is not None
+                ):
+                    windows = split_date_window(chunk_start, chunk_end, min_split_days)
+                if windows is None:
+                    raise
+                error = str(e).splitlines()[0]
+                break
 
-            if (
-                chunk_details.issue_row_examples is not None
-                and not chunk_details.issue_row_examples.empty
-                and sum(len(frame) for frame in issue_example_frames) < examples_limit
+        app_logger.warning(
+            f'Chunk {chunk_start}..{chunk_end} split into {windows}: {error}'
+        )
+        recovery['splits'].append(
+            {
+                'window': [chunk_start, chunk_end],
+                'halves': [list(window) for window in windows],
+                'error': error,
+            }
+        )
+        accumulator = CheckResultAccumulator(examples_limit)
+        for window_start, window_end in windows:
+            window_days = (
+                pd.Timestamp(window_end) - pd.Timestamp(window_start)
+            ).days + 1
+            if recovery['min_window_days'] is None or (
+                window_days < recovery['min_window_days']
             ):
-                issue_example_frames.append(chunk_details.issue_row_examples)
-
-        if not has_data:
+                recovery['min_window_days'] = window_days
+            window_stats, window_details = self._compare_chunk_with_recovery(
+                compare,
+                window_start,
+                window_end,
+                max_retries,
+                min_split_days,
+                examples_limit,
+                evaluated_columns,
+                recovery,
+            )
+            if window_stats:
+                accumulator.add(window_stats, window_details)
+        if not accumulator.has_data:
             return None, None
-
-        stats = build_sniff_issue_stats(total_rows, passed_rows, issue_rows)
-        status_value_counts = (
-            pd.DataFrame(
-                [
-                    {'status_value': value, 'count': count}
-                    for value, count in sorted(status_counter.items(), key=str)
-                ]
+        return accumulator.build(evaluated_columns)
+
+    def _load_run_checkpoints(
+        self, resume_run_id: str, checkpoint_key: Optional[str]
+    ) -> Dict[Tuple[str, str], Dict]:
+        """Chunk results checkpointed by an interrupted run of the same check"""
+        checkpoints = self.state_store.get_run_checkpoints(resume_run_id)
+        if not checkpoints:
+            raise ValueError(f'No checkpoints stored for run_id {resume_run_id}')
+        if any(
+            checkpoint['check_key'] != checkpoint_key
+            for checkpoint in checkpoints.values()
+        ):
+            raise ValueError(
+                f'run_id {resume_run_id} was checkpointed with other check settings'
             )
-            if status_counter
-            else pd.DataFrame(columns=['status_value', 'count'])
+        app_logger.info(
+            f'Resuming run_id={resume_run_id}: {len(checkpoints)} chunks done'
         )
-        merged_issue_row_examples = (
-            pd.concat(issue_example_frames, ignore_index=True).head(examples_limit)
-            if issue_example_frames
-            else pd.DataFrame()
+        return checkpoints
+
+    def _count_range_day_rows(
+        self,
+        source_table: DataReference,
+        target_table: DataReference,
+        date_column: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        source_columns_meta: pd.DataFrame,
+        target_columns_meta: pd.DataFrame,
+    ) -> Dict[str, Dict[str, int]]:
+        """Rows per day and side of the date range, one grouped count query each"""
+        plan = self._plan_counts_execution(
+            source_table, target_table, [(start_date, end_date)], 1, None
         )
-        details = CheckDetails(
-            issue_breakdown=status_value_counts,
-            issue_examples=pd.DataFrame(),
-            dup_source_keys_examples=tuple(),
-            dup_target_keys_examples=tuple(),
-            source_only_keys_examples=tuple(),
-            target_only_keys_examples=tuple(),
-            issue_row_examples=merged_issue_row_examples,
-            evaluated_columns=example_columns,
+        source_counts, target_counts, _, _ = self._fetch_counts(
+            plan,
+            self._get_adapter(self.source_db_type),
+            self._get_adapter(self.target_db_type),
+            source_table,
+            target_table,
+            date_column,
+            source_columns_meta,
+            target_columns_meta,
         )
-        return stats, details
+        return {
+            side: {
+                pd.Timestamp(dt).strftime(ct.DATE_FORMAT): int(cnt)
+                for dt, cnt in zip(counts['dt'], counts['cnt'])
+            }
+            for side, counts in (('source', source_counts), ('target', target_counts))
+        }
 
-    def _execute_custom_query_chunk(
+    def _memory_budget_state(
         self,
-        source_query: str,
-        source_params: Dict,
-        target_query: str,
-        target_params: Dict,
-        source_engine: Engine,
-        target_engine: Engine,
-        source_adapter,
-        target_adapter,
-        source_metadata: pd.DataFrame,
-        target_metadata: pd.DataFrame,
-        custom_primary_key: List[str],
-        exclude_columns: Optional[List[str]],
-        max_examples: Optional[int],
-        timezone: str,
+        source_table: DataReference,
+        target_table: DataReference,
+        day_rows: Dict[str, Dict[str, int]],
+    ) -> Dict:
+        """
+        Window sizing state of a samples check under ``memory_budget_gb``.
+
+        Rows per day are summed over both sides; the row width starts from
+        the catalog estimate (the wider table) and is replaced by the width
+        measured on the compared frames.
+        """
+        row_widths = [
+            stats.avg_row_bytes
+            for stats in (
+                self._get_table_stats(source_table, self.source_engine),
+                self._get_table_stats(target_table, self.target_engine),
+            )
+            if stats is not None and stats.avg_row_bytes
+        ]
+        days = set(day_rows['source']) | set(day_rows['target'])
+        return {
+            'budget_bytes': self.memory_budget_gb * 1024**3,
+            'day_rows': {
+                day: day_rows['source'].get(day, 0) + day_rows['target'].get(day, 0)
+                for day in days
+            },
+            'row_bytes': max(row_widths) if row_widths else None,
+            'row_bytes_source': 'catalog' if row_widths else None,
+            'measured_rows': 0,
+            'measured_bytes': 0.0,
+            'windows': 0,
+            'over_budget_days': [],
+        }
+
+    def _compare_within_budget(
+        self,
+        compare: Callable[
+            [Optional[str], Optional[str]],
+            Tuple[Optional[CheckStats], Optional[CheckDetails]],
+        ],
+        chunk_start: Optional[str],
+        chunk_end: Optional[str],
+        examples_limit: int,
+        evaluated_columns: List[str],
+        memory: Optional[Dict],
     ) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
-        source_data = self._execute_query(
-            (source_query, source_params), source_engine, timezone, query_side='source'
-        )
-        target_data = self._execute_query(
-            (target_query, target_params), target_engine, timezone, query_side='target'
+        """
+        Compare a chunk in consecutive windows predicted to fit the memory
+        budget (see ``plan_memory_window``) and merge the window results.
+        """
+        if memory is None or chunk_start is None or chunk_end is None:
+            return compare(chunk_start, chunk_end)
+
+        accumulator = CheckResultAccumulator(examples_limit)
+        window_start = pd.Timestamp(chunk_start).strftime(ct.DATE_FORMAT)
+        chunk_end = pd.Timestamp(chunk_end).strftime(ct.DATE_FORMAT)
+        while window_start <= chunk_end:
+            window_end = plan_memory_window(
+                window_start,
+                chunk_end,
+                memory['day_rows'],
+                memory['row_bytes'],
+                memory['budget_bytes'],
+            )
+            if (
+                window_end == window_start
+                and memory['row_bytes'] is not None
+                and memory['day_rows'].get(window_start, 0)
+                * memory['row_bytes']
+                * ct.MEMORY_FOOTPRINT_FACTOR
+                > memory['budget_bytes']
+            ):
+                memory['over_budget_days'].append(window_start)
+            memory['windows'] += 1
+            window_stats, window_details = compare(window_start, window_end)
+            if memory['measured_rows']:
+                memory['row_bytes'] = memory['measured_bytes'] / memory['measured_rows']
+                memory['row_bytes_source'] = 'measured'
+            if window_stats:
+                accumulator.add(window_stats, window_details)
+            window_start = (
+                pd.Timestamp(window_end) + pd.Timedelta(days=1)
+            ).strftime(ct.DATE_FORMAT)
+        if not accumulator.has_data:
+            return None, None
+        return accumulator.build(evaluated_columns)
+
+    def _fail_fast_lower_bound(
+        self,
+        accumulator: CheckResultAccumulator,
+        row_totals: Dict[str, int],
+        tolerance_pct: float,
+    ) -> Optional[float]:
+        """
+        Lower bound of the final_diff_score when it exceeds tolerance_pct
+        whatever the rows not compared yet hold, else None.
+
+        ``row_totals`` bound the rows of the whole range per side; rows not
+        compared yet are at most the totals minus the rows seen so far.
+        """
+        if not accumulator.has_data:
+            return None
+        stats = accumulator.build_stats()
+        lower_bound = final_diff_score_lower_bound(
+            stats,
+            max(0, row_totals['source'] - stats.total_source_rows),
+            max(0, row_totals['target'] - stats.total_target_rows),
         )
+        return lower_bound if lower_bound > tolerance_pct else None
+
+    @staticmethod
+    def _fail_fast_info(
+        lower_bound: Optional[float],
+        chunks_compared: int,
+        chunks_total: int,
+        row_totals: Dict[str, int],
+    ) -> Dict:
+        return {
+            'partial': lower_bound is not None,
+            'chunks_compared': chunks_compared,
+            'chunks_total': chunks_total,
+            'range_source_rows': row_totals['source'],
+            'range_target_rows': row_totals['target'],
+            'final_diff_score_lower_bound': (
+                round(lower_bound, ct.STATS_REPORT_FLOAT_DECIMALS)
+                if lower_bound is not None
+                else None
+            ),
+        }
 
-        source_data = source_adapter.convert_types(
-            source_data, source_metadata, timezone
+    def _freeze_before(self, freeze_after_days: int) -> str:
+        """First day (in the checker timezone) that is not frozen yet"""
+        return (
+            pd.Timestamp.now(tz=self.timezone).normalize()
+            - pd.Timedelta(days=freeze_after_days)
+        ).strftime(ct.DATE_FORMAT)
+
+    def _check_samples_incremental(
+        self,
+        check_name: str,
+        max_tracked_keys: int,
+        **samples_kwargs,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Samples check limited to rows changed since the previous run.
+
+        The first run is a full check that records the update_column
+        watermark and the mismatched keys; later runs compare only changed
+        rows and previously mismatched keys. The status of later runs is
+        based on the mismatched keys still open since the last full run.
+        """
+        source_table = samples_kwargs['source_table']
+        target_table = samples_kwargs['target_table']
+        update_column = samples_kwargs['update_column']
+        if update_column not in samples_kwargs['common_cols']:
+            raise MetadataError(
+                f'incremental samples check needs update_column {update_column} '
+                'among the compared columns'
+            )
+
+        tracker = IncrementalSampleTracker(
+            samples_kwargs['key_columns'],
+            update_column,
+            self.state_store.get_sample_state(check_name, source_table, target_table),
+            max_tracked_keys,
         )
-        target_data = target_adapter.convert_types(
-            target_data, target_metadata, timezone
+        app_logger.info(
+            f'incremental samples check: mode={tracker.mode} '
+            f'watermark={tracker.previous_watermark} '
+            f'recheck_keys={len(tracker.recheck_keys)}'
         )
-        source_data_prepared = prepare_dataframe(source_data)
-        target_data_prepared = prepare_dataframe(target_data)
 
-        exclude_cols = exclude_columns or []
-        common_cols = [
-            col
-            for col in source_data_prepared.columns
-            if col in target_data_prepared.columns and col not in exclude_cols
-        ]
-        source_data_filtered = source_data_prepared[common_cols]
-        target_data_filtered = target_data_prepared[common_cols]
-        if ct.XRECENTLY_CHANGED_COLUMN in common_cols:
-            source_data_filtered, target_data_filtered = clean_recently_changed_data(
-                source_data_filtered, target_data_filtered, custom_primary_key
-            )
-        return self._check_dataframes_timed(
-            source_data_filtered,
-            target_data_filtered,
-            custom_primary_key,
-            max_examples,
+        if tracker.mode == INCREMENTAL_MODE_FULL:
+            result = self._check_samples_iterative(tracker=tracker, **samples_kwargs)
+            if result[0] == ct.CHECK_SKIPPED:
+                return result
+        else:
+            result = self._check_changed_samples(tracker, **samples_kwargs)
+
+        self.state_store.put_sample_state(
+            check_name, source_table, target_table, tracker.next_state(result[2])
         )
+        return result
 
-    def _check_custom_queries_iterative(
+    def _check_changed_samples(
         self,
-        source_query: str,
-        target_query: str,
-        chunk_ranges: List[Tuple[Dict, Dict]],
-        source_engine: Engine,
-        target_engine: Engine,
-        source_adapter,
-        target_adapter,
-        source_metadata: pd.DataFrame,
-        target_metadata: pd.DataFrame,
-        custom_primary_key: List[str],
-        exclude_columns: Optional[List[str]],
+        tracker: IncrementalSampleTracker,
+        source_table: DataReference,
+        target_table: DataReference,
+        source_columns_meta: pd.DataFrame,
+        target_columns_meta: pd.DataFrame,
+        common_cols: List[str],
+        key_columns: List[str],
+        source_only_cols: List[str],
+        target_only_cols: List[str],
+        date_column: Optional[str],
+        update_column: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        chunk_size_days: Optional[int],
+        exclude_recent_hours: Optional[int],
+        tolerance_pct: float,
         max_examples: Optional[int],
-        timezone: str,
-    ) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
-        examples_limit = max_examples or ct.DEFAULT_MAX_EXAMPLES
-        total_source_rows = 0
-        total_target_rows = 0
-        dup_source_rows = 0
-        dup_target_rows = 0
-        only_source_rows = 0
-        only_target_rows = 0
-        comparable_rows = 0
-        passed_rows = 0
-        issue_counter = defaultdict(int)
-        has_data = False
-
-        dup_source_examples: set = set()
-        dup_target_examples: set = set()
-        source_only_examples: set = set()
-        target_only_examples: set = set()
-        discrepant_chunks: List[pd.DataFrame] = []
-        discrepancy_examples_rows: List[Dict] = []
-        discrepancy_examples_by_col = defaultdict(int)
-
-        for source_chunk_params, target_chunk_params in chunk_ranges:
-            chunk_stats, chunk_details = self._execute_custom_query_chunk(
-                source_query=source_query,
-                source_params=source_chunk_params,
-                target_query=target_query,
-                target_params=target_chunk_params,
-                source_engine=source_engine,
-                target_engine=target_engine,
-                source_adapter=source_adapter,
-                target_adapter=target_adapter,
-                source_metadata=source_metadata,
-                target_metadata=target_metadata,
-                custom_primary_key=custom_primary_key,
-                exclude_columns=exclude_columns,
-                max_examples=examples_limit,
-                timezone=timezone,
-            )
-            if not chunk_stats:
-                continue
-            has_data = True
-            total_source_rows += chunk_stats.total_source_rows
-            total_target_rows += chunk_stats.total_target_rows
-            dup_source_rows += chunk_stats.dup_source_rows
-            dup_target_rows += chunk_stats.dup_target_rows
-            only_source_rows += chunk_stats.only_source_rows
-            only_target_rows += chunk_stats.only_target_rows
-            comparable_rows += chunk_stats.comparable_rows
-            passed_rows += chunk_stats.passed_rows
+        run_id: str,
+        run_started_at: str,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Compare rows changed since the watermark on either side.
 
-            if not chunk_details.issue_breakdown.empty:
-                for row in chunk_details.issue_breakdown.itertuples(index=False):
-                    issue_counter[row.column_name] += int(row.issue_count)
+        Phase 1 fetches changed rows of each side; phase 2 fetches by key the
+        rows of the other side plus the keys that mismatched last run.
+        """
+        if chunk_size_days:
+            app_logger.info('chunk_size_days is not used by incremental runs')
+        examples_limit = max_examples or ct.DEFAULT_MAX_EXAMPLES
+        sides = {
+            'source': (self.source_engine, source_table, source_columns_meta),
+            'target': (self.target_engine, target_table, target_columns_meta),
+        }
 
-            self._merge_examples_set(
-                dup_source_examples,
-                chunk_details.dup_source_keys_examples,
-                examples_limit,
-            )
-            self._merge_examples_set(
-                dup_target_examples,
-                chunk_details.dup_target_keys_examples,
-                examples_limit,
+        def _fetch(side: str, condition: Tuple[str, Dict]) -> Tuple:
+            engine, table, columns_meta = sides[side]
+            return self._get_table_data(
+                engine,
+                table,
+                columns_meta,
+                common_cols,
+                date_column,
+                update_column,
+                start_date,
+                end_date,
+                exclude_recent_hours,
+                query_side=side,
+                extra_conditions=[condition],
             )
-            self._merge_examples_set(
-                source_only_examples,
-                chunk_details.source_only_keys_examples,
-                examples_limit,
+
+        changed, queries, changed_keys = {}, {}, {}
+        for side, (engine, _, _) in sides.items():
+            adapter = self._get_adapter(DBMSType.from_engine(engine))
+            data, query, params = _fetch(
+                side,
+                adapter.build_updated_after_condition(update_column, tracker.watermark),
             )
-            self._merge_examples_set(
-                target_only_examples,
-                chunk_details.target_only_keys_examples,
-                examples_limit,
+            changed[side] = data
+            queries[side] = (query, params)
+            tracker.changed_rows[side] = len(data)
+            changed_keys[side] = set(
+                prepare_dataframe(data[key_columns]).itertuples(index=False, name=None)
             )
 
-            if (
-                chunk_details.issue_row_examples is not None
-                and not chunk_details.issue_row_examples.empty
-                and len(discrepant_chunks) < examples_limit
-            ):
-                needed = examples_limit * 2
-                current_cnt = sum(len(x) for x in discrepant_chunks)
-                if current_cnt < needed:
-                    remain = needed - current_cnt
-                    discrepant_chunks.append(
-                        chunk_details.issue_row_examples.head(remain)
-                    )
+        frames = {}
+        for side, other in (('source', 'target'), ('target', 'source')):
+            missing_keys = sorted(
+                (changed_keys[other] | tracker.recheck_keys) - changed_keys[side]
+            )
+            frames[side] = changed[side]
+            if missing_keys:
+                engine, _, columns_meta = sides[side]
+                adapter = self._get_adapter(DBMSType.from_engine(engine))
+                by_key, _, _ = _fetch(
+                    side,
+                    adapter.build_key_filter_condition(
+                        key_columns, missing_keys, columns_meta
+                    ),
+                )
+                frames[side] = pd.concat([changed[side], by_key], ignore_index=True)
 
-            if (
-                chunk_details.issue_examples is not None
-                and not chunk_details.issue_examples.empty
-            ):
-                for row in chunk_details.issue_examples.to_dict(
-                    'records'
-                ):
-                    col = row['column_name']
-                    if discrepancy_examples_by_col[col] < examples_limit:
-                        discrepancy_examples_rows.append(row)
-                        discrepancy_examples_by_col[col] += 1
+        source_data = prepare_dataframe(frames['source'])
+        target_data = prepare_dataframe(frames['target'])
+        if update_column and exclude_recent_hours:
+            source_data, target_data = clean_recently_changed_data(
+                source_data, target_data, key_columns
+            )
+        if source_data.empty and target_data.empty:
+            app_logger.info('no changed rows since the watermark')
+            return ct.CHECK_SKIPPED, None, None, None
 
-        if not has_data:
-            return None, None
+        tracker.observe(source_data, target_data)
+        stats, details = self._check_dataframes_timed(
+            source_data, target_data, key_columns, examples_limit
+        )
+        details.evaluated_columns = common_cols
+        details.skipped_source_columns = source_only_cols
+        details.skipped_target_columns = target_only_cols
+        details.execution_info.update(tracker.execution_info(stats))
 
-        stats = build_check_stats(
-            total_source_rows=total_source_rows,
-            total_target_rows=total_target_rows,
-            dup_source_rows=dup_source_rows,
-            dup_target_rows=dup_target_rows,
-            only_source_rows=only_source_rows,
-            only_target_rows=only_target_rows,
-            comparable_rows=comparable_rows,
-            passed_rows=passed_rows,
-            issue_counts=list(issue_counter.values()),
-        )
-        issue_breakdown = (
-            pd.DataFrame(
-                sorted(
-                    issue_counter.items(), key=lambda item: item[1], reverse=True
-                ),
-                columns=['column_name', 'issue_count'],
-            )
-            if issue_counter
-            else pd.DataFrame(columns=['column_name', 'issue_count'])
+        report = self._sample_report(
+            source_table.full_name,
+            target_table.full_name,
+            stats,
+            details,
+            self.timezone,
+            run_id,
+            run_started_at,
+            *queries['source'],
+            *queries['target'],
+            date_chunks=[(start_date, end_date)],
+            **self._report_context,
         )
-        details = CheckDetails(
-            issue_breakdown=issue_breakdown,
-            issue_examples=(
-                pd.DataFrame(discrepancy_examples_rows)
-                if discrepancy_examples_rows
-                else pd.DataFrame()
-            ),
-            dup_source_keys_examples=tuple(dup_source_examples),
-            dup_target_keys_examples=tuple(dup_target_examples),
-            source_only_keys_examples=tuple(source_only_examples),
-            target_only_keys_examples=tuple(target_only_examples),
-            issue_row_examples=(
-                pd.concat(discrepant_chunks, ignore_index=True)
-                if discrepant_chunks
-                else pd.DataFrame()
-            ),
-            evaluated_columns=[],
+        status = (
+            ct.CHECK_FAILED
+            if tracker.cumulative(stats)['mismatch_pct'] > tolerance_pct
+            else ct.CHECK_SUCCESS
         )
-        return stats, details
-
-    def _get_metadata_cols_for_custom_query(
-        self, query, engine: Engine
-    ) -> pd.DataFrame:
-        """Get metadata with proper source handling"""
-        adapter = self._get_adapter(DBMSType.from_engine(engine))
-
-        columns_meta = adapter.get_metadata_for_custom_query(query, engine)
-
-        if columns_meta.empty:
-            raise ValueError(f'Failed to get metadata for custom query: {query}')
-
-        return columns_meta
-
-    def _get_metadata_cols(
-        self, data_ref: DataReference, engine: Engine
-    ) -> pd.DataFrame:
-        """Get metadata with proper source handling"""
-        adapter = self._get_adapter(DBMSType.from_engine(engine))
-
-        query, params = adapter.build_metadata_columns_query(data_ref)
-        columns_meta = self._execute_query((query, params), engine)
-
-        if columns_meta.empty:
-            raise ValueError(f'Failed to get metadata for: {data_ref.full_name}')
-
-        return columns_meta
+        return status, report, stats, details
 
-    def _get_metadata_pk(self, data_ref: DataReference, engine: Engine) -> pd.DataFrame:
-        """Get metadata with proper source handling"""
-        adapter = self._get_adapter(DBMSType.from_engine(engine))
+    def _check_samples_iterative(
+        self,
+        source_table: DataReference,
+        target_table: DataReference,
+        source_columns_meta: pd.DataFrame,
+        target_columns_meta: pd.DataFrame,
+        common_cols: List[str],
+        key_columns: List[str],
+        source_only_cols: List[str],
+        target_only_cols: List[str],
+        date_column: Optional[str],
+        update_column: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        chunk_size_days: Optional[int],
+        exclude_recent_hours: Optional[int],
+        tolerance_pct: float,
+        max_examples: Optional[int],
+        run_id: str,
+        run_started_at: str,
+        tracker: Optional[IncrementalSampleTracker] = None,
+        chunk_reuse: Optional[Tuple[str, str]] = None,
+        sample_fraction: Optional[float] = None,
+        fail_fast: bool = False,
+        checkpoint_key: Optional[str] = None,
+        resume_run_id: Optional[str] = None,
+        max_retries: int = 0,
+        min_split_days: Optional[int] = None,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Compare table data chunk by chunk and reduce the chunk results.
+
+        ``chunk_reuse`` is ``(check_key, freeze_before)``: chunks ending before
+        ``freeze_before`` reuse their stored result while the fingerprints of
+        both sides are unchanged. ``sample_fraction`` restricts both sides to
+        the same key-hash sample. ``fail_fast`` stops before the next chunk
+        once the range row counts prove the check fails anyway. Under
+        ``memory_budget_gb`` chunks are compared in windows fitting the
+        budget, see ``_compare_within_budget``.
+
+        With ``checkpoint_key`` (the check settings) each chunk result is
+        checkpointed under ``run_id`` until the run completes; chunks
+        checkpointed by ``resume_run_id`` are merged instead of compared.
+        Failed chunk queries are retried or split, see
+        ``_compare_chunk_with_recovery``.
+        """
+        examples_limit = max_examples or ct.DEFAULT_MAX_EXAMPLES
+        accumulator = CheckResultAccumulator(examples_limit)
+        queries = {'source': (None, None), 'target': (None, None)}
+        closed_chunks, reused_chunks = 0, 0
+        sample_conditions = None
+        if sample_fraction is not None:
+            sample_buckets = sample_fraction_buckets(sample_fraction)
+            sample_conditions = self._key_sample_conditions(
+                key_columns, source_columns_meta, target_columns_meta, sample_buckets
+            )
 
-        query, params = adapter.build_primary_key_query(data_ref)
-        primary_key = self._execute_query((query, params), engine)
+        date_chunks = self._iter_date_chunks(
+            date_column, start_date, end_date, chunk_size_days
+        )
+        row_totals, lower_bound, memory = None, None, None
+        chunks_compared = len(date_chunks)
+        checkpointing = checkpoint_key is not None and len(date_chunks) > 1
+        resumed = (
+            self._load_run_checkpoints(resume_run_id, checkpoint_key)
+            if resume_run_id is not None
+            else {}
+        )
+        resumed_chunks = 0
+        recovery = {'retries': 0, 'splits': [], 'min_window_days': None}
+        budgeted = (
+            self.memory_budget_gb is not None
+            and date_column is not None
+            and start_date is not None
+            and end_date is not None
+        )
+        if budgeted or (fail_fast and len(date_chunks) > 1):
+            day_rows = self._count_range_day_rows(
+                source_table,
+                target_table,
+                date_column,
+                start_date,
+                end_date,
+                source_columns_meta,
+                target_columns_meta,
+            )
+            if fail_fast and len(date_chunks) > 1:
+                row_totals = {side: sum(day_rows[side].values()) for side in day_rows}
+            if budgeted:
+                memory = self._memory_budget_state(source_table, target_table, day_rows)
+        for chunk_index, (chunk_start, chunk_end) in enumerate(date_chunks):
+            if row_totals is not None:
+                lower_bound = self._fail_fast_lower_bound(
+                    accumulator, row_totals, tolerance_pct
+                )
+                if lower_bound is not None:
+                    app_logger.info(
+                        f'fail fast: final_diff_score >= {lower_bound:.2f} '
+                        f'after {chunk_index} of {len(date_chunks)} chunks'
+                    )
+                    chunks_compared = chunk_index
+                    break
+            checkpoint = resumed.get((chunk_start, chunk_end))
+            if checkpoint is not None:
+                resumed_chunks += 1
+                if checkpointing:
+                    self.state_store.put_run_checkpoint(
+                        run_id, chunk_start, chunk_end, checkpoint
+                    )
+                if checkpoint['stats'] is not None:
+                    accumulator.add(
+                        check_stats_from_dict(checkpoint['stats']),
+                        check_details_from_dict(checkpoint['details']),
+                    )
+                continue
+            fingerprints = None
+            if chunk_reuse and chunk_end is not None and chunk_end < chunk_reuse[1]:
+                closed_chunks += 1
+                fingerprints = {
+                    side: self._get_chunk_fingerprint(
+                        engine,
+                        table,
+                        columns_meta,
+                        common_cols,
+                        date_column,
+                        update_column,
+                        chunk_start,
+                        chunk_end,
+                        query_side=side,
+                    )
+                    for side, engine, table, columns_meta in (
+                        (
+                            'source',
+                            self.source_engine,
+                            source_table,
+                            source_columns_meta,
+                        ),
+                        (
+                            'target',
+                            self.target_engine,
+                            target_table,
+                            target_columns_meta,
+                        ),
+                    )
+                }
+                stored = self.state_store.get_chunk_result(
+                    chunk_reuse[0], chunk_start, chunk_end
+                )
+                if stored is not None and stored['fingerprints'] == fingerprints:
+                    reused_chunks += 1
+                    if stored['stats'] is not None:
+                        accumulator.add(
+                            check_stats_from_dict(stored['stats']),
+                            check_details_from_dict(stored['details']),
+                        )
+                    continue
+
+            chunk_stats, chunk_details = self._compare_chunk_with_recovery(
+                lambda window_start, window_end: self._compare_within_budget(
+                    lambda budget_start, budget_end: self._compare_table_chunk(
+                        queries,
+                        source_table,
+                        target_table,
+                        source_columns_meta,
+                        target_columns_meta,
+                        common_cols,
+                        key_columns,
+                        date_column,
+                        update_column,
+                        budget_start,
+                        budget_end,
+                        exclude_recent_hours,
+                        examples_limit,
+                        tracker,
+                        extra_conditions=sample_conditions,
+                        memory=memory,
+                    ),
+                    window_start,
+                    window_end,
+                    examples_limit,
+                    common_cols,
+                    memory,
+                ),
+                chunk_start,
+                chunk_end,
+                max_retries,
+                min_split_days,
+                examples_limit,
+                common_cols,
+                recovery,
+            )
+            if fingerprints is not None:
+                self.state_store.put_chunk_result(
+                    chunk_reuse[0],
+                    chunk_start,
+                    chunk_end,
+                    {
+                        'fingerprints': fingerprints,
+                        'stats': (
+                            check_stats_to_dict(chunk_stats) if chunk_stats else None
+                        ),
+                        'details': (
+                            check_details_to_dict(chunk_details)
+                            if chunk_stats
+                            else None
+                        ),
+                    },
+                )
+            if checkpointing:
+                self.state_store.put_run_checkpoint(
+                    run_id,
+                    chunk_start,
+                    chunk_end,
+                    {
+                        'check_key': checkpoint_key,
+                        'stats': (
+                            check_stats_to_dict(chunk_stats) if chunk_stats else None
+                        ),
+                        'details': (
+                            check_details_to_dict(chunk_details)
+                            if chunk_stats
+                            else None
+                        ),
+                    },
+                )
+            if not chunk_stats:
+                continue
+            accumulator.add(chunk_stats, chunk_details)
 
-        return primary_key
+        # the run is complete, nothing left to resume
+        if checkpointing:
+            self.state_store.delete_run_checkpoints(run_id)
+        if resume_run_id is not None:
+            self.state_store.delete_run_checkpoints(resume_run_id)
 
-    def _get_object_type(self, data_ref: DataReference, engine: Engine) -> pd.DataFrame:
+        if not accumulator.has_data:
+            status = ct.CHECK_SKIPPED
+            return status, None, None, None
 
-        adapter = self._get_adapter(DBMSType.from_engine(engine))
-        object_type = adapter.get_object_type(data_ref, engine)
-        return object_type
+        stats, details = accumulator.build(
+            common_cols, source_only_cols, target_only_cols
+        )
+        if tracker is not None:
+            details.execution_info.update(tracker.execution_info(stats))
+        if chunk_reuse:
+            details.execution_info['chunk_fingerprints'] = {
+                'freeze_before': chunk_reuse[1],
+                'closed_chunks': closed_chunks,
+                'reused_chunks': reused_chunks,
+            }
+        if sample_conditions is not None:
+            details.execution_info['sampling'] = build_sampling_estimates(
+                stats, sample_buckets / ct.KEY_SAMPLE_BUCKETS
+            )
+        if row_totals is not None:
+            details.execution_info['fail_fast'] = self._fail_fast_info(
+                lower_bound, chunks_compared, len(date_chunks), row_totals
+            )
+        if recovery['retries'] or recovery['splits']:
+            details.execution_info['chunk_recovery'] = {
+                'retries': recovery['retries'],
+                'splits': recovery['splits'],
+                'suggested_chunk_size_days': recovery['min_window_days'],
+            }
+        if resume_run_id is not None:
+            details.execution_info['checkpoints'] = {
+                'resumed_run_id': resume_run_id,
+                'resumed_chunks': resumed_chunks,
+            }
+        if memory is not None:
+            details.execution_info['memory_budget'] = {
+                'budget_gb': self.memory_budget_gb,
+                'row_bytes': memory['row_bytes'],
+                'row_bytes_source': memory['row_bytes_source'],
+                'windows': memory['windows'],
+                'over_budget_days': memory['over_budget_days'],
+            }
+
+        return self._finish_samples_check(
+            source_table,
+            target_table,
+            stats,
+            details,
+            tolerance_pct,
+            queries,
+            run_id,
+            run_started_at,
+            date_chunks,
+        )
 
-    def _get_table_data(
+    def _check_samples_sequential(
         self,
-        engine,
-        data_ref: DataReference,
-        columns_meta: pd.DataFrame,
-        common_columns: List[str],
-        date_column: str,
-        update_column: str,
+        slice_fraction: float,
+        source_table: DataReference,
+        target_table: DataReference,
+        source_columns_meta: pd.DataFrame,
+        target_columns_meta: pd.DataFrame,
+        common_cols: List[str],
+        key_columns: List[str],
+        source_only_cols: List[str],
+        target_only_cols: List[str],
+        date_column: Optional[str],
+        update_column: Optional[str],
         start_date: Optional[str],
         end_date: Optional[str],
+        chunk_size_days: Optional[int],
         exclude_recent_hours: Optional[int],
-        query_side: str,
-    ) -> Tuple[pd.DataFrame, str, Dict]:
-        """Retrieve and prepare table data"""
-        db_type = DBMSType.from_engine(engine)
-        adapter = self._get_adapter(db_type)
-        app_logger.info(db_type)
-
-        query, params = adapter.build_data_query_common(
-            data_ref,
-            common_columns,
-            date_column,
-            update_column,
-            start_date,
-            end_date,
-            exclude_recent_hours,
-            columns_meta,
-            self.timezone,
+        tolerance_pct: float,
+        max_examples: Optional[int],
+        run_id: str,
+        run_started_at: str,
+    ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Compare key-hash slices one at a time (each over all date chunks) until
+        the confidence interval of final_diff_score lies entirely above or
+        below ``tolerance_pct``, or all keys are compared.
+        """
+        examples_limit = max_examples or ct.DEFAULT_MAX_EXAMPLES
+        accumulator = CheckResultAccumulator(examples_limit)
+        queries = {'source': (None, None), 'target': (None, None)}
+        date_chunks = self._iter_date_chunks(
+            date_column, start_date, end_date, chunk_size_days
         )
+        slice_buckets = sample_fraction_buckets(slice_fraction)
+        decision, slices, sampled_buckets = None, 0, 0
 
-        df = self._execute_query(
-            (query, params), engine, self.timezone, query_side=query_side
-        )
+        for first_bucket in range(0, ct.KEY_SAMPLE_BUCKETS, slice_buckets):
+            sampled_buckets = min(first_bucket + slice_buckets, ct.KEY_SAMPLE_BUCKETS)
+            conditions = self._key_sample_conditions(
+                key_columns,
+                source_columns_meta,
+                target_columns_meta,
+                sampled_buckets,
+                first_bucket,
+            )
+            for chunk_start, chunk_end in date_chunks:
+                chunk_stats, chunk_details = self._compare_table_chunk(
+                    queries,
+                    source_table,
+                    target_table,
+                    source_columns_meta,
+                    target_columns_meta,
+                    common_cols,
+                    key_columns,
+                    date_column,
+                    update_column,
+                    chunk_start,
+                    chunk_end,
+                    exclude_recent_hours,
+                    examples_limit,
+                    extra_conditions=conditions,
+                )
+                if chunk_stats:
+                    accumulator.add(chunk_stats, chunk_details)
+            slices += 1
 
-        # Apply type conversions
-        df = adapter.convert_types(df, columns_meta, self.timezone)
+            if not accumulator.has_data or sampled_buckets == ct.KEY_SAMPLE_BUCKETS:
+                continue
+            low, high = build_sampling_estimates(
+                accumulator.build_stats(), sampled_buckets / ct.KEY_SAMPLE_BUCKETS
+            )['final_diff_score_ci']
+            app_logger.info(
+                f'sequential sampling: slice {slices}, '
+                f'final_diff_score interval [{low}, {high}]'
+            )
+            if low > tolerance_pct:
+                decision = 'above tolerance'
+                break
+            if high <= tolerance_pct:
+                decision = 'below tolerance'
+                break
 
-        return df, query, params
+        if not accumulator.has_data:
+            status = ct.CHECK_SKIPPED
+            return status, None, None, None
 
-    def _get_adapter(self, db_type: DBMSType) -> BaseDatabaseAdapter:
-        """Get adapter for specific DBMS"""
-        try:
-            return self.adapters[db_type]
-        except KeyError:
-            raise ValueError(f'No adapter available for {db_type}')
+        stats, details = accumulator.build(
+            common_cols, source_only_cols, target_only_cols
+        )
+        sampled_fraction = sampled_buckets / ct.KEY_SAMPLE_BUCKETS
+        details.execution_info['sequential_sampling'] = {
+            'slice_fraction': slice_buckets / ct.KEY_SAMPLE_BUCKETS,
+            'slices': slices,
+            'decision': decision or 'all keys compared',
+        }
+        if sampled_fraction < 1:
+            details.execution_info['sampling'] = build_sampling_estimates(
+                stats, sampled_fraction
+            )
+
+        return self._finish_samples_check(
+            source_table,
+            target_table,
+            stats,
+            details,
+            tolerance_pct,
+            queries,
+            run_id,
+            run_started_at,
+            date_chunks,
+        )
+
+    def _finish_samples_check(
+        self,
+        source_table: DataReference,
+        target_table: DataReference,
+        stats: CheckStats,
+        details: CheckDetails,
+        tolerance_pct: float,
+        queries: Dict[str, Tuple[Optional[str], Optional[Dict]]],
+        run_id: str,
+        run_started_at: str,
+        date_chunks: List[Tuple[Optional[str], Optional[str]]],
+        report_context: Optional[Dict] = None,
+    ) -> Tuple[str, str, CheckStats, CheckDetails]:
+        (source_query, source_params), (target_query, target_params) = (
+            queries['source'],
+            queries['target'],
+        )
+        report = self._sample_report(
+            source_table.full_name,
+            target_table.full_name,
+            stats,
+            details,
+            self.timezone,
+            run_id,
+            run_started_at,
+            source_query,
+            source_params,
+            target_query,
+            target_params,
+            date_chunks=date_chunks,
+            **(report_context or self._report_context),
+        )
+        status = (
+            ct.CHECK_FAILED
+            if stats.final_diff_score > tolerance_pct
+            else ct.CHECK_SUCCESS
+        )
+        return status, report, stats, details
 
-    def _iter_date_chunks(
+    def _check_samples_multi_iterative(
         self,
+        source_table: DataReference,
+        targets: List[Tuple[Engine, DataReference]],
         date_column: Optional[str],
+        update_column: Optional[str],
         start_date: Optional[str],
         end_date: Optional[str],
         chunk_size_days: Optional[int],
-    ) -> List[Tuple[Optional[str], Optional[str]]]:
-        if chunk_size_days is not None and chunk_size_days <= 0:
-            raise ValueError('chunk_size_days must be greater than 0')
+        exclude_columns: List[str],
+        include_columns: List[str],
+        custom_key_columns: Optional[List[str]],
+        exclude_recent_hours: Optional[int],
+        examples_limit: int,
+    ) -> List[Union[Exception, Tuple]]:
+        """
+        Fetch every source chunk once and compare it against all targets.
 
-        if not (
-            chunk_size_days
-            and date_column
-            and start_date is not None
-            and end_date is not None
-        ):
-            return [(start_date, end_date)]
+        Returns per target either the exception that failed it or
+        ``(stats, details, queries, date_chunks, report_context)``; stats is
+        None when there was nothing to compare.
+        """
+        outcomes: List[Union[Exception, Tuple]] = [None] * len(targets)
+        resolved = {}
+        for i, (target_engine, target_table) in enumerate(targets):
+            try:
+                resolved[i] = self._resolve_samples_columns(
+                    source_table,
+                    target_table,
+                    target_engine,
+                    exclude_columns,
+                    include_columns,
+                    custom_key_columns,
+                )
+            except Exception as e:
+                app_logger.exception(
+                    f'Samples check failed for {target_table.full_name}'
+                )
+                outcomes[i] = e
+        if not resolved:
+            return outcomes
+
+        # the source query selects the columns compared with any target
+        source_columns_meta = pd.concat(
+            [columns['source_columns_meta'] for columns in resolved.values()]
+        ).drop_duplicates('column_name')
+        needed_cols = {
+            col for columns in resolved.values() for col in columns['common_cols']
+        }
+        source_cols = [
+            col
+            for col in source_columns_meta['column_name'].tolist()
+            if col in needed_cols
+        ]
+        source_columns_meta = source_columns_meta[
+            source_columns_meta['column_name'].isin(source_cols)
+        ]
 
-        start_ts = pd.Timestamp(start_date).normalize()
-        end_ts = pd.Timestamp(end_date).normalize()
-        if start_ts > end_ts:
-            raise ValueError(
-                f'date_range start {start_date} is greater than end {end_date}'
+        accumulators = {i: CheckResultAccumulator(examples_limit) for i in resolved}
+        queries = {
+            i: {'source': (None, None), 'target': (None, None)} for i in resolved
+        }
+        source_fetches = 0
+
+        date_chunks = self._iter_date_chunks(
+            date_column, start_date, end_date, chunk_size_days
+        )
+        for chunk_start, chunk_end in date_chunks:
+            source_data, *source_query = self._get_table_data(
+                self.source_engine,
+                source_table,
+                source_columns_meta,
+                list(source_cols),
+                date_column,
+                update_column,
+                chunk_start,
+                chunk_end,
+                exclude_recent_hours,
+                query_side='source',
             )
+            source_fetches += 1
+            source_data = prepare_dataframe(source_data)
+            # with a compare pool the targets of the chunk compare in parallel
+            pool = self._get_compare_pool() if self.compare_processes else None
+            source_path = pool.write_frame(source_data) if pool else None
+            pending = {}
 
-        chunks: List[Tuple[str, str]] = []
-        current = start_ts
-        while current <= end_ts:
-            chunk_end = min(current + pd.Timedelta(days=chunk_size_days - 1), end_ts)
-            chunks.append(
+            jobs = [
                 (
-                    current.strftime(ct.DATE_FORMAT),
-                    chunk_end.strftime(ct.DATE_FORMAT),
+                    i,
+                    targets[i][0],
+                    self._fetch_target_chunk,
+                    (
+                        targets[i][0],
+                        targets[i][1],
+                        resolved[i]['target_columns_meta'],
+                        list(resolved[i]['common_cols']),
+                        date_column,
+                        update_column,
+                        chunk_start,
+                        chunk_end,
+                        exclude_recent_hours,
+                    ),
+                    {},
+                )
+                for i in resolved
+                if outcomes[i] is None
+            ]
+            for i, fetched in self._run_per_engine(jobs, 1, 'xoverrr-multi'):
+                if isinstance(fetched, Exception):
+                    app_logger.error(
+                        f'Samples check failed for {targets[i][1].full_name}: '
+                        f'{fetched}'
+                    )
+                    outcomes[i] = fetched
+                    continue
+                target_data, *queries[i]['target'] = fetched
+                queries[i]['source'] = tuple(source_query)
+                key_columns = resolved[i]['key_columns']
+                compared_cols = set(resolved[i]['common_cols']) | {
+                    ct.XRECENTLY_CHANGED_COLUMN
+                }
+                if pool is not None:
+                    if source_data.empty and target_data.empty:
+                        continue
+                    target_path = pool.write_frame(target_data)
+                    pending[i] = (
+                        pool.submit(
+                            source_path,
+                            target_path,
+                            key_columns,
+                            examples_limit,
+                            self._details_level,
+                            source_prepared=True,
+                            source_columns=sorted(compared_cols),
+                            clean_recent=bool(update_column and exclude_recent_hours),
+                        ),
+                        target_path,
+                    )
+                    continue
+                source_part = source_data[
+                    [col for col in source_data.columns if col in compared_cols]
+                ]
+                if source_part.empty and target_data.empty:
+                    continue
+                target_data = prepare_dataframe(target_data)
+                if update_column and exclude_recent_hours:
+                    source_part, target_data = clean_recently_changed_data(
+                        source_part, target_data, key_columns
+                    )
+                if source_part.empty and target_data.empty:
+                    continue
+                chunk_stats, chunk_details = self._check_dataframes_timed(
+                    source_part, target_data, key_columns, examples_limit
                 )
+                if chunk_stats:
+                    accumulators[i].add(chunk_stats, chunk_details)
+            if pool is not None:
+                self._run_timings.mark_dataset_check_start()
+                try:
+                    for i, (future, target_path) in pending.items():
+                        try:
+                            chunk_stats, chunk_details = future.result()
+                        except Exception as e:
+                            app_logger.exception(
+                                'Samples check failed for '
+                                f'{targets[i][1].full_name}'
+                            )
+                            outcomes[i] = e
+                            continue
+                        finally:
+                            pool.discard(target_path)
+                        if chunk_stats:
+                            accumulators[i].add(chunk_stats, chunk_details)
+                finally:
+                    self._run_timings.mark_dataset_check_end()
+                    pool.discard(source_path)
+
+        for i, columns in resolved.items():
+            if outcomes[i] is not None:
+                continue
+            if not accumulators[i].has_data:
+                outcomes[i] = (None, None, None, date_chunks, None)
+                continue
+            stats, details = accumulators[i].build(
+                columns['common_cols'],
+                columns['source_only_cols'],
+                columns['target_only_cols'],
             )
-            current = chunk_end + pd.Timedelta(days=1)
-        return chunks
+            details.execution_info['samples_multi'] = {
+                'targets': len(targets),
+                'source_fetches': source_fetches,
+            }
+            report_context = {
+                **self._report_context,
+                'target_db_type': DBMSType.from_engine(targets[i][0]).name.lower(),
+            }
+            outcomes[i] = (stats, details, queries[i], date_chunks, report_context)
+        return outcomes
+
+    def _fetch_target_chunk(
+        self, engine: Engine, *args
+    ) -> Union[Exception, Tuple[pd.DataFrame, str, Dict]]:
+        """Target chunk of a multi-target check; errors are returned, not raised"""
+        try:
+            return self._get_table_data(engine, *args, query_side='target')
+        except Exception as e:  # noqa: BLE001
+            # delivered to the caller, which fails only this target
+            return e
 
-    def _check_samples_iterative(
+    def _check_samples_sharded(
         self,
-        source_table: DataReference,
+        sources: List[Tuple[Engine, DataReference]],
+        labels: List[str],
         target_table: DataReference,
-        source_columns_meta: pd.DataFrame,
-        target_columns_meta: pd.DataFrame,
-        common_cols: List[str],
-        key_columns: List[str],
-        source_only_cols: List[str],
-        target_only_cols: List[str],
         date_column: Optional[str],
         update_column: Optional[str],
         start_date: Optional[str],
         end_date: Optional[str],
         chunk_size_days: Optional[int],
-        exclude_recent_hours: Optional[int],
+        exclude_columns: List[str],
+        include_columns: List[str],
+        custom_key_columns: Optional[List[str]],
         tolerance_pct: float,
+        exclude_recent_hours: Optional[int],
         max_examples: Optional[int],
+        shard_column: Optional[str],
         run_id: str,
         run_started_at: str,
     ) -> Tuple[str, str, Optional[CheckStats], Optional[CheckDetails]]:
         examples_limit = max_examples or ct.DEFAULT_MAX_EXAMPLES
+        shard_columns = [
+            self._resolve_samples_columns(
+                source_table,
+                target_table,
+                self.target_engine,
+                exclude_columns + ([shard_column] if shard_column else []),
+                include_columns,
+                custom_key_columns,
+                source_engine=source_engine,
+            )
+            for source_engine, source_table in sources
+        ]
+        columns = shard_columns[0]
+        key_columns = columns['key_columns']
+        # compare only the columns present on every shard
+        common_cols = [
+            col
+            for col in columns['common_cols']
+            if all(col in shard['common_cols'] for shard in shard_columns[1:])
+        ]
+        target_columns_meta = columns['target_columns_meta']
+        target_only_cols = columns['target_only_cols']
+        if shard_column:
+            target_meta = self._get_metadata_cols(target_table, self.target_engine)
+            if shard_column not in target_meta['column_name'].tolist():
+                raise MetadataError(
+                    f'Shard column {shard_column} missing in target: '
+                    f'{target_table.full_name}'
+                )
+            target_columns_meta = pd.concat(
+                [
+                    target_columns_meta,
+                    target_meta[target_meta['column_name'] == shard_column],
+                ]
+            )
+            target_only_cols = [
+                col for col in target_only_cols if col != shard_column
+            ]
 
-        total_source_rows = 0
-        total_target_rows = 0
-        dup_source_rows = 0
-        dup_target_rows = 0
-        only_source_rows = 0
-        only_target_rows = 0
-        comparable_rows = 0
-        passed_rows = 0
-        issue_counter = defaultdict(int)
-
-        dup_source_examples: set = set()
-        dup_target_examples: set = set()
-        source_only_examples: set = set()
-        target_only_examples: set = set()
-        discrepant_chunks: List[pd.DataFrame] = []
-        discrepancy_examples_rows: List[Dict] = []
-        discrepancy_examples_by_col = defaultdict(int)
-
-        total_source_rows_raw = 0
-        total_target_rows_raw = 0
-        source_query, source_params = None, None
-        target_query, target_params = None, None
+        accumulator = CheckResultAccumulator(examples_limit)
+        queries = {'source': (None, None), 'target': (None, None)}
+        shard_rows = {label: 0 for label in labels}
 
         date_chunks = self._iter_date_chunks(
             date_column, start_date, end_date, chunk_size_days
         )
         for chunk_start, chunk_end in date_chunks:
-            source_data, source_query, source_params = self._get_table_data(
-                self.source_engine,
-                source_table,
-                source_columns_meta,
-                common_cols,
-                date_column,
-                update_column,
-                chunk_start,
-                chunk_end,
-                exclude_recent_hours,
-                query_side='source',
+            jobs = [
+                (
+                    i,
+                    source_engine,
+                    self._get_table_data,
+                    (
+                        source_engine,
+                        source_table,
+                        shard_columns[i]['source_columns_meta'],
+                        list(common_cols),
+                        date_column,
+                        update_column,
+                        chunk_start,
+                        chunk_end,
+                        exclude_recent_hours,
+                    ),
+                    {'query_side': 'source'},
+                )
+                for i, (source_engine, source_table) in enumerate(sources)
+            ]
+            shard_frames = {}
+            for i, (shard_data, *shard_query) in self._run_per_engine(
+                jobs, 1, 'xoverrr-shard'
+            ):
+                shard_rows[labels[i]] += len(shard_data)
+                if shard_column:
+                    shard_data[shard_column] = labels[i]
+                shard_frames[i] = shard_data
+                if i == 0:
+                    queries['source'] = tuple(shard_query)
+            source_data = pd.concat(
+                [shard_frames[i] for i in sorted(shard_frames)], ignore_index=True
             )
-            target_data, target_query, target_params = self._get_table_data(
+            target_data, *queries['target'] = self._get_table_data(
                 self.target_engine,
                 target_table,
                 target_columns_meta,
-                common_cols,
+                common_cols + ([shard_column] if shard_column else []),
                 date_column,
                 update_column,
                 chunk_start,
@@ -1557,9 +4937,6 @@ class DataQualityChecker:
                 query_side='target',
             )
 
-            total_source_rows_raw += len(source_data)
-            total_target_rows_raw += len(target_data)
-
             if source_data.empty and target_data.empty:
                 continue
 
@@ -1576,151 +4953,213 @@ class DataQualityChecker:
             chunk_stats, chunk_details = self._check_dataframes_timed(
                 source_data, target_data, key_columns, examples_limit
             )
-            if not chunk_stats:
-                continue
+            if chunk_stats:
+                accumulator.add(chunk_stats, chunk_details)
 
-            total_source_rows += chunk_stats.total_source_rows
-            total_target_rows += chunk_stats.total_target_rows
-            dup_source_rows += chunk_stats.dup_source_rows
-            dup_target_rows += chunk_stats.dup_target_rows
-            only_source_rows += chunk_stats.only_source_rows
-            only_target_rows += chunk_stats.only_target_rows
-            comparable_rows += chunk_stats.comparable_rows
-            passed_rows += chunk_stats.passed_rows
+        if not accumulator.has_data:
+            status = ct.CHECK_SKIPPED
+            return status, None, None, None
 
-            if not chunk_details.issue_breakdown.empty:
-                for row in chunk_details.issue_breakdown.itertuples(index=False):
-                    issue_counter[row.column_name] += int(row.issue_count)
+        stats, details = accumulator.build(
+            common_cols + ([shard_column] if shard_column else []),
+            columns['source_only_cols'],
+            target_only_cols,
+        )
+        details.execution_info['shards'] = shard_rows
+        return self._finish_samples_check(
+            sources[0][1],
+            target_table,
+            stats,
+            details,
+            tolerance_pct,
+            queries,
+            run_id,
+            run_started_at,
+            date_chunks,
+            report_context={
+                **self._report_context,
+                'source_db_type': DBMSType.from_engine(sources[0][0]).name.lower(),
+            },
+        )
 
-            self._merge_examples_set(
-                dup_source_examples,
-                chunk_details.dup_source_keys_examples,
-                examples_limit,
-            )
-            self._merge_examples_set(
-                dup_target_examples,
-                chunk_details.dup_target_keys_examples,
-                examples_limit,
-            )
-            self._merge_examples_set(
-                source_only_examples,
-                chunk_details.source_only_keys_examples,
-                examples_limit,
-            )
-            self._merge_examples_set(
-                target_only_examples,
-                chunk_details.target_only_keys_examples,
+    def _compare_table_chunk(
+        self,
+        queries: Dict[str, Tuple[Optional[str], Optional[Dict]]],
+        source_table: DataReference,
+        target_table: DataReference,
+        source_columns_meta: pd.DataFrame,
+        target_columns_meta: pd.DataFrame,
+        common_cols: List[str],
+        key_columns: List[str],
+        date_column: Optional[str],
+        update_column: Optional[str],
+        chunk_start: Optional[str],
+        chunk_end: Optional[str],
+        exclude_recent_hours: Optional[int],
+        examples_limit: int,
+        tracker: Optional[IncrementalSampleTracker] = None,
+        extra_conditions: Optional[Dict[str, List[Tuple[str, Dict]]]] = None,
+        memory: Optional[Dict] = None,
+    ) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Fetch and compare one chunk; the executed queries are stored in
+        ``queries``. ``extra_conditions`` are data query conditions per side.
+        The size of the fetched rows is added to the ``memory`` budget state.
+        Raw frames are dropped as soon as their prepared copies exist.
+        """
+        extra_conditions = extra_conditions or {}
+        source_data, *queries['source'] = self._get_table_data(
+            self.source_engine,
+            source_table,
+            source_columns_meta,
+            common_cols,
+            date_column,
+            update_column,
+            chunk_start,
+            chunk_end,
+            exclude_recent_hours,
+            query_side='source',
+            extra_conditions=extra_conditions.get('source'),
+        )
+        target_data, *queries['target'] = self._get_table_data(
+            self.target_engine,
+            target_table,
+            target_columns_meta,
+            common_cols,
+            date_column,
+            update_column,
+            chunk_start,
+            chunk_end,
+            exclude_recent_hours,
+            query_side='target',
+            extra_conditions=extra_conditions.get('target'),
+        )
+
+        if source_data.empty and target_data.empty:
+            return None, None
+        if memory is not None:
+            memory['measured_rows'] += len(source_data) + len(target_data)
+            memory['measured_bytes'] += (
+                get_dataframe_size_gb(source_data) + get_dataframe_size_gb(target_data)
+            ) * 1024**3
+
+        if self.compare_processes is not None and tracker is None:
+            return self._compare_in_pool(
+                source_data,
+                target_data,
+                key_columns,
                 examples_limit,
+                clean_recent=bool(update_column and exclude_recent_hours),
             )
 
-            if (
-                chunk_details.issue_row_examples is not None
-                and not chunk_details.issue_row_examples.empty
-                and len(discrepant_chunks) < examples_limit
-            ):
-                needed = examples_limit * 2
-                current_cnt = sum(len(x) for x in discrepant_chunks)
-                if current_cnt < needed:
-                    remain = needed - current_cnt
-                    discrepant_chunks.append(
-                        chunk_details.issue_row_examples.head(remain)
-                    )
-
-            if (
-                chunk_details.issue_examples is not None
-                and not chunk_details.issue_examples.empty
-            ):
-                for row in chunk_details.issue_examples.to_dict(
-                    'records'
-                ):
-                    col = row['column_name']
-                    if discrepancy_examples_by_col[col] < examples_limit:
-                        discrepancy_examples_rows.append(row)
-                        discrepancy_examples_by_col[col] += 1
+        source_data = prepare_dataframe(source_data)
+        target_data = prepare_dataframe(target_data)
+        if update_column and exclude_recent_hours:
+            source_data, target_data = clean_recently_changed_data(
+                source_data, target_data, key_columns
+            )
 
-        if (total_source_rows, total_target_rows) == (0, 0):
-            status = ct.CHECK_SKIPPED
-            return status, None, None, None
+        if source_data.empty and target_data.empty:
+            return None, None
 
-        stats = build_check_stats(
-            total_source_rows=total_source_rows,
-            total_target_rows=total_target_rows,
-            dup_source_rows=dup_source_rows,
-            dup_target_rows=dup_target_rows,
-            only_source_rows=only_source_rows,
-            only_target_rows=only_target_rows,
-            comparable_rows=comparable_rows,
-            passed_rows=passed_rows,
-            issue_counts=list(issue_counter.values()),
-        )
+        if tracker is not None:
+            tracker.observe(source_data, target_data)
 
-        issue_breakdown = (
-            pd.DataFrame(
-                sorted(
-                    issue_counter.items(),
-                    key=lambda item: item[1],
-                    reverse=True,
-                ),
-                columns=['column_name', 'issue_count'],
-            )
-            if issue_counter
-            else pd.DataFrame(columns=['column_name', 'issue_count'])
-        )
-        issue_examples = (
-            pd.DataFrame(discrepancy_examples_rows)
-            if discrepancy_examples_rows
-            else pd.DataFrame()
-        )
-        issue_row_examples = (
-            pd.concat(discrepant_chunks, ignore_index=True)
-            if discrepant_chunks
-            else pd.DataFrame()
+        return self._check_dataframes_timed(
+            source_data, target_data, key_columns, examples_limit
         )
 
-        details = CheckDetails(
-            issue_breakdown=issue_breakdown,
-            issue_examples=issue_examples,
-            dup_source_keys_examples=tuple(dup_source_examples),
-            dup_target_keys_examples=tuple(dup_target_examples),
-            source_only_keys_examples=tuple(source_only_examples),
-            target_only_keys_examples=tuple(target_only_examples),
-            issue_row_examples=issue_row_examples,
-            evaluated_columns=common_cols,
-            skipped_source_columns=source_only_cols,
-            skipped_target_columns=target_only_cols,
-        )
-
-        report = generate_sample_report(
-            source_table.full_name,
-            target_table.full_name,
-            stats,
-            details,
+    def _get_chunk_fingerprint(
+        self,
+        engine: Engine,
+        data_ref: DataReference,
+        columns_meta: pd.DataFrame,
+        common_cols: List[str],
+        date_column: Optional[str],
+        update_column: Optional[str],
+        chunk_start: str,
+        chunk_end: str,
+        query_side: str,
+    ) -> Dict[str, Optional[str]]:
+        adapter = self._get_adapter(DBMSType.from_engine(engine))
+        query = adapter.build_chunk_fingerprint_query(
+            data_ref,
+            common_cols,
+            date_column,
+            update_column,
+            chunk_start,
+            chunk_end,
+            columns_meta,
             self.timezone,
-            run_id,
-            run_started_at,
-            source_query,
-            source_params,
-            target_query,
-            target_params,
-            date_chunks=date_chunks,
-            **self._report_context,
         )
-        status = (
-            ct.CHECK_FAILED
-            if stats.final_diff_score > tolerance_pct
-            else ct.CHECK_SUCCESS
+        result = self._execute_query(
+            query, engine, self.timezone, query_side=query_side
         )
-        return status, report, stats, details
+        row = result.iloc[0] if not result.empty else {}
+        return {
+            name: None if pd.isna(row.get(name)) else str(row.get(name))
+            for name in ('cnt', 'hash_sum', 'max_updated')
+        }
 
-    def _merge_examples_set(
-        self, target_set: set, source_items, max_examples: int
-    ) -> None:
-        if not source_items:
-            return
-        for item in source_items:
-            if len(target_set) >= max_examples:
-                break
-            target_set.add(item)
+    def _get_compare_pool(self) -> ComparePool:
+        if self._compare_pool is None:
+            self._compare_pool = ComparePool(self.compare_processes)
+        return self._compare_pool
+
+    def _get_compare_executor(self) -> ThreadPoolExecutor:
+        if self._compare_executor is None:
+            self._compare_executor = ThreadPoolExecutor(
+                max_workers=self.compare_partitions,
+                thread_name_prefix='xoverrr-compare',
+            )
+        return self._compare_executor
+
+    def _compare_in_pool(
+        self,
+        source_df: pd.DataFrame,
+        target_df: pd.DataFrame,
+        key_columns: List[str],
+        max_examples: int,
+        clean_recent: bool = False,
+        prepared: bool = False,
+    ) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
+        """
+        Prepare and compare chunk frames in worker processes, one job per
+        key hash partition (``compare_partitions``).
+        """
+        pool = self._get_compare_pool()
+        pairs = (
+            split_partitions(source_df, target_df, key_columns, self.compare_partitions)
+            if self.compare_partitions > 1
+            else [(source_df, target_df)]
+        )
+        jobs = []
+        self._run_timings.mark_dataset_check_start()
+        try:
+            for source_part, target_part in pairs:
+                if source_part.empty and target_part.empty:
+                    continue
+                paths = (pool.write_frame(source_part), pool.write_frame(target_part))
+                future = pool.submit(
+                    *paths,
+                    key_columns,
+                    max_examples,
+                    self._details_level,
+                    source_prepared=prepared,
+                    target_prepared=prepared,
+                    clean_recent=clean_recent,
+                )
+                jobs.append((future, paths))
+            del pairs
+            if len(jobs) == 1:
+                return jobs[0][0].result()
+            return merge_partition_results(
+                (future.result() for future, _ in jobs), max_examples
+            )
+        finally:
+            self._run_timings.mark_dataset_check_end()
+            for _, paths in jobs:
+                pool.discard(*paths)
 
     def _check_dataframes_timed(
         self,
@@ -1729,14 +5168,37 @@ class DataQualityChecker:
         key_columns: List[str],
         max_examples: Optional[int],
     ):
+        if self.compare_partitions > 1 and self.compare_processes is not None:
+            return self._compare_in_pool(
+                source_df, target_df, key_columns, max_examples, prepared=True
+            )
+        executor = (
+            self._get_compare_executor() if self.compare_partitions > 1 else None
+        )
         self._run_timings.mark_dataset_check_start()
         try:
             return compare_dataframes(
-                source_df, target_df, key_columns, max_examples
+                source_df,
+                target_df,
+                key_columns,
+                max_examples,
+                self._details_level,
+                partitions=self.compare_partitions,
+                executor=executor,
             )
         finally:
             self._run_timings.mark_dataset_check_end()
 
+    def _sample_report(self, *args, **kwargs) -> Optional[str]:
+        """Text report of a samples check, not rendered without details"""
+        if self._details_level == ct.DETAILS_NONE:
+            return None
+        return generate_sample_report(
+            *args,
+            include_issue_row_examples=self._details_level == ct.DETAILS_FULL,
+            **kwargs,
+        )
+
     def _execute_query(
         self,
         query: Union[str, Tuple[str, Dict]],
@@ -1745,18 +5207,79 @@ class DataQualityChecker:
         query_side: Optional[str] = None,
     ) -> pd.DataFrame:
         """Execute SQL query using appropriate adapter."""
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+        timeout_seconds = self._query_timeout()
         if query_side:
             self._run_timings.mark_query_start(query_side)
         try:
             db_type = DBMSType.from_engine(engine)
             adapter = self._get_adapter(db_type)
-            df = adapter._execute_query(query, engine, timezone)
-            validate_dataframe_size(df, ct.DEFAULT_MAX_SAMPLE_SIZE_GB)
+            df = self._from_snapshot(
+                'query',
+                query,
+                engine,
+                timezone,
+                lambda: adapter._execute_query(
+                    query,
+                    engine,
+                    timezone,
+                    timeout_seconds=timeout_seconds,
+                    cancel_token=self.cancel_token,
+                ),
+            )
+            validate_dataframe_size(df, self._max_frame_size_gb())
             return df
+        except QueryExecutionError:
+            # aborted by the token or by the check deadline, not a query error
+            if self.cancel_token is not None:
+                self.cancel_token.raise_if_cancelled()
+            if self._check_deadline is not None:
+                self._query_timeout()
+            raise
         finally:
             if query_side:
                 self._run_timings.mark_query_end(query_side)
 
+    def _max_frame_size_gb(self) -> float:
+        """Size limit of one fetched frame"""
+        if self.memory_budget_gb is None:
+            return ct.DEFAULT_MAX_SAMPLE_SIZE_GB
+        return self.memory_budget_gb / ct.MEMORY_FOOTPRINT_FACTOR
+
+    def _query_timeout(self) -> Optional[float]:
+        """Timeout of the next query, capped by the time left to the check"""
+        timeout_seconds = self.query_timeout_seconds
+        if self._check_deadline is not None:
+            remaining = self._check_deadline - time.monotonic()
+            if remaining <= 0:
+                raise CheckCancelledError(
+                    f'Check run exceeded check_timeout_seconds='
+                    f'{self.check_timeout_seconds}'
+                )
+            timeout_seconds = (
+                remaining
+                if timeout_seconds is None
+                else min(timeout_seconds, remaining)
+            )
+        return timeout_seconds
+
+    def _from_snapshot(
+        self,
+        kind: str,
+        query: Union[str, Tuple[str, Dict]],
+        engine: Engine,
+        timezone: Optional[str],
+        loader: Callable[[], Any],
+    ) -> Any:
+        """Result of ``loader`` served through the snapshot cache when configured"""
+        if self.snapshot_cache is None:
+            return loader()
+        query_text, params = query if isinstance(query, tuple) else (query, None)
+        return self.snapshot_cache.fetch(
+            (kind, query_text, params, engine_label(engine), timezone), loader
+        )
+
     def _analyze_columns_meta(
         self, source_columns_meta: pd.DataFrame, target_columns_meta: pd.DataFrame
     ) -> tuple[pd.DataFrame, list, list]:
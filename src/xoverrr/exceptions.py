@@ -16,7 +16,25 @@ class QueryExecutionError(DQCheckException):
     pass
 
 
+class DataFrameSizeError(DQCheckException, ValueError):
+    """Exception raised when a fetched result exceeds the size limit"""
+
+    pass
+
+
 class TypeConversionError(DQCheckException):
     """Exception raised for type conversion failures"""
 
     pass
+
+
+class SnapshotMissError(DQCheckException):
+    """Exception raised when a replayed query has no stored snapshot"""
+
+    pass
+
+
+class CheckCancelledError(DQCheckException):
+    """Exception raised when a check run is cancelled or runs out of time"""
+
+    pass
@@ -0,0 +1,127 @@
+"""
+State tracking of incremental samples checks.
+
+An incremental check keeps, per check name, the high-water mark of the
+``update_column`` among compared rows and the keys that mismatched. The
+next run compares only rows changed since the watermark plus those keys.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from .logger import app_logger
+from .utils import CheckStats, find_mismatched_keys, max_column_value
+
+INCREMENTAL_MODE_FULL = 'full'
+INCREMENTAL_MODE_CHANGED = 'incremental'
+
+
+def _compared_rows(stats: Optional[CheckStats]) -> int:
+    if stats is None:
+        return 0
+    return max(stats.total_source_rows, stats.total_target_rows)
+
+
+class IncrementalSampleTracker:
+    """
+    Watermark, mismatched keys and cumulative stats of one incremental run.
+
+    Parameters:
+        key_columns: Primary key columns of the check
+        update_column: Column driving the watermark (date/timestamp)
+        state: State saved by the previous run, ``None`` for the first run
+        max_tracked_keys: Max mismatched keys kept in the state; when
+            exceeded the next run falls back to a full check
+    """
+
+    def __init__(
+        self,
+        key_columns: List[str],
+        update_column: str,
+        state: Optional[Dict],
+        max_tracked_keys: int,
+    ):
+        self.key_columns = key_columns
+        self.update_column = update_column
+        self.max_tracked_keys = max_tracked_keys
+        self.previous_state = state or {}
+        self.previous_watermark: Optional[str] = self.previous_state.get('watermark')
+        self.watermark = self.previous_watermark
+        self.recheck_keys: Set[Tuple] = {
+            tuple(key) for key in self.previous_state.get('mismatched_keys', [])
+        }
+        self.mismatched_keys: Set[Tuple] = set()
+        self.changed_rows = {'source': 0, 'target': 0}
+
+    @property
+    def mode(self) -> str:
+        if self.previous_watermark is None:
+            return INCREMENTAL_MODE_FULL
+        return INCREMENTAL_MODE_CHANGED
+
+    def observe(self, source_data: pd.DataFrame, target_data: pd.DataFrame) -> None:
+        """Record compared (prepared) rows of both sides"""
+        self.mismatched_keys.update(
+            find_mismatched_keys(source_data, target_data, self.key_columns)
+        )
+        self.watermark = max_column_value(
+            [source_data, target_data], self.update_column, self.watermark
+        )
+
+    def cumulative(self, stats: Optional[CheckStats]) -> Dict:
+        """Stats accumulated over the runs since the last full run"""
+        previous = self.previous_state.get('cumulative', {})
+        rows = _compared_rows(stats)
+        baseline_rows = (
+            rows
+            if self.mode == INCREMENTAL_MODE_FULL
+            else previous.get('baseline_rows', 0)
+        )
+        open_keys = len(self.mismatched_keys)
+        if baseline_rows:
+            mismatch_pct = 100 * min(open_keys / baseline_rows, 1.0)
+        else:
+            mismatch_pct = 100.0 if open_keys else 0.0
+        return {
+            'runs': (
+                1 if self.mode == INCREMENTAL_MODE_FULL else previous.get('runs', 0) + 1
+            ),
+            'rows_compared': (
+                rows
+                if self.mode == INCREMENTAL_MODE_FULL
+                else previous.get('rows_compared', 0) + rows
+            ),
+            'baseline_rows': baseline_rows,
+            'open_mismatched_keys': open_keys,
+            'mismatch_pct': mismatch_pct,
+        }
+
+    def execution_info(self, stats: Optional[CheckStats]) -> Dict:
+        return {
+            'incremental': {
+                'mode': self.mode,
+                'watermark_from': self.previous_watermark,
+                'watermark_to': self.watermark,
+                'changed_rows': dict(self.changed_rows),
+                'rechecked_keys': len(self.recheck_keys),
+                'cumulative': self.cumulative(stats),
+            }
+        }
+
+    def next_state(self, stats: Optional[CheckStats]) -> Dict:
+        """State to save for the next run"""
+        watermark = self.watermark
+        mismatched_keys = sorted(list(key) for key in self.mismatched_keys)
+        if len(mismatched_keys) > self.max_tracked_keys:
+            app_logger.warning(
+                f'{len(mismatched_keys)} mismatched keys exceed '
+                f'max_tracked_keys={self.max_tracked_keys}; '
+                'the next incremental run will be a full check'
+            )
+            watermark, mismatched_keys = None, []
+        return {
+            'watermark': watermark,
+            'mismatched_keys': mismatched_keys,
+            'cumulative': self.cumulative(stats),
+        }
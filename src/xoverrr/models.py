@@ -1,7 +1,7 @@
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional
+from typing import Dict, Optional
 
 from sqlalchemy.engine import Engine
 
@@ -56,3 +56,21 @@ class DataReference:
     def full_name(self) -> str:
         """Get fully qualified object name"""
         return f'{self.schema}.{self.name}' if self.schema else self.name
+
+
+@dataclass(frozen=True)
+class CountsCheckSpec:
+    """One table pair of a multi-table counts check"""
+
+    source_table: DataReference
+    target_table: DataReference
+    date_column: Optional[str] = None
+    check_name: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SuiteCheck:
+    """One check of a suite: checker method name and its keyword arguments"""
+
+    method: str
+    kwargs: Dict = field(default_factory=dict)
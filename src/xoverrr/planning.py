@@ -0,0 +1,296 @@
+"""
+Execution planning helpers for chunked checks.
+
+Plans are plain dataclasses computed from the requested date chunks and
+cheap catalog statistics; the checker executes them.
+"""
+
+import random
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .constants import DATE_FORMAT, KEY_SAMPLE_BUCKETS, MEMORY_FOOTPRINT_FACTOR
+
+COUNTS_PLAN_SINGLE = 'single'
+COUNTS_PLAN_CHUNKED = 'chunked'
+
+
+@dataclass(frozen=True)
+class TableStats:
+    """Catalog statistics of a table (estimates, may be stale or missing)."""
+
+    num_rows: Optional[int] = None
+    avg_row_bytes: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class CountsExecutionPlan:
+    """How the per-day count queries of a counts check are issued."""
+
+    mode: str
+    chunks: List[Tuple[Optional[str], Optional[str]]]
+    max_workers_per_engine: int
+    reason: str
+
+    @property
+    def is_parallel(self) -> bool:
+        return self.mode == COUNTS_PLAN_CHUNKED and self.max_workers_per_engine > 1
+
+    def to_dict(self) -> Dict:
+        plan = asdict(self)
+        plan['chunks'] = len(self.chunks)
+        return plan
+
+
+def plan_counts_execution(
+    date_chunks: List[Tuple[Optional[str], Optional[str]]],
+    source_stats: Optional[TableStats],
+    target_stats: Optional[TableStats],
+    max_workers_per_engine: int = 1,
+    single_scan_max_rows: Optional[int] = None,
+) -> CountsExecutionPlan:
+    """
+    Choose between one grouped query for the whole range and chunked queries.
+
+    Count queries return one row per day, so chunking only adds round trips
+    unless the scan of the whole range is predicted to be too heavy.
+    Catalog row estimates of both tables are used as an (upper bound)
+    prediction of the scanned rows.
+
+    Parameters:
+        date_chunks: Chunks from ``_iter_date_chunks``
+        source_stats, target_stats: Catalog statistics, ``None`` when unknown
+        max_workers_per_engine: Concurrent chunk queries allowed per engine
+        single_scan_max_rows: Max predicted rows for a single query over the
+            whole range, ``None`` disables the single query plan
+
+    Returns:
+        CountsExecutionPlan
+    """
+    if max_workers_per_engine < 1:
+        raise ValueError('max_parallel_chunks must be greater than 0')
+
+    if len(date_chunks) <= 1:
+        return CountsExecutionPlan(
+            mode=COUNTS_PLAN_SINGLE,
+            chunks=list(date_chunks),
+            max_workers_per_engine=1,
+            reason='no chunking requested',
+        )
+
+    estimated_rows = [
+        stats.num_rows
+        for stats in (source_stats, target_stats)
+        if stats is not None and stats.num_rows is not None
+    ]
+    full_range = [(date_chunks[0][0], date_chunks[-1][1])]
+
+    if not _chunks_are_contiguous(date_chunks):
+        reason = 'chunks do not cover a contiguous range'
+    elif single_scan_max_rows is not None and len(estimated_rows) == 2:
+        predicted_rows = max(estimated_rows)
+        if predicted_rows <= single_scan_max_rows:
+            return CountsExecutionPlan(
+                mode=COUNTS_PLAN_SINGLE,
+                chunks=full_range,
+                max_workers_per_engine=1,
+                reason=(
+                    f'predicted scan of {predicted_rows} rows is within '
+                    f'single scan limit of {single_scan_max_rows}'
+                ),
+            )
+        reason = (
+            f'predicted scan of {predicted_rows} rows exceeds '
+            f'single scan limit of {single_scan_max_rows}'
+        )
+    elif single_scan_max_rows is None:
+        reason = 'single scan disabled'
+    else:
+        reason = 'no catalog statistics to predict the scan'
+
+    return CountsExecutionPlan(
+        mode=COUNTS_PLAN_CHUNKED,
+        chunks=list(date_chunks),
+        max_workers_per_engine=max_workers_per_engine,
+        reason=reason,
+    )
+
+
+def _chunks_are_contiguous(
+    date_chunks: List[Tuple[Optional[str], Optional[str]]],
+) -> bool:
+    for (_, prev_end), (next_start, _) in zip(date_chunks, date_chunks[1:]):
+        if prev_end is None or next_start is None:
+            return False
+        if pd.Timestamp(prev_end) + pd.Timedelta(days=1) != pd.Timestamp(next_start):
+            return False
+    return True
+
+
+def days_to_windows(days: List[str]) -> List[Tuple[str, str]]:
+    """Group sorted ``YYYY-MM-DD`` days into contiguous (start, end) windows"""
+    windows: List[Tuple[str, str]] = []
+    for day in days:
+        next_day = pd.Timestamp(windows[-1][1]) + pd.Timedelta(days=1) if windows else None
+        if next_day == pd.Timestamp(day):
+            windows[-1] = (windows[-1][0], day)
+        else:
+            windows.append((day, day))
+    return windows
+
+
+@dataclass(frozen=True)
+class CountCachePlan:
+    """Which days of a counts check are served from the count cache."""
+
+    freeze_before: str
+    cached_days: List[str]
+    query_days: List[str]
+    frozen_query_days: List[str]
+    revalidate_days: List[str]
+
+    def to_dict(self) -> Dict:
+        return {
+            'freeze_before': self.freeze_before,
+            'cached_days': len(self.cached_days),
+            'query_days': len(self.query_days),
+            'revalidate_days': list(self.revalidate_days),
+        }
+
+
+def plan_count_cache(
+    start_date: str,
+    end_date: str,
+    freeze_before: str,
+    source_cached: Dict[str, int],
+    target_cached: Dict[str, int],
+    revalidate_days: int = 0,
+    seed: Optional[int] = None,
+) -> CountCachePlan:
+    """
+    Split the days of a date range into cached and queried days.
+
+    Days before ``freeze_before`` are immutable and served from the cache when
+    both sides have them; ``revalidate_days`` random cached days are queried
+    again to detect late changes of "immutable" history.
+
+    Parameters:
+        start_date, end_date: Inclusive date range (``YYYY-MM-DD``)
+        freeze_before: First day that is still mutable
+        source_cached, target_cached: Cached counts per day
+        revalidate_days: Cached days re-queried per run
+        seed: Seed of the revalidation sample
+
+    Returns:
+        CountCachePlan
+    """
+    if revalidate_days < 0:
+        raise ValueError('revalidate_days must not be negative')
+
+    days = [
+        day.strftime(DATE_FORMAT)
+        for day in pd.date_range(
+            pd.Timestamp(start_date).normalize(),
+            pd.Timestamp(end_date).normalize(),
+            freq='D',
+        )
+    ]
+    cached_both = [
+        day
+        for day in days
+        if day < freeze_before and day in source_cached and day in target_cached
+    ]
+    revalidate = sorted(
+        random.Random(seed).sample(cached_both, min(revalidate_days, len(cached_both)))
+    )
+    cached = sorted(set(cached_both) - set(revalidate))
+    cached_set = set(cached)
+    query_days = [day for day in days if day not in cached_set]
+
+    return CountCachePlan(
+        freeze_before=freeze_before,
+        cached_days=cached,
+        query_days=query_days,
+        frozen_query_days=[day for day in query_days if day < freeze_before],
+        revalidate_days=revalidate,
+    )
+
+
+def bisect_key_ranges(
+    ranges: List[Tuple[int, int]],
+    source_counts: List[int],
+    target_counts: List[int],
+    max_range_rows: int,
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    One step of a key-range bisection over half-open ``[lo, hi)`` ranges.
+
+    Ranges with equal counts on both sides are dropped, ranges of at most
+    ``max_range_rows`` rows (or a single key) are returned as leaves whose
+    keys are fetched, the others are split in halves to be counted next.
+    Returns ``(ranges_to_count, leaves)``.
+    """
+    to_count: List[Tuple[int, int]] = []
+    leaves: List[Tuple[int, int]] = []
+    for (lo, hi), source_cnt, target_cnt in zip(ranges, source_counts, target_counts):
+        if source_cnt == target_cnt:
+            continue
+        if max(source_cnt, target_cnt) <= max_range_rows or hi - lo <= 1:
+            leaves.append((lo, hi))
+        else:
+            mid = (lo + hi) // 2
+            to_count.extend([(lo, mid), (mid, hi)])
+    return to_count, leaves
+
+
+def sample_fraction_buckets(sample_fraction: float) -> int:
+    """Key hash buckets kept for a sample fraction (at least one)"""
+    return max(1, round(sample_fraction * KEY_SAMPLE_BUCKETS))
+
+
+def split_date_window(
+    start_date: str, end_date: str, min_days: int
+) -> Optional[List[Tuple[str, str]]]:
+    """
+    Halves of an inclusive day window, ``None`` when the window is not
+    longer than ``min_days`` (it cannot be split further).
+    """
+    start_ts = pd.Timestamp(start_date)
+    days = (pd.Timestamp(end_date) - start_ts).days + 1
+    if days <= max(min_days, 1):
+        return None
+    first_end = start_ts + pd.Timedelta(days=(days + 1) // 2 - 1)
+    return [
+        (start_date, first_end.strftime(DATE_FORMAT)),
+        ((first_end + pd.Timedelta(days=1)).strftime(DATE_FORMAT), end_date),
+    ]
+
+
+def plan_memory_window(
+    start_date: str,
+    end_date: str,
+    day_rows: Dict[str, int],
+    row_bytes: Optional[float],
+    budget_bytes: float,
+    footprint_factor: float = MEMORY_FOOTPRINT_FACTOR,
+) -> str:
+    """
+    End of the longest window from ``start_date`` to at most ``end_date``
+    whose predicted comparison footprint fits ``budget_bytes``.
+
+    The footprint of a window is its rows of both sides (``day_rows``) times
+    ``row_bytes`` times ``footprint_factor``. A window has at least one day;
+    without a row width it is one day, so that the width can be measured.
+    """
+    if row_bytes is None:
+        return start_date
+    window_end, rows = start_date, 0
+    for day in pd.date_range(start_date, end_date, freq='D'):
+        day = day.strftime(DATE_FORMAT)
+        rows += day_rows.get(day, 0)
+        if day != start_date and rows * row_bytes * footprint_factor > budget_bytes:
+            break
+        window_end = day
+    return window_end
@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 import pandas as pd
 
 from .constants import DATETIME_FORMAT, REPORT_OUTPUT_FORMAT_JSON, REPORT_OUTPUT_FORMATS, REPORT_OUTPUT_FORMAT_TEXT
-from .utils import CheckDetails, CheckStats, append_report_run_header, format_report_collection, sniff_issue_row_count
+from .utils import CheckDetails, CheckStats, append_report_execution_info, append_report_run_header, format_report_collection, sniff_issue_row_count
 
 if TYPE_CHECKING:
     from .persistence import CheckRunTimings
@@ -221,6 +221,7 @@ def generate_sample_report(
     library_version: Optional[str] = None,
     source_db_type: Optional[str] = None,
     target_db_type: Optional[str] = None,
+    include_issue_row_examples: bool = False,
 ) -> str:
     """
     Generate a human-readable text report for a sample check.
@@ -236,6 +237,7 @@ def generate_sample_report(
         target_query: Target SQL query
         target_params: Target query parameters
         date_chunks: Optional chunk intervals used for the check
+        include_issue_row_examples: Dump the issue rows of both sides
         
     Returns:
         Formatted text report
@@ -320,9 +322,11 @@ def generate_sample_report(
             )
         )
 
-    # Horizontal wide row dumps are hard to use in text reports.
-    # Keep the code for a future optional report parameter (e.g. include_issue_row_examples).
-    if False and (
+    append_report_execution_info(lines, details.execution_info)
+
+    # Horizontal wide row dumps are hard to use in text reports,
+    # they are only added on request (details_level='full').
+    if include_issue_row_examples and (
         details.issue_row_examples is not None
         and not details.issue_row_examples.empty
     ):
@@ -401,6 +405,8 @@ def generate_check_sniff_query_report(
         )
         lines.append('')
 
+    append_report_execution_info(lines, details.execution_info)
+
     lines.append('=' * 80)
     return '\n'.join(lines)
 
@@ -488,6 +494,8 @@ def generate_count_report(
         lines.append('\nISSUE BREAKDOWN:')
         lines.append(details.issue_breakdown.to_string(index=False))
 
+    append_report_execution_info(lines, details.execution_info)
+
     # Horizontal wide row dumps are hard to use in text reports.
     # Keep the code for a future optional report parameter (e.g. include_issue_row_examples).
     if False and (
@@ -0,0 +1,139 @@
+"""
+Local snapshot cache of query results.
+
+Every result set fetched by a checker (data chunks, metadata, counts) can be
+stored on disk and served again in replay mode on later runs with the same
+query, params, engine and timezone. In replay mode the checker never reaches
+the databases: the whole pandas pipeline reruns from the snapshots, which
+makes tuning ``exclude_columns`` or ``tolerance_pct`` on a failing check
+cheap. Outside replay mode every query runs and refreshes its snapshot.
+
+Snapshots are gzip-compressed pickles; load them only from directories you
+trust.
+"""
+
+import gzip
+import os
+import pickle
+import tempfile
+import threading
+from typing import Any, Callable, Optional
+
+from .exceptions import SnapshotMissError
+from .logger import app_logger
+from .state import build_check_key
+
+SNAPSHOT_SUFFIX = '.pkl.gz'
+
+
+def engine_label(engine) -> str:
+    """Engine identity used in snapshot keys (password hidden)"""
+    url = getattr(engine, 'url', None)
+    if url is not None:
+        return url.render_as_string(hide_password=True)
+    return engine.dialect.name
+
+
+class SnapshotCache:
+    """
+    Directory of query result snapshots with size-based LRU eviction.
+
+    Parameters:
+        path: Directory for the snapshot files, created on first use
+        max_size_mb: Total size kept on disk; least recently used snapshots
+            are removed when exceeded
+        replay: Serve results only from the snapshots; a missing snapshot
+            raises ``SnapshotMissError`` instead of querying the database.
+            Without replay every query runs and overwrites its snapshot
+    """
+
+    def __init__(self, path: str, max_size_mb: float = 1024, replay: bool = False):
+        self.path = path
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.replay = replay
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    def fetch(self, key_parts: tuple, loader: Callable[[], Any]) -> Any:
+        """
+        In replay mode the snapshot stored under ``key_parts``, otherwise the
+        ``loader`` result, stored as the new snapshot
+        """
+        key = build_check_key(*key_parts)
+        file_path = os.path.join(self.path, key + SNAPSHOT_SUFFIX)
+        if self.replay:
+            value = self._read(file_path)
+            if value is None:
+                with self._lock:
+                    self.misses += 1
+                raise SnapshotMissError(
+                    f'No snapshot for query in replay mode (key {key}): {key_parts[1]}'
+                )
+            with self._lock:
+                self.hits += 1
+            return value[0]
+
+        with self._lock:
+            self.misses += 1
+        result = loader()
+        self._write(file_path, result)
+        self._evict()
+        return result
+
+    def clear(self) -> None:
+        for name in self._snapshot_files():
+            os.remove(os.path.join(self.path, name))
+
+    def _read(self, file_path: str) -> Optional[tuple]:
+        try:
+            with gzip.open(file_path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            app_logger.warning(f'Ignoring unreadable snapshot {file_path}: {e}')
+            return None
+        try:
+            # access time drives the LRU eviction
+            os.utime(file_path)
+        except FileNotFoundError:
+            pass
+        return (value,)
+
+    def _write(self, file_path: str, value: Any) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            for name in self._snapshot_files():
+                file_path = os.path.join(self.path, name)
+                try:
+                    stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, file_path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, file_path in sorted(entries):
+                if total <= self.max_size_bytes:
+                    break
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def _snapshot_files(self):
+        return [
+            name for name in os.listdir(self.path) if name.endswith(SNAPSHOT_SUFFIX)
+        ]
@@ -0,0 +1,350 @@
+"""
+Local state shared between check runs.
+
+The store is a small SQLite database (via SQLAlchemy) kept next to the
+process running the checks; it is not the results table of
+``persist_result``.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from .constants import DATETIME_FORMAT
+from .models import DataReference
+
+# SQLite limits the number of bound variables per statement
+_MAX_BINDS_PER_QUERY = 500
+
+
+@dataclass(frozen=True)
+class CountCacheScope:
+    """Identifies the daily counts of one table column on one database."""
+
+    engine_url: str
+    table_name: str
+    date_column: str
+    timezone: str
+
+    @classmethod
+    def for_table(
+        cls,
+        engine: Engine,
+        data_ref: DataReference,
+        date_column: str,
+        timezone: str,
+    ) -> 'CountCacheScope':
+        return cls(
+            engine_url=engine.url.render_as_string(hide_password=True),
+            table_name=data_ref.full_name.lower(),
+            date_column=date_column.lower(),
+            timezone=timezone,
+        )
+
+
+class CheckStateStore:
+    """
+    SQLite-backed store of state reused across check runs.
+
+    Parameters:
+        path: SQLite database file, created on first use
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.engine = create_engine(f'sqlite:///{path}')
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    CREATE TABLE IF NOT EXISTS count_cache (
+                        engine_url TEXT NOT NULL,
+                        table_name TEXT NOT NULL,
+                        date_column TEXT NOT NULL,
+                        timezone TEXT NOT NULL,
+                        day TEXT NOT NULL,
+                        cnt INTEGER NOT NULL,
+                        cached_at TEXT NOT NULL,
+                        PRIMARY KEY (engine_url, table_name, date_column, timezone, day)
+                    )
+                    """
+                )
+            )
+            conn.execute(
+                text(
+                    """
+                    CREATE TABLE IF NOT EXISTS sample_state (
+                        check_name TEXT NOT NULL,
+                        source_table TEXT NOT NULL,
+                        target_table TEXT NOT NULL,
+                        state_json TEXT NOT NULL,
+                        updated_at TEXT NOT NULL,
+                        PRIMARY KEY (check_name, source_table, target_table)
+                    )
+                    """
+                )
+            )
+
+            conn.execute(
+                text(
+                    """
+                    CREATE TABLE IF NOT EXISTS chunk_results (
+                        check_key TEXT NOT NULL,
+                        chunk_start TEXT NOT NULL,
+                        chunk_end TEXT NOT NULL,
+                        result_json TEXT NOT NULL,
+                        updated_at TEXT NOT NULL,
+                        PRIMARY KEY (check_key, chunk_start, chunk_end)
+                    )
+                    """
+                )
+            )
+            conn.execute(
+                text(
+                    """
+                    CREATE TABLE IF NOT EXISTS run_checkpoints (
+                        run_id TEXT NOT NULL,
+                        chunk_start TEXT NOT NULL,
+                        chunk_end TEXT NOT NULL,
+                        result_json TEXT NOT NULL,
+                        updated_at TEXT NOT NULL,
+                        PRIMARY KEY (run_id, chunk_start, chunk_end)
+                    )
+                    """
+                )
+            )
+
+    def get_day_counts(
+        self, scope: CountCacheScope, days: Iterable[str]
+    ) -> Dict[str, int]:
+        """Cached counts of the given days (days missing from cache are omitted)"""
+        days = list(days)
+        counts = {}
+        with self.engine.connect() as conn:
+            for offset in range(0, len(days), _MAX_BINDS_PER_QUERY):
+                batch = days[offset : offset + _MAX_BINDS_PER_QUERY]
+                binds = {f'day_{i}': day for i, day in enumerate(batch)}
+                rows = conn.execute(
+                    text(
+                        f"""
+                        SELECT day, cnt FROM count_cache
+                        WHERE engine_url = :engine_url
+                        AND table_name = :table_name
+                        AND date_column = :date_column
+                        AND timezone = :timezone
+                        AND day IN ({', '.join(f':{bind}' for bind in binds)})
+                        """
+                    ),
+                    {**self._scope_params(scope), **binds},
+                )
+                counts.update({day: int(cnt) for day, cnt in rows})
+        return counts
+
+    def put_day_counts(self, scope: CountCacheScope, counts: Dict[str, int]) -> None:
+        """Insert or replace cached counts of days"""
+        if not counts:
+            return
+        cached_at = pd.Timestamp.now().strftime(DATETIME_FORMAT)
+        scope_params = self._scope_params(scope)
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT OR REPLACE INTO count_cache
+                        (engine_url, table_name, date_column, timezone, day, cnt, cached_at)
+                    VALUES
+                        (:engine_url, :table_name, :date_column, :timezone, :day, :cnt, :cached_at)
+                    """
+                ),
+                [
+                    {
+                        **scope_params,
+                        'day': day,
+                        'cnt': int(cnt),
+                        'cached_at': cached_at,
+                    }
+                    for day, cnt in counts.items()
+                ],
+            )
+
+    def delete_day_counts(self, scope: CountCacheScope, days: List[str]) -> None:
+        """Drop cached counts of days (e.g. after a backfill)"""
+        if not days:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    DELETE FROM count_cache
+                    WHERE engine_url = :engine_url
+                    AND table_name = :table_name
+                    AND date_column = :date_column
+                    AND timezone = :timezone
+                    AND day = :day
+                    """
+                ),
+                [{**self._scope_params(scope), 'day': day} for day in days],
+            )
+
+    def get_sample_state(
+        self, check_name: str, source_table: DataReference, target_table: DataReference
+    ) -> Optional[Dict]:
+        """State of an incremental samples check, None before its first run"""
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    SELECT state_json FROM sample_state
+                    WHERE check_name = :check_name
+                    AND source_table = :source_table
+                    AND target_table = :target_table
+                    """
+                ),
+                {
+                    'check_name': check_name,
+                    'source_table': source_table.full_name.lower(),
+                    'target_table': target_table.full_name.lower(),
+                },
+            ).first()
+        return json.loads(row[0]) if row else None
+
+    def put_sample_state(
+        self,
+        check_name: str,
+        source_table: DataReference,
+        target_table: DataReference,
+        state: Dict,
+    ) -> None:
+        """Replace the state of an incremental samples check"""
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT OR REPLACE INTO sample_state
+                        (check_name, source_table, target_table, state_json, updated_at)
+                    VALUES
+                        (:check_name, :source_table, :target_table, :state_json, :updated_at)
+                    """
+                ),
+                {
+                    'check_name': check_name,
+                    'source_table': source_table.full_name.lower(),
+                    'target_table': target_table.full_name.lower(),
+                    'state_json': json.dumps(state),
+                    'updated_at': pd.Timestamp.now().strftime(DATETIME_FORMAT),
+                },
+            )
+
+    def get_chunk_result(
+        self, check_key: str, chunk_start: str, chunk_end: str
+    ) -> Optional[Dict]:
+        """Stored fingerprints and outcome of a closed chunk"""
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    SELECT result_json FROM chunk_results
+                    WHERE check_key = :check_key
+                    AND chunk_start = :chunk_start
+                    AND chunk_end = :chunk_end
+                    """
+                ),
+                {
+                    'check_key': check_key,
+                    'chunk_start': chunk_start,
+                    'chunk_end': chunk_end,
+                },
+            ).first()
+        return json.loads(row[0]) if row else None
+
+    def put_chunk_result(
+        self, check_key: str, chunk_start: str, chunk_end: str, result: Dict
+    ) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT OR REPLACE INTO chunk_results
+                        (check_key, chunk_start, chunk_end, result_json, updated_at)
+                    VALUES
+                        (:check_key, :chunk_start, :chunk_end, :result_json, :updated_at)
+                    """
+                ),
+                {
+                    'check_key': check_key,
+                    'chunk_start': chunk_start,
+                    'chunk_end': chunk_end,
+                    'result_json': json.dumps(result, default=str),
+                    'updated_at': pd.Timestamp.now().strftime(DATETIME_FORMAT),
+                },
+            )
+
+    def get_run_checkpoints(self, run_id: str) -> Dict[Tuple[str, str], Dict]:
+        """Stored results of the chunks a run completed, by chunk bounds"""
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    """
+                    SELECT chunk_start, chunk_end, result_json FROM run_checkpoints
+                    WHERE run_id = :run_id
+                    """
+                ),
+                {'run_id': run_id},
+            )
+            return {
+                (chunk_start, chunk_end): json.loads(result_json)
+                for chunk_start, chunk_end, result_json in rows
+            }
+
+    def put_run_checkpoint(
+        self, run_id: str, chunk_start: str, chunk_end: str, result: Dict
+    ) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT OR REPLACE INTO run_checkpoints
+                        (run_id, chunk_start, chunk_end, result_json, updated_at)
+                    VALUES
+                        (:run_id, :chunk_start, :chunk_end, :result_json, :updated_at)
+                    """
+                ),
+                {
+                    'run_id': run_id,
+                    'chunk_start': chunk_start,
+                    'chunk_end': chunk_end,
+                    'result_json': json.dumps(result, default=str),
+                    'updated_at': pd.Timestamp.now().strftime(DATETIME_FORMAT),
+                },
+            )
+
+    def delete_run_checkpoints(self, run_id: str) -> None:
+        """Drop the checkpoints of a run once it no longer needs resuming"""
+        with self.engine.begin() as conn:
+            conn.execute(
+                text('DELETE FROM run_checkpoints WHERE run_id = :run_id'),
+                {'run_id': run_id},
+            )
+
+    @staticmethod
+    def _scope_params(scope: CountCacheScope) -> Dict[str, str]:
+        return {
+            'engine_url': scope.engine_url,
+            'table_name': scope.table_name,
+            'date_column': scope.date_column,
+            'timezone': scope.timezone,
+        }
+
+
+def build_check_key(*parts) -> str:
+    """Stable key of a check configuration (hash of its JSON-encoded parts)"""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
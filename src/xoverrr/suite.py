@@ -0,0 +1,163 @@
+"""
+Planning of suite runs: checks sharing table reads.
+
+Samples checks of a suite reading the same table, date range, chunking and
+recent-rows settings on the same side share one read per chunk: the first
+check issues a query for the union of the compared columns and the others
+get a projection of the fetched frame. Counts checks over the same table and
+range take their daily counts from the shared frames instead of querying.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from .models import DataReference, SuiteCheck
+
+SUITE_METHOD_SAMPLES = 'check_samples'
+SUITE_METHOD_COUNTS = 'check_counts'
+SUITE_SIDES = ('source', 'target')
+
+
+@dataclass(frozen=True)
+class SuiteReadKey:
+    """What makes two table reads of a suite interchangeable"""
+
+    side: str
+    table_name: str
+    date_column: Optional[str]
+    update_column: Optional[str]
+    date_range: Optional[Tuple[str, str]]
+    chunk_size_days: Optional[int]
+    exclude_recent_hours: Optional[int]
+
+
+@dataclass
+class SharedRead:
+    """
+    One table read shared by several checks of a suite.
+
+    ``frames`` holds, per chunk window, the fetched superset frame with its
+    query and the number of samples checks still to read it; a frame is
+    dropped after its last reader.
+    """
+
+    key: SuiteReadKey
+    table: DataReference
+    sample_checks: List[int] = field(default_factory=list)
+    count_checks: List[int] = field(default_factory=list)
+    columns: List[str] = field(default_factory=list)
+    columns_meta: Optional[pd.DataFrame] = None
+    windows: List[Tuple[Optional[str], Optional[str]]] = field(default_factory=list)
+    frames: Dict[Tuple, list] = field(default_factory=dict)
+    fetched_windows: Set[Tuple] = field(default_factory=set)
+    day_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def consumers(self) -> int:
+        return len(self.sample_checks) + len(self.count_checks)
+
+    @property
+    def complete(self) -> bool:
+        return bool(self.windows) and self.fetched_windows >= set(self.windows)
+
+    def to_dict(self) -> Dict:
+        return {
+            'side': self.key.side,
+            'table': self.key.table_name,
+            'sample_checks': list(self.sample_checks),
+            'count_checks': list(self.count_checks),
+            'columns': list(self.columns),
+        }
+
+
+def _read_key(
+    side: str,
+    table: DataReference,
+    kwargs: Dict,
+    default_exclude_recent_hours: Optional[int],
+) -> SuiteReadKey:
+    date_range = kwargs.get('date_range')
+    return SuiteReadKey(
+        side=side,
+        table_name=table.full_name.lower(),
+        date_column=kwargs.get('date_column'),
+        update_column=kwargs.get('update_column'),
+        date_range=tuple(date_range) if date_range else None,
+        chunk_size_days=kwargs.get('chunk_size_days'),
+        exclude_recent_hours=(
+            kwargs.get('exclude_recent_hours') or default_exclude_recent_hours
+        ),
+    )
+
+
+def _shares_reads(check: SuiteCheck) -> bool:
+    kwargs = check.kwargs
+    if check.method == SUITE_METHOD_SAMPLES:
+        return (
+            not kwargs.get('incremental')
+            and kwargs.get('freeze_after_days') is None
+            and kwargs.get('sample_fraction') is None
+            and kwargs.get('sequential_slice_fraction') is None
+            and not kwargs.get('fail_fast')
+            and kwargs.get('resume_run_id') is None
+        )
+    if check.method == SUITE_METHOD_COUNTS:
+        return (
+            kwargs.get('freeze_after_days') is None
+            and not kwargs.get('key_fingerprint')
+            and kwargs.get('date_column') is not None
+            and kwargs.get('date_range') is not None
+        )
+    return False
+
+
+def plan_suite(
+    checks: List[SuiteCheck], default_exclude_recent_hours: Optional[int]
+) -> Tuple[List[SharedRead], List[int]]:
+    """
+    Group the reads of a suite and order its checks.
+
+    Returns the reads used by at least two checks and the execution order:
+    checks deriving counts from shared reads run after the samples checks
+    feeding them, all others keep their position.
+    """
+    reads: Dict[SuiteReadKey, SharedRead] = {}
+    for i, check in enumerate(checks):
+        if check.method != SUITE_METHOD_SAMPLES or not _shares_reads(check):
+            continue
+        for side in SUITE_SIDES:
+            table = check.kwargs[f'{side}_table']
+            key = _read_key(side, table, check.kwargs, default_exclude_recent_hours)
+            reads.setdefault(key, SharedRead(key=key, table=table))
+            reads[key].sample_checks.append(i)
+
+    for i, check in enumerate(checks):
+        if check.method != SUITE_METHOD_COUNTS or not _shares_reads(check):
+            continue
+        matches = []
+        for side in SUITE_SIDES:
+            table_name = check.kwargs[f'{side}_table'].full_name.lower()
+            matches.append(
+                next(
+                    (
+                        read
+                        for key, read in reads.items()
+                        if key.side == side
+                        and key.table_name == table_name
+                        and key.date_column == check.kwargs['date_column']
+                        and key.date_range == tuple(check.kwargs['date_range'])
+                    ),
+                    None,
+                )
+            )
+        # counts are derived only when both sides are read anyway
+        if all(matches):
+            for read in matches:
+                read.count_checks.append(i)
+
+    shared = [read for read in reads.values() if read.consumers > 1]
+    derived = {i for read in shared for i in read.count_checks}
+    order = [i for i in range(len(checks)) if i not in derived] + sorted(derived)
+    return shared, order
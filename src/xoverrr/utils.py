@@ -1,21 +1,37 @@
+import logging
+import math
 from collections import defaultdict
-from dataclasses import dataclass, field
+from concurrent.futures import Executor
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from itertools import repeat
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from .constants import (
+    CHUNK_ERROR_RETRY,
+    CHUNK_ERROR_SPLIT,
+    DATAFRAME_SIZE_SAMPLE_ROWS,
     DATETIME_FORMAT,
     DEFAULT_MAX_EXAMPLES,
+    DETAILS_EXAMPLES,
+    DETAILS_NONE,
     FLAG_VALUE_NO,
     FLAG_VALUE_YES,
     NULL_REPLACEMENT,
+    RETRYABLE_QUERY_ERROR_PATTERNS,
+    SAMPLE_CONFIDENCE_PCT,
+    SAMPLE_CONFIDENCE_Z,
+    SPLIT_QUERY_ERROR_PATTERNS,
+    STATS_REPORT_FLOAT_DECIMALS,
     XSNIFF_PASSED_COLUMN,
     XSNIFF_PASSED_VALUE_NO,
     XRECENTLY_CHANGED_COLUMN,
 )
+from .exceptions import DataFrameSizeError, QueryExecutionError
 from .logger import app_logger
 
 
@@ -53,6 +69,20 @@ def append_report_run_header(
         lines.append(f'target db type: {target_db_type}')
 
 
+def append_report_execution_info(lines: List[str], execution_info: Optional[Dict]) -> None:
+    """Append the execution section (plans, cache usage, ...) when present."""
+    if not execution_info:
+        return
+    lines.append('\nEXECUTION:')
+    for name, value in execution_info.items():
+        if isinstance(value, dict):
+            lines.append(f'  {name}:')
+            for key, item in value.items():
+                lines.append(f'    {key}: {format_report_collection(item)}')
+        else:
+            lines.append(f'  {name}: {format_report_collection(value)}')
+
+
 def build_check_stats(
     total_source_rows: int,
     total_target_rows: int,
@@ -130,6 +160,102 @@ def build_check_stats(
     )
 
 
+def wilson_interval(
+    successes: int, trials: int, z: float = SAMPLE_CONFIDENCE_Z
+) -> Tuple[float, float]:
+    """
+    Wilson score interval of a proportion, as percentages. More successes
+    than trials (e.g. only-source rows over comparable rows) count as a
+    proportion of 1.
+    """
+    if trials == 0:
+        return 0.0, 100.0
+    # plain floats, also for numpy counts
+    successes, trials = float(successes), float(trials)
+    p = min(successes / trials, 1.0)
+    denominator = 1 + z**2 / trials
+    center = (p + z**2 / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z**2 / (4 * trials**2)) / denominator
+    return max(0.0, center - margin) * 100, min(1.0, center + margin) * 100
+
+
+def build_sampling_estimates(stats: 'CheckStats', sample_fraction: float) -> Dict:
+    """
+    Full-range estimates of a check run on a key sample: row counts scaled
+    by the sample fraction and confidence intervals of the percentages.
+
+    The interval of ``final_diff_score`` combines the intervals of its terms
+    with their weights, so it is conservative.
+    """
+    terms = [
+        # (successes, trials, weight) of the final_diff_score terms
+        (stats.dup_source_rows, stats.total_source_rows, 0.1),
+        (stats.dup_target_rows, stats.total_target_rows, 0.1),
+        (stats.only_source_rows, stats.comparable_rows, 0.15),
+        (stats.only_target_rows, stats.comparable_rows, 0.15),
+        (stats.comparable_rows - stats.passed_rows, stats.comparable_rows, 0.5),
+    ]
+    intervals = [wilson_interval(successes, trials) for successes, trials, _ in terms]
+    weights = [weight for *_, weight in terms]
+
+    def _scaled(rows: int) -> int:
+        return round(rows / sample_fraction)
+
+    def _rounded(interval: Tuple[float, float]) -> List[float]:
+        return [round(bound, STATS_REPORT_FLOAT_DECIMALS) for bound in interval]
+
+    return {
+        'sample_fraction': sample_fraction,
+        'estimated_source_rows': _scaled(stats.total_source_rows),
+        'estimated_target_rows': _scaled(stats.total_target_rows),
+        'estimated_only_source_rows': _scaled(stats.only_source_rows),
+        'estimated_only_target_rows': _scaled(stats.only_target_rows),
+        'estimated_issue_rows': _scaled(stats.comparable_rows - stats.passed_rows),
+        'confidence_pct': SAMPLE_CONFIDENCE_PCT,
+        'source_only_rows_pct_ci': _rounded(intervals[2]),
+        'target_only_rows_pct_ci': _rounded(intervals[3]),
+        'issue_rows_pct_ci': _rounded(intervals[4]),
+        'final_diff_score_ci': _rounded(
+            (
+                sum(w * low for w, (low, _) in zip(weights, intervals)),
+                sum(w * high for w, (_, high) in zip(weights, intervals)),
+            )
+        ),
+    }
+
+
+def final_diff_score_lower_bound(
+    stats: 'CheckStats', remaining_source_rows: int, remaining_target_rows: int
+) -> float:
+    """
+    Smallest final_diff_score the check can still end with once at most the
+    given rows are compared on top of ``stats``.
+
+    Issue counts only grow with more rows, so the best case is that every
+    remaining row is clean: totals grow by the remaining rows and comparable
+    rows by at most the smaller side.
+    """
+    total_source = stats.total_source_rows + remaining_source_rows
+    total_target = stats.total_target_rows + remaining_target_rows
+    comparable = stats.comparable_rows + min(
+        remaining_source_rows, remaining_target_rows
+    )
+    if comparable == 0:
+        # nothing left can become comparable: the score stays at its maximum
+        return 100.0
+
+    terms = [
+        (stats.dup_source_rows, total_source, 0.1),
+        (stats.dup_target_rows, total_target, 0.1),
+        (stats.only_source_rows, comparable, 0.15),
+        (stats.only_target_rows, comparable, 0.15),
+        (stats.comparable_rows - stats.passed_rows, comparable, 0.5),
+    ]
+    return sum(
+        weight * rows / total * 100 for rows, total, weight in terms if total
+    )
+
+
 def normalize_column_names(columns: List[str]) -> List[str]:
     """
     Normalize column names to lowercase for a consistent check.
@@ -187,6 +313,183 @@ class CheckDetails:
     evaluated_columns: List[str]
     skipped_source_columns: List[str] = field(default_factory=list)
     skipped_target_columns: List[str] = field(default_factory=list)
+    # how the check was executed (plans, cache usage, partial runs, ...)
+    execution_info: Dict = field(default_factory=dict)
+
+
+def check_stats_to_dict(stats: CheckStats) -> Dict:
+    """JSON-serializable dict of CheckStats"""
+    return {
+        key: value.item() if hasattr(value, 'item') else value
+        for key, value in asdict(stats).items()
+    }
+
+
+def check_stats_from_dict(data: Dict) -> CheckStats:
+    return CheckStats(**{f.name: data[f.name] for f in fields(CheckStats)})
+
+
+def _examples_to_json(examples) -> list:
+    return [list(item) if isinstance(item, tuple) else item for item in examples]
+
+
+def _examples_from_json(examples) -> tuple:
+    return tuple(tuple(item) if isinstance(item, list) else item for item in examples)
+
+
+def check_details_to_dict(details: CheckDetails) -> Dict:
+    """JSON-serializable dict of CheckDetails (DataFrames as records)"""
+    data = {}
+    for f in fields(CheckDetails):
+        value = getattr(details, f.name)
+        if isinstance(value, pd.DataFrame):
+            data[f.name] = {
+                'columns': list(value.columns),
+                'records': value.astype(object).where(value.notna(), None).to_dict(
+                    'records'
+                ),
+            }
+        elif isinstance(value, (tuple, set)):
+            data[f.name] = _examples_to_json(value)
+        else:
+            data[f.name] = value
+    return data
+
+
+def check_details_from_dict(data: Dict) -> CheckDetails:
+    values = {}
+    for f in fields(CheckDetails):
+        value = data.get(f.name)
+        if isinstance(value, dict) and 'records' in value:
+            values[f.name] = pd.DataFrame(value['records'], columns=value['columns'])
+        elif f.name.endswith('_keys_examples'):
+            values[f.name] = _examples_from_json(value or [])
+        elif value is not None:
+            values[f.name] = value
+    return CheckDetails(**values)
+
+
+class CheckResultAccumulator:
+    """
+    Reduces per-chunk (CheckStats, CheckDetails) of a chunked check into
+    check totals; examples are capped at ``max_examples`` and kept in the
+    order they were added.
+    """
+
+    def __init__(self, max_examples: int):
+        self.max_examples = max_examples
+        self.counters = defaultdict(int)
+        self.issue_counter = defaultdict(int)
+        # dicts as insertion-ordered sets
+        self.dup_source_examples: Dict = {}
+        self.dup_target_examples: Dict = {}
+        self.source_only_examples: Dict = {}
+        self.target_only_examples: Dict = {}
+        self.discrepant_chunks: List[pd.DataFrame] = []
+        self.discrepancy_examples_rows: List[Dict] = []
+        self.discrepancy_examples_by_col = defaultdict(int)
+        self.chunks = 0
+
+    _COUNTER_FIELDS = (
+        'total_source_rows',
+        'total_target_rows',
+        'dup_source_rows',
+        'dup_target_rows',
+        'only_source_rows',
+        'only_target_rows',
+        'comparable_rows',
+        'passed_rows',
+    )
+
+    @property
+    def has_data(self) -> bool:
+        return self.chunks > 0
+
+    def _merge_examples(self, target: Dict, items) -> None:
+        for item in items or ():
+            if len(target) >= self.max_examples:
+                break
+            target[item] = None
+
+    def add(self, stats: CheckStats, details: CheckDetails) -> None:
+        self.chunks += 1
+        for name in self._COUNTER_FIELDS:
+            self.counters[name] += getattr(stats, name)
+
+        if not details.issue_breakdown.empty:
+            for row in details.issue_breakdown.itertuples(index=False):
+                self.issue_counter[row.column_name] += int(row.issue_count)
+
+        self._merge_examples(self.dup_source_examples, details.dup_source_keys_examples)
+        self._merge_examples(self.dup_target_examples, details.dup_target_keys_examples)
+        self._merge_examples(
+            self.source_only_examples, details.source_only_keys_examples
+        )
+        self._merge_examples(
+            self.target_only_examples, details.target_only_keys_examples
+        )
+
+        if (
+            details.issue_row_examples is not None
+            and not details.issue_row_examples.empty
+            and len(self.discrepant_chunks) < self.max_examples
+        ):
+            needed = self.max_examples * 2
+            current_cnt = sum(len(x) for x in self.discrepant_chunks)
+            if current_cnt < needed:
+                remain = needed - current_cnt
+                self.discrepant_chunks.append(details.issue_row_examples.head(remain))
+
+        if details.issue_examples is not None and not details.issue_examples.empty:
+            for row in details.issue_examples.to_dict('records'):
+                col = row['column_name']
+                if self.discrepancy_examples_by_col[col] < self.max_examples:
+                    self.discrepancy_examples_rows.append(row)
+                    self.discrepancy_examples_by_col[col] += 1
+
+    def build_stats(self) -> CheckStats:
+        """Stats of the chunks added so far"""
+        return build_check_stats(
+            **{name: self.counters[name] for name in self._COUNTER_FIELDS},
+            issue_counts=list(self.issue_counter.values()),
+        )
+
+    def build(
+        self,
+        evaluated_columns: List[str],
+        skipped_source_columns: Optional[List[str]] = None,
+        skipped_target_columns: Optional[List[str]] = None,
+    ) -> Tuple[CheckStats, CheckDetails]:
+        stats = self.build_stats()
+        issue_breakdown = (
+            pd.DataFrame(
+                sorted(self.issue_counter.items(), key=lambda item: item[1], reverse=True),
+                columns=['column_name', 'issue_count'],
+            )
+            if self.issue_counter
+            else pd.DataFrame(columns=['column_name', 'issue_count'])
+        )
+        details = CheckDetails(
+            issue_breakdown=issue_breakdown,
+            issue_examples=(
+                pd.DataFrame(self.discrepancy_examples_rows)
+                if self.discrepancy_examples_rows
+                else pd.DataFrame()
+            ),
+            dup_source_keys_examples=tuple(self.dup_source_examples),
+            dup_target_keys_examples=tuple(self.dup_target_examples),
+            source_only_keys_examples=tuple(self.source_only_examples),
+            target_only_keys_examples=tuple(self.target_only_examples),
+            issue_row_examples=(
+                pd.concat(self.discrepant_chunks, ignore_index=True)
+                if self.discrepant_chunks
+                else pd.DataFrame()
+            ),
+            evaluated_columns=evaluated_columns,
+            skipped_source_columns=skipped_source_columns or [],
+            skipped_target_columns=skipped_target_columns or [],
+        )
+        return stats, details
 
 
 def build_sniff_issue_stats(
@@ -407,6 +710,9 @@ def compare_dataframes(
     target_df: pd.DataFrame,
     key_columns: List[str],
     max_examples: int = DEFAULT_MAX_EXAMPLES,
+    details_level: str = DETAILS_EXAMPLES,
+    partitions: int = 1,
+    executor: Optional[Executor] = None,
 ) -> tuple[CheckStats, CheckDetails]:
     """
     Efficient comparison of two dataframes by primary key when discrepancies ratio quite small,
@@ -425,6 +731,14 @@ def compare_dataframes(
             List of primary key columns
         max_examples : int, optional
             Maximum number of discrepancy examples per column
+        details_level : str, optional
+            ``DETAILS_NONE`` computes the counters only: no key sets, no
+            sorting and no examples
+        partitions : int, optional
+            Hash-partition both frames on the key columns and compare the
+            partitions independently, see ``split_partitions``
+        executor : Executor, optional
+            Runs the partition comparisons, sequential without it
 
     Returns:
     --------
@@ -438,6 +752,25 @@ def compare_dataframes(
     if source_df.empty and target_df.empty:
         return None, None
     _validate_input_data(source_df, target_df, key_columns)
+    if partitions > 1:
+        pairs = split_partitions(source_df, target_df, key_columns, partitions)
+        results = (executor.map if executor is not None else map)(
+            compare_dataframes,
+            [source_part for source_part, _ in pairs],
+            [target_part for _, target_part in pairs],
+            repeat(key_columns),
+            repeat(max_examples),
+            repeat(details_level),
+        )
+        check_stats, check_details = merge_partition_results(results, max_examples)
+        app_logger.info('end')
+        return check_stats, check_details
+    if details_level == DETAILS_NONE:
+        check_stats, check_details = _compare_dataframes_counters(
+            source_df, target_df, key_columns
+        )
+        app_logger.info('end')
+        return check_stats, check_details
 
     # Check for duplicate primary keys and handle them
     source_dup = source_df[source_df.duplicated(subset=key_columns, keep=False)]
@@ -452,6 +785,7 @@ def compare_dataframes(
 
     source_dup_keys_examples = format_keys(source_dup_keys, max_examples)
     target_dup_keys_examples = format_keys(target_dup_keys, max_examples)
+    del source_dup, target_dup
 
     # Remove duplicates from both dataframes for clean comparison
     source_clean = source_df.drop_duplicates(subset=key_columns, keep='first')
@@ -463,11 +797,13 @@ def compare_dataframes(
 
     non_key_columns = compare_dataframes_meta(source_clean, target_clean, key_columns)
 
-    source_clean = source_clean.assign(xflg='src')
-    target_clean = target_clean.assign(xflg='trg')
-
+    source_clean_cnt = len(source_clean)
+    target_clean_cnt = len(target_clean)
     xor_combined_df = (
-        pd.concat([source_clean, target_clean], ignore_index=True)
+        pd.concat(
+            [source_clean.assign(xflg='src'), target_clean.assign(xflg='trg')],
+            ignore_index=True,
+        )
         .drop_duplicates(subset=key_columns + non_key_columns, keep=False)
         .assign(
             xcount_pairs=lambda df: df.groupby(key_columns)[key_columns[0]].transform(
@@ -475,11 +811,14 @@ def compare_dataframes(
             )
         )
     )
+    # release the deduplicated copies before sorting the difference
+    del source_clean, target_clean
 
     # symmetrical difference between two datasets, sorted
     xor_combined_sorted = xor_combined_df.sort_values(
         by=key_columns + ['xflg'], ascending=[False] * len(key_columns) + [True]
     )
+    del xor_combined_df
 
     mask = xor_combined_sorted['xcount_pairs'] > 1
     xor_df_multi = xor_combined_sorted[mask]
@@ -509,9 +848,9 @@ def compare_dataframes(
     # get number of records that present in two datasets based on primary key
     common_keys_cnt = int(
         (
-            len(source_clean)
+            source_clean_cnt
             - xor_source_only_keys_cnt
-            + len(target_clean)
+            + target_clean_cnt
             - xor_target_only_keys_cnt
         )
         / 2
@@ -579,6 +918,117 @@ def compare_dataframes(
     return check_stats, check_details
 
 
+def hash_partitions(
+    df: pd.DataFrame, key_columns: List[str], partitions: int
+) -> np.ndarray:
+    """
+    Partition of every row: a hash of its prepared key values modulo
+    ``partitions``. Keys equal after ``prepare_dataframe`` share a partition,
+    whether the frame is raw or already prepared.
+    """
+    keys = prepare_dataframe(df[key_columns])
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy() % partitions
+
+
+def split_partitions(
+    source_df: pd.DataFrame,
+    target_df: pd.DataFrame,
+    key_columns: List[str],
+    partitions: int,
+) -> List[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Split both frames into ``partitions`` pairs by a hash of the key columns.
+
+    Partitions share no key, so every pair is compared on its own and the
+    results are merged with ``merge_partition_results``.
+    """
+    if partitions < 1:
+        raise ValueError('partitions must be greater than 0')
+    source_buckets = hash_partitions(source_df, key_columns, partitions)
+    target_buckets = hash_partitions(target_df, key_columns, partitions)
+    return [
+        (
+            source_df[source_buckets == bucket].reset_index(drop=True),
+            target_df[target_buckets == bucket].reset_index(drop=True),
+        )
+        for bucket in range(partitions)
+    ]
+
+
+def merge_partition_results(
+    results, max_examples: int
+) -> Tuple[Optional[CheckStats], Optional[CheckDetails]]:
+    """
+    Merge per-partition ``(stats, details)`` in partition order.
+
+    Counters are sums over disjoint keys, so the stats equal the ones of a
+    single comparison. Examples are taken from the first partitions, so the
+    selection does not depend on which partition finished first.
+    """
+    accumulator = CheckResultAccumulator(max_examples)
+    evaluated_columns: List[str] = []
+    for stats, details in results:
+        if stats is None:
+            continue
+        accumulator.add(stats, details)
+        evaluated_columns = details.evaluated_columns
+    if not accumulator.has_data:
+        return None, None
+    return accumulator.build(evaluated_columns)
+
+
+def _compare_dataframes_counters(
+    source_df: pd.DataFrame,
+    target_df: pd.DataFrame,
+    key_columns: List[str],
+) -> tuple[CheckStats, CheckDetails]:
+    """
+    Stats of ``compare_dataframes`` without examples: the rows of keys found
+    on both sides are aligned by a key index and compared column-wise.
+    """
+    source_clean = source_df.drop_duplicates(subset=key_columns, keep='first')
+    target_clean = target_df.drop_duplicates(subset=key_columns, keep='first')
+    non_key_columns = compare_dataframes_meta(source_clean, target_clean, key_columns)
+
+    source_keyed = source_clean.set_index(key_columns)[non_key_columns]
+    target_keyed = target_clean.set_index(key_columns)[non_key_columns]
+    common_keys = source_keyed.index.intersection(target_keyed.index)
+    source_common = source_keyed.loc[common_keys]
+    target_common = target_keyed.loc[common_keys]
+    # nulls on both sides are equal, as in the drop_duplicates based compare
+    diff = source_common.ne(target_common) & ~(
+        source_common.isna() & target_common.isna()
+    )
+    issue_counts = diff.sum()
+    issue_counts = issue_counts[issue_counts > 0]
+
+    check_stats = build_check_stats(
+        total_source_rows=len(source_df),
+        total_target_rows=len(target_df),
+        dup_source_rows=len(source_df) - len(source_clean),
+        dup_target_rows=len(target_df) - len(target_clean),
+        only_source_rows=len(source_clean) - len(common_keys),
+        only_target_rows=len(target_clean) - len(common_keys),
+        comparable_rows=len(common_keys),
+        passed_rows=len(common_keys) - int(diff.any(axis=1).sum()),
+        issue_counts=[int(count) for count in issue_counts],
+    )
+    check_details = CheckDetails(
+        issue_breakdown=pd.DataFrame(
+            [(column, int(count)) for column, count in issue_counts.items()],
+            columns=['column_name', 'issue_count'],
+        ),
+        issue_examples=pd.DataFrame(),
+        dup_source_keys_examples=(),
+        dup_target_keys_examples=(),
+        source_only_keys_examples=(),
+        target_only_keys_examples=(),
+        issue_row_examples=pd.DataFrame(),
+        evaluated_columns=non_key_columns,
+    )
+    return check_stats, check_details
+
+
 def _validate_input_data(
     source_df: pd.DataFrame, target_df: pd.DataFrame, key_columns: List[str]
 ) -> None:
@@ -811,6 +1261,24 @@ def safe_remove_zeros(x):
     return x
 
 
+def normalize_profile_value(value) -> str:
+    """
+    Engine-independent text of a profile aggregate: integral numbers without
+    decimals, other numbers rounded to 6 decimals.
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return NULL_REPLACEMENT
+    try:
+        number = Decimal(str(value))
+    except InvalidOperation:
+        return str(value)
+    if not number.is_finite():
+        return str(value)
+    if number == number.to_integral_value():
+        return str(int(number))
+    return str(round(number, 6).normalize())
+
+
 def prepare_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Prepare DataFrame for comparison by handling nulls and empty strings"""
     df = df.map(safe_remove_zeros)
@@ -911,6 +1379,49 @@ def clean_recently_changed_data(
     return df1_processed, df2_processed
 
 
+def find_mismatched_keys(
+    source_df: pd.DataFrame, target_df: pd.DataFrame, key_columns: List[str]
+) -> set:
+    """
+    Keys that are duplicated, present on one side only or differ in any
+    common column of two prepared dataframes.
+    """
+    common_columns = [col for col in source_df.columns if col in target_df.columns]
+    mismatched = set()
+    for df in (source_df, target_df):
+        dup = df[df.duplicated(subset=key_columns, keep=False)]
+        mismatched.update(_create_keys_set(dup, key_columns))
+    # rows equal on both sides come in pairs and cancel out
+    xor_df = pd.concat(
+        [
+            source_df[common_columns].drop_duplicates(),
+            target_df[common_columns].drop_duplicates(),
+        ],
+        ignore_index=True,
+    ).drop_duplicates(keep=False)
+    mismatched.update(_create_keys_set(xor_df, key_columns))
+    return mismatched
+
+
+def max_column_value(
+    frames: List[pd.DataFrame], column: str, current: Optional[str] = None
+) -> Optional[str]:
+    """Max non-null value of a prepared (string) datetime column in DATETIME_FORMAT"""
+    values = [
+        df[column][df[column] != NULL_REPLACEMENT]
+        for df in frames
+        if column in df.columns and not df.empty
+    ]
+    values = [series for series in values if not series.empty]
+    if not values:
+        return current
+    latest = pd.to_datetime(pd.concat(values), errors='coerce', format='mixed').max()
+    if pd.isna(latest):
+        return current
+    latest = latest.strftime(DATETIME_FORMAT)
+    return max(latest, current) if current else latest
+
+
 def find_count_discrepancies(
     source_counts: pd.DataFrame, target_counts: pd.DataFrame
 ) -> pd.DataFrame:
@@ -982,22 +1493,71 @@ def format_keys(keys, max_examples):
     return ()
 
 
-def get_dataframe_size_gb(df: pd.DataFrame) -> float:
-    """Calculate DataFrame size in GB"""
+def get_dataframe_size_gb(
+    df: pd.DataFrame,
+    sample_rows: int = DATAFRAME_SIZE_SAMPLE_ROWS,
+    exact: Optional[bool] = None,
+) -> float:
+    """
+    Estimate DataFrame size in GB.
+
+    Fixed width columns are sized from their buffers. Text columns hold
+    Python strings, so their deep size is measured on ``sample_rows`` random
+    rows (fixed seed) and scaled to the frame. ``exact`` measures every value with
+    ``memory_usage(deep=True)``, an O(n) walk of all strings. By default it
+    is used only when the logger is at DEBUG level.
+    """
     if df.empty:
         return 0.0
-    return df.memory_usage(deep=True).sum() / 1024 / 1024 / 1024
+    if exact is None:
+        exact = app_logger.isEnabledFor(logging.DEBUG)
+    if exact or len(df) <= sample_rows:
+        return df.memory_usage(deep=True).sum() / 1024 / 1024 / 1024
+
+    usage = df.memory_usage(deep=False)
+    text_df = df.select_dtypes(include=['object', 'string'])
+    size_bytes = float(usage.sum())
+    if not text_df.empty:
+        positions = np.random.default_rng(0).integers(0, len(df), sample_rows)
+        sample_bytes = text_df.iloc[positions].memory_usage(deep=True, index=False)
+        size_bytes += (
+            sample_bytes.sum() * len(df) / sample_rows
+            - usage[text_df.columns].sum()
+        )
+    return size_bytes / 1024 / 1024 / 1024
 
 
-def validate_dataframe_size(df: pd.DataFrame, max_size_gb: float) -> None:
+def validate_dataframe_size(
+    df: pd.DataFrame,
+    max_size_gb: float,
+    sample_rows: int = DATAFRAME_SIZE_SAMPLE_ROWS,
+) -> None:
     """Validate DataFrame size and raise exception if exceeds limit"""
     if df is None:
         return
 
-    size_gb = get_dataframe_size_gb(df)
+    size_gb = get_dataframe_size_gb(df, sample_rows)
 
     if size_gb > max_size_gb:
-        raise ValueError(
+        raise DataFrameSizeError(
             f'DataFrame size {size_gb:.2f} GB exceeds limit of {max_size_gb} GB. '
             f'Shape: {df.shape}'
         )
+
+
+def classify_chunk_error(error: Exception) -> Optional[str]:
+    """
+    How a failed chunk can be recovered: ``CHUNK_ERROR_SPLIT`` for results
+    too big or queries too slow, ``CHUNK_ERROR_RETRY`` for transient
+    failures, ``None`` when it cannot.
+    """
+    if isinstance(error, DataFrameSizeError):
+        return CHUNK_ERROR_SPLIT
+    if not isinstance(error, QueryExecutionError):
+        return None
+    message = str(error).lower()
+    if any(pattern in message for pattern in SPLIT_QUERY_ERROR_PATTERNS):
+        return CHUNK_ERROR_SPLIT
+    if any(pattern in message for pattern in RETRYABLE_QUERY_ERROR_PATTERNS):
+        return CHUNK_ERROR_RETRY
+    return None
@@ -0,0 +1,72 @@
+import inspect
+from types import SimpleNamespace
+
+import pytest
+
+from xoverrr.core import DataQualityChecker
+
+PG_ENGINE = SimpleNamespace(dialect=SimpleNamespace(name='postgresql'))
+CHECKER_PARAMETERS = inspect.signature(DataQualityChecker.__init__).parameters
+TABLE_DATA_SIGNATURE = inspect.signature(DataQualityChecker._get_table_data)
+
+
+def _fake_table_data(checker, tables, row_filter):
+    """
+    ``_get_table_data`` serving ``tables[query_side]`` (or the frame keyed by
+    the table full name), limited to the requested date range. Arguments are
+    bound to the real signature, so a signature change breaks the fake too.
+    Served calls are recorded in ``checker.table_data_calls`` (arguments plus
+    the merged condition ``params``); ``row_filter(df, call)`` may filter
+    further or raise.
+    """
+
+    def _get_table_data(*args, **kwargs):
+        bound = TABLE_DATA_SIGNATURE.bind(checker, *args, **kwargs)
+        bound.apply_defaults()
+        call = SimpleNamespace(**bound.arguments)
+        call.params = {}
+        for _, condition_params in call.extra_conditions or []:
+            call.params.update(condition_params)
+        table_name = call.data_ref.full_name
+        df = tables[table_name if table_name in tables else call.query_side]
+        if call.date_column in df and call.start_date:
+            dates = df[call.date_column]
+            df = df[(dates >= call.start_date) & (dates <= call.end_date)]
+        if row_filter is not None:
+            df = row_filter(df, call)
+        checker.table_data_calls.append(call)
+        return df.reset_index(drop=True), 'select ...', call.params
+
+    return _get_table_data
+
+
+@pytest.fixture
+def make_checker():
+    """
+    Factory of checkers on PostgreSQL stand-in engines, with a started check
+    run as the internal check methods expect. Keyword arguments of
+    ``DataQualityChecker`` go to the constructor, other ones are set as
+    attributes; ``adapter`` replaces the adapter of every DBMS. With
+    ``tables`` (frames per query side) ``_get_table_data`` is faked, see
+    ``_fake_table_data``.
+    """
+
+    def _make(tables=None, row_filter=None, adapter=None, **attributes):
+        options = {
+            name: attributes.pop(name)
+            for name in list(attributes)
+            if name in CHECKER_PARAMETERS
+        }
+        options.setdefault('default_exclude_recent_hours', None)
+        checker = DataQualityChecker(PG_ENGINE, PG_ENGINE, **options)
+        if adapter is not None:
+            checker.adapters = dict.fromkeys(checker.adapters, adapter)
+        checker._start_check_run('test', None)
+        checker.table_data_calls = []
+        if tables is not None:
+            checker._get_table_data = _fake_table_data(checker, tables, row_filter)
+        for name, value in attributes.items():
+            setattr(checker, name, value)
+        return checker
+
+    return _make
@@ -0,0 +1,194 @@
+import pandas as pd
+import pytest
+
+from xoverrr.adapters.clickhouse import ClickHouseAdapter
+from xoverrr.adapters.oracle import OracleAdapter
+from xoverrr.adapters.postgres import PostgresAdapter
+from xoverrr.models import DataReference
+
+TZ_COLUMNS_META = pd.DataFrame(
+    {
+        'column_name': ['id', 'created_at', 'record_date'],
+        'data_type': ['number', 'timestamp(6) with time zone', 'date'],
+    }
+)
+
+
+class TestOracleDatePredicates:
+    def test_count_query_keeps_tz_column_raw_in_where(self):
+        query, params = OracleAdapter().build_count_query(
+            DataReference('events', 'test'),
+            'created_at',
+            '2024-01-01',
+            '2024-01-31',
+            TZ_COLUMNS_META,
+            'Europe/Athens',
+        )
+
+        where_clause = query.split('WHERE', 1)[1].split('GROUP BY', 1)[0]
+        assert 'cast(created_at' not in where_clause
+        assert (
+            "created_at >= from_tz(cast(trunc(to_date(:start_date, 'YYYY-MM-DD'), 'dd') "
+            "as timestamp), 'Europe/Athens')" in where_clause
+        )
+        assert (
+            "created_at < from_tz(cast(trunc(to_date(:end_date, 'YYYY-MM-DD'), 'dd') + 1 "
+            "as timestamp), 'Europe/Athens')" in where_clause
+        )
+        # day bucketing still happens in the target timezone
+        assert (
+            "cast(created_at at time zone 'Europe/Athens' as timestamp)"
+            in query.split('FROM', 1)[0]
+        )
+        assert params == {'start_date': '2024-01-01', 'end_date': '2024-01-31'}
+
+    def test_data_query_casts_only_in_select_list(self):
+        query, params = OracleAdapter().build_data_query(
+            DataReference('events', 'test'),
+            ['id', 'created_at'],
+            'created_at',
+            None,
+            '2024-01-01',
+            '2024-01-31',
+            columns_meta=TZ_COLUMNS_META,
+            timezone='UTC',
+        )
+
+        select_clause, where_clause = query.split('WHERE', 1)
+        assert (
+            "cast(created_at at time zone 'UTC' as timestamp) AS created_at"
+            in select_clause
+        )
+        assert 'cast(created_at' not in where_clause
+        assert 'created_at >= from_tz(' in where_clause
+        assert 'created_at < from_tz(' in where_clause
+        assert params == {'start_date': '2024-01-01', 'end_date': '2024-01-31'}
+
+    def test_plain_date_column_predicate_unchanged(self):
+        query, _ = OracleAdapter().build_data_query(
+            DataReference('events', 'test'),
+            ['id', 'record_date'],
+            'record_date',
+            None,
+            '2024-01-01',
+            '2024-01-31',
+            columns_meta=TZ_COLUMNS_META,
+            timezone='UTC',
+        )
+
+        assert (
+            "record_date >= trunc(to_date(:start_date, 'YYYY-MM-DD'), 'dd')" in query
+        )
+        assert (
+            "record_date < trunc(to_date(:end_date, 'YYYY-MM-DD'), 'dd') + 1" in query
+        )
+        assert 'from_tz' not in query
+
+
+class TestCountUnionQuery:
+    def test_union_query_renames_binds_per_part(self):
+        query, params = OracleAdapter().build_count_union_query(
+            [
+                (
+                    (
+                        "SELECT dt, cnt FROM a WHERE d >= :start_date "
+                        "AND d < :end_date AND t = to_date('00:00', 'HH24:MI')"
+                    ),
+                    {'start_date': '2024-01-01', 'end_date': '2024-01-31'},
+                ),
+                (
+                    'SELECT dt, cnt FROM b WHERE d >= :start_date',
+                    {'start_date': '2024-02-01'},
+                ),
+            ]
+        )
+
+        assert query.count('UNION ALL') == 1
+        assert ':start_date_0' in query and ':end_date_0' in query
+        assert ':start_date_1' in query
+        assert ':start_date ' not in query
+        assert "'HH24:MI'" in query
+        assert "SELECT '1' AS xtable_label, dt, cnt FROM (" in query
+        assert params == {
+            'start_date_0': '2024-01-01',
+            'end_date_0': '2024-01-31',
+            'start_date_1': '2024-02-01',
+        }
+
+
+def _key_meta(*data_types):
+    return pd.DataFrame(
+        {'column_name': ['id', 'doc_date', 'code'], 'data_type': list(data_types)}
+    )
+
+
+class TestKeyHashExpression:
+    KEY = ('id', 'doc_date', 'code')
+
+    def test_same_key_text_on_all_engines(self):
+        oracle = OracleAdapter().build_key_hash_expression(
+            self.KEY, _key_meta('number', 'date', 'varchar2')
+        )
+        postgres = PostgresAdapter().build_key_hash_expression(
+            self.KEY, _key_meta('int8', 'date', 'varchar')
+        )
+        clickhouse = ClickHouseAdapter().build_key_hash_expression(
+            self.KEY, _key_meta('Int64', 'Nullable(Date)', 'LowCardinality(String)')
+        )
+
+        assert (
+            "standard_hash(coalesce(to_char(id, 'TM9'), '<null>') || '|' || "
+            "coalesce(to_char(doc_date, 'YYYY-MM-DD HH24:MI:SS'), '<null>') || '|' || "
+            "coalesce(to_char(code), '<null>'), 'MD5')" in oracle
+        )
+        assert (
+            "md5(coalesce(id::text, '<null>') || '|' || "
+            "coalesce(to_char(doc_date, 'YYYY-MM-DD HH24:MI:SS'), '<null>') || '|' || "
+            "coalesce(nullif(code::text, ''), '<null>'))" in postgres
+        )
+        assert (
+            "MD5(concat(coalesce(toString(id), '<null>'), '|', "
+            "coalesce(formatDateTime(doc_date, '%Y-%m-%d %H:%i:%S'), '<null>'), "
+            "'|', coalesce(nullIf(toString(code), ''), '<null>')))" in clickhouse
+        )
+
+    @pytest.mark.parametrize(
+        'adapter, data_type',
+        [
+            (OracleAdapter(), 'float'),
+            (PostgresAdapter(), 'numeric'),
+            (ClickHouseAdapter(), 'Decimal(18, 2)'),
+        ],
+    )
+    def test_key_without_common_text_form_is_rejected(self, adapter, data_type):
+        with pytest.raises(ValueError, match='cannot be hashed'):
+            adapter.build_key_sample_condition(
+                ['id'], _key_meta(data_type, 'date', 'text'), 100
+            )
+
+
+def test_oracle_chunk_fingerprint_hashes_lob_length_and_prefix():
+    query, _ = OracleAdapter().build_chunk_fingerprint_query(
+        DataReference('docs', 'test'),
+        ['id', 'body', 'scan'],
+        None,
+        None,
+        None,
+        None,
+        pd.DataFrame(
+            {
+                'column_name': ['id', 'body', 'scan'],
+                'data_type': ['number', 'clob', 'blob'],
+            }
+        ),
+        'UTC',
+    )
+
+    assert (
+        "sum(ora_hash(ora_hash(id) || '|' || "
+        "ora_hash(dbms_lob.getlength(body)) || ':' || "
+        "ora_hash(dbms_lob.substr(body, 1000, 1)) || '|' || "
+        "ora_hash(dbms_lob.getlength(scan)) || ':' || "
+        'ora_hash(dbms_lob.substr(scan, 2000, 1))))' in query
+    )
+    assert 'ora_hash(body)' not in query
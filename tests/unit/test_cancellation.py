@@ -0,0 +1,125 @@
+import threading
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from xoverrr.cancellation import CancellationToken
+from xoverrr.exceptions import CheckCancelledError, QueryExecutionError
+
+ENGINE = SimpleNamespace(dialect=SimpleNamespace(name='postgresql'))
+
+
+class _BlockingAdapter:
+    """Adapter whose query runs until its abort callback is called"""
+
+    def __init__(self):
+        self.calls = []
+        self.started = threading.Event()
+
+    def _execute_query(
+        self, query, engine, timezone, timeout_seconds=None, cancel_token=None
+    ):
+        self.calls.append(timeout_seconds)
+        aborted = threading.Event()
+        with cancel_token.in_flight(aborted.set):
+            self.started.set()
+            if not aborted.wait(timeout=5):
+                return pd.DataFrame({'id': [1]})
+        raise QueryExecutionError('Query failed: canceling statement')
+
+
+def test_cancel_aborts_the_running_query_and_stops_later_ones(make_checker):
+    adapter = _BlockingAdapter()
+    token = CancellationToken()
+    checker = make_checker(
+        adapter=adapter, cancel_token=token, query_timeout_seconds=30
+    )
+    errors = []
+
+    def _run():
+        try:
+            checker._execute_query(('select 1', {}), ENGINE, 'UTC')
+        except CheckCancelledError as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=_run)
+    worker.start()
+    assert adapter.started.wait(timeout=5)
+    token.cancel('deploy window closed')
+    worker.join(timeout=5)
+
+    assert len(errors) == 1
+    assert 'deploy window closed' in str(errors[0])
+    assert adapter.calls == [30]
+    with pytest.raises(CheckCancelledError):
+        checker._execute_query(('select 1', {}), ENGINE, 'UTC')
+    assert len(adapter.calls) == 1
+
+
+def test_query_timeout_is_capped_by_the_check_deadline(make_checker, monkeypatch):
+    checker = make_checker(
+        cancel_token=CancellationToken(),
+        query_timeout_seconds=60,
+        check_timeout_seconds=10,
+    )
+    clock = iter([100.0, 104.0, 120.0])
+    monkeypatch.setattr('xoverrr.core.time.monotonic', lambda: next(clock))
+
+    checker._start_check_run('samples', None)
+    assert checker._query_timeout() == pytest.approx(6.0)
+    with pytest.raises(CheckCancelledError, match='check_timeout_seconds=10'):
+        checker._query_timeout()
+
+
+def test_shared_fetch_of_multi_table_checks_starts_a_new_deadline(
+    make_checker, monkeypatch
+):
+    from xoverrr.constants import CHECK_SUCCESS, XTABLE_LABEL_COLUMN
+    from xoverrr.models import DataReference
+
+    now = [100.0]
+    monkeypatch.setattr('xoverrr.core.time.monotonic', lambda: now[0])
+    meta = pd.DataFrame({'column_name': ['id', 'val'], 'data_type': ['int', 'text']})
+    frame = pd.DataFrame({'id': [1, 2], 'val': ['a', 'b']})
+    timeouts = []
+
+    def _record_timeout(df, call):
+        timeouts.append(checker._query_timeout())
+        return df
+
+    def _fake_execute(query, engine, timezone=None, query_side=None):
+        timeouts.append(checker._query_timeout())
+        return pd.DataFrame(
+            {XTABLE_LABEL_COLUMN: ['0'], 'dt': ['2024-01-01'], 'cnt': [2]}
+        )
+
+    def _fake_resolve(source_table, target_table, target_engine, *args):
+        return {
+            'source_columns_meta': meta,
+            'target_columns_meta': meta,
+            'common_cols': ['id', 'val'],
+            'key_columns': ['id'],
+            'source_only_cols': [],
+            'target_only_cols': [],
+        }
+
+    checker = make_checker(
+        tables={'source': frame, 'target': frame},
+        row_filter=_record_timeout,
+        check_timeout_seconds=10,
+        _execute_query=_fake_execute,
+    )
+    monkeypatch.setattr(checker, '_resolve_samples_columns', _fake_resolve)
+    table = DataReference('t', 'test')
+
+    status, *_ = checker.check_samples(table, table)
+    assert status == CHECK_SUCCESS
+    # the deadline of the previous check has long passed
+    now[0] += 60
+    results = checker.check_samples_multi(table, [(ENGINE, table), (ENGINE, table)])
+    assert [status for status, *_ in results] == [CHECK_SUCCESS, CHECK_SUCCESS]
+    now[0] += 60
+    results = checker.check_counts_many([(table, table, 'dt')])
+    assert [status for status, *_ in results] == [CHECK_SUCCESS]
+    assert timeouts == [10.0] * 7
@@ -0,0 +1,66 @@
+import pandas as pd
+
+
+def test_samples_chunk_recovery_retries_and_splits_failed_chunks(
+    make_checker, monkeypatch
+):
+    from xoverrr.constants import CHECK_SUCCESS
+    from xoverrr.exceptions import DataFrameSizeError, QueryExecutionError
+    from xoverrr.models import DataReference
+
+    monkeypatch.setattr('xoverrr.core.time.sleep', lambda seconds: None)
+    days = ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04']
+    table = pd.DataFrame(
+        {'id': range(8), 'val': 'a', 'dt': [day for day in days for _ in range(2)]}
+    )
+    failures = {'2024-01-03': 1}
+
+    def _flaky_fetch(df, call):
+        if call.start_date != call.end_date:
+            raise DataFrameSizeError('DataFrame size 4.00 GB exceeds limit of 3 GB')
+        if failures.get(call.start_date):
+            failures[call.start_date] -= 1
+            raise QueryExecutionError('Query failed: server closed the connection')
+        return df
+
+    checker = make_checker(
+        tables={'source': table, 'target': table}, row_filter=_flaky_fetch
+    )
+    status, _, stats, details = checker._check_samples_iterative(
+        source_table=DataReference('t', 'test'),
+        target_table=DataReference('t', 'test'),
+        source_columns_meta=None,
+        target_columns_meta=None,
+        common_cols=['id', 'val', 'dt'],
+        key_columns=['id'],
+        source_only_cols=[],
+        target_only_cols=[],
+        date_column='dt',
+        update_column=None,
+        start_date=days[0],
+        end_date=days[-1],
+        chunk_size_days=4,
+        exclude_recent_hours=None,
+        tolerance_pct=0.0,
+        max_examples=3,
+        run_id='run',
+        run_started_at='2024-01-10 00:00:00',
+        max_retries=1,
+        min_split_days=1,
+    )
+
+    assert status == CHECK_SUCCESS
+    assert stats.comparable_rows == 8
+    assert [
+        call.start_date
+        for call in checker.table_data_calls
+        if call.query_side == 'source'
+    ] == days
+    recovery = details.execution_info['chunk_recovery']
+    assert recovery['retries'] == 1
+    assert [split['window'] for split in recovery['splits']] == [
+        ['2024-01-01', '2024-01-04'],
+        ['2024-01-01', '2024-01-02'],
+        ['2024-01-03', '2024-01-04'],
+    ]
+    assert recovery['suggested_chunk_size_days'] == 1
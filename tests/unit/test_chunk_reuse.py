@@ -0,0 +1,219 @@
+import pandas as pd
+import pytest
+
+from xoverrr.adapters.postgres import PostgresAdapter
+from xoverrr.constants import CHECK_FAILED
+from xoverrr.models import DataReference
+from xoverrr.state import CheckStateStore
+from xoverrr.utils import (CheckResultAccumulator, check_details_from_dict,
+                           check_details_to_dict, check_stats_from_dict,
+                           check_stats_to_dict, compare_dataframes)
+
+COLUMNS = ['id', 'val', 'dt']
+META = pd.DataFrame({'column_name': COLUMNS, 'data_type': ['int', 'text', 'date']})
+TABLE = DataReference('items', 'test')
+
+
+def _checker(make_checker, tmp_path, tables, fingerprints, row_filter=None):
+    def _fake_execute_query(query, engine, timezone=None, query_side=None):
+        _, params = query
+        return pd.DataFrame(
+            [fingerprints[(query_side, params['start_date'])]],
+        )
+
+    return make_checker(
+        tables=tables,
+        row_filter=row_filter,
+        state_store=CheckStateStore(str(tmp_path / 'state.db')),
+        _execute_query=_fake_execute_query,
+    )
+
+
+def _run(checker):
+    return checker._check_samples_iterative(
+        source_table=TABLE,
+        target_table=TABLE,
+        source_columns_meta=META,
+        target_columns_meta=META,
+        common_cols=COLUMNS,
+        key_columns=['id'],
+        source_only_cols=[],
+        target_only_cols=[],
+        date_column='dt',
+        update_column=None,
+        start_date='2024-01-01',
+        end_date='2024-01-04',
+        chunk_size_days=2,
+        exclude_recent_hours=None,
+        tolerance_pct=0.0,
+        max_examples=3,
+        run_id='run',
+        run_started_at='2024-01-10 00:00:00',
+        chunk_reuse=('key', '2024-01-03'),
+    )
+
+
+def _fetched(checker):
+    return [(call.query_side, call.start_date) for call in checker.table_data_calls]
+
+
+def test_closed_chunks_reuse_stored_result_while_fingerprints_match(
+    make_checker, tmp_path
+):
+    tables = {
+        'source': pd.DataFrame(
+            {
+                'id': [1, 2, 3, 4],
+                'val': ['a', 'b', 'c', 'd'],
+                'dt': ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04'],
+            }
+        ),
+        'target': pd.DataFrame(
+            {
+                'id': [1, 2, 3, 4],
+                'val': ['a', 'x', 'c', 'd'],
+                'dt': ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04'],
+            }
+        ),
+    }
+    fingerprints = {
+        (side, day): {'cnt': 2, 'hash_sum': 10, 'max_updated': None}
+        for side in ('source', 'target')
+        for day in ('2024-01-01', '2024-01-03')
+    }
+    checker = _checker(make_checker, tmp_path, tables, fingerprints)
+
+    status, _, first_stats, details = _run(checker)
+    assert status == CHECK_FAILED
+    assert details.execution_info['chunk_fingerprints'] == {
+        'freeze_before': '2024-01-03',
+        'closed_chunks': 1,
+        'reused_chunks': 0,
+    }
+
+    checker.table_data_calls.clear()
+    status, _, stats, details = _run(checker)
+    assert status == CHECK_FAILED
+    assert stats == first_stats
+    assert details.execution_info['chunk_fingerprints']['reused_chunks'] == 1
+    # only the open chunk is fetched again
+    assert _fetched(checker) == [('source', '2024-01-03'), ('target', '2024-01-03')]
+
+    # the closed chunk is fixed on target and its fingerprint changes
+    tables['target'].loc[1, 'val'] = 'b'
+    fingerprints[('target', '2024-01-01')] = {
+        'cnt': 2,
+        'hash_sum': 11,
+        'max_updated': None,
+    }
+    checker.table_data_calls.clear()
+    status, _, stats, details = _run(checker)
+    assert stats.final_diff_score == 0
+    assert details.execution_info['chunk_fingerprints']['reused_chunks'] == 0
+    assert ('source', '2024-01-01') in _fetched(checker)
+
+
+def test_check_result_round_trips_through_dict():
+    source = pd.DataFrame({'id': ['1', '2', '3'], 'val': ['a', 'b', 'c']})
+    target = pd.DataFrame({'id': ['1', '2', '4'], 'val': ['a', 'x', 'd']})
+    stats, details = compare_dataframes(source, target, ['id'], 5)
+
+    restored_stats = check_stats_from_dict(check_stats_to_dict(stats))
+    restored_details = check_details_from_dict(check_details_to_dict(details))
+
+    assert restored_stats == stats
+    assert set(restored_details.source_only_keys_examples) == set(
+        details.source_only_keys_examples
+    )
+    pd.testing.assert_frame_equal(
+        restored_details.issue_breakdown.reset_index(drop=True),
+        details.issue_breakdown.reset_index(drop=True),
+        check_dtype=False,
+    )
+
+    accumulator = CheckResultAccumulator(5)
+    accumulator.add(stats, details)
+    accumulator.add(restored_stats, restored_details)
+    merged_stats, _ = accumulator.build(['id', 'val'])
+    assert merged_stats.total_source_rows == 2 * stats.total_source_rows
+
+
+def test_chunk_fingerprint_query_hashes_compared_columns():
+    query, params = PostgresAdapter().build_chunk_fingerprint_query(
+        TABLE, ['id', 'val'], 'dt', 'updated_at', '2024-01-01', '2024-01-02'
+    )
+
+    assert 'sum(hashtext(ROW(id, val)::text)::bigint) AS hash_sum' in query
+    assert 'max(updated_at) AS max_updated' in query
+    assert params['start_date'] == '2024-01-01'
+
+
+def test_interrupted_run_resumes_from_its_chunk_checkpoints(make_checker, tmp_path):
+    source = pd.DataFrame(
+        {
+            'id': [1, 2, 3, 4],
+            'val': ['a', 'b', 'c', 'd'],
+            'dt': ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04'],
+        }
+    )
+    target = source.copy()
+    target.loc[0, 'val'] = 'x'
+    tables = {'source': source, 'target': target}
+    failing_days = {'2024-01-03'}
+
+    def _fail_on_lost_connection(df, call):
+        if call.start_date in failing_days:
+            raise ConnectionError('connection lost')
+        return df
+
+    checker = _checker(
+        make_checker, tmp_path, tables, {}, row_filter=_fail_on_lost_connection
+    )
+
+    def _run(run_id, checkpoint_key='key', resume_run_id=None):
+        return checker._check_samples_iterative(
+            source_table=TABLE,
+            target_table=TABLE,
+            source_columns_meta=META,
+            target_columns_meta=META,
+            common_cols=COLUMNS,
+            key_columns=['id'],
+            source_only_cols=[],
+            target_only_cols=[],
+            date_column='dt',
+            update_column=None,
+            start_date='2024-01-01',
+            end_date='2024-01-04',
+            chunk_size_days=2,
+            exclude_recent_hours=None,
+            tolerance_pct=0.0,
+            max_examples=3,
+            run_id=run_id,
+            run_started_at='2024-01-10 00:00:00',
+            checkpoint_key=checkpoint_key,
+            resume_run_id=resume_run_id,
+        )
+
+    with pytest.raises(ConnectionError):
+        _run('first')
+    assert list(checker.state_store.get_run_checkpoints('first')) == [
+        ('2024-01-01', '2024-01-02')
+    ]
+
+    failing_days.clear()
+    with pytest.raises(ValueError, match='other check settings'):
+        _run('second', checkpoint_key='other', resume_run_id='first')
+
+    checker.table_data_calls.clear()
+    status, _, stats, details = _run('second', resume_run_id='first')
+    assert status == CHECK_FAILED
+    assert _fetched(checker) == [('source', '2024-01-03'), ('target', '2024-01-03')]
+    assert stats.comparable_rows == 4
+    assert stats.passed_rows == 3
+    assert details.execution_info['checkpoints'] == {
+        'resumed_run_id': 'first',
+        'resumed_chunks': 1,
+    }
+    # completed runs leave no checkpoints behind
+    assert checker.state_store.get_run_checkpoints('first') == {}
+    assert checker.state_store.get_run_checkpoints('second') == {}
@@ -0,0 +1,156 @@
+import os
+from types import SimpleNamespace
+
+import pandas as pd
+
+from xoverrr.compare_pool import ComparePool
+from xoverrr.utils import compare_dataframes, prepare_dataframe
+
+SOURCE = pd.DataFrame(
+    {
+        'id': [1, 2, 3, 4, 4],
+        'val': ['a', 'b', None, 'd', 'd'],
+        'amount': [1.0, 2.50, 3.0, 4.0, 4.0],
+        'dt': ['2024-01-01', '2024-01-01', '2024-01-02', '2024-01-02', '2024-01-02'],
+    }
+)
+TARGET = pd.DataFrame(
+    {
+        'id': [1, 2, 3, 5],
+        'val': ['a', 'B', '', 'e'],
+        'amount': [1.0, 2.5, 3.1, 5.0],
+        'dt': ['2024-01-01', '2024-01-01', '2024-01-02', '2024-01-02'],
+    }
+)
+
+
+def test_compare_pool_matches_in_process_compare():
+    expected = compare_dataframes(
+        prepare_dataframe(SOURCE), prepare_dataframe(TARGET), ['id'], 3
+    )
+
+    pool = ComparePool(1)
+    try:
+        paths = (pool.write_frame(SOURCE), pool.write_frame(TARGET))
+        stats, details = pool.submit(*paths, ['id'], 3).result()
+        pool.discard(*paths)
+        assert not any(os.path.exists(path) for path in paths)
+    finally:
+        pool.shutdown()
+
+    assert stats == expected[0]
+    assert details.source_only_keys_examples == expected[1].source_only_keys_examples
+    assert details.issue_examples.equals(expected[1].issue_examples)
+    assert not os.path.exists(pool._directory)
+
+
+def test_samples_chunks_compared_in_worker_processes(make_checker):
+    from xoverrr.models import DataReference
+
+    checker = make_checker(tables={'source': SOURCE, 'target': TARGET})
+
+    def _run():
+        return checker._check_samples_iterative(
+            source_table=DataReference('t', 'test'),
+            target_table=DataReference('t', 'test'),
+            source_columns_meta=None,
+            target_columns_meta=None,
+            common_cols=['id', 'val', 'amount', 'dt'],
+            key_columns=['id'],
+            source_only_cols=[],
+            target_only_cols=[],
+            date_column='dt',
+            update_column=None,
+            start_date='2024-01-01',
+            end_date='2024-01-02',
+            chunk_size_days=1,
+            exclude_recent_hours=None,
+            tolerance_pct=0.0,
+            max_examples=3,
+            run_id='run',
+            run_started_at='2024-01-10 00:00:00',
+        )
+
+    _, _, expected_stats, _ = _run()
+    checker.compare_processes = 2
+    try:
+        _, _, stats, details = _run()
+        assert checker._compare_pool is not None
+        checker.compare_partitions = 3
+        _, _, partitioned_stats, _ = _run()
+    finally:
+        checker._compare_pool.shutdown()
+
+    assert stats == expected_stats
+    assert partitioned_stats == expected_stats
+    assert stats.dup_source_rows == 1
+    assert details.issue_breakdown['issue_count'].sum() == 2
+
+
+def test_compare_partitions_default_to_compare_processes():
+    from xoverrr.core import DataQualityChecker
+
+    engine = SimpleNamespace(dialect=SimpleNamespace(name='postgresql'))
+
+    assert DataQualityChecker(engine, engine).compare_partitions == 1
+    # one partition job per worker keeps the whole pool busy on every chunk
+    checker = DataQualityChecker(engine, engine, compare_processes=4)
+    assert checker.compare_partitions == 4
+    checker = DataQualityChecker(
+        engine, engine, compare_processes=4, compare_partitions=1
+    )
+    assert checker.compare_partitions == 1
+
+
+def test_partition_threads_are_started_once_per_check_run(make_checker, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    import xoverrr.core
+    from xoverrr.constants import CHECK_FAILED
+    from xoverrr.models import DataReference
+
+    started = []
+
+    class _Executor(ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            if self._thread_name_prefix == 'xoverrr-compare':
+                started.append(self)
+
+    meta = pd.DataFrame(
+        {
+            'column_name': ['id', 'val', 'amount', 'dt'],
+            'data_type': ['int', 'text', 'numeric', 'date'],
+        }
+    )
+
+    def _fake_resolve(source_table, target_table, target_engine, *args):
+        return {
+            'source_columns_meta': meta,
+            'target_columns_meta': meta,
+            'common_cols': ['id', 'val', 'amount', 'dt'],
+            'key_columns': ['id'],
+            'source_only_cols': [],
+            'target_only_cols': [],
+        }
+
+    monkeypatch.setattr(xoverrr.core, 'ThreadPoolExecutor', _Executor)
+    checker = make_checker(
+        tables={'source': SOURCE, 'target': TARGET}, compare_partitions=3
+    )
+    monkeypatch.setattr(checker, '_resolve_samples_columns', _fake_resolve)
+
+    status, _, stats, _ = checker.check_samples(
+        DataReference('t', 'test'),
+        DataReference('t', 'test'),
+        date_column='dt',
+        date_range=('2024-01-01', '2024-01-02'),
+        chunk_size_days=1,
+    )
+
+    assert status == CHECK_FAILED
+    assert stats.total_source_rows == 5
+    # both chunks are compared on the threads of one executor
+    assert len(started) == 1
+    assert started[0]._shutdown
+    assert checker._compare_executor is None
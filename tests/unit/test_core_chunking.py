@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from xoverrr.core import DataQualityChecker
@@ -48,3 +49,76 @@ def test_iter_date_chunks_raises_on_non_positive_chunk_size():
             end_date='2024-01-31',
             chunk_size_days=0,
         )
+
+
+class _CountsAdapter:
+    def build_count_query_common(
+        self,
+        data_ref,
+        date_column,
+        start_date,
+        end_date,
+        columns_meta,
+        timezone,
+        aggregates=None,
+    ):
+        return (
+            f'select dt, cnt from {data_ref.full_name}',
+            {'start_date': start_date, 'end_date': end_date},
+        )
+
+
+def _counts_checker(make_checker, monkeypatch, daily_counts):
+    checker = make_checker()
+
+    def _fake_execute(query, engine, timezone=None, query_side=None):
+        _, params = query
+        rows = [
+            (dt, cnt)
+            for dt, cnt in daily_counts[query_side].items()
+            if params['start_date'] <= dt <= params['end_date']
+        ]
+        return pd.DataFrame(rows, columns=['dt', 'cnt'])
+
+    monkeypatch.setattr(checker, '_execute_query', _fake_execute)
+    return checker
+
+
+@pytest.mark.parametrize('max_workers', [1, 3])
+def test_fetch_counts_merges_chunk_results(make_checker, monkeypatch, max_workers):
+    from xoverrr.models import DataReference
+    from xoverrr.planning import COUNTS_PLAN_CHUNKED, CountsExecutionPlan
+
+    daily_counts = {
+        'source': {'2024-01-01': 5, '2024-01-05': 7, '2024-01-09': 1},
+        'target': {'2024-01-01': 5, '2024-01-09': 2},
+    }
+    checker = _counts_checker(make_checker, monkeypatch, daily_counts)
+    plan = CountsExecutionPlan(
+        mode=COUNTS_PLAN_CHUNKED,
+        chunks=checker._iter_date_chunks('dt', '2024-01-01', '2024-01-10', 3),
+        max_workers_per_engine=max_workers,
+        reason='test',
+    )
+
+    source_counts, target_counts, source_query, _ = checker._fetch_counts(
+        plan,
+        _CountsAdapter(),
+        _CountsAdapter(),
+        DataReference('a', 'test'),
+        DataReference('b', 'test'),
+        'dt',
+        None,
+        None,
+    )
+
+    assert source_counts.to_dict('records') == [
+        {'dt': '2024-01-01', 'cnt': 5},
+        {'dt': '2024-01-05', 'cnt': 7},
+        {'dt': '2024-01-09', 'cnt': 1},
+    ]
+    assert target_counts.to_dict('records') == [
+        {'dt': '2024-01-01', 'cnt': 5},
+        {'dt': '2024-01-09', 'cnt': 2},
+    ]
+    assert source_query[0] == 'select dt, cnt from test.a'
@@ -0,0 +1,69 @@
+import pandas as pd
+
+
+def test_check_counts_many_splits_union_result_per_table(make_checker, monkeypatch):
+    from xoverrr.constants import CHECK_FAILED, CHECK_SUCCESS, XTABLE_LABEL_COLUMN
+    from xoverrr.models import CountsCheckSpec, DataReference
+
+    executed = []
+
+    def _fake_execute(query, engine, timezone=None, query_side=None):
+        executed.append((query_side, query[0]))
+        assert 'UNION ALL' in query[0]
+        target_cnt = 5 if query_side == 'source' else 4
+        return pd.DataFrame(
+            {
+                XTABLE_LABEL_COLUMN: ['0', '1', '1'],
+                'dt': ['2024-01-01', '2024-01-01', '2024-01-02'],
+                'cnt': [3, 5, 1] if query_side == 'source' else [3, target_cnt, 1],
+            }
+        )
+
+    checker = make_checker()
+    monkeypatch.setattr(checker, '_execute_query', _fake_execute)
+
+    results = checker.check_counts_many(
+        [
+            CountsCheckSpec(
+                DataReference('a', 'test'), DataReference('a', 'test'), 'dt'
+            ),
+            (DataReference('b', 'test'), DataReference('b', 'test'), 'dt', 'b_counts'),
+        ],
+        date_range=('2024-01-01', '2024-01-02'),
+    )
+
+    assert len(executed) == 2
+    assert [status for status, *_ in results] == [CHECK_SUCCESS, CHECK_FAILED]
+    stats, details = results[1][2], results[1][3]
+    assert stats.total_source_rows == 2
+    assert details.execution_info['counts_many']['tables_in_query'] == 2
+    assert checker.check_stats['checked'] == 2
+
+
+def test_check_counts_many_falls_back_to_per_table_queries(
+    make_checker, monkeypatch
+):
+    from xoverrr.constants import CHECK_FAILED, CHECK_SUCCESS
+    from xoverrr.models import DataReference
+
+    def _fake_execute(query, engine, timezone=None, query_side=None):
+        sql = query[0]
+        if 'UNION ALL' in sql or 'test.broken' in sql:
+            raise RuntimeError('relation does not exist')
+        return pd.DataFrame({'dt': ['2024-01-01'], 'cnt': [7]})
+
+    checker = make_checker()
+    monkeypatch.setattr(checker, '_execute_query', _fake_execute)
+
+    results = checker.check_counts_many(
+        [
+            (DataReference('a', 'test'), DataReference('a', 'test'), 'dt'),
+            (DataReference('broken', 'test'), DataReference('a', 'test'), 'dt'),
+        ],
+        max_parallel_queries=2,
+    )
+
+    assert results[0][0] == CHECK_SUCCESS
+    assert results[0][3].execution_info['counts_many']['per_table_fallback']
+    assert results[1][0] == CHECK_FAILED
+    assert results[1][2] is None
@@ -0,0 +1,104 @@
+import re
+
+import pandas as pd
+
+from xoverrr.constants import CHECK_FAILED, CHECK_SUCCESS
+from xoverrr.models import DataReference
+
+TABLE = DataReference('events', 'test')
+META = pd.DataFrame(
+    {'column_name': ['id', 'val', 'ts'], 'data_type': ['integer', 'text', 'timestamp']}
+)
+ROWS = pd.DataFrame(
+    {
+        'id': [1, 2, 3, 4],
+        'val': ['a', 'b', 'c', 'd'],
+        'ts': pd.to_datetime(
+            [
+                '2024-01-01 10:00',
+                '2024-01-02 09:15',
+                '2024-01-02 17:40',
+                '2024-01-03 08:00',
+            ]
+        ),
+    }
+)
+
+
+def _checker(make_checker, monkeypatch, tables, executed):
+    from xoverrr.models import ObjectType
+
+    checker = make_checker()
+
+    def _fake_execute(query, engine, timezone=None, query_side=None):
+        sql, params = query
+        executed.append((query_side, sql, params))
+        rows = tables[query_side]
+        day = rows['ts'].dt.strftime('%Y-%m-%d')
+        rows = rows[(day >= params['start_date']) & (day <= params['end_date'])]
+        if 'count(*)' in sql:
+            bucket_format = '%Y-%m-%d %H' if 'HH24' in sql else '%Y-%m-%d'
+            return (
+                rows.groupby(rows['ts'].dt.strftime(bucket_format))
+                .size()
+                .rename_axis('dt')
+                .reset_index(name='cnt')
+            )
+        hours = [value for name, value in params.items() if name.startswith('xhour')]
+        if hours:
+            rows = rows[rows['ts'].dt.strftime('%Y-%m-%d %H').isin(hours)]
+        columns = re.search(r'SELECT (.*?)\s+FROM', sql, re.DOTALL).group(1).split(', ')
+        return rows[columns].reset_index(drop=True)
+
+    monkeypatch.setattr(checker, '_execute_query', _fake_execute)
+    monkeypatch.setattr(checker, '_get_object_type', lambda *args: ObjectType.TABLE)
+    monkeypatch.setattr(checker, '_get_metadata_cols', lambda *args: META)
+    return checker
+
+
+def _run(checker):
+    return checker.check_counts_drilldown(
+        TABLE,
+        TABLE,
+        'ts',
+        ('2024-01-01', '2024-01-03'),
+        custom_primary_key=['id'],
+    )
+
+
+def test_drilldown_compares_only_rows_of_mismatched_hours(make_checker, monkeypatch):
+    executed = []
+    # target lost the 17:40 row of Jan 2
+    tables = {'source': ROWS, 'target': ROWS.drop(index=2)}
+    checker = _checker(make_checker, monkeypatch, tables, executed)
+
+    status, report, stats, details = _run(checker)
+
+    assert status == CHECK_FAILED
+    assert details.execution_info['drilldown']['days'] == ['2024-01-02']
+    assert details.execution_info['drilldown']['hours'] == ['2024-01-02 17']
+    assert stats.total_source_rows == 1
+    assert stats.only_source_rows == 1
+    data_queries = [params for _, sql, params in executed if 'count(*)' not in sql]
+    assert data_queries == [
+        {
+            'start_date': '2024-01-02',
+            'end_date': '2024-01-02',
+            'xhour0': '2024-01-02 17',
+        }
+    ] * 2
+    # counts report followed by the row-level report
+    assert report.count('run_id:') == 2
+
+
+def test_drilldown_stops_at_counts_when_they_match(make_checker, monkeypatch):
+    executed = []
+    checker = _checker(
+        make_checker, monkeypatch, {'source': ROWS, 'target': ROWS}, executed
+    )
+
+    status, _, _, details = _run(checker)
+
+    assert status == CHECK_SUCCESS
+    assert details.execution_info['drilldown'] == {'days': [], 'hours': []}
+    assert len(executed) == 2
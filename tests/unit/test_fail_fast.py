@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+
+
+def test_samples_fail_fast_skips_chunks_once_failure_is_certain(make_checker):
+    from xoverrr.constants import CHECK_FAILED
+    from xoverrr.models import DataReference
+
+    days = ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04']
+    source = pd.DataFrame(
+        {'id': range(40), 'val': 'a', 'dt': [day for day in days for _ in range(10)]}
+    )
+    target = source.copy()
+    target.loc[:9, 'val'] = 'b'  # the first day differs entirely
+    tables = {'source': source, 'target': target}
+    meta = pd.DataFrame(
+        {'column_name': ['id', 'val', 'dt'], 'data_type': ['int', 'text', 'date']}
+    )
+
+    def _fake_execute_query(query, engine, timezone=None, query_side=None):
+        counts = tables[query_side].groupby('dt').size()
+        return pd.DataFrame({'dt': counts.index, 'cnt': counts.values})
+
+    checker = make_checker(tables=tables, _execute_query=_fake_execute_query)
+
+    def _fetched():
+        return [(call.query_side, call.start_date) for call in checker.table_data_calls]
+
+    def _run(tolerance_pct):
+        checker.table_data_calls.clear()
+        return checker._check_samples_iterative(
+            source_table=DataReference('t', 'test'),
+            target_table=DataReference('t', 'test'),
+            source_columns_meta=meta,
+            target_columns_meta=meta,
+            common_cols=['id', 'val', 'dt'],
+            key_columns=['id'],
+            source_only_cols=[],
+            target_only_cols=[],
+            date_column='dt',
+            update_column=None,
+            start_date=days[0],
+            end_date=days[-1],
+            chunk_size_days=1,
+            exclude_recent_hours=None,
+            tolerance_pct=tolerance_pct,
+            max_examples=3,
+            run_id='run',
+            run_started_at='2024-01-10 00:00:00',
+            fail_fast=True,
+        )
+
+    # 10 issues out of at most 40 comparable rows: the score is at least 12.5
+    status, _, stats, details = _run(tolerance_pct=5.0)
+    assert status == CHECK_FAILED
+    assert _fetched() == [('source', days[0]), ('target', days[0])]
+    assert stats.comparable_rows == 10
+    assert details.execution_info['fail_fast'] == {
+        'partial': True,
+        'chunks_compared': 1,
+        'chunks_total': 4,
+        'range_source_rows': 40,
+        'range_target_rows': 40,
+        'final_diff_score_lower_bound': 12.5,
+    }
+
+    # the remaining chunks could still bring the score under 20%
+    _, _, stats, details = _run(tolerance_pct=20.0)
+    assert len(_fetched()) == 8
+    assert stats.final_diff_score == pytest.approx(12.5)
+    assert details.execution_info['fail_fast']['partial'] is False
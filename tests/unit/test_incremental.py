@@ -0,0 +1,153 @@
+from datetime import date, datetime
+
+import pandas as pd
+
+from xoverrr.adapters.postgres import PostgresAdapter
+from xoverrr.constants import CHECK_FAILED, CHECK_SUCCESS
+from xoverrr.models import DataReference
+from xoverrr.state import CheckStateStore
+
+COLUMNS = ['id', 'val', 'updated_at']
+META = pd.DataFrame({'column_name': COLUMNS, 'data_type': ['int', 'text', 'date']})
+TABLE = DataReference('items', 'test')
+
+
+def _changed_rows(df, call):
+    """Rows updated since the watermark or selected by key"""
+    if 'xwatermark' in call.params:
+        df = df[
+            pd.to_datetime(df['updated_at']) >= pd.Timestamp(call.params['xwatermark'])
+        ]
+    keys = {
+        str(value) for name, value in call.params.items() if name.startswith('xkey')
+    }
+    if keys:
+        df = df[df['id'].astype(str).isin(keys)]
+    return df
+
+
+def _checker(make_checker, tmp_path, tables):
+    return make_checker(
+        tables=tables,
+        row_filter=_changed_rows,
+        state_store=CheckStateStore(str(tmp_path / 'state.db')),
+    )
+
+
+def _run(checker):
+    return checker._check_samples_incremental(
+        'items_sync',
+        100,
+        source_table=TABLE,
+        target_table=TABLE,
+        source_columns_meta=META,
+        target_columns_meta=META,
+        common_cols=COLUMNS,
+        key_columns=['id'],
+        source_only_cols=[],
+        target_only_cols=[],
+        date_column=None,
+        update_column='updated_at',
+        start_date=None,
+        end_date=None,
+        chunk_size_days=None,
+        exclude_recent_hours=None,
+        tolerance_pct=0.0,
+        max_examples=3,
+        run_id='run',
+        run_started_at='2024-01-06 00:00:00',
+    )
+
+
+def test_incremental_run_compares_only_changed_and_mismatched_rows(
+    make_checker, tmp_path
+):
+    tables = {
+        'source': pd.DataFrame(
+            {
+                'id': [1, 2, 3],
+                'val': ['a', 'b', 'c'],
+                'updated_at': ['2024-01-01', '2024-01-01', '2024-01-02'],
+            }
+        ),
+        'target': pd.DataFrame(
+            {
+                'id': [1, 2, 3],
+                'val': ['a', 'b', 'x'],
+                'updated_at': ['2024-01-01', '2024-01-01', '2024-01-02'],
+            }
+        ),
+    }
+    checker = _checker(make_checker, tmp_path, tables)
+
+    status, _, _, details = _run(checker)
+    assert status == CHECK_FAILED
+    assert details.execution_info['incremental']['mode'] == 'full'
+    assert (
+        details.execution_info['incremental']['watermark_to'] == '2024-01-02 00:00:00'
+    )
+
+    # id 3 fixed on target, id 4 added on source only
+    tables['target'].loc[2, 'val'] = 'c'
+    tables['source'] = pd.concat(
+        [
+            tables['source'],
+            pd.DataFrame({'id': [4], 'val': ['d'], 'updated_at': ['2024-01-05']}),
+        ],
+        ignore_index=True,
+    )
+    status, _, stats, details = _run(checker)
+    info = details.execution_info['incremental']
+    assert info['mode'] == 'incremental'
+    assert info['changed_rows'] == {'source': 2, 'target': 1}
+    assert info['rechecked_keys'] == 1
+    assert stats.total_source_rows == 2
+    assert info['cumulative']['open_mismatched_keys'] == 1
+    assert status == CHECK_FAILED
+
+    # id 4 replicated
+    tables['target'] = pd.concat(
+        [
+            tables['target'],
+            pd.DataFrame({'id': [4], 'val': ['d'], 'updated_at': ['2024-01-05']}),
+        ],
+        ignore_index=True,
+    )
+    status, _, stats, details = _run(checker)
+    assert status == CHECK_SUCCESS
+    assert stats.total_source_rows == 1
+    cumulative = details.execution_info['incremental']['cumulative']
+    assert cumulative['runs'] == 3
+    assert cumulative['open_mismatched_keys'] == 0
+
+
+def test_key_filter_condition_binds_typed_key_values():
+    columns_meta = pd.DataFrame(
+        {'column_name': ['id', 'date'], 'data_type': ['int8', 'timestamp']}
+    )
+    condition, params = PostgresAdapter().build_key_filter_condition(
+        ['id', 'date'],
+        [('1', '2024-01-01'), ('2', '2024-01-02 10:30:00'), ('3', 'N/A')],
+        columns_meta,
+    )
+
+    assert condition == (
+        '(id, "date") IN ((:xkey_0_0, :xkey_0_1), (:xkey_1_0, :xkey_1_1)) '
+        'OR (id = :xkey_2_0 AND "date" IS NULL)'
+    )
+    assert params == {
+        'xkey_0_0': 1,
+        'xkey_0_1': datetime(2024, 1, 1),
+        'xkey_1_0': 2,
+        'xkey_1_1': datetime(2024, 1, 2, 10, 30),
+        'xkey_2_0': 3,
+    }
+
+    _, params = PostgresAdapter().build_key_filter_condition(
+        ['doc_date', 'code'],
+        [('2024-01-02', 'A1')],
+        pd.DataFrame(
+            {'column_name': ['doc_date', 'code'], 'data_type': ['date', 'varchar']}
+        ),
+    )
+    assert params == {'xkey_0_0': date(2024, 1, 2), 'xkey_0_1': 'A1'}
@@ -0,0 +1,60 @@
+import pandas as pd
+
+
+def test_counts_key_bisection_finds_missing_keys_with_range_counts(
+    make_checker, monkeypatch
+):
+    import re
+
+    from xoverrr.adapters.postgres import PostgresAdapter
+    from xoverrr.models import DataReference
+
+    keys = {'source': set(range(1, 10_001)), 'target': set(range(1, 10_001))}
+    keys['target'] -= {17, 7_500}
+    keys['target'].add(20_000)
+    checker = make_checker()
+    data_queries = []
+
+    def _fake_execute(query, engine, timezone=None, query_side=None):
+        sql, params = query
+        side_keys = keys[query_side]
+        if 'count(*)' not in sql:
+            data_queries.append(query_side)
+            ranges = [
+                (params[f'xlo{i}'], params[f'xhi{i}'])
+                for i in range(len(params) // 2)
+                if f'xlo{i}' in params
+            ]
+            fetched = [k for k in side_keys if any(lo <= k < hi for lo, hi in ranges)]
+            return pd.DataFrame({'id': sorted(fetched)})
+        row = {'dt': '2024-01-01', 'cnt': len(side_keys)}
+        if 'xkey_min' in sql:
+            row.update(xkey_min=min(side_keys), xkey_max=max(side_keys))
+        range_aggregates = re.findall(
+            r'>= (\d+) AND id < (\d+) THEN 1 ELSE 0 END\) as xrange(\d+)', sql
+        )
+        for lo, hi, i in range_aggregates:
+            row[f'xrange{i}'] = sum(int(lo) <= k < int(hi) for k in side_keys)
+        return pd.DataFrame([row])
+
+    monkeypatch.setattr(checker, '_execute_query', _fake_execute)
+    adapter = PostgresAdapter()
+    table = DataReference('orders', 'test')
+
+    info = checker._bisect_day_keys(
+        {'source': adapter, 'target': adapter},
+        {'source': None, 'target': None},
+        {'source': table, 'target': table},
+        'id',
+        'dt',
+        '2024-01-01',
+        100,
+        3,
+    )
+
+    assert info['source_only_keys_examples'] == [17, 7_500]
+    assert info['target_only_keys_examples'] == [20_000]
+    assert info['unresolved_ranges'] == 0
+    # far fewer rows fetched than the 10k keys of the day
+    assert info['fetched_ranges'] <= 4
+    assert info['queries'] < 40
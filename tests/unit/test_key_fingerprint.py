@@ -0,0 +1,110 @@
+import pandas as pd
+import pytest
+
+
+def test_counts_key_fingerprint_flags_same_count_different_keys(
+    make_checker, monkeypatch
+):
+    from xoverrr.adapters.postgres import PostgresAdapter
+    from xoverrr.constants import CHECK_FAILED, XKEY_HASH_SUM_COLUMN
+    from xoverrr.models import DataReference
+    from xoverrr.planning import COUNTS_PLAN_CHUNKED, CountsExecutionPlan
+
+    # day 2: one row deleted on target and another one added, count unchanged
+    key_hashes = {
+        'source': {'2024-01-01': 2**62, '2024-01-02': 11},
+        'target': {'2024-01-01': 2**62, '2024-01-02': 12},
+    }
+    checker = make_checker()
+    queries = []
+
+    def _fake_execute(query, engine, timezone=None, query_side=None):
+        queries.append(query[0])
+        day = query[1]['start_date']
+        return pd.DataFrame(
+            {
+                'dt': [day],
+                'cnt': [2],
+                XKEY_HASH_SUM_COLUMN: [key_hashes[query_side][day]],
+            }
+        )
+
+    monkeypatch.setattr(checker, '_execute_query', _fake_execute)
+    plan = CountsExecutionPlan(
+        mode=COUNTS_PLAN_CHUNKED,
+        chunks=[('2024-01-01', '2024-01-01'), ('2024-01-02', '2024-01-02')],
+        max_workers_per_engine=1,
+        reason='test',
+    )
+    table = DataReference('orders', 'test')
+    columns_meta = pd.DataFrame(
+        {'column_name': ['id', 'dt'], 'data_type': ['int8', 'date']}
+    )
+    source_counts, target_counts, source_query, target_query = checker._fetch_counts(
+        plan,
+        PostgresAdapter(),
+        PostgresAdapter(),
+        table,
+        table,
+        'dt',
+        columns_meta,
+        columns_meta,
+        key_columns=['id'],
+    )
+    status, _, _, details = checker._evaluate_counts(
+        table,
+        table,
+        source_counts,
+        target_counts,
+        0.0,
+        3,
+        'run',
+        '2024-01-10 00:00:00',
+        source_query,
+        target_query,
+    )
+
+    assert (
+        "sum(('x' || substr(md5(coalesce(id::text, '<null>')), 1, 15))"
+        '::bit(60)::bigint)' in queries[0]
+    )
+    assert source_counts[XKEY_HASH_SUM_COLUMN].tolist() == [str(2**62), '11']
+    assert status == CHECK_FAILED
+    assert details.execution_info['key_fingerprint'] == {
+        'same_count_different_keys_days': ['2024-01-02']
+    }
+
+
+def test_counts_key_fingerprint_rejects_decimal_keys_before_querying(
+    make_checker, monkeypatch
+):
+    from xoverrr.models import DataReference
+
+    checker = make_checker()
+    monkeypatch.setattr(
+        checker,
+        '_get_metadata_cols',
+        lambda table, engine: pd.DataFrame(
+            {'column_name': ['amount', 'dt'], 'data_type': ['numeric', 'date']}
+        ),
+    )
+
+    def _fail_execute(*args, **kwargs):
+        raise AssertionError('no query expected')
+
+    monkeypatch.setattr(checker, '_execute_query', _fail_execute)
+    table = DataReference('orders', 'test')
+    with pytest.raises(ValueError, match='Key column amount of type numeric'):
+        checker._check_counts(
+            table,
+            table,
+            'dt',
+            '2024-01-01',
+            '2024-01-02',
+            None,
+            0.0,
+            3,
+            'run',
+            '2024-01-10 00:00:00',
+            key_fingerprint_columns=['amount'],
+        )
@@ -0,0 +1,122 @@
+import pandas as pd
+
+
+def _key_bucket(key):
+    import hashlib
+
+    return int(hashlib.md5(str(key).encode()).hexdigest()[:15], 16) % 10_000
+
+
+SAMPLING_COLUMNS_META = pd.DataFrame(
+    {'column_name': ['id', 'val'], 'data_type': ['int8', 'text']}
+)
+
+
+def _sampled_samples_run(make_checker, tables, conditions, **kwargs):
+    from xoverrr.models import DataReference
+
+    def _sampled_keys(df, call):
+        ((condition, params),) = call.extra_conditions
+        conditions.append(condition)
+        buckets = df['id'].map(_key_bucket)
+        sampled = (buckets >= params.get('xsample_first_bucket', 0)) & (
+            buckets < params['xsample_buckets']
+        )
+        return df[sampled]
+
+    checker = make_checker(tables=tables, row_filter=_sampled_keys)
+    method = (
+        checker._check_samples_sequential
+        if 'slice_fraction' in kwargs
+        else checker._check_samples_iterative
+    )
+    return method(
+        source_table=DataReference('t', 'test'),
+        target_table=DataReference('t', 'test'),
+        source_columns_meta=SAMPLING_COLUMNS_META,
+        target_columns_meta=SAMPLING_COLUMNS_META,
+        common_cols=['id', 'val'],
+        key_columns=['id'],
+        source_only_cols=[],
+        target_only_cols=[],
+        date_column=None,
+        update_column=None,
+        start_date=None,
+        end_date=None,
+        chunk_size_days=None,
+        exclude_recent_hours=None,
+        max_examples=3,
+        run_id='run',
+        run_started_at='2024-01-10 00:00:00',
+        **kwargs,
+    )
+
+
+def _sampling_tables(changed_every):
+    source = pd.DataFrame({'id': range(1, 4001), 'val': 'a'})
+    target = source.copy()
+    target.loc[target['id'] % changed_every == 0, 'val'] = 'b'
+    return {'source': source, 'target': target}
+
+
+def test_samples_key_sampling_reads_the_same_key_subset_on_both_sides(make_checker):
+    from xoverrr.constants import CHECK_FAILED
+
+    conditions = []
+    # 1% of rows differ
+    status, _, stats, details = _sampled_samples_run(
+        make_checker,
+        _sampling_tables(100), conditions, tolerance_pct=0.0, sample_fraction=0.25
+    )
+
+    assert conditions[0] == (
+        "mod(('x' || substr(md5(coalesce(id::text, '<null>')), 1, 15))"
+        '::bit(60)::bigint, 10000) < :xsample_buckets'
+    )
+    assert status == CHECK_FAILED
+    assert 800 < stats.total_source_rows < 1200
+    assert stats.only_source_rows == stats.only_target_rows == 0
+    sampling = details.execution_info['sampling']
+    assert sampling['sample_fraction'] == 0.25
+    assert 3200 < sampling['estimated_source_rows'] < 4800
+    low, high = sampling['issue_rows_pct_ci']
+    assert low < stats.issue_rows_pct < high
+
+
+def test_sequential_sampling_stops_once_the_interval_clears_the_tolerance(
+    make_checker,
+):
+    from xoverrr.constants import CHECK_FAILED, CHECK_SUCCESS
+
+    # half of the rows differ: far above a 5% tolerance after one slice
+    status, _, _, details = _sampled_samples_run(
+        make_checker,
+        _sampling_tables(2), [], tolerance_pct=5.0, slice_fraction=0.1
+    )
+    assert status == CHECK_FAILED
+    assert details.execution_info['sequential_sampling'] == {
+        'slice_fraction': 0.1,
+        'slices': 1,
+        'decision': 'above tolerance',
+    }
+
+    # clean table: confirmed below tolerance before all keys are compared
+    status, _, _, details = _sampled_samples_run(
+        make_checker,
+        _sampling_tables(10**6), [], tolerance_pct=1.0, slice_fraction=0.1
+    )
+    assert status == CHECK_SUCCESS
+    assert details.execution_info['sequential_sampling']['decision'] == (
+        'below tolerance'
+    )
+    assert details.execution_info['sequential_sampling']['slices'] < 10
+
+    # a zero tolerance cannot be confirmed from a sample
+    _, _, stats, details = _sampled_samples_run(
+        make_checker,
+        _sampling_tables(10**6), [], tolerance_pct=0.0, slice_fraction=0.5
+    )
+    assert details.execution_info['sequential_sampling']['decision'] == (
+        'all keys compared'
+    )
+    assert stats.total_source_rows == 4000
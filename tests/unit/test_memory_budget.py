@@ -0,0 +1,61 @@
+import pandas as pd
+
+
+def test_samples_memory_budget_sizes_windows_from_daily_counts(make_checker):
+    from xoverrr.constants import CHECK_SUCCESS
+    from xoverrr.models import DataReference
+
+    days = ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04']
+    table = pd.DataFrame(
+        {'id': range(40), 'val': 'a', 'dt': [day for day in days for _ in range(10)]}
+    )
+
+    def _fake_execute_query(query, engine, timezone=None, query_side=None):
+        counts = table.groupby('dt').size()
+        return pd.DataFrame({'dt': counts.index, 'cnt': counts.values})
+
+    checker = make_checker(
+        tables={'source': table, 'target': table},
+        _execute_query=_fake_execute_query,
+        _get_table_stats=lambda data_ref, engine: None,
+    )
+    # the first day is measured, the budget then fits two days
+    day_bytes = 20 * (table.head(10).memory_usage(deep=True).sum() / 10) * 4
+    checker.memory_budget_gb = 2.5 * day_bytes / 1024**3
+
+    status, _, stats, details = checker._check_samples_iterative(
+        source_table=DataReference('t', 'test'),
+        target_table=DataReference('t', 'test'),
+        source_columns_meta=None,
+        target_columns_meta=None,
+        common_cols=['id', 'val', 'dt'],
+        key_columns=['id'],
+        source_only_cols=[],
+        target_only_cols=[],
+        date_column='dt',
+        update_column=None,
+        start_date=days[0],
+        end_date=days[-1],
+        chunk_size_days=None,
+        exclude_recent_hours=None,
+        tolerance_pct=0.0,
+        max_examples=3,
+        run_id='run',
+        run_started_at='2024-01-10 00:00:00',
+    )
+
+    assert status == CHECK_SUCCESS
+    assert stats.comparable_rows == 40
+    assert [
+        (call.start_date, call.end_date)
+        for call in checker.table_data_calls
+        if call.query_side == 'source'
+    ] == [
+        ('2024-01-01', '2024-01-01'),
+        ('2024-01-02', '2024-01-03'),
+        ('2024-01-04', '2024-01-04'),
+    ]
+    info = details.execution_info['memory_budget']
+    assert info['windows'] == 3
+    assert info['row_bytes_source'] == 'measured'
+    assert info['over_budget_days'] == []
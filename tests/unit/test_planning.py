@@ -0,0 +1,157 @@
+import pytest
+
+from xoverrr.planning import (
+    COUNTS_PLAN_CHUNKED,
+    COUNTS_PLAN_SINGLE,
+    TableStats,
+    bisect_key_ranges,
+    days_to_windows,
+    plan_count_cache,
+    plan_counts_execution,
+    plan_memory_window,
+    split_date_window,
+)
+
+CHUNKS = [
+    ('2024-01-01', '2024-01-10'),
+    ('2024-01-11', '2024-01-20'),
+    ('2024-01-21', '2024-01-31'),
+]
+
+
+class TestCountsExecutionPlan:
+    def test_small_tables_use_single_query_for_whole_range(self):
+        plan = plan_counts_execution(
+            CHUNKS,
+            TableStats(num_rows=1_000),
+            TableStats(num_rows=2_000),
+            max_workers_per_engine=4,
+            single_scan_max_rows=10_000,
+        )
+
+        assert plan.mode == COUNTS_PLAN_SINGLE
+        assert plan.chunks == [('2024-01-01', '2024-01-31')]
+        assert not plan.is_parallel
+
+    def test_large_tables_fan_out_chunks(self):
+        plan = plan_counts_execution(
+            CHUNKS,
+            TableStats(num_rows=1_000),
+            TableStats(num_rows=20_000),
+            max_workers_per_engine=4,
+            single_scan_max_rows=10_000,
+        )
+
+        assert plan.mode == COUNTS_PLAN_CHUNKED
+        assert plan.chunks == CHUNKS
+        assert plan.is_parallel
+        assert plan.to_dict()['chunks'] == 3
+
+    def test_unknown_stats_keep_requested_chunks(self):
+        plan = plan_counts_execution(
+            CHUNKS, None, TableStats(num_rows=10), single_scan_max_rows=10_000
+        )
+
+        assert plan.mode == COUNTS_PLAN_CHUNKED
+        assert not plan.is_parallel
+        assert 'catalog statistics' in plan.reason
+
+    def test_rejects_non_positive_workers(self):
+        with pytest.raises(ValueError, match='max_parallel_chunks'):
+            plan_counts_execution(CHUNKS, None, None, max_workers_per_engine=0)
+
+
+    def test_non_contiguous_chunks_are_never_merged(self):
+        plan = plan_counts_execution(
+            [('2024-01-01', '2024-01-02'), ('2024-01-10', '2024-01-11')],
+            TableStats(num_rows=10),
+            TableStats(num_rows=10),
+            single_scan_max_rows=10_000,
+        )
+
+        assert plan.mode == COUNTS_PLAN_CHUNKED
+        assert len(plan.chunks) == 2
+
+
+class TestCountCachePlan:
+    def test_only_uncached_and_recent_days_are_queried(self):
+        cached = {'2024-01-01': 5, '2024-01-02': 0, '2024-01-03': 7}
+
+        plan = plan_count_cache(
+            '2024-01-01',
+            '2024-01-06',
+            freeze_before='2024-01-05',
+            source_cached=cached,
+            target_cached={**cached, '2024-01-04': 1},
+        )
+
+        assert plan.cached_days == ['2024-01-01', '2024-01-02', '2024-01-03']
+        assert plan.query_days == ['2024-01-04', '2024-01-05', '2024-01-06']
+        assert plan.frozen_query_days == ['2024-01-04']
+        assert days_to_windows(plan.query_days) == [('2024-01-04', '2024-01-06')]
+
+    def test_revalidation_days_are_queried_again(self):
+        cached = {'2024-01-01': 5, '2024-01-02': 6, '2024-01-03': 7}
+
+        plan = plan_count_cache(
+            '2024-01-01',
+            '2024-01-03',
+            freeze_before='2024-02-01',
+            source_cached=cached,
+            target_cached=cached,
+            revalidate_days=1,
+            seed=1,
+        )
+
+        assert len(plan.revalidate_days) == 1
+        assert plan.query_days == plan.revalidate_days
+        assert plan.frozen_query_days == plan.revalidate_days
+        assert len(plan.cached_days) == 2
+
+
+def test_days_to_windows_splits_gaps():
+    assert days_to_windows(['2024-01-01', '2024-01-02', '2024-01-05']) == [
+        ('2024-01-01', '2024-01-02'),
+        ('2024-01-05', '2024-01-05'),
+    ]
+
+
+def test_bisect_key_ranges_drops_equal_splits_large_and_keeps_small():
+    to_count, leaves = bisect_key_ranges(
+        [(0, 100), (100, 200), (200, 1000), (1000, 1001)],
+        [50, 40, 800, 5],
+        [50, 39, 700, 4],
+        max_range_rows=100,
+    )
+
+    assert to_count == [(200, 600), (600, 1000)]
+    assert leaves == [(100, 200), (1000, 1001)]
+
+
+def test_split_date_window_halves_down_to_min_days():
+    assert split_date_window('2024-01-01', '2024-01-05', 1) == [
+        ('2024-01-01', '2024-01-03'),
+        ('2024-01-04', '2024-01-05'),
+    ]
+    assert split_date_window('2024-01-01', '2024-01-02', 2) is None
+    assert split_date_window('2024-01-01', '2024-01-01', 1) is None
+
+
+def test_plan_memory_window_packs_days_into_the_budget():
+    day_rows = {'2024-01-01': 100, '2024-01-02': 100, '2024-01-03': 300}
+
+    # 100 bytes per row, 4 copies: a day of 100 rows takes 40k
+    assert plan_memory_window('2024-01-01', '2024-01-04', day_rows, 100, 80e3) == (
+        '2024-01-02'
+    )
+    # a day over the budget still is a window of its own
+    assert plan_memory_window('2024-01-03', '2024-01-04', day_rows, 100, 80e3) == (
+        '2024-01-03'
+    )
+    # days without rows are free, an unknown width gives one day
+    assert plan_memory_window('2024-01-04', '2024-01-09', day_rows, 100, 1) == (
+        '2024-01-09'
+    )
+    assert plan_memory_window('2024-01-01', '2024-01-04', day_rows, None, 1e9) == (
+        '2024-01-01'
+    )
@@ -0,0 +1,115 @@
+
+import pandas as pd
+
+from xoverrr.adapters.clickhouse import ClickHouseAdapter
+from xoverrr.adapters.postgres import PostgresAdapter
+from xoverrr.constants import CHECK_FAILED
+from xoverrr.models import DataReference
+
+TABLE = DataReference('orders', 'test')
+META = pd.DataFrame(
+    {
+        'column_name': ['id', 'amount', 'note', 'dt'],
+        'data_type': ['integer', 'numeric(12,2)', 'character varying', 'date'],
+    }
+)
+
+
+def test_count_query_gains_profile_aggregates():
+    adapter = PostgresAdapter()
+    aggregates = adapter.build_profile_aggregates(
+        [('amount', 'numeric'), ('note', 'string'), ('date', 'other')]
+    )
+    query, _ = adapter.build_count_query(
+        TABLE,
+        'dt',
+        '2024-01-01',
+        '2024-01-02',
+        META,
+        'UTC',
+        aggregates=[aggregate[:2] for aggregate in aggregates],
+    )
+
+    assert [alias for alias, *_ in aggregates] == [
+        'xp0_nulls',
+        'xp0_min',
+        'xp0_max',
+        'xp0_sum',
+        'xp1_nulls',
+        'xp1_len_sum',
+        'xp2_nulls',
+    ]
+    assert 'sum(amount) as xp0_sum' in query
+    assert 'sum(length(note)) as xp1_len_sum' in query
+    assert 'count(*) - count("date") as xp2_nulls' in query
+    assert query.index('count(*) as cnt') < query.index('xp0_nulls') < query.index(
+        'GROUP BY'
+    )
+    assert (
+        ClickHouseAdapter().build_profile_aggregates([('note', 'string')])[1][1]
+        == 'sum(lengthUTF8(note))'
+    )
+
+
+def test_profile_column_kinds():
+    classify = PostgresAdapter.classify_profile_column
+
+    assert classify('numeric(12,2)') == 'numeric'
+    assert classify('Nullable(Int64)') == 'numeric'
+    assert classify('double precision') == 'numeric'
+    assert classify('LowCardinality(String)') == 'string'
+    assert classify('varchar2') == 'string'
+    assert classify('interval') == 'other'
+    assert classify('timestamp without time zone') == 'other'
+
+
+def test_check_profile_compares_daily_aggregates_without_fetching_rows(make_checker):
+    checker = make_checker(_get_metadata_cols=lambda *args: META)
+
+    executed = []
+
+    def _fake_execute(query, engine, timezone=None, query_side=None):
+        _, params = query
+        executed.append((query_side, params['start_date']))
+        day = params['start_date']
+        # amount sums come back as Decimal on source and float on target
+        amount_sum = {'source': '30.50', 'target': 30.5}[query_side]
+        note_len = 7 if (query_side, day) == ('target', '2024-01-02') else 6
+        return pd.DataFrame(
+            {
+                'dt': [day],
+                'cnt': [2],
+                'xp0_nulls': [0],
+                'xp0_min': [10],
+                'xp0_max': [20.5],
+                'xp0_sum': [amount_sum],
+                'xp1_nulls': [1],
+                'xp1_len_sum': [note_len],
+            }
+        )
+
+    checker._execute_query = _fake_execute
+
+    status, _, stats, details = checker._check_profile(
+        TABLE,
+        TABLE,
+        'dt',
+        '2024-01-01',
+        '2024-01-02',
+        1,
+        ['id'],
+        [],
+        0.0,
+        3,
+        run_id='run',
+        run_started_at='2024-01-10 00:00:00',
+    )
+
+    assert status == CHECK_FAILED
+    assert len(executed) == 4
+    assert stats.total_source_rows == 2  # days
+    assert details.issue_breakdown['column_name'].tolist() == ['note__len_sum']
+    assert details.execution_info['profile']['columns'] == {
+        'amount': 'numeric',
+        'note': 'string',
+    }
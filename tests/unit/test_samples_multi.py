@@ -0,0 +1,154 @@
+import pandas as pd
+
+
+def test_check_samples_multi_fetches_source_once_per_chunk(make_checker, monkeypatch):
+    from types import SimpleNamespace
+
+    from xoverrr.constants import CHECK_FAILED, CHECK_SUCCESS
+    from xoverrr.models import DataReference
+
+    meta = pd.DataFrame({'column_name': ['id', 'val'], 'data_type': ['int', 'text']})
+    source = pd.DataFrame({'id': [1, 2], 'val': ['a', 'b']})
+    tables = {
+        'source': source,
+        'test.pg': source.copy(),
+        'test.ch': pd.DataFrame({'id': [1, 2], 'val': ['a', 'x']}),
+        'test.broken': pd.DataFrame(),
+    }
+    fetched = []
+
+    def _record_fetch(df, call):
+        fetched.append((call.query_side, call.data_ref.full_name))
+        if call.data_ref.full_name == 'test.broken':
+            raise RuntimeError('relation does not exist')
+        return df
+
+    def _fake_resolve(source_table, target_table, target_engine, *args):
+        return {
+            'source_columns_meta': meta,
+            'target_columns_meta': meta,
+            'common_cols': ['id', 'val'],
+            'key_columns': ['id'],
+            'source_only_cols': [],
+            'target_only_cols': [],
+        }
+
+    checker = make_checker(tables=tables, row_filter=_record_fetch)
+    monkeypatch.setattr(checker, '_resolve_samples_columns', _fake_resolve)
+    pg = SimpleNamespace(dialect=SimpleNamespace(name='postgresql'))
+    ch = SimpleNamespace(dialect=SimpleNamespace(name='clickhouse'))
+
+    results = checker.check_samples_multi(
+        DataReference('src', 'test'),
+        [
+            (pg, DataReference('pg', 'test')),
+            (ch, DataReference('ch', 'test')),
+            (pg, DataReference('broken', 'test')),
+        ],
+        date_column='dt',
+        date_range=('2024-01-01', '2024-01-02'),
+        chunk_size_days=1,
+    )
+
+    assert [status for status, *_ in results] == [
+        CHECK_SUCCESS,
+        CHECK_FAILED,
+        CHECK_FAILED,
+    ]
+    assert fetched.count(('source', 'test.src')) == 2
+    # the failed target is not queried again for the second chunk
+    assert fetched.count(('target', 'test.broken')) == 1
+    assert results[1][2].total_source_rows == 4
+    assert results[0][3].execution_info['samples_multi'] == {
+        'targets': 3,
+        'source_fetches': 2,
+    }
+    assert results[2][2] is None
+    assert checker.check_stats['checked'] == 3
+
+
+def test_check_samples_multi_fails_every_target_when_source_fetch_fails(
+    make_checker, monkeypatch
+):
+    from types import SimpleNamespace
+
+    from xoverrr.constants import CHECK_FAILED
+    from xoverrr.models import DataReference
+
+    meta = pd.DataFrame({'column_name': ['id', 'val'], 'data_type': ['int', 'text']})
+
+    def _fail_fetch(df, call):
+        raise RuntimeError('source relation does not exist')
+
+    def _fake_resolve(source_table, target_table, target_engine, *args):
+        return {
+            'source_columns_meta': meta,
+            'target_columns_meta': meta,
+            'common_cols': ['id', 'val'],
+            'key_columns': ['id'],
+            'source_only_cols': [],
+            'target_only_cols': [],
+        }
+
+    checker = make_checker(
+        tables={'source': pd.DataFrame(), 'target': pd.DataFrame()},
+        row_filter=_fail_fetch,
+    )
+    monkeypatch.setattr(checker, '_resolve_samples_columns', _fake_resolve)
+    shutdowns = []
+    checker._compare_pool = SimpleNamespace(shutdown=lambda: shutdowns.append(1))
+    pg = SimpleNamespace(dialect=SimpleNamespace(name='postgresql'))
+
+    results = checker.check_samples_multi(
+        DataReference('src', 'test'),
+        [(pg, DataReference('a', 'test')), (pg, DataReference('b', 'test'))],
+        date_column='dt',
+        date_range=('2024-01-01', '2024-01-02'),
+    )
+
+    assert [status for status, *_ in results] == [CHECK_FAILED, CHECK_FAILED]
+    assert checker.check_stats['checked'] == 2
+    assert checker.check_stats['failed'] == 2
+    assert checker._compare_pool is None and shutdowns
+
+
+def test_check_samples_multi_does_not_inherit_the_details_level(
+    make_checker, monkeypatch
+):
+    from types import SimpleNamespace
+
+    from xoverrr.models import DataReference
+
+    meta = pd.DataFrame({'column_name': ['id', 'val'], 'data_type': ['int', 'text']})
+    frame = pd.DataFrame({'id': [1, 2], 'val': ['a', 'b']})
+    levels = []
+
+    def _record_details_level(df, call):
+        levels.append(checker._details_level)
+        return df
+
+    def _fake_resolve(source_table, target_table, target_engine, *args):
+        return {
+            'source_columns_meta': meta,
+            'target_columns_meta': meta,
+            'common_cols': ['id', 'val'],
+            'key_columns': ['id'],
+            'source_only_cols': [],
+            'target_only_cols': [],
+        }
+
+    checker = make_checker(
+        tables={'source': frame, 'target': frame}, row_filter=_record_details_level
+    )
+    monkeypatch.setattr(checker, '_resolve_samples_columns', _fake_resolve)
+    pg = SimpleNamespace(dialect=SimpleNamespace(name='postgresql'))
+    table = DataReference('t', 'test')
+
+    # left over from a previous check
+    checker._start_check_run('samples', None, details_level='none')
+    checker.check_samples_multi(table, [(pg, table)])
+    assert levels == ['examples', 'examples']
+
+    levels.clear()
+    checker.check_samples_multi(table, [(pg, table)], details_level='none')
+    assert levels == ['none', 'none']
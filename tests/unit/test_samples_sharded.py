@@ -0,0 +1,52 @@
+import pandas as pd
+
+
+def test_check_samples_sharded_compares_union_of_shards(make_checker, monkeypatch):
+    from types import SimpleNamespace
+
+    from xoverrr.constants import CHECK_SUCCESS
+    from xoverrr.models import DataReference
+
+    meta = pd.DataFrame({'column_name': ['id', 'val'], 'data_type': ['int', 'text']})
+    target_meta = pd.DataFrame(
+        {'column_name': ['id', 'val', 'shard'], 'data_type': ['int', 'text', 'text']}
+    )
+    tables = {
+        'test.s0': pd.DataFrame({'id': [1, 2], 'val': ['a', 'b']}),
+        'test.s1': pd.DataFrame({'id': [3], 'val': ['c']}),
+        'target': pd.DataFrame(
+            {'id': [1, 2, 3], 'val': ['a', 'b', 'c'], 'shard': ['eu', 'eu', 'us']}
+        ),
+    }
+
+    def _fake_resolve(source_table, target_table, target_engine, *args, **kwargs):
+        return {
+            'source_columns_meta': meta,
+            'target_columns_meta': meta,
+            'common_cols': ['id', 'val'],
+            'key_columns': ['id'],
+            'source_only_cols': [],
+            'target_only_cols': [],
+        }
+
+    checker = make_checker(tables=tables)
+    monkeypatch.setattr(checker, '_resolve_samples_columns', _fake_resolve)
+    monkeypatch.setattr(checker, '_get_metadata_cols', lambda ref, engine: target_meta)
+    pg = SimpleNamespace(dialect=SimpleNamespace(name='postgresql'))
+
+    status, _, stats, details = checker.check_samples_sharded(
+        [(pg, DataReference('s0', 'test')), (pg, DataReference('s1', 'test'))],
+        DataReference('all', 'test'),
+        shard_column='shard',
+        shard_labels=['eu', 'us'],
+    )
+
+    assert status == CHECK_SUCCESS
+    assert stats.total_source_rows == 3
+    assert [
+        call.common_columns
+        for call in checker.table_data_calls
+        if call.query_side == 'target'
+    ] == [['id', 'val', 'shard']]
+    assert details.execution_info['shards'] == {'eu': 2, 'us': 1}
+    assert 'shard' in details.evaluated_columns
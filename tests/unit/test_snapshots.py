@@ -0,0 +1,79 @@
+import os
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from xoverrr.exceptions import SnapshotMissError
+from xoverrr.snapshots import SnapshotCache
+
+
+class _CountingAdapter:
+    def __init__(self):
+        self.calls = 0
+
+    def _execute_query(
+        self, query, engine, timezone, timeout_seconds=None, cancel_token=None
+    ):
+        self.calls += 1
+        return pd.DataFrame({'id': [1, 2], 'val': ['a', 'b']})
+
+
+ENGINE = SimpleNamespace(dialect=SimpleNamespace(name='postgresql'))
+
+
+def test_checker_queries_are_replayed_from_snapshots(make_checker, tmp_path):
+    adapter = _CountingAdapter()
+    query = (
+        'select id, val from t where dt >= :start_date',
+        {'start_date': '2024-01-01'},
+    )
+
+    first = make_checker(
+        adapter=adapter, snapshot_cache=SnapshotCache(str(tmp_path))
+    )._execute_query(query, ENGINE, 'UTC')
+    replay_checker = make_checker(
+        adapter=adapter, snapshot_cache=SnapshotCache(str(tmp_path), replay=True)
+    )
+    replayed = replay_checker._execute_query(query, ENGINE, 'UTC')
+
+    assert adapter.calls == 1
+    pd.testing.assert_frame_equal(first, replayed)
+    assert replay_checker.snapshot_cache.hits == 1
+
+    # outside replay mode the query runs again and refreshes the snapshot
+    refresh_checker = make_checker(
+        adapter=adapter, snapshot_cache=SnapshotCache(str(tmp_path))
+    )
+    refresh_checker._execute_query(query, ENGINE, 'UTC')
+    assert adapter.calls == 2
+    assert refresh_checker.snapshot_cache.hits == 0
+
+    with pytest.raises(SnapshotMissError):
+        replay_checker._execute_query(
+            (query[0], {'start_date': '2024-01-02'}), ENGINE, 'UTC'
+        )
+
+
+def test_least_recently_used_snapshots_are_evicted(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    frame = pd.DataFrame({'val': [str(i) for i in range(2000)]})
+    for name in ('a', 'b'):
+        cache.fetch(('query', name, None, 'pg', None), lambda: frame)
+    files = os.listdir(tmp_path)
+    # age both snapshots, then touch "a" through a replay hit
+    for name in files:
+        os.utime(tmp_path / name, (0, 0))
+    cache.replay = True
+    cache.fetch(('query', 'a', None, 'pg', None), lambda: None)
+    cache.replay = False
+
+    cache.max_size_bytes = os.stat(tmp_path / files[0]).st_size
+    cache.fetch(('query', 'c', None, 'pg', None), lambda: frame.head(1))
+
+    loaded = []
+    cache.replay = True
+    cache.fetch(('query', 'c', None, 'pg', None), lambda: loaded.append('c'))
+    with pytest.raises(SnapshotMissError):
+        cache.fetch(('query', 'b', None, 'pg', None), lambda: None)
+    assert not loaded
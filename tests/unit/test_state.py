@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+import pandas as pd
+from sqlalchemy.engine import make_url
+
+from xoverrr.models import DataReference
+from xoverrr.state import CheckStateStore, CountCacheScope
+
+
+def _engine(url):
+    url = make_url(url)
+    dialect = SimpleNamespace(name=url.get_backend_name())
+    return SimpleNamespace(url=url, dialect=dialect)
+
+
+def _scope(engine, table='events'):
+    return CountCacheScope.for_table(
+        engine, DataReference(table, 'test'), 'created_at', 'UTC'
+    )
+
+
+def test_count_cache_roundtrip(tmp_path):
+    store = CheckStateStore(str(tmp_path / 'state.db'))
+    engine = _engine('postgresql://user:secret@db/app')
+    scope = _scope(engine)
+
+    store.put_day_counts(scope, {'2024-01-01': 10, '2024-01-02': 0})
+    store.put_day_counts(scope, {'2024-01-01': 11})
+
+    assert 'secret' not in scope.engine_url
+    assert store.get_day_counts(scope, ['2024-01-01', '2024-01-02', '2024-01-03']) == {
+        '2024-01-01': 11,
+        '2024-01-02': 0,
+    }
+    assert store.get_day_counts(_scope(engine, 'other'), ['2024-01-01']) == {}
+
+    store.delete_day_counts(scope, ['2024-01-01'])
+    assert store.get_day_counts(scope, ['2024-01-01']) == {}
+
+
+def test_checker_serves_frozen_days_from_cache(tmp_path):
+    from xoverrr.core import DataQualityChecker
+
+    checker = DataQualityChecker(
+        _engine('postgresql://user@source/app'),
+        _engine('postgresql://user@target/app'),
+        timezone='UTC',
+        state_store=CheckStateStore(str(tmp_path / 'state.db')),
+    )
+    table = DataReference('events', 'test')
+    today = pd.Timestamp.now(tz='UTC').normalize()
+    start = (today - pd.Timedelta(days=9)).strftime('%Y-%m-%d')
+    end = today.strftime('%Y-%m-%d')
+    old_day = (today - pd.Timedelta(days=8)).strftime('%Y-%m-%d')
+    queried = pd.DataFrame({'dt': [old_day, end], 'cnt': [4, 2]})
+
+    cache_plan, scopes, cached = checker._plan_count_cache(
+        table, table, 'created_at', start, end, 3, 0
+    )
+    assert len(cache_plan.query_days) == 10
+    checker._apply_count_cache(cache_plan, scopes, cached, queried, queried)
+
+    cache_plan, scopes, cached = checker._plan_count_cache(
+        table, table, 'created_at', start, end, 3, 0
+    )
+    assert len(cache_plan.query_days) == 4
+    source_counts, _, cache_info = checker._apply_count_cache(
+        cache_plan, scopes, cached, queried[queried['dt'] == end], queried
+    )
+
+    assert source_counts.to_dict('records') == [
+        {'dt': old_day, 'cnt': 4},
+        {'dt': end, 'cnt': 2},
+    ]
+    assert cache_info['cached_days'] == 6
+    assert cache_info['revalidation_mismatches'] == []
@@ -0,0 +1,135 @@
+import re
+
+import pandas as pd
+
+from xoverrr.constants import CHECK_SUCCESS
+from xoverrr.models import DataReference, SuiteCheck
+from xoverrr.suite import plan_suite
+
+SOURCE = DataReference('orders', 'src')
+TARGET = DataReference('orders', 'dst')
+META = pd.DataFrame(
+    {
+        'column_name': ['id', 'val', 'amount', 'dt'],
+        'data_type': ['integer', 'text', 'text', 'date'],
+    }
+)
+TABLE = pd.DataFrame(
+    {
+        'id': [1, 2, 3],
+        'val': ['a', 'b', 'c'],
+        'amount': ['10', '20', '30'],
+        'dt': ['2024-01-01', '2024-01-01', '2024-01-02'],
+    }
+)
+
+
+def _samples(**kwargs):
+    return SuiteCheck(
+        'check_samples',
+        dict(
+            source_table=SOURCE,
+            target_table=TARGET,
+            date_column='dt',
+            date_range=('2024-01-01', '2024-01-02'),
+            chunk_size_days=1,
+            custom_primary_key=['id'],
+            **kwargs,
+        ),
+    )
+
+
+COUNTS = SuiteCheck(
+    'check_counts',
+    {
+        'source_table': SOURCE,
+        'target_table': TARGET,
+        'date_column': 'dt',
+        'date_range': ('2024-01-01', '2024-01-02'),
+    },
+)
+
+
+def _checker(make_checker, monkeypatch, executed):
+    from xoverrr.models import ObjectType
+
+    checker = make_checker()
+
+    def _fake_execute(query, engine, timezone=None, query_side=None):
+        sql, params = query
+        executed.append((query_side, sql))
+        if 'count(*)' in sql:
+            return pd.DataFrame({'dt': ['2024-01-01', '2024-01-02'], 'cnt': [2, 1]})
+        columns = re.search(r'SELECT (.*?)\s+FROM', sql, re.DOTALL).group(1).split(', ')
+        rows = TABLE[
+            (TABLE['dt'] >= params['start_date']) & (TABLE['dt'] <= params['end_date'])
+        ]
+        return rows[columns].reset_index(drop=True)
+
+    monkeypatch.setattr(checker, '_execute_query', _fake_execute)
+    monkeypatch.setattr(checker, '_get_object_type', lambda *args: ObjectType.TABLE)
+    monkeypatch.setattr(checker, '_get_metadata_cols', lambda *args: META)
+    return checker
+
+
+def test_plan_suite_groups_reads_and_runs_derived_counts_last():
+    shared, order = plan_suite(
+        [COUNTS, _samples(include_columns=['val']), _samples()], None
+    )
+
+    assert [read.key.side for read in shared] == ['source', 'target']
+    assert shared[0].sample_checks == [1, 2]
+    assert shared[0].count_checks == [0]
+    assert order == [1, 2, 0]
+
+
+def test_run_suite_shares_chunk_reads_and_derives_counts(make_checker, monkeypatch):
+    executed = []
+    checker = _checker(make_checker, monkeypatch, executed)
+
+    results = checker.run_suite(
+        [
+            _samples(include_columns=['val']),
+            _samples(include_columns=['amount']),
+            COUNTS,
+        ]
+    )
+
+    assert [status for status, *_ in results] == [CHECK_SUCCESS] * 3
+    # one read per side and chunk, no count queries
+    assert len(executed) == 4
+    assert all('id, val, amount, dt' in sql for _, sql in executed)
+    assert results[0][3].evaluated_columns == ['id', 'val']
+    counts_stats, counts_details = results[2][2], results[2][3]
+    assert counts_stats.total_source_rows == 2  # days
+    assert counts_details.execution_info == {'counts_source': 'suite shared reads'}
+    assert checker._suite_reads is None
+
+
+def test_run_suite_queries_counts_over_a_range_not_read_by_samples(
+    make_checker, monkeypatch
+):
+    executed = []
+    checker = _checker(make_checker, monkeypatch, executed)
+    counts = SuiteCheck(
+        'check_counts', {**COUNTS.kwargs, 'date_range': ('2024-01-01', '2024-01-01')}
+    )
+
+    results = checker.run_suite([_samples(), counts])
+
+    assert [status for status, *_ in results] == [CHECK_SUCCESS] * 2
+    assert sum('count(*)' in sql for _, sql in executed) == 2
+    assert 'counts_plan' in results[1][3].execution_info
+
+
+def test_run_suite_passes_details_level_to_samples_checks(make_checker, monkeypatch):
+    checker = _checker(make_checker, monkeypatch, [])
+
+    results = checker.run_suite(
+        [_samples(details_level='none'), _samples(details_level='full')]
+    )
+
+    assert [status for status, *_ in results] == [CHECK_SUCCESS] * 2
+    assert results[0][1] is None
+    assert results[0][3].issue_examples.empty
+    assert 'SAMPLES CHECK REPORT' in results[1][1]
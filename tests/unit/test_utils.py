@@ -1,20 +1,26 @@
 import time
+import warnings
 
 import numpy as np
 import pandas as pd
 import pytest
 
 from xoverrr.constants import (
+    CHUNK_ERROR_RETRY,
+    CHUNK_ERROR_SPLIT,
     FLAG_VALUE_NO,
     FLAG_VALUE_YES,
     XRECENTLY_CHANGED_COLUMN,
 )
-from xoverrr.utils import (CheckDetails, CheckStats,
-                           clean_recently_changed_data, compare_dataframes,
-                           cross_fill_missing_dates, format_report_collection,
-                           get_dataframe_size_gb, prepare_dataframe,
-                           validate_dataframe_size)
-
+from xoverrr.utils import (classify_chunk_error, clean_recently_changed_data,
+                           compare_dataframes, cross_fill_missing_dates,
+                           final_diff_score_lower_bound,
+                           format_report_collection,
+                           get_dataframe_size_gb, merge_partition_results,
+                           prepare_dataframe, validate_dataframe_size,
+                           wilson_interval)
+
+from xoverrr.exceptions import DataFrameSizeError, QueryExecutionError
 from xoverrr.reporting import generate_sample_report
 
 class TestUtils:
@@ -244,6 +250,85 @@ class TestUtils:
         stats, details = compare_dataframes(df1, df2, ['pk'], 3)
         assert stats.final_diff_score == pytest.approx(7.5, rel=1e-5)
 
+    def test_compare_dataframes_without_details_counts_the_same(self):
+        """details_level='none' gives the same stats without examples"""
+        df1 = pd.DataFrame(
+            {
+                'pk': [1, 2, 2, 3, 4, 5],
+                'a': ['x', 'y', 'y', 'z', 'w', None],
+                'b': ['1', '2', '2', '3', '4', '5'],
+            }
+        )
+        df2 = pd.DataFrame(
+            {
+                'pk': [1, 2, 3, 4, 6],
+                'a': ['x', 'Y', 'z', 'W', 'v'],
+                'b': ['1', '2', '0', '4', '6'],
+            }
+        )
+
+        stats, details = compare_dataframes(df1, df2, ['pk'], 3)
+        fast_stats, fast_details = compare_dataframes(
+            df1, df2, ['pk'], 3, details_level='none'
+        )
+
+        assert fast_stats == stats
+        assert fast_details.issue_breakdown.to_dict('records') == [
+            {'column_name': 'a', 'issue_count': 2},
+            {'column_name': 'b', 'issue_count': 1},
+        ]
+        assert details.source_only_keys_examples
+        assert fast_details.source_only_keys_examples == ()
+        assert fast_details.issue_examples.empty
+
+        report_args = ('src', 'trg', stats, details, 'UTC', 'run', '2024-01-01')
+        assert 'ISSUE ROW EXAMPLES' not in generate_sample_report(*report_args)
+        assert 'ISSUE ROW EXAMPLES' in generate_sample_report(
+            *report_args, include_issue_row_examples=True
+        )
+
+    def test_compare_dataframes_partitioned_matches_single_compare(self):
+        """Hash partitions merge into the stats of one comparison"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        df1 = pd.DataFrame(
+            {
+                'pk': [str(i) for i in range(200)] + ['7'],
+                'val': [str(i % 7) for i in range(200)] + ['x'],
+            }
+        )
+        df2 = df1.iloc[5:].copy()
+        df2.loc[df2.index[::10], 'val'] = 'changed'
+
+        stats, _ = compare_dataframes(df1, df2, ['pk'], 3)
+        sequential = compare_dataframes(df1, df2, ['pk'], 3, partitions=4)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            threaded = compare_dataframes(
+                df1, df2, ['pk'], 3, partitions=4, executor=executor
+            )
+
+        assert sequential[0] == stats
+        assert threaded[0] == stats
+        # examples come from the first partitions, whatever finished first
+        assert threaded[1].issue_examples.equals(sequential[1].issue_examples)
+        assert len(sequential[1].source_only_keys_examples) == 3
+
+    def test_merge_partition_results_keeps_example_order(self):
+        """Merged key examples keep the partition order, capped"""
+        from dataclasses import replace
+
+        df = pd.DataFrame({'pk': ['1'], 'val': ['a']})
+        stats, details = compare_dataframes(df, df, ['pk'], 3)
+        keys = [f'key{i}' for i in range(6)]
+        results = [
+            (stats, replace(details, source_only_keys_examples=tuple(keys[i : i + 3])))
+            for i in (0, 3)
+        ]
+
+        _, merged = merge_partition_results(results, 5)
+
+        assert merged.source_only_keys_examples == tuple(keys[:5])
+
     def test_get_dataframe_size_gb(self):
         """Test dataframe size calculation"""
         df = pd.DataFrame({'col': range(1000)})
@@ -252,6 +337,23 @@ class TestUtils:
         assert size_gb > 0.0
         assert size_gb < 0.1
 
+    def test_get_dataframe_size_gb_samples_text_columns(self):
+        """Text column sizes are estimated from sampled rows"""
+        df = pd.DataFrame(
+            {
+                'id': range(20_000),
+                'val': pd.Series(['ab', 'abcdefgh'] * 10_000, dtype=object),
+            }
+        )
+
+        exact = get_dataframe_size_gb(df, exact=True)
+        assert get_dataframe_size_gb(df, sample_rows=500) == pytest.approx(
+            exact, rel=0.02
+        )
+        assert get_dataframe_size_gb(df.head(50), sample_rows=100) == (
+            get_dataframe_size_gb(df.head(50), exact=True)
+        )
+
     def test_validate_dataframe_size_raises_on_exceed(self):
         """Test validation raises exception when size exceeds limit"""
         df = pd.DataFrame({'col': range(10_000_000)})  # Large dataframe
@@ -551,3 +653,48 @@ def sample_dataframe():
             'score': [85.5, 92.0, 78.5, 95.0],
         }
     )
+
+
+def test_wilson_interval_bounds():
+    low, high = wilson_interval(10, 1000)
+    assert 0.5 < low < 1.0 < high < 1.9
+    assert wilson_interval(0, 100)[0] == 0.0
+    assert wilson_interval(0, 0) == (0.0, 100.0)
+
+
+def test_wilson_interval_caps_more_successes_than_trials():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        low, high = wilson_interval(np.int64(30), np.int64(20))
+    assert low > 80.0
+    assert high == 100.0
+    assert type(low) is float and type(high) is float
+
+
+def test_final_diff_score_lower_bound_assumes_clean_remaining_rows():
+    source = pd.DataFrame({'id': ['1', '2', '3', '4'], 'val': ['a', 'b', 'c', 'd']})
+    target = pd.DataFrame({'id': ['1', '2', '3', '5'], 'val': ['x', 'b', 'c', 'e']})
+    stats, _ = compare_dataframes(source, target, ['id'], 5)
+
+    assert final_diff_score_lower_bound(stats, 0, 0) == pytest.approx(
+        stats.final_diff_score
+    )
+    # 3 comparable rows with 1 issue and 1 only-row per side, 7 more common
+    assert final_diff_score_lower_bound(stats, 7, 10) == pytest.approx(
+        0.15 * 10 + 0.15 * 10 + 0.5 * 10
+    )
+    assert final_diff_score_lower_bound(stats, 10**9, 10**9) < 0.001
+
+
+def test_classify_chunk_error():
+    timeout = QueryExecutionError(
+        'Query failed: canceling statement due to statement timeout'
+    )
+    assert classify_chunk_error(timeout) == CHUNK_ERROR_SPLIT
+    assert classify_chunk_error(DataFrameSizeError('too big')) == CHUNK_ERROR_SPLIT
+    assert (
+        classify_chunk_error(QueryExecutionError('Query failed: ORA-03113: eof'))
+        == CHUNK_ERROR_RETRY
+    )
+    assert classify_chunk_error(QueryExecutionError('syntax error')) is None
+    assert classify_chunk_error(ValueError('statement timeout')) is None